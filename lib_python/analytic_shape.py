@@ -0,0 +1,324 @@
+from typing import Optional
+
+import math
+
+from .vec import Vec3
+from .color import Color
+from .ray import Ray
+from .voxel_grid import VoxelGrid
+from .pos_transform import has_pos_transform
+from .shape_rasterizer import plane_axes
+from .voxel_value import (
+    VoxelValueShape,
+    VoxelValueShapePoint,
+    VoxelValueShapeCircle,
+    VoxelValueShapeCube,
+    VoxelValueShapeRect,
+    VoxelValueShapeSphere,
+    VoxelValueShapeCylinder,
+)
+
+
+class AnalyticShape(VoxelGrid):
+    """
+    A shape kept as its parameters instead of its voxels, for rendering huge
+    primitives: the voxels of the shape are given by a closed-form membership
+    test, so its memory and build time do not depend on its volume.
+
+    It is placed in the owner grid as an instance (see `VoxelGrid.add_instance`),
+    and marched by `AnalyticShapeMarcher`, which starts at the closed-form
+    entry distance of the ray into the shape.
+    """
+
+    def __init__(
+        self,
+        owner: VoxelGrid,
+        slot: int,
+        bounds_min: tuple[int, int, int],
+        bounds_max: tuple[int, int, int]
+    ) -> None:
+
+        super().__init__()
+
+        # The color is read from the color table of the owner grid (palette changes apply)
+        self.owner: VoxelGrid = owner
+        self.slot: int = slot
+
+        self._update_bounds(*bounds_min)
+        self._update_bounds(*bounds_max)
+
+    def contains(
+        self,
+        x: int,
+        y: int,
+        z: int
+    ) -> bool:
+        """
+        Check if a voxel inside the bounds belongs to the shape.
+        """
+
+        return True
+
+    def ray_range(
+        self,
+        ray: Ray
+    ) -> tuple[float, float]:
+        """
+        Get a closed-form range of distances along the ray containing all
+        the voxels of the shape it crosses (t_near > t_far if it misses).
+        """
+
+        return float('-inf'), float('inf')
+
+    def get_voxel(
+        self,
+        x: int,
+        y: int,
+        z: int
+    ) -> Optional[Color]:
+
+        if not self._in_bounds(x, y, z) or not self.contains(x, y, z):
+            return None
+
+        return self.owner._color_table[self.slot]
+
+    def _in_bounds(
+        self,
+        x: int,
+        y: int,
+        z: int
+    ) -> bool:
+
+        return (
+            self._min_bounds.x <= x < self._max_bounds.x
+            and self._min_bounds.y <= y < self._max_bounds.y
+            and self._min_bounds.z <= z < self._max_bounds.z
+        )
+
+
+class AnalyticBox(AnalyticShape):
+    """
+    Axis-aligned box of voxels (points, cubes and rects): the voxels fill the bounds.
+    """
+
+
+class AnalyticSphere(AnalyticShape):
+    """
+    Voxelized sphere: the voxels at a distance at most `radius` from the center.
+    """
+
+    def __init__(
+        self,
+        owner: VoxelGrid,
+        slot: int,
+        center: tuple[int, int, int],
+        radius: int
+    ) -> None:
+
+        cx, cy, cz = center
+
+        super().__init__(
+            owner,
+            slot,
+            (cx - radius, cy - radius, cz - radius),
+            (cx + radius, cy + radius, cz + radius)
+        )
+
+        self.center: tuple[int, int, int] = center
+        self.radius: int = radius
+
+    def contains(
+        self,
+        x: int,
+        y: int,
+        z: int
+    ) -> bool:
+
+        cx, cy, cz = self.center
+
+        return (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2 <= self.radius * self.radius
+
+    def ray_range(
+        self,
+        ray: Ray
+    ) -> tuple[float, float]:
+
+        # The cells of the voxels are inside the sphere around the center of the
+        # center cell, enlarged by half a cell diagonal
+        ox, oy, oz = (float(v) for v in ray.origin.data)
+        dx, dy, dz = (float(v) for v in ray.direction.data)
+
+        cx, cy, cz = (c + 0.5 for c in self.center)
+        r: float = self.radius + math.sqrt(3.0) / 2.0
+
+        lx, ly, lz = ox - cx, oy - cy, oz - cz
+
+        a: float = dx * dx + dy * dy + dz * dz
+        b: float = lx * dx + ly * dy + lz * dz
+        c: float = lx * lx + ly * ly + lz * lz - r * r
+
+        discriminant: float = b * b - a * c
+
+        if a == 0 or discriminant < 0:
+            return float('inf'), float('-inf')
+
+        root: float = math.sqrt(discriminant)
+
+        return (-b - root) / a, (-b + root) / a
+
+
+class AnalyticCylinder(AnalyticShape):
+    """
+    Voxelized cylinder (and circle): a disk of `radius` in the plane of `axis`,
+    repeated on `height` layers from the center along the perpendicular axis.
+    """
+
+    def __init__(
+        self,
+        owner: VoxelGrid,
+        slot: int,
+        center: tuple[int, int, int],
+        radius: int,
+        height: int,
+        axes: tuple[int, int, int]
+    ) -> None:
+
+        u, v, normal = axes
+
+        bounds_min: list[int] = list(center)
+        bounds_max: list[int] = list(center)
+
+        bounds_min[u] -= radius
+        bounds_min[v] -= radius
+        bounds_max[u] += radius
+        bounds_max[v] += radius
+        bounds_max[normal] += height - 1
+
+        super().__init__(
+            owner,
+            slot,
+            (bounds_min[0], bounds_min[1], bounds_min[2]),
+            (bounds_max[0], bounds_max[1], bounds_max[2])
+        )
+
+        self.center: tuple[int, int, int] = center
+        self.radius: int = radius
+        self.axes: tuple[int, int, int] = axes
+
+    def contains(
+        self,
+        x: int,
+        y: int,
+        z: int
+    ) -> bool:
+
+        u, v, _ = self.axes
+        p: tuple[int, int, int] = (x, y, z)
+
+        return (p[u] - self.center[u]) ** 2 + (p[v] - self.center[v]) ** 2 <= self.radius * self.radius
+
+    def ray_range(
+        self,
+        ray: Ray
+    ) -> tuple[float, float]:
+
+        # Infinite cylinder around the center cell axis, enlarged by half a cell diagonal
+        # (the layers are limited by the bounds)
+        u, v, _ = self.axes
+
+        lu: float = float(ray.origin.data[u]) - (self.center[u] + 0.5)
+        lv: float = float(ray.origin.data[v]) - (self.center[v] + 0.5)
+        du: float = float(ray.direction.data[u])
+        dv: float = float(ray.direction.data[v])
+
+        r: float = self.radius + math.sqrt(2.0) / 2.0
+
+        a: float = du * du + dv * dv
+        c: float = lu * lu + lv * lv - r * r
+
+        if a < 1e-20:
+
+            if c <= 0:
+                return float('-inf'), float('inf')
+
+            return float('inf'), float('-inf')
+
+        b: float = lu * du + lv * dv
+
+        discriminant: float = b * b - a * c
+
+        if discriminant < 0:
+            return float('inf'), float('-inf')
+
+        root: float = math.sqrt(discriminant)
+
+        return (-b - root) / a, (-b + root) / a
+
+
+def analytic_shape_for(
+    voxel_value: VoxelValueShape,
+    owner: VoxelGrid,
+    slot: int
+) -> Optional[AnalyticShape]:
+    """
+    Build the analytic form of a shape, if it has one.
+
+    Args:
+        voxel_value: The shape
+        owner: The grid the shape is placed in
+        slot: Color table index of the shape in the owner grid
+
+    Returns:
+        The analytic shape, None for the shapes that must be rasterized
+        (lines, triangles, polygons, and shapes with position transforms)
+    """
+
+    if has_pos_transform(voxel_value.position):
+        return None
+
+    pos: Vec3 = voxel_value.position.xyz
+    x, y, z = int(pos.x), int(pos.y), int(pos.z)
+
+    if isinstance(voxel_value, VoxelValueShapePoint):
+
+        return AnalyticBox(owner, slot, (x, y, z), (x, y, z))
+
+    if isinstance(voxel_value, VoxelValueShapeCube):
+
+        if voxel_value.size <= 0:
+            return None
+
+        size: int = voxel_value.size - 1
+
+        return AnalyticBox(owner, slot, (x, y, z), (x + size, y + size, z + size))
+
+    if isinstance(voxel_value, VoxelValueShapeRect):
+
+        pos2: Vec3 = voxel_value.position2.xyz
+        x2, y2, z2 = int(pos2.x), int(pos2.y), int(pos2.z)
+
+        return AnalyticBox(
+            owner,
+            slot,
+            (min(x, x2), min(y, y2), min(z, z2)),
+            (max(x, x2), max(y, y2), max(z, z2))
+        )
+
+    if isinstance(voxel_value, VoxelValueShapeSphere):
+
+        if voxel_value.radius < 0:
+            return None
+
+        return AnalyticSphere(owner, slot, (x, y, z), voxel_value.radius)
+
+    if isinstance(voxel_value, (VoxelValueShapeCylinder, VoxelValueShapeCircle)):
+
+        height: int = voxel_value.height if isinstance(voxel_value, VoxelValueShapeCylinder) else 1
+        axes: Optional[tuple[int, int, int]] = plane_axes(voxel_value.axis)
+
+        if axes is None or voxel_value.radius < 0 or height <= 0:
+            return None
+
+        return AnalyticCylinder(owner, slot, (x, y, z), voxel_value.radius, height, axes)
+
+    return None
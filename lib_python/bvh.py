@@ -0,0 +1,466 @@
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .voxel_value import VoxelValue, VoxelValueShape
+from .shape_rasterizer import shape_bounds
+
+
+# Number of centroid bins tested per axis by the SAH construction
+SAH_BINS: int = 16
+
+
+def _box_areas(
+    box_min: NDArray[np.float64],
+    box_max: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Surface areas of (N, 3) boxes (0 for empty boxes).
+    """
+
+    size: NDArray[np.float64] = np.maximum(box_max - box_min, 0.0)
+
+    with np.errstate(invalid="ignore"):
+
+        areas: NDArray[np.float64] = 2.0 * (
+            size[:, 0] * size[:, 1] + size[:, 1] * size[:, 2] + size[:, 2] * size[:, 0]
+        )
+
+    return np.nan_to_num(areas, nan=0.0)
+
+
+def slab_test(
+    origin: NDArray[np.float64],
+    direction: NDArray[np.float64],
+    boxes_min: NDArray[np.float64],
+    boxes_max: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Intersect a ray with (N, 3) axis-aligned boxes at once.
+
+    Returns:
+        Tuple of (t_enter, t_exit) arrays, t_enter > t_exit for missed boxes
+    """
+
+    parallel: NDArray[np.bool_] = np.abs(direction) < 1e-10
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+
+        inv_dir: NDArray[np.float64] = np.where(parallel, 0.0, 1.0 / np.where(parallel, 1.0, direction))
+
+        t1: NDArray[np.float64] = (boxes_min - origin) * inv_dir
+        t2: NDArray[np.float64] = (boxes_max - origin) * inv_dir
+
+    t_near: NDArray[np.float64] = np.minimum(t1, t2)
+    t_far: NDArray[np.float64] = np.maximum(t1, t2)
+
+    # A ray parallel to a slab is inside it everywhere, or nowhere
+    inside: NDArray[np.bool_] = (origin >= boxes_min) & (origin <= boxes_max)
+
+    t_near = np.where(parallel, np.where(inside, -np.inf, np.inf), t_near)
+    t_far = np.where(parallel, np.where(inside, np.inf, -np.inf), t_far)
+
+    return t_near.max(axis=1), t_far.min(axis=1)
+
+
+class BVH:
+    """
+    Bounding volume hierarchy over axis-aligned boxes (shapes, instances),
+    so that the boxes hit by a ray, or overlapping a region, are found in
+    a time logarithmic in the number of boxes.
+
+    It is built top-down with the binned surface area heuristic, each split
+    evaluating all the bins of the three axes at once with NumPy. Nodes are
+    stored in flat arrays, the primitives of a leaf being a range of `order`.
+    """
+
+    def __init__(
+        self,
+        boxes_min: NDArray[np.floating],
+        boxes_max: NDArray[np.floating],
+        leaf_size: int = 4
+    ) -> None:
+        """
+        Args:
+            boxes_min: (N, 3) minimum corners of the boxes
+            boxes_max: (N, 3) maximum corners of the boxes
+            leaf_size: Maximum number of boxes of a leaf (unless they cannot be split)
+        """
+
+        self.boxes_min: NDArray[np.float64] = np.asarray(boxes_min, dtype=np.float64).reshape(-1, 3)
+        self.boxes_max: NDArray[np.float64] = np.asarray(boxes_max, dtype=np.float64).reshape(-1, 3)
+
+        self.leaf_size: int = max(1, leaf_size)
+
+        # Box indices, grouped by leaf
+        self.order: NDArray[np.intp] = np.arange(len(self.boxes_min), dtype=np.intp)
+
+        # Nodes: bounds, children (-1 for leaves), range in `order`
+        self.nodes_min: NDArray[np.float64] = np.zeros((0, 3), dtype=np.float64)
+        self.nodes_max: NDArray[np.float64] = np.zeros((0, 3), dtype=np.float64)
+        self.nodes_left: NDArray[np.intp] = np.zeros((0,), dtype=np.intp)
+        self.nodes_right: NDArray[np.intp] = np.zeros((0,), dtype=np.intp)
+        self.nodes_start: NDArray[np.intp] = np.zeros((0,), dtype=np.intp)
+        self.nodes_end: NDArray[np.intp] = np.zeros((0,), dtype=np.intp)
+
+        self._nodes_min_list: list[list[float]] = []
+        self._nodes_max_list: list[list[float]] = []
+        self._nodes_left_list: list[int] = []
+        self._nodes_right_list: list[int] = []
+        self._nodes_start_list: list[int] = []
+        self._nodes_end_list: list[int] = []
+
+        if len(self.order) > 0:
+            self._build()
+
+    def __len__(self) -> int:
+
+        return len(self.order)
+
+    def _build(self) -> None:
+        """
+        Build the tree top-down, splitting each node at its best SAH bin boundary.
+        """
+
+        centroids: NDArray[np.float64] = (self.boxes_min + self.boxes_max) * 0.5
+
+        nodes_min: list[NDArray[np.float64]] = []
+        nodes_max: list[NDArray[np.float64]] = []
+        nodes_left: list[int] = []
+        nodes_right: list[int] = []
+        nodes_start: list[int] = []
+        nodes_end: list[int] = []
+
+        # (parent node, is right child, start, end) of the nodes to create
+        stack: list[tuple[int, bool, int, int]] = [(-1, False, 0, len(self.order))]
+
+        while len(stack) > 0:
+
+            parent, is_right, start, end = stack.pop()
+
+            node: int = len(nodes_start)
+
+            if parent >= 0:
+
+                if is_right:
+                    nodes_right[parent] = node
+                else:
+                    nodes_left[parent] = node
+
+            indices: NDArray[np.intp] = self.order[start:end]
+
+            nodes_min.append(self.boxes_min[indices].min(axis=0))
+            nodes_max.append(self.boxes_max[indices].max(axis=0))
+            nodes_left.append(-1)
+            nodes_right.append(-1)
+            nodes_start.append(start)
+            nodes_end.append(end)
+
+            if end - start <= self.leaf_size:
+                continue
+
+            split: Optional[NDArray[np.bool_]] = self._sah_split(indices, centroids[indices])
+
+            if split is None:
+                continue
+
+            left: NDArray[np.intp] = indices[split]
+            right: NDArray[np.intp] = indices[~split]
+
+            self.order[start:end] = np.concatenate([left, right])
+
+            middle: int = start + len(left)
+
+            stack.append((node, True, middle, end))
+            stack.append((node, False, start, middle))
+
+        self.nodes_min = np.array(nodes_min, dtype=np.float64).reshape(-1, 3)
+        self.nodes_max = np.array(nodes_max, dtype=np.float64).reshape(-1, 3)
+        self.nodes_left = np.array(nodes_left, dtype=np.intp)
+        self.nodes_right = np.array(nodes_right, dtype=np.intp)
+        self.nodes_start = np.array(nodes_start, dtype=np.intp)
+        self.nodes_end = np.array(nodes_end, dtype=np.intp)
+
+        # Plain list copies for the per-node traversal
+        self._nodes_min_list = self.nodes_min.tolist()
+        self._nodes_max_list = self.nodes_max.tolist()
+        self._nodes_left_list = nodes_left
+        self._nodes_right_list = nodes_right
+        self._nodes_start_list = nodes_start
+        self._nodes_end_list = nodes_end
+
+    def _sah_split(
+        self,
+        indices: NDArray[np.intp],
+        centroids: NDArray[np.float64]
+    ) -> Optional[NDArray[np.bool_]]:
+        """
+        Find the split of the boxes of a node with the lowest surface area cost.
+
+        Returns:
+            Mask of the boxes going to the left child, None if they cannot be split
+        """
+
+        c_min: NDArray[np.float64] = centroids.min(axis=0)
+        extent: NDArray[np.float64] = centroids.max(axis=0) - c_min
+
+        best_cost: float = float('inf')
+        best_mask: Optional[NDArray[np.bool_]] = None
+
+        boxes_min: NDArray[np.float64] = self.boxes_min[indices]
+        boxes_max: NDArray[np.float64] = self.boxes_max[indices]
+
+        for axis in range(3):
+
+            if extent[axis] <= 0:
+                continue
+
+            bins: NDArray[np.intp] = np.minimum(
+                ((centroids[:, axis] - c_min[axis]) / extent[axis] * SAH_BINS).astype(np.intp),
+                SAH_BINS - 1
+            )
+
+            counts: NDArray[np.int64] = np.bincount(bins, minlength=SAH_BINS)
+
+            # Bounds of each bin, reduced over the boxes sorted by bin
+            by_bin: NDArray[np.intp] = np.argsort(bins, kind="stable")
+            used: NDArray[np.intp] = np.flatnonzero(counts)
+            starts: NDArray[np.int64] = (np.cumsum(counts) - counts)[used]
+
+            bins_min: NDArray[np.float64] = np.full((SAH_BINS, 3), np.inf)
+            bins_max: NDArray[np.float64] = np.full((SAH_BINS, 3), -np.inf)
+
+            bins_min[used] = np.minimum.reduceat(boxes_min[by_bin], starts, axis=0)
+            bins_max[used] = np.maximum.reduceat(boxes_max[by_bin], starts, axis=0)
+
+            # Bounds and counts of the left side (bins <= k) and right side (bins > k)
+            left_area: NDArray[np.float64] = _box_areas(
+                np.minimum.accumulate(bins_min, axis=0),
+                np.maximum.accumulate(bins_max, axis=0)
+            )[:-1]
+            right_area: NDArray[np.float64] = _box_areas(
+                np.minimum.accumulate(bins_min[::-1], axis=0)[::-1],
+                np.maximum.accumulate(bins_max[::-1], axis=0)[::-1]
+            )[1:]
+
+            left_count: NDArray[np.int64] = np.cumsum(counts)[:-1]
+            right_count: NDArray[np.int64] = len(indices) - left_count
+
+            costs: NDArray[np.float64] = np.where(
+                (left_count > 0) & (right_count > 0),
+                left_area * left_count + right_area * right_count,
+                np.inf
+            )
+
+            k: int = int(np.argmin(costs))
+
+            if costs[k] < best_cost:
+
+                best_cost = float(costs[k])
+                best_mask = bins <= k
+
+        return best_mask
+
+    def query_ray(
+        self,
+        origin: NDArray[np.floating],
+        direction: NDArray[np.floating],
+        t_min: float = float('-inf'),
+        t_max: float = float('inf')
+    ) -> tuple[NDArray[np.intp], NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Find the boxes hit by a ray between two distances.
+
+        Args:
+            origin: Origin of the ray
+            direction: Direction of the ray
+            t_min: Minimum distance along the ray
+            t_max: Maximum distance along the ray
+
+        Returns:
+            Tuple of (box indices, t_enter, t_exit) of the boxes hit, sorted by t_enter
+        """
+
+        empty: tuple[NDArray[np.intp], NDArray[np.float64], NDArray[np.float64]] = (
+            np.zeros((0,), dtype=np.intp),
+            np.zeros((0,), dtype=np.float64),
+            np.zeros((0,), dtype=np.float64)
+        )
+
+        if len(self.order) == 0:
+            return empty
+
+        o: NDArray[np.float64] = np.asarray(origin, dtype=np.float64).reshape(3)
+        d: NDArray[np.float64] = np.asarray(direction, dtype=np.float64).reshape(3)
+
+        ranges: list[NDArray[np.intp]] = []
+
+        # Node tests in plain floats: much faster than NumPy on a single box
+        ox, oy, oz = o.tolist()
+        inv: list[float] = [1.0 / v if abs(v) >= 1e-10 else float('inf') for v in d.tolist()]
+        inv_x, inv_y, inv_z = inv
+
+        nodes_min: list[list[float]] = self._nodes_min_list
+        nodes_max: list[list[float]] = self._nodes_max_list
+
+        stack: list[int] = [0]
+
+        while len(stack) > 0:
+
+            node: int = stack.pop()
+
+            (x0, y0, z0), (x1, y1, z1) = nodes_min[node], nodes_max[node]
+
+            t_near: float = t_min
+            t_far: float = t_max
+
+            for lo, hi, p, inv_d in ((x0, x1, ox, inv_x), (y0, y1, oy, inv_y), (z0, z1, oz, inv_z)):
+
+                if inv_d == float('inf'):
+
+                    # Parallel to the slab: inside it everywhere, or nowhere
+                    if p < lo or p > hi:
+                        t_near = float('inf')
+                        break
+
+                    continue
+
+                t1: float = (lo - p) * inv_d
+                t2: float = (hi - p) * inv_d
+
+                if t1 > t2:
+                    t1, t2 = t2, t1
+
+                t_near = max(t_near, t1)
+                t_far = min(t_far, t2)
+
+            if t_near > t_far:
+                continue
+
+            left: int = self._nodes_left_list[node]
+
+            if left < 0:
+
+                ranges.append(self.order[self._nodes_start_list[node]:self._nodes_end_list[node]])
+
+            else:
+
+                stack.append(self._nodes_right_list[node])
+                stack.append(left)
+
+        if len(ranges) == 0:
+            return empty
+
+        candidates: NDArray[np.intp] = np.concatenate(ranges)
+
+        t_enter, t_exit = slab_test(o, d, self.boxes_min[candidates], self.boxes_max[candidates])
+
+        hit: NDArray[np.bool_] = (t_enter <= t_exit) & (t_exit >= t_min) & (t_enter <= t_max)
+
+        candidates, t_enter, t_exit = candidates[hit], t_enter[hit], t_exit[hit]
+
+        by_distance: NDArray[np.intp] = np.lexsort((candidates, t_enter))
+
+        return candidates[by_distance], t_enter[by_distance], t_exit[by_distance]
+
+    def query_box(
+        self,
+        box_min: NDArray[np.floating],
+        box_max: NDArray[np.floating]
+    ) -> NDArray[np.intp]:
+        """
+        Find the boxes overlapping an axis-aligned box.
+
+        Args:
+            box_min: Minimum corner of the region
+            box_max: Maximum corner of the region
+
+        Returns:
+            Sorted indices of the overlapping boxes
+        """
+
+        if len(self.order) == 0:
+            return np.zeros((0,), dtype=np.intp)
+
+        lo: NDArray[np.float64] = np.asarray(box_min, dtype=np.float64).reshape(3)
+        hi: NDArray[np.float64] = np.asarray(box_max, dtype=np.float64).reshape(3)
+
+        ranges: list[NDArray[np.intp]] = []
+
+        lx, ly, lz = lo.tolist()
+        hx, hy, hz = hi.tolist()
+
+        stack: list[int] = [0]
+
+        while len(stack) > 0:
+
+            node: int = stack.pop()
+
+            (x0, y0, z0), (x1, y1, z1) = self._nodes_min_list[node], self._nodes_max_list[node]
+
+            if x0 > hx or y0 > hy or z0 > hz or x1 < lx or y1 < ly or z1 < lz:
+                continue
+
+            left: int = self._nodes_left_list[node]
+
+            if left < 0:
+
+                ranges.append(self.order[self._nodes_start_list[node]:self._nodes_end_list[node]])
+
+            else:
+
+                stack.append(self._nodes_right_list[node])
+                stack.append(left)
+
+        if len(ranges) == 0:
+            return np.zeros((0,), dtype=np.intp)
+
+        candidates: NDArray[np.intp] = np.concatenate(ranges)
+
+        overlap: NDArray[np.bool_] = np.all(
+            (self.boxes_min[candidates] <= hi) & (self.boxes_max[candidates] >= lo),
+            axis=1
+        )
+
+        return np.sort(candidates[overlap])
+
+
+def shapes_bvh(
+    voxel_values: list[VoxelValue]
+) -> tuple[BVH, NDArray[np.intp]]:
+    """
+    Build a BVH over the bounds of the shapes of a voxels_list.
+
+    Args:
+        voxel_values: The voxel values (the ones that are not shapes are skipped)
+
+    Returns:
+        Tuple of the BVH, and for each of its boxes the index of its shape in `voxel_values`
+    """
+
+    shape_indices: list[int] = []
+    boxes_min: list[NDArray[np.int64]] = []
+    boxes_max: list[NDArray[np.int64]] = []
+
+    for i, voxel_value in enumerate(voxel_values):
+
+        if not isinstance(voxel_value, VoxelValueShape):
+            continue
+
+        bounds: Optional[tuple[NDArray[np.int64], NDArray[np.int64]]] = shape_bounds(voxel_value)
+
+        if bounds is None:
+            continue
+
+        shape_indices.append(i)
+        boxes_min.append(bounds[0])
+        boxes_max.append(bounds[1])
+
+    return (
+        BVH(
+            np.array(boxes_min, dtype=np.float64).reshape(-1, 3),
+            np.array(boxes_max, dtype=np.float64).reshape(-1, 3)
+        ),
+        np.array(shape_indices, dtype=np.intp)
+    )
@@ -1,5 +1,24 @@
+from typing import Optional, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
 from .utils_numeric import clamp, between
 from .vec import Vec3
+from .color_zone_index import ColorZoneIndex
+
+
+# Minimum number of zones of a ColorZones to search them with a ColorZoneIndex
+ZONE_INDEX_MIN_ZONES: int = 8
+
+
+def _positions_array(positions: NDArray[Any]) -> NDArray[np.float64]:
+    """
+    Get (N, 3) voxel positions as a float64 array.
+    """
+
+    return np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+
 
 class Color:
 
@@ -20,6 +39,10 @@ class Color:
 
         return [self.r, self.g, self.b, self.a]
 
+    def export_to_json(self) -> Any:
+
+        return self.export_to_lst()
+
     def color_at_pixel(
         self,
         xyz: Vec3
@@ -32,6 +55,24 @@ class Color:
             clamp(self.a, 0, 255)
         )
 
+    def colors_at_positions(
+        self,
+        positions: NDArray[Any]
+    ) -> NDArray[np.uint8]:
+        """
+        Get the colors of many voxels at once.
+
+        Args:
+            positions: (N, 3) voxel positions
+
+        Returns:
+            (N, 4) uint8 RGBA colors
+        """
+
+        rgba: NDArray[np.uint8] = np.clip([self.r, self.g, self.b, self.a], 0, 255).astype(np.uint8)
+
+        return np.tile(rgba, (len(_positions_array(positions)), 1))
+
     def mult_factor(
         self,
         value: float
@@ -57,7 +98,42 @@ class Color:
         )
 
 
+class FrozenColor(Color):
+    """
+    Immutable Color, safe to share between many voxels
+    (returned by the interning cache of `parse_color`).
+    """
+
+    def __init__(
+        self,
+        r: int = 0,
+        g: int = 0,
+        b: int = 0,
+        a: int = 255
+    ) -> None:
+
+        object.__setattr__(self, "r", r)
+        object.__setattr__(self, "g", g)
+        object.__setattr__(self, "b", b)
+        object.__setattr__(self, "a", a)
+
+    def __setattr__(self, name: str, value: object) -> None:
+
+        raise AttributeError(f"FrozenColor is immutable, cannot set `{name}`")
+
+    def __delattr__(self, name: str) -> None:
+
+        raise AttributeError(f"FrozenColor is immutable, cannot delete `{name}`")
+
+
 class ColorGradient(Color):
+    """
+    Gradient between colors placed at positions: the color of a voxel is the
+    average of the colors weighted by their inverse squared distance to the
+    voxel (the color of a position itself at that position).
+
+    Its flat color (used where no voxel position is known) is the first color.
+    """
 
     def __init__(
         self,
@@ -65,40 +141,87 @@ class ColorGradient(Color):
         positions: list[Vec3] = [],
     ) -> None:
 
+        first: Color = colors[0] if len(colors) > 0 else Color()
+
+        super().__init__(first.r, first.g, first.b, first.a)
+
         self.colors: list[Color] = colors
         self.positions: list[Vec3] = positions
 
+    def export_to_json(self) -> Any:
+
+        return {
+            "type": "gradient_lst",
+            "colors": [c.export_to_json() for c in self.colors],
+            "positions": [[p.x, p.y, p.z] for p in self.positions]
+        }
+
     def color_at_pixel(
         self,
         xyz: Vec3
     ) -> tuple[int, int, int, int]:
 
-        final_color: Color = Color()
+        r, g, b, a = self.colors_at_positions(np.array([[xyz.x, xyz.y, xyz.z]]))[0].tolist()
+
+        return r, g, b, a
+
+    def colors_at_positions(
+        self,
+        positions: NDArray[Any]
+    ) -> NDArray[np.uint8]:
+        """
+        Get the colors of many voxels at once: the inverse squared distance
+        weights of all the voxels are a (N, K) matrix, multiplied by the
+        (K, 4) colors of the K gradient positions.
+
+        Args:
+            positions: (N, 3) voxel positions
+
+        Returns:
+            (N, 4) uint8 RGBA colors
+        """
 
-        dist_tot: float = 0
+        points: NDArray[np.float64] = _positions_array(positions)
 
-        c: Color
-        p: Vec3
+        count: int = min(len(self.colors), len(self.positions))
 
-        for c, p in zip(self.colors, self.positions):
+        if count == 0:
+            return Color().colors_at_positions(points)
 
-            if xyz.check_equal(p):
+        stops: NDArray[np.float64] = np.array(
+            [[p.x, p.y, p.z] for p in self.positions[:count]],
+            dtype=np.float64
+        )
+
+        stop_colors: NDArray[np.float64] = np.array(
+            [c.color_at_pixel(p) for c, p in zip(self.colors[:count], self.positions[:count])],
+            dtype=np.float64
+        )
 
-                return c.color_at_pixel(xyz)
+        # Squared distances |p|^2 - 2 p.s + |s|^2, as a matrix product
+        dist: NDArray[np.float64] = np.maximum(
+            (points * points).sum(axis=1)[:, None]
+            - 2.0 * (points @ stops.T)
+            + (stops * stops).sum(axis=1)[None, :],
+            0.0
+        )
 
-            d: float = 1 / xyz.dist(p)
+        on_stop: NDArray[np.bool_] = dist == 0
 
-            tmp_color = c.mult_factor(d)
+        with np.errstate(divide="ignore"):
+            weights: NDArray[np.float64] = 1.0 / dist
 
-            dist_tot += d
+        # A voxel at a gradient position takes the color of the first one there
+        at_stop: NDArray[np.bool_] = on_stop.any(axis=1)
 
-            final_color = final_color.add_color(tmp_color)
+        if at_stop.any():
 
-        if abs(dist_tot) > 1e-6:
-            final_color.mult_factor( 1 / dist_tot )
+            weights[at_stop] = 0.0
+            weights[at_stop, on_stop[at_stop].argmax(axis=1)] = 1.0
 
-        return final_color.color_at_pixel(xyz)
+        colors: NDArray[np.float64] = (weights @ stop_colors) / weights.sum(axis=1)[:, None]
 
+        return np.clip(np.rint(colors), 0, 255).astype(np.uint8)
 
 
 class ColorZone:
@@ -125,6 +248,14 @@ class ColorZone:
 
 
 class ColorZones(Color):
+    """
+    Box zones with their own colors: a voxel takes the color of the first
+    zone it is in, or the default color. With many zones, they are searched
+    with a uniform grid index (see `ColorZoneIndex`), built on first use and
+    rebuilt when zones are added, removed or moved.
+
+    Its flat color (used where no voxel position is known) is the default color.
+    """
 
     def __init__(
         self,
@@ -132,14 +263,88 @@ class ColorZones(Color):
         zones: list[ColorZone] = []
     ) -> None:
 
+        super().__init__(default_color.r, default_color.g, default_color.b, default_color.a)
+
         self.default_color: Color = default_color
         self.zones: list[ColorZone] = zones
 
+        self._index: Optional[ColorZoneIndex] = None
+        self._index_bounds: Optional[tuple[tuple[float, ...], ...]] = None
+
+    def export_to_json(self) -> Any:
+
+        return {
+            "type": "color_zones",
+            "default_color": self.default_color.export_to_json(),
+            "zones": [
+                {
+                    "color": z.color.export_to_json(),
+                    "positions": [[z.pos1.x, z.pos1.y, z.pos1.z], [z.pos2.x, z.pos2.y, z.pos2.z]]
+                }
+                for z in self.zones
+            ]
+        }
+
+    def _zone_corners(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Get the (Z, 3) lowest and highest corners of the zones.
+        """
+
+        corners_1: NDArray[np.float64] = np.array(
+            [[z.pos1.x, z.pos1.y, z.pos1.z] for z in self.zones],
+            dtype=np.float64
+        ).reshape(-1, 3)
+
+        corners_2: NDArray[np.float64] = np.array(
+            [[z.pos2.x, z.pos2.y, z.pos2.z] for z in self.zones],
+            dtype=np.float64
+        ).reshape(-1, 3)
+
+        return np.minimum(corners_1, corners_2), np.maximum(corners_1, corners_2)
+
+    def _zone_bounds(self) -> tuple[tuple[float, ...], ...]:
+        """
+        Get the corners of the zones, to detect zones changed in place.
+        """
+
+        return tuple(
+            (z.pos1.x, z.pos1.y, z.pos1.z, z.pos2.x, z.pos2.y, z.pos2.z)
+            for z in self.zones
+        )
+
+    def get_index(self) -> Optional[ColorZoneIndex]:
+        """
+        Get the spatial index of the zones, None if there are too few zones to need one.
+        """
+
+        if len(self.zones) < ZONE_INDEX_MIN_ZONES:
+            return None
+
+        bounds: tuple[tuple[float, ...], ...] = self._zone_bounds()
+
+        if self._index is None or self._index_bounds != bounds:
+
+            self._index = ColorZoneIndex(*self._zone_corners())
+            self._index_bounds = bounds
+
+        return self._index
+
     def color_at_pixel(
         self,
         xyz: Vec3
     ) -> tuple[int, int, int, int]:
 
+        index: Optional[ColorZoneIndex] = self.get_index()
+
+        if index is not None:
+
+            zone_index: int = index.first_zone(xyz.x, xyz.y, xyz.z)
+
+            if zone_index < 0:
+                return self.default_color.color_at_pixel(xyz)
+
+            return self.zones[zone_index].color.color_at_pixel(xyz)
+
         z: ColorZone
 
         for z in self.zones:
@@ -149,3 +354,63 @@ class ColorZones(Color):
                 return z.color.color_at_pixel(xyz)
 
         return self.default_color.color_at_pixel(xyz)
+
+    def colors_at_positions(
+        self,
+        positions: NDArray[Any]
+    ) -> NDArray[np.uint8]:
+        """
+        Get the colors of many voxels at once: the voxels are tested against
+        the zone boxes with broadcast comparisons (all of them, or only the
+        zones of their cell in the index), and take the color of their first zone.
+
+        Args:
+            positions: (N, 3) voxel positions
+
+        Returns:
+            (N, 4) uint8 RGBA colors
+        """
+
+        points: NDArray[np.float64] = _positions_array(positions)
+
+        colors: NDArray[np.uint8] = self.default_color.colors_at_positions(points)
+
+        if len(self.zones) == 0 or len(points) == 0:
+            return colors
+
+        index: Optional[ColorZoneIndex] = self.get_index()
+
+        first_zone: NDArray[np.int64]
+
+        if index is not None:
+
+            first_zone = index.first_zones(points)
+
+        else:
+
+            lows, highs = self._zone_corners()
+
+            # (N, Z) zone membership of all the voxels
+            inside: NDArray[np.bool_] = (
+                (points[:, None, :] >= lows[None, :, :]) & (points[:, None, :] <= highs[None, :, :])
+            ).all(axis=2)
+
+            first_zone = np.where(inside.any(axis=1), inside.argmax(axis=1), -1)
+
+        # Voxels grouped by zone, each zone colors its voxels at once
+        zoned: NDArray[np.intp] = np.flatnonzero(first_zone >= 0)
+        order: NDArray[np.intp] = zoned[np.argsort(first_zone[zoned], kind="stable")]
+
+        zone_ids: NDArray[np.int64]
+        starts: NDArray[np.intp]
+        zone_ids, starts = np.unique(first_zone[order], return_index=True)
+
+        ends: list[int] = starts[1:].tolist() + [len(order)]
+
+        for zone_index, start, end in zip(zone_ids.tolist(), starts.tolist(), ends):
+
+            voxels: NDArray[np.intp] = order[start:end]
+
+            colors[voxels] = self.zones[zone_index].color.colors_at_positions(points[voxels])
+
+        return colors
@@ -1,7 +1,22 @@
 from typing import Optional, Any, cast
 
-from .color import Color
-from .colors_names import COLORS_DICT
+import copy
+from collections import OrderedDict
+
+from .vec import parse_vec3
+from .color import Color, FrozenColor, ColorGradient, ColorZone, ColorZones
+from .colors_names import get_named_color
+
+
+# Types of the dict color formats (position-dependent colors)
+COLOR_DICT_TYPES: tuple[str, ...] = ("gradient_lst", "gradient_dict", "gradient_items", "color_zones")
+
+# Maximum number of entries of the parse_color interning cache
+PARSE_COLOR_CACHE_SIZE: int = 4096
+
+# Palette-independent color data -> shared immutable Color
+# (None for strings that are neither hex codes nor color names)
+_PARSE_COLOR_CACHE: OrderedDict[Any, Optional[Color]] = OrderedDict()
 
 class ColorPalette:
 
@@ -15,7 +30,7 @@ class ColorPalette:
     def export_to_dict(self) -> dict[str | int, Any]:
 
         return {
-            k: v.export_to_lst() for k, v in self.palette.items()
+            k: v.export_to_json() for k, v in self.palette.items()
         }
 
     def get_color(
@@ -38,85 +53,187 @@ def parse_color(
         - hex string: "#RRGGBB" or "#RRGGBBAA"
         - color name: "red", "blue", etc.
         - palette key (if color_palette provided)
+        - dict: gradients and color zones (see `_parse_color_dict`)
         - Color instance (pass-through)
+
+    Palette-independent values (lists, tuples, hex codes and names) are
+    memoized, and the same immutable Color instance is returned for equal values.
     """
 
     if isinstance(data, Color):
         return data
 
-    # List/tuple format: [r, g, b] or [r, g, b, a]
-    if isinstance(data, list):
+    color: Optional[Color]
+
+    if isinstance(data, (str, list, tuple)):
+
+        key: Any = _color_cache_key(data)
+
+        if key in _PARSE_COLOR_CACHE:
+
+            _PARSE_COLOR_CACHE.move_to_end(key)
+
+            color = _PARSE_COLOR_CACHE[key]
+
+        else:
+
+            color = _parse_color_literal(data)
 
-        data_list: list[int] = cast(list[int], data)
+            _PARSE_COLOR_CACHE[key] = color
 
-        if len(data_list) >= 4:
-            return Color(int(data_list[0]), int(data_list[1]), int(data_list[2]), int(data_list[3]))
+            if len(_PARSE_COLOR_CACHE) > PARSE_COLOR_CACHE_SIZE:
+                _PARSE_COLOR_CACHE.popitem(last=False)
 
-        elif len(data_list) >= 3:
-            return Color(int(data_list[0]), int(data_list[1]), int(data_list[2]), 255)
+        if color is not None:
+            return color
 
-        return Color()
+    if isinstance(data, dict):
+
+        dict_color: Optional[Color] = _parse_color_dict(cast(dict[str, Any], data), color_palette)
 
-    if isinstance(data, tuple):
+        if dict_color is not None:
+            return dict_color
 
-        data_tuple: tuple[int, ...] = cast(tuple[int, ...], data)
+    # Palette lookup if provided
+    if isinstance(data, (str, int)) and color_palette is not None:
 
-        if len(data_tuple) >= 4:
-            return Color(int(data_tuple[0]), int(data_tuple[1]), int(data_tuple[2]), int(data_tuple[3]))
+        palette_color: Optional[Color] = color_palette.get_color(data)
+
+        if palette_color is not None:
+            return palette_color
+
+    return Color()
 
-        elif len(data_tuple) >= 3:
-            return Color(int(data_tuple[0]), int(data_tuple[1]), int(data_tuple[2]), 255)
 
-        return Color()
+def _color_cache_key(data: str | list[Any] | tuple[Any, ...]) -> Any:
+    """
+    Get the interning cache key of palette-independent color data.
+    """
 
-    # String format
     if isinstance(data, str):
+        return data
 
-        # Hex format: #RRGGBB or #RRGGBBAA
-        if data.startswith("#"):
+    # Lists and tuples with the same values give the same color
+    return ("__rgba__",) + tuple(
+        v if isinstance(v, (int, float)) else repr(v) for v in data
+    )
 
-            hex_str: str = data[1:]
 
-            if len(hex_str) == 6:
+def _parse_color_literal(data: str | list[Any] | tuple[Any, ...]) -> Optional[Color]:
+    """
+    Parse palette-independent color data into an immutable Color.
 
-                r: int = int(hex_str[0:2], 16)
-                g: int = int(hex_str[2:4], 16)
-                b: int = int(hex_str[4:6], 16)
+    Returns:
+        The Color, or None for a string that is neither a hex code nor a color name
+    """
 
-                return Color(r, g, b, 255)
+    # List/tuple format: [r, g, b] or [r, g, b, a]
+    if isinstance(data, (list, tuple)):
 
-            elif len(hex_str) == 8:
+        data_lt: list[int] | tuple[int, ...] = cast(list[int] | tuple[int, ...], data)
 
-                r = int(hex_str[0:2], 16)
-                g = int(hex_str[2:4], 16)
-                b = int(hex_str[4:6], 16)
-                a: int = int(hex_str[6:8], 16)
+        if len(data_lt) >= 4:
+            return FrozenColor(int(data_lt[0]), int(data_lt[1]), int(data_lt[2]), int(data_lt[3]))
 
-                return Color(r, g, b, a)
+        elif len(data_lt) >= 3:
+            return FrozenColor(int(data_lt[0]), int(data_lt[1]), int(data_lt[2]), 255)
 
-        # Color name lookup
-        color_name_lower: str = data.lower()
+        return FrozenColor()
 
-        if color_name_lower in COLORS_DICT:
-            return COLORS_DICT[color_name_lower]
+    # Hex format: #RRGGBB or #RRGGBBAA
+    if data.startswith("#"):
 
-        # Palette lookup if provided
-        if color_palette is not None:
+        hex_str: str = data[1:]
 
-            palette_color: Optional[Color] = color_palette.get_color(data)
+        if len(hex_str) == 6:
 
-            if palette_color is not None:
-                return palette_color
+            r: int = int(hex_str[0:2], 16)
+            g: int = int(hex_str[2:4], 16)
+            b: int = int(hex_str[4:6], 16)
 
-    # Integer palette key lookup
-    if isinstance(data, int) and color_palette is not None:
+            return FrozenColor(r, g, b, 255)
 
-        palette_color = color_palette.get_color(data)
+        elif len(hex_str) == 8:
 
-        if palette_color is not None:
-            return palette_color
+            r = int(hex_str[0:2], 16)
+            g = int(hex_str[2:4], 16)
+            b = int(hex_str[4:6], 16)
+            a: int = int(hex_str[6:8], 16)
 
-    return Color()
+            return FrozenColor(r, g, b, a)
+
+    # Color name lookup
+    return get_named_color(data.lower())
+
+
+def _parse_color_dict(
+    data: dict[str, Any],
+    color_palette: Optional[ColorPalette] = None
+) -> Optional[Color]:
+    """
+    Parse a position-dependent color from its JSON dict format.
+
+    Supported types:
+        - "gradient_lst": {"colors": [cl, ...], "positions": [pos, ...]}
+        - "gradient_dict": {"colors": {pos: cl, ...}}
+        - "gradient_items": {"colors": [[pos, cl], ...]}
+        - "color_zones": {"default_color": cl, "zones": [{"color": cl, "positions": [pos, pos]}, ...]}
+
+    Returns:
+        The ColorGradient or ColorZones, None for an unknown type
+    """
+
+    color_type: Any = data.get("type", None)
+
+    if color_type in ("gradient_lst", "gradient_dict", "gradient_items"):
+
+        if data.get("interpolation", "linear") != "linear":
+            print(f"Warning: Gradient interpolation `{data['interpolation']}` is not supported, using `linear`")
+
+        items: list[tuple[Any, Any]]
+
+        if color_type == "gradient_lst":
+            items = list(zip(data.get("positions", []), data.get("colors", [])))
+
+        elif color_type == "gradient_dict":
+            items = list(cast(dict[str, Any], data.get("colors", {})).items())
+
+        else:
+            items = [(item[0], item[1]) for item in data.get("colors", [])]
+
+        return ColorGradient(
+            colors=[parse_color(c, color_palette) for _, c in items],
+            positions=[parse_vec3(p) for p, _ in items]
+        )
+
+    if color_type == "color_zones":
+
+        zones: list[ColorZone] = []
+
+        for zone_data in data.get("zones", []):
+
+            corners: list[Any] = zone_data.get("positions", [])
+
+            if len(corners) < 2:
+                print(f"Warning: Color zone without two corner positions ignored: {zone_data}")
+                continue
+
+            zones.append(
+                ColorZone(
+                    color=parse_color(zone_data.get("color", "#000000"), color_palette),
+                    position1=parse_vec3(corners[0]),
+                    position2=parse_vec3(corners[1])
+                )
+            )
+
+        return ColorZones(
+            default_color=parse_color(data.get("default_color", "#000000"), color_palette),
+            zones=zones
+        )
+
+    print(f"Warning: Unknown color type `{color_type}`")
+
+    return None
 
 
 def parse_color_palette(data: Any) -> ColorPalette:
@@ -138,7 +255,11 @@ def parse_color_palette(data: Any) -> ColorPalette:
         palette: dict[str | int, Color] = {}
 
         for key, value in data_dict.items():
-            palette[key] = parse_color(value)
+
+            # Each key gets its own instance (named colors are shared objects),
+            # so voxels built from the palette can be bound back to their key
+            # (see VoxelGrid.apply_palette)
+            palette[key] = copy.copy(parse_color(value))
 
         return ColorPalette(palette=palette)
 
@@ -0,0 +1,221 @@
+import math
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+# Maximum number of grid cells per indexed zone
+CELLS_PER_ZONE: int = 8
+
+
+class ColorZoneIndex:
+    """
+    Uniform grid over the boxes of color zones, to find the first zone
+    containing a position without testing all the zones.
+
+    Each cell keeps the indices of the zones overlapping it, in increasing
+    order, so the first zone of a cell containing a position is also the
+    first zone of the whole list containing it (first-match priority).
+    """
+
+    def __init__(
+        self,
+        lows: NDArray[np.float64],
+        highs: NDArray[np.float64]
+    ) -> None:
+        """
+        Args:
+            lows: (Z, 3) lowest corners of the zones (inclusive)
+            highs: (Z, 3) highest corners of the zones (inclusive)
+        """
+
+        self.lows: NDArray[np.float64] = np.asarray(lows, dtype=np.float64).reshape(-1, 3)
+        self.highs: NDArray[np.float64] = np.asarray(highs, dtype=np.float64).reshape(-1, 3)
+
+        zones_count: int = len(self.lows)
+
+        self.origin: NDArray[np.float64] = self.lows.min(axis=0) if zones_count > 0 else np.zeros(3)
+        extent: NDArray[np.float64] = (self.highs.max(axis=0) - self.origin + 1.0) if zones_count > 0 else np.ones(3)
+
+        # Cells about the size of a typical zone, enlarged until the grid is small enough
+        self.cell_size: NDArray[np.float64] = np.maximum(
+            np.median(self.highs - self.lows + 1.0, axis=0) if zones_count > 0 else np.ones(3),
+            1.0
+        )
+
+        max_cells: int = max(64, CELLS_PER_ZONE * zones_count)
+
+        while True:
+
+            self.dims: NDArray[np.int64] = np.maximum(np.ceil(extent / self.cell_size), 1).astype(np.int64)
+
+            if int(np.prod(self.dims)) <= max_cells:
+                break
+
+            self.cell_size = self.cell_size * 2.0
+
+        self._build()
+
+    def _build(self) -> None:
+        """
+        Fill the cells with the indices of the zones overlapping them.
+        """
+
+        cell_lo: NDArray[np.int64] = self._cells_of(self.lows)
+        cell_hi: NDArray[np.int64] = self._cells_of(self.highs)
+
+        zone_ids: list[NDArray[np.int64]] = []
+        cell_ids: list[NDArray[np.int64]] = []
+
+        for zone_index in range(len(self.lows)):
+
+            lo: NDArray[np.int64] = cell_lo[zone_index]
+            hi: NDArray[np.int64] = cell_hi[zone_index]
+
+            covered: NDArray[np.int64] = np.mgrid[
+                lo[0]:hi[0] + 1,
+                lo[1]:hi[1] + 1,
+                lo[2]:hi[2] + 1
+            ].reshape(3, -1)
+
+            cells: NDArray[np.int64] = np.ravel_multi_index(
+                (covered[0], covered[1], covered[2]),
+                (int(self.dims[0]), int(self.dims[1]), int(self.dims[2]))
+            ).astype(np.int64)
+
+            cell_ids.append(cells)
+            zone_ids.append(np.full(len(cells), zone_index, dtype=np.int64))
+
+        all_cells: NDArray[np.int64] = np.concatenate(cell_ids) if cell_ids else np.zeros(0, dtype=np.int64)
+        all_zones: NDArray[np.int64] = np.concatenate(zone_ids) if zone_ids else np.zeros(0, dtype=np.int64)
+
+        # Sorted by cell, then by zone index (stable sort of the zone-ordered entries)
+        order: NDArray[np.intp] = np.argsort(all_cells, kind="stable")
+
+        self.cell_zones: NDArray[np.int64] = all_zones[order]
+
+        cells_count: int = int(np.prod(self.dims))
+
+        self.cell_start: NDArray[np.int64] = np.zeros(cells_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(all_cells, minlength=cells_count), out=self.cell_start[1:])
+
+        # Plain lists for the per-position lookups
+        self._cell_start_list: list[int] = self.cell_start.tolist()
+        self._cell_zones_list: list[int] = self.cell_zones.tolist()
+        self._lows_list: list[list[float]] = self.lows.tolist()
+        self._highs_list: list[list[float]] = self.highs.tolist()
+        self._origin_list: list[float] = self.origin.tolist()
+        self._cell_size_list: list[float] = self.cell_size.tolist()
+        self._dims_list: list[int] = self.dims.tolist()
+
+    def _cells_of(
+        self,
+        points: NDArray[np.float64]
+    ) -> NDArray[np.int64]:
+        """
+        Get the (N, 3) grid cells of (N, 3) positions, clamped to the grid.
+        """
+
+        cells: NDArray[np.int64] = np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+
+        return np.clip(cells, 0, self.dims - 1)
+
+    def first_zone(
+        self,
+        x: float,
+        y: float,
+        z: float
+    ) -> int:
+        """
+        Get the index of the first zone containing a position.
+
+        Returns:
+            The zone index, -1 if the position is in no zone
+        """
+
+        p: tuple[float, float, float] = (x, y, z)
+
+        cell: int = 0
+
+        for axis in range(3):
+
+            c: int = math.floor((p[axis] - self._origin_list[axis]) / self._cell_size_list[axis])
+
+            if c < 0 or c >= self._dims_list[axis]:
+                return -1
+
+            cell = cell * self._dims_list[axis] + c
+
+        for i in range(self._cell_start_list[cell], self._cell_start_list[cell + 1]):
+
+            zone_index: int = self._cell_zones_list[i]
+            lo: list[float] = self._lows_list[zone_index]
+            hi: list[float] = self._highs_list[zone_index]
+
+            if lo[0] <= x <= hi[0] and lo[1] <= y <= hi[1] and lo[2] <= z <= hi[2]:
+                return zone_index
+
+        return -1
+
+    def first_zones(
+        self,
+        points: NDArray[np.float64]
+    ) -> NDArray[np.int64]:
+        """
+        Get the index of the first zone containing each of (N, 3) positions:
+        the k-th candidate zones of all the unresolved positions are tested
+        at once, for k up to the largest number of zones in a cell.
+
+        Returns:
+            (N,) zone indices, -1 for the positions in no zone
+        """
+
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+
+        result: NDArray[np.int64] = np.full(len(points), -1, dtype=np.int64)
+
+        if len(points) == 0 or len(self.lows) == 0:
+            return result
+
+        raw_cells: NDArray[np.int64] = np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+        in_grid: NDArray[np.bool_] = ((raw_cells >= 0) & (raw_cells < self.dims)).all(axis=1)
+
+        pending: NDArray[np.intp] = np.flatnonzero(in_grid)
+
+        cells: NDArray[np.int64] = np.ravel_multi_index(
+            raw_cells[pending].T,
+            (int(self.dims[0]), int(self.dims[1]), int(self.dims[2]))
+        ).astype(np.int64)
+
+        start: NDArray[np.int64] = self.cell_start[cells]
+        end: NDArray[np.int64] = self.cell_start[cells + 1]
+
+        k: int = 0
+
+        while len(pending) > 0:
+
+            has_candidate: NDArray[np.bool_] = start + k < end
+
+            pending = pending[has_candidate]
+            start = start[has_candidate]
+            end = end[has_candidate]
+
+            if len(pending) == 0:
+                break
+
+            zones: NDArray[np.int64] = self.cell_zones[start + k]
+            p: NDArray[np.float64] = points[pending]
+
+            inside: NDArray[np.bool_] = (
+                (p >= self.lows[zones]) & (p <= self.highs[zones])
+            ).all(axis=1)
+
+            result[pending[inside]] = zones[inside]
+
+            pending = pending[~inside]
+            start = start[~inside]
+            end = end[~inside]
+
+            k += 1
+
+        return result
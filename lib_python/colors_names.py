@@ -1,929 +1,998 @@
-from .color import Color
+from typing import Optional, Any
+
+from .color import FrozenColor
 
 """
 List of all colors from https://en.wikipedia.org/wiki/List_of_colors:_A%E2%80%93F
 
 Got them in october 2024.
+
+The table is kept as one packed string (a name, then its RRGGBB hex code, per
+line), and only parsed on the first color name lookup: importing the module
+does not build any Color. Each color is created once, when first looked up.
+"""
+_COLORS_TABLE: str = """
+absolute zero                                   0048BA
+acid green                                      B0BF1A
+aero                                            7CB9E8
+african violet                                  B284BE
+air superiority blue                            72A0C1
+alice blue                                      F0F8FF
+alizarin                                        DB2D43
+alloy orange                                    C46210
+almond                                          EED9C4
+amaranth deep purple                            9F2B68
+amaranth pink                                   F19CBB
+amaranth purple                                 AB274F
+amazon                                          3B7A57
+amber                                           FFBF00
+amethyst                                        9966CC
+android green                                   3DDC84
+antique brass                                   C88A65
+antique bronze                                  665D1E
+antique fuchsia                                 915C83
+antique ruby                                    841B2D
+antique white                                   FAEBD7
+apricot                                         FBCEB1
+aqua                                            00FFFF
+aquamarine                                      7FFFD4
+arctic lime                                     D0FF14
+artichoke green                                 4B6F44
+arylide yellow                                  E9D66B
+ash gray                                        B2BEB5
+atomic tangerine                                FF9966
+aureolin                                        FDEE00
+azure                                           007FFF
+azure web                                       F0FFFF
+baby blue                                       89CFF0
+baby blue eyes                                  A1CAF1
+baby pink                                       F4C2C2
+baby powder                                     FEFEFA
+baker-miller pink                               FF91AF
+banana mania                                    FAE7B5
+barbie pink                                     DA1884
+barn red                                        7C0A02
+battleship grey                                 848482
+beau blue                                       BCD4E6
+beaver                                          9F8170
+beige                                           F5F5DC
+b-dazzled blue                                  2E5894
+big dip o-ruby                                  9C2542
+bisque                                          FFE4C4
+bistre                                          3D2B1F
+bistre brown                                    967117
+bitter lemon                                    CAE00D
+black                                           000000
+black bean                                      3D0C02
+black coral                                     54626F
+black olive                                     3B3C36
+black shadows                                   BFAFB2
+blanched almond                                 FFEBCD
+blast-off bronze                                A57164
+bleu de france                                  318CE7
+blizzard blue                                   ACE5EE
+blood red                                       660000
+blue                                            0000FF
+blue crayola                                    1F75FE
+blue munsell                                    0093AF
+blue ncs                                        0087BD
+blue pantone                                    0018A8
+blue pigment                                    333399
+blue bell                                       A2A2D0
+blue gray                                       6699CC
+blue jeans                                      5DADEC
+blue saphire                                    126180
+blue violet                                     8A2BE2
+blue yonder                                     5072A7
+bluetiful                                       3C69E7
+blush                                           DE5D83
+bole                                            79443B
+bone                                            E3DAC9
+brick red                                       CB4154
+bright liliac                                   D891EF
+bright yellow                                   FFAA1D
+british racing green                            004225
+bronze                                          CD7F32
+brown                                           964B00
+brown sugar                                     AF6E4D
+bud green                                       7BB661
+buff                                            FFC680
+burgundy                                        800020
+burlywood                                       DEB887
+burnished brown                                 A17A74
+burnt orange                                    CC5500
+burnt sienna                                    E97451
+burnt umber                                     8A3324
+byzantine                                       BD33A4
+byzantium                                       702963
+cadet blue                                      5F9EA0
+cadet grey                                      91A3B0
+cadmium green                                   006B3C
+cadmium orange                                  ED872D
+cafe au lait                                    A67B5B
+cafe noir                                       4B3621
+cambridge blue                                  A3C1AD
+camel                                           C19A6B
+cameo pink                                      EFBBCC
+canary                                          FFFF99
+canary yellow                                   FFEF00
+candy pink                                      E4717A
+cardinal                                        C41E3A
+caribbean green                                 00CC99
+carmine                                         960018
+carmine m&p                                     D70040
+carnation pink                                  FFA6C9
+carnelian                                       B31B1B
+carolina blue                                   56A0D3
+carrot orange                                   ED9121
+catawba                                         703642
+cedar chest                                     C95A49
+celadon                                         ACE1AF
+celeste                                         B2FFFF
+cerise                                          DE3163
+cerulean                                        007BA7
+cerulean blue                                   2A52BE
+cerulean frost                                  6D9BC3
+cerulean crayola                                1DACD6
+cerulean rgb                                    0040FF
+champagne                                       F7E7CE
+champagne pink                                  F1DDCF
+charcoal                                        36454F
+charm pink                                      E68FAC
+chartreuse                                      80FF00
+cherry blossom pink                             FFB7C5
+chestnut                                        954535
+chili red                                       E23D28
+china pink                                      DE6FA1
+chinese red                                     AA381E
+chinese violet                                  856088
+chinese yellow                                  FFB200
+chocolate                                       7B3F00
+chocolate web                                   D2691E
+cinereous                                       98817B
+cinnabar                                        E34234
+cinnamon satin                                  CD607E
+citrine                                         E4D00A
+citron                                          9FA91F
+claret                                          7F1734
+coffee                                          6F4E37
+columbia blue                                   B9D9EB
+congo pink                                      F88379
+cool grey                                       8C92AC
+copper                                          B87333
+copper crayola                                  DA8A67
+copper penny                                    AD6F69
+copper red                                      CB6D51
+coper rose                                      996666
+coquelicot                                      FF3800
+coral                                           FF7F50
+coral pink                                      F88379
+cordovan                                        893F45
+corn                                            FBEC5D
+cornflower blue                                 6495ED
+cornsilk                                        FFF8DC
+cosmic cobalt                                   2E2D88
+cosmic latte                                    FFF8E7
+coyote brown                                    81613C
+cotton candy                                    FFBCD9
+cream                                           FFFDD0
+crimson                                         DC143C
+crimson ua                                      9E1B32
+cultured pearl                                  F5F5F5
+cyan                                            00FFFF
+cyan process                                    00B7EB
+cyber grape                                     58427C
+cyber yellow                                    FFD300
+cyclamen                                        F56FA1
+dandelion                                       FED85D
+dark brown                                      654321
+dark byzantium                                  5D3954
+dark cyan                                       008B8B
+dark electric blue                              536878
+dark goldenrod                                  B8860B
+dark green                                      006400
+dark gray                                       323232
+dark grey                                       464646
+dark jungle green                               1A2421
+dark khaki                                      BDB76B
+dark lava                                       483C32
+dark liver                                      543D37
+dark magenta                                    8B008B
+dark olive green                                556B2F
+dark orange                                     FF8C00
+dark orchid                                     9932CC
+dark purple                                     301934
+dark red                                        8B0000
+dark salmon                                     E9967A
+dark sea green                                  8FBC8F
+dark sienna                                     3C1414
+dark sky blue                                   8CBED6
+dark slate blue                                 483D8B
+dark slate gray                                 2F4F4F
+dark spring green                               177245
+dark turquoise                                  00CED1
+dark violet                                     9400D3
+davy-s grey                                     555555
+deep cerise                                     DA3287
+deep champagne                                  FAD6A5
+deep chestnut                                   B94E48
+deep jungle green                               004B49
+deep pink                                       FF1493
+deep saffron                                    FF9933
+deep sky blue                                   00BFFF
+deep Space Sparkle                              4A646C
+deep taupe                                      7E5E60
+denim                                           1560BD
+denim blue                                      2243B6
+desert                                          C19A6B
+desert sand                                     EDC9AF
+dim gray                                        696969
+dodger blue                                     1E90FF
+drab dark brown                                 4A412A
+duke blue                                       00009C
+dutch white                                     EFDFBB
+ebony                                           555D50
+ecru                                            C2B280
+eerie black                                     1B1B1B
+eggplant                                        614051
+eggshell                                        F0EAD6
+electric lime                                   CCFF00
+electric purple                                 BF00FF
+electric violet                                 8F00FF
+emerald                                         50C878
+eminence                                        6C3082
+english lavender                                B48395
+english red                                     AB4B52
+english vermillion                              CC474B
+english violet                                  563C5C
+erin                                            00FF40
+eton blue                                       96C8A2
+fallow                                          C19A6B
+falu red                                        801818
+fandango                                        B53389
+fandango pink                                   DE5285
+fawn                                            E5AA70
+fern green                                      4F7942
+field drab                                      6C541E
+fiery rose                                      FF5470
+finn                                            683068
+firebrick                                       B22222
+fire engine red                                 CE2029
+flame                                           E25822
+flax                                            EEDC82
+flirt                                           A2006D
+floral white                                    FFFAF0
+forest green                                    228B22
+french beige                                    A67B5B
+french bistre                                   856D4D
+french blue                                     0072BB
+french fuchsia                                  FD3F92
+french lilac                                    86608E
+french lime                                     9EFD38
+french mauve                                    D473D4
+french pink                                     FD6C9E
+french raspberry                                C72C48
+french sky blue                                 77B5FE
+french violet                                   8806CE
+frostbite                                       E936A7
+fuchsia                                         FF00FF
+fuchsia  crayola                                C154C1
+fulvous                                         E48400
+fuzzy wuzzy                                     87421F
+gainsboro                                       DCDCDC
+gamboge                                         E49B0F
+generic viridian                                007F66
+ghost white                                     F8F8FF
+glaucous                                        6082B6
+glossy grape                                    AB92B3
+go green                                        00AB66
+gold metallic                                   D4AF37
+gold web golden                                 FFD700
+gold crayola                                    E6BE8A
+gold fusion                                     85754E
+golden brown                                    996515
+golden poppy                                    FCC200
+golden yellow                                   FFDF00
+goldenrod                                       DAA520
+gotham green                                    00573F
+granite gray                                    676767
+granny smith apple                              A8E4A0
+gray                                            808080
+grey                                            BEBEBE
+green                                           00FF00
+green crayola                                   1CAC78
+green web                                       008000
+green munsell                                   00A877
+green ncs                                       009F6B
+green pantone                                   00AD43
+green pigment                                   00A550
+green-blue                                      1164B4
+green lizard                                    A7F432
+green sheen                                     6EAEA1
+gunmetal                                        2A3439
+hansa yellow                                    E9D66B
+harlequin                                       3FFF00
+harvest gold                                    DA9100
+heat wave                                       FF7A00
+heliotrope                                      DF73FF
+heliotrope gray                                 AA98A9
+hollywood cerise                                F400A1
+honolulu blue                                   006DB0
+hooker-s green                                  49796B
+hot magenta                                     FF1DCE
+hot pink                                        FF69B4
+hunter green                                    355E3B
+iceberg                                         71A6D2
+illuminating emerald                            319177
+imperial red                                    ED2939
+inchworm                                        B2EC5D
+independence                                    4C516D
+india green                                     138808
+indian red                                      CD5C5C
+indian yellow                                   E3A857
+indigo                                          6A5DFF
+indigo dye                                      00416A
+international klein blue                        130A8F
+international orange engineering                BA160C
+international orange                            C0362C
+irresistible                                    B3446C
+isabelline                                      F4F0EC
+italian sky blue                                B2FFFF
+ivory                                           FFFFF0
+japanese carmine                                9D2933
+japanese violet                                 5B3256
+jasmine                                         F8DE7E
+jazzberry jam                                   A50B5E
+jet                                             343434
+jonquil                                         F4CA16
+june bud                                        BDDA57
+jungle green                                    29AB87
+kelly green                                     4CBB17
+keppel                                          3AB09E
+key lime                                        E8F48C
+khakiweb                                        C3B091
+kobe                                            F0E68C
+kobi                                            882D17
+kobicha                                         E79FC4
+ksu purple                                      6B4423
+languid lavender                                512888
+lapis lazuli                                    D6CADD
+laser lemon                                     26619C
+laurel green                                    FFFF66
+lava                                            A9BA9D
+lavenderfloral                                  CF1020
+lavenderweb                                     B57EDC
+lavender blue                                   E6E6FA
+lavender blush                                  CCCCFF
+lavender gray                                   FFF0F5
+lawn green                                      C4C3D0
+lemon                                           7CFC00
+lemon chiffon                                   FFF700
+lemon curry                                     FFFACD
+lemon glacier                                   CCA01D
+lemon meringue                                  FDFF00
+lemon yellow                                    F6EABE
+lemon yellowcrayola                             FFF44F
+liberty                                         FFFF9F
+light blue                                      545AA7
+light coral                                     ADD8E6
+light cornflower blue                           F08080
+light cyan                                      93CCEA
+light french beige                              E0FFFF
+light khaki                                     C8AD7F
+light goldenrod yellow                          FAFAD2
+light gray                                      D3D3D3
+light green                                     90EE90
+light orange                                    FED8B1
+light periwinkle                                C5CBE1
+light pink                                      FFB6C1
+light salmon                                    FFA07A
+light sea green                                 20B2AA
+light sky blue                                  87CEFA
+light slate gray                                778899
+light steel blue                                B0C4DE
+light yellow                                    FFFFE0
+lilac                                           C8A2C8
+lilac luster                                    AE98AA
+limecolor wheel                                 BFFF00
+limeweb)x11 green                               00FF00
+lime green                                      32CD32
+lincoln green                                   195905
+linen                                           FAF0E6
+lion                                            DECC9C
+liseran purple                                  DE6FA1
+little boy blue                                 6CA0DC
+liver                                           674C47
+liverdogs                                       B86D29
+liverorgan                                      6C2E1F
+liver chestnut                                  987456
+livid                                           6699CC
+macaroni and cheese                             FFBD88
+madder lake                                     CC3336
+magenta                                         FF00FF
+magenta crayola                                 F653A6
+magenta dye                                     CA1F7B
+magenta pantone                                 D0417E
+magenta process                                 FF0090
+magenta haze                                    9F4576
+magic mint                                      AAF0D1
+magnolia                                        F2E8D7
+mahogany                                        C04000
+maize                                           FBEC5D
+maize crayola                                   F2C649
+majorelle blue                                  6050DC
+malachite                                       0BDA51
+manatee                                         979AAA
+mandarin                                        F37A48
+mango                                           FDBE02
+mango tango                                     FF8243
+mantis                                          74C365
+mardi gras                                      880085
+marigold                                        EAA221
+marooncrayola                                   C32148
+maroon web                                      800000
+maroon                                          B03060
+mauve                                           E0B0FF
+mauve taupe                                     915F6D
+mauvelous                                       EF98AA
+maximum blue                                    47ABCC
+maximum blue green                              30BFBF
+maximum blue purple                             ACACE6
+maximum green                                   5E8C31
+maximum green yellow                            D9E650
+maximum purple                                  733380
+maximum red                                     D92121
+maximum red purple                              A63A79
+maximum yellow                                  FAFA37
+maximum yellow red                              F2BA49
+may green                                       4C9141
+maya blue                                       73C2FB
+medium aquamarine                               66DDAA
+medium blue                                     0000CD
+medium candy apple red                          E2062C
+medium carmine                                  AF4035
+medium champagne                                F3E5AB
+medium orchid                                   BA55D3
+medium purple                                   9370DB
+medium sea green                                3CB371
+medium slate blue                               7B68EE
+medium spring green                             00FA9A
+medium turquoise                                48D1CC
+medium violet-red                               C71585
+mellow apricot                                  F8B878
+mellow yellow                                   F8DE7E
+melon                                           FEBAAD
+metallic gold                                   D3AF37
+metallic seaweed                                0A7E8C
+metallic sunburst                               9C7C38
+mexican pink                                    E4007C
+middle blue                                     7ED4E6
+middle blue green                               8DD9CC
+middle blue purple                              8B72BE
+middle grey                                     8B8680
+middle green                                    4D8C57
+middle green yellow                             ACBF60
+middle purple                                   D982B5
+middle red                                      E58E73
+middle red purple                               A55353
+middle yellow                                   FFEB00
+middle yellow red                               ECB176
+midnight                                        702670
+midnight blue                                   191970
+midnight green                                  004953
+mikado yellow                                   FFC40C
+mimi pink                                       FFDAE9
+mindaro                                         E3F988
+ming                                            36747D
+minion yellow                                   F5E050
+mint                                            3EB489
+mint cream                                      F5FFFA
+mint green                                      98FF98
+misty moss                                      BBB477
+misty rose                                      FFE4E1
+moccasin                                        FFE4B5
+mode beige                                      967117
+mona lisa                                       FF948E
+morning blue                                    8DA399
+moss green                                      8A9A5B
+mountain meadow                                 30BA8F
+mountbatten pink                                997A8D
+msu green                                       18453B
+mulberry                                        C54B8C
+mulberrycrayola                                 C8509B
+mustard                                         FFDB58
+myrtle green                                    317873
+mystic                                          D65282
+mystic maroon                                   AD4379
+nadeshiko pink                                  F6ADC6
+naples yellow                                   FADA5E
+navajo white                                    FFDEAD
+navy blue                                       000080
+navy blue crayola                               1974D2
+neon blue                                       4666FF
+neon green                                      39FF14
+neon fuchsia                                    FE4164
+new car                                         214FC6
+new york pink                                   D7837F
+nickel                                          727472
+non-photo blue                                  A4DDED
+nyanza                                          E9FFDB
+ochre                                           CC7722
+old burgundy                                    43302E
+old gold                                        CFB53B
+old lace                                        FDF5E6
+old lavender                                    796878
+old mauve                                       673147
+old rose                                        C08081
+old silver                                      848482
+olive                                           808000
+olive drab 3                                    6B8E23
+olive drab 7                                    3C341F
+olive green                                     B5B35C
+olivine                                         9AB973
+onyx                                            353839
+opal                                            A8C3BC
+opera mauve                                     B784A7
+orange                                          FF7F00
+orange crayola                                  FF7538
+orange pantone                                  FF5800
+orange web                                      FFA500
+orange peel                                     FF9F00
+orange-red                                      FF681F
+orange-red crayola                              FF5349
+orange soda                                     FA5B3D
+orange-yellow                                   F5BD1F
+orange-yellow crayola                           F8D568
+orchid                                          DA70D6
+orchid pink                                     F2BDCD
+orchid crayola                                  E29CD2
+outer space crayola                             2D383A
+outrageous orange                               FF6E4A
+oxblood                                         4A0000
+oxford blue                                     002147
+ou crimson red                                  841617
+pacific blue                                    1CA9C9
+pakistan green                                  006600
+palatinate purple                               682860
+pale aqua                                       BED3E5
+pale cerulean                                   9BC4E2
+pale dogwood                                    ED7A9B
+pale pink                                       FADADD
+pale purple pantone                             FAE6FA
+pale spring bud                                 ECEBBD
+pansy purple                                    78184A
+paolo veronese green                            009B7D
+papaya whip                                     FFEFD5
+paradise pink                                   E63E62
+parchment                                       F1E9D2
+paris green                                     50C878
+pastel pink                                     DEA5A4
+patriarch                                       800080
+paua                                            1F005E
+payne-s grey                                    536878
+peach                                           FFE5B4
+peach crayola                                   FFCBA4
+peach puff                                      FFDAB9
+pear                                            D1E231
+pearly purple                                   B768A2
+periwinkle                                      CCCCFF
+periwinkle crayola                              C3CDE6
+permanent geranium lake                         E12C2C
+persian blue                                    1C39BB
+persian green                                   00A693
+persian indigo                                  32127A
+persian orange                                  D99058
+persian pink                                    F77FBE
+persian plum                                    701C1C
+persian red                                     CC3333
+persian rose                                    FE28A2
+persimmon                                       EC5800
+pewter blue                                     8BA8B7
+phlox                                           DF00FF
+phthalo blue                                    000F89
+phthalo green                                   123524
+picotee blue                                    2E2787
+pictorial carmine                               C30B4E
+piggy pink                                      FDDDE6
+pine green                                      01796F
+pine green 2                                    2A2F23
+pink                                            FFC0CB
+pink pantone                                    D74894
+pink lace                                       FFDDF4
+pink lavender                                   D8B2D1
+pink sherbet                                    F78FA7
+pistachio                                       93C572
+platinum                                        E5E4E2
+plum                                            8E4585
+plum web                                        DDA0DD
+plump purple                                    5946B2
+polished pine                                   5DA493
+pomp and power                                  86608E
+popstar                                         BE4F62
+portland orange                                 FF5A36
+powder blue                                     B0E0E6
+prairie gold                                    E1CA7A
+princeton orange                                F58025
+prune                                           701C1C
+prussian blue                                   003153
+psychedelic purple                              DF00FF
+puce                                            CC8899
+pullman brown ups brown                         644117
+pumpkin                                         FF7518
+purple                                          6A0DAD
+purple web                                      800080
+purple munsell                                  9F00C5
+purple x11                                      A020F0
+purple mountain majesty                         9678B6
+purple navy                                     4E5180
+purple pizza                                    FE4EDA
+purple plum                                     9C51B6
+purpureus                                       9A4EAE
+queen blue                                      436B95
+queen pink                                      E8CCD7
+quick silver                                    A6A6A6
+quinacridone magenta                            8E3A59
+radical red                                     FF355E
+raisin black                                    242124
+rajah                                           FBAB60
+raspberry                                       E30B5D
+raspberry glacé                                 915F6D
+raspberry rose                                  B3446C
+raw sienna                                      D68A59
+raw umber                                       826644
+razzle dazzle rose                              FF33CC
+razzmatazz                                      E3256B
+razzmic berry                                   8D4E85
+rebecca purple                                  663399
+red                                             FF0000
+red crayola                                     EE204D
+red munsell                                     F2003C
+red ncs                                         C40233
+red pantone                                     ED2939
+red pigment                                     ED1C24
+red ryb                                         FE2712
+red-orange                                      FF5349
+red-orange crayola                              FF681F
+red-orange color wheel                          FF4500
+red-purple                                      E40078
+red salsa                                       FD3A4A
+red-violet                                      C71585
+red-violet crayola                              C0448F
+red-violet color wheel                          922B3E
+redwood                                         A45A52
+resolution blue                                 002387
+rhythm                                          777696
+rich black                                      004040
+rich black fogra29                              010B13
+rich black fogra39                              010203
+rifle green                                     444C38
+robin egg blue                                  00CCCC
+rocket metallic                                 8A7F80
+rojo spanish red                                A91101
+roman silver                                    838996
+rose                                            FF007F
+rose bonbon                                     F9429E
+rose dust                                       9E5E6F
+rose ebony                                      674846
+rose madder                                     E32636
+rose pink                                       FF66CC
+rose pompadour                                  ED7A9B
+rose red                                        C21E56
+rose taupe                                      905D5D
+rose vale                                       AB4E52
+rosewood                                        65000B
+rosso corsa                                     D40000
+rosy brown                                      BC8F8F
+royal blue dark                                 002366
+royal blue light                                4169E1
+royal purple                                    7851A9
+royal yellow                                    FADA5E
+ruber                                           CE4676
+rubine red                                      D10056
+ruby                                            E0115F
+ruby red                                        9B111E
+rufous                                          A81C07
+russet                                          80461B
+russian green                                   679267
+russian violet                                  32174D
+rust                                            B7410E
+rusty red                                       DA2C43
+sacramento state green                          043927
+saddle brown                                    8B4513
+safety orange                                   FF7800
+safety orange blaze orange                      FF6700
+safety yellow                                   EED202
+saffron                                         F4C430
+sage                                            BCB88A
+st patrick-s blue                               23297A
+salmon                                          FA8072
+salmon pink                                     FF91A4
+sand                                            C2B280
+sand dune                                       967117
+sandy brown                                     F4A460
+sap green                                       507D2A
+sapphire                                        0F52BA
+sapphire blue                                   0067A5
+sapphire crayola                                2D5DA1
+satin sheen gold                                CBA135
+scarlet                                         FF2400
+schauss pink                                    FF91AF
+school bus yellow                               FFD800
+screamin green                                  66FF66
+sea green                                       2E8B57
+sea green crayola                               00FFCD
+seance                                          612086
+seal brown                                      59260B
+seashell                                        FFF5EE
+secret                                          764374
+selective yellow                                FFBA00
+sepia                                           704214
+shadow                                          8A795D
+shadow blue                                     778BA5
+shamrock green                                  009E60
+sheen green                                     8FD400
+shimmering blush                                D98695
+shiny shamrock                                  5FA778
+shocking pink                                   FC0FC0
+shocking pink crayola                           FF6FFF
+sienna                                          882D17
+silver                                          C0C0C0
+silver crayola                                  C9C0BB
+silver metallic                                 AAA9AD
+silver chalice                                  ACACAC
+silver pink                                     C4AEAD
+silver sand                                     BFC1C2
+sinopia                                         CB410B
+sizzling red                                    FF3855
+sizzling sunrise                                FFDB00
+skobeloff                                       007474
+sky blue                                        87CEEB
+sky blue crayola                                76D7EA
+sky magenta                                     CF71AF
+slate blue                                      6A5ACD
+slate gray                                      708090
+slimy green                                     299617
+smitten                                         C84186
+smoky black                                     100C08
+snow                                            FFFAFA
+solid pink                                      893843
+sonic silver                                    757575
+space cadet                                     1D2951
+spanish bistre                                  807532
+spanish blue                                    0070B8
+spanish carmine                                 D10047
+spanish gray                                    989898
+spanish green                                   009150
+spanish orange                                  E86100
+spanish pink                                    F7BFBE
+spanish red                                     E60026
+spanish sky blue                                00FFFE
+spanish violet                                  4C2882
+spanish viridian                                007F5C
+spring bud                                      A7FC00
+spring frost                                    87FF2A
+spring green                                    00FF7F
+spring green crayola                            ECEBBD
+star command blue                               007BB8
+steel blue                                      4682B4
+steel pink                                      CC33CC
+stil de grain yellow                            FADA5E
+straw                                           E4D96F
+strawberry                                      FA5053
+strawberry blonde                               FF9361
+strong lime green                               33CC33
+sugar plum                                      914E75
+sunglow                                         FFCC33
+sunray                                          E3AB57
+sunset                                          FAD6A5
+super pink                                      CF6BA9
+sweet brown                                     A83731
+syracuse orange                                 D44500
+tan                                             D2B48C
+tan crayola                                     D99A6C
+tangerine                                       F28500
+tango pink                                      E4717A
+tart orange                                     FB4D46
+taupe                                           483C32
+taupe gray                                      8B8589
+tea green                                       D0F0C0
+tea rose                                        F4C2C2
+teal                                            008080
+teal blue                                       367588
+technobotanica                                  00FFBF
+telemagenta                                     CF3476
+tenné tawny                                     CD5700
+terra cotta                                     E2725B
+thistle                                         D8BFD8
+thulian pink                                    DE6FA1
+tickle me pink                                  FC89AC
+tiffany blue                                    0ABAB5
+timberwolf                                      DBD7D2
+titanium yellow                                 EEE600
+tomato                                          FF6347
+tourmaline                                      86A1A9
+tropical rainforest                             00755E
+true blue                                       2D68C4
+trypan blue                                     1C05B3
+tufts blue                                      3E8EDE
+tumbleweed                                      DEAA88
+turquoise                                       40E0D0
+turquoise blue                                  00FFEF
+turquoise green                                 A0D6B4
+turtle green                                    8A9A5B
+tuscan                                          FAD6A5
+tuscan brown                                    6F4E37
+tuscan red                                      7C4848
+tuscan tan                                      A67B5B
+tuscany                                         C09999
+twilight lavender                               8A496B
+tyrian purple                                   66023C
+ua blue                                         0033AA
+ua red                                          D9004C
+ultramarine                                     3F00FF
+ultramarine blue                                4166F5
+ultra pink                                      FF6FFF
+ultra red                                       FC6C85
+umber                                           635147
+unbleached silk                                 FFDDCA
+united nations blue                             009EDB
+university of pennsylvania red                  A50021
+unmellow yellow                                 FFFF66
+up forest green                                 014421
+up maroon                                       7B1113
+upsdell red                                     AE2029
+uranian blue                                    AFDBF5
+usafa blue                                      004F98
+van dyke brown                                  664228
+vanilla                                         F3E5AB
+vanilla ice                                     F38FA9
+vegas gold                                      C5B358
+venetian red                                    C80815
+verdigris                                       43B3AE
+vermilion                                       E34234
+vermilion 2                                     D9381E
+veronica                                        A020F0
+very dark gray                                  121212
+very dark grey                                  1A1A1A
+violet                                          8F00FF
+violet color wheel                              7F00FF
+violet crayola                                  963D7F
+violet ryb                                      8601AF
+violet web                                      EE82EE
+violet-blue                                     324AB2
+violet-blue crayola                             766EC8
+violet-red                                      F75394
+violet-redperbang                               F0599C
+viridian                                        40826D
+viridian green                                  009698
+vivid burgundy                                  9F1D35
+vivid sky blue                                  00CCFF
+vivid tangerine                                 FFA089
+vivid violet                                    9F00FF
+volt                                            CEFF00
+warm black                                      004242
+weezy blue                                      189BCC
+wheat                                           F5DEB3
+white                                           FFFFFF
+wild blue yonder                                A2ADD0
+wild orchid                                     D470A2
+wild strawberry                                 FF43A4
+wild watermelon                                 FC6C85
+windsor tan                                     A75502
+wine                                            722F37
+wine dregs                                      673147
+winter sky                                      FF007C
+wintergreen dream                               56887D
+wisteria                                        C9A0DC
+wood brown                                      C19A6B
+xanadu                                          738678
+xanthic                                         EEED09
+xanthous                                        F1B42F
+yale blue                                       00356B
+yellow                                          FFFF00
+yellow crayola                                  FCE883
+yellow munsell                                  EFCC00
+yellow ncs                                      FFD300
+yellow pantone                                  FEDF00
+yellow process                                  FFEF00
+yellow ryb                                      FEFE33
+yellow-green                                    9ACD32
+yellow-green crayola                            C5E384
+yellow-green color wheel                        30B21A
+yellow orange                                   FFAE42
+yellow orange color wheel                       FF9505
+yellow sunshine                                 FFF700
+yinmn blue                                      2E5090
+zaffre                                          0014A8
+zinnwaldite brown                               2C1608
+zomp                                            39A78E
 """
-COLORS_DICT: dict[str, Color] = {
-
-    "absolute zero":                                Color(  0,  72, 186, 255),     #0048BA    rgba(   0,  72, 186, 255)
-    "acid green":                                   Color(176, 191,  26, 255),     #B0BF1A    rgba( 176, 191,  26, 255)
-    "aero":                                         Color(124, 185, 232, 255),     #7CB9E8    rgba( 124, 185, 232, 255)
-    "african violet":                               Color(178, 132, 190, 255),     #B284BE    rgba( 178, 132, 190, 255)
-    "air superiority blue":                         Color(114, 160, 193, 255),     #72A0C1    rgba( 114, 160, 193, 255)
-    "alice blue":                                   Color(240, 248, 255, 255),     #F0F8FF    rgba( 240, 248, 255, 255)
-    "alizarin":                                     Color(219,  45,  67, 255),     #DB2D43    rgba( 219,  45,  67, 255)
-    "alloy orange":                                 Color(196,  98,  16, 255),     #C46210    rgba( 196,  98,  16, 255)
-    "almond":                                       Color(238, 217, 196, 255),     #EED9C4    rgba( 238, 217, 196, 255)
-    "amaranth deep purple":                         Color(159,  43, 104, 255),     #9F2B68    rgba( 159,  43, 104, 255)
-    "amaranth pink":                                Color(241, 156, 187, 255),     #F19CBB    rgba( 241, 156, 187, 255)
-    "amaranth purple":                              Color(171,  39,  79, 255),     #AB274F    rgba( 171,  39,  79, 255)
-    "amazon":                                       Color( 59, 122,  87, 255),     #3B7A57    rgba(  59, 122,  87, 255)
-    "amber":                                        Color(255, 191,   0, 255),     #FFBF00    rgba( 255, 191,   0, 255)
-    "amethyst":                                     Color(153, 102, 204, 255),     #9966CC    rgba( 153, 102, 204, 255)
-    "android green":                                Color( 61, 220, 132, 255),     #3DDC84    rgba(  61, 220, 132, 255)
-    "antique brass":                                Color(200, 138, 101, 255),     #C88A65    rgba( 200, 138, 101, 255)
-    "antique bronze":                               Color(102,  93,  30, 255),     #665D1E    rgba( 102,  93,  30, 255)
-    "antique fuchsia":                              Color(145,  92, 131, 255),     #915C83    rgba( 145,  92, 131, 255)
-    "antique ruby":                                 Color(132,  27,  45, 255),     #841B2D    rgba( 132,  27,  45, 255)
-    "antique white":                                Color(250, 235, 215, 255),     #FAEBD7    rgba( 250, 235, 215, 255)
-    "apricot":                                      Color(251, 206, 177, 255),     #FBCEB1    rgba( 251, 206, 177, 255)
-    "aqua":                                         Color(  0, 255, 255, 255),     #00FFFF    rgba(   0, 255, 255, 255)
-    "aquamarine":                                   Color(127, 255, 212, 255),     #7FFFD4    rgba( 127, 255, 212, 255)
-    "arctic lime":                                  Color(208, 255,  20, 255),     #D0FF14    rgba( 208, 255,  20, 255)
-    "artichoke green":                              Color( 75, 111,  68, 255),     #4B6F44    rgba(  75, 111,  68, 255)
-    "arylide yellow":                               Color(233, 214, 107, 255),     #E9D66B    rgba( 233, 214, 107, 255)
-    "ash gray":                                     Color(178, 190, 181, 255),     #B2BEB5    rgba( 178, 190, 181, 255)
-    "atomic tangerine":                             Color(255, 153, 102, 255),     #FF9966    rgba( 255, 153, 102, 255)
-    "aureolin":                                     Color(253, 238,   0, 255),     #FDEE00    rgba( 253, 238,   0, 255)
-    "azure":                                        Color(  0, 127, 255, 255),     #007FFF    rgba(   0, 127, 255, 255)
-    "azure web":                                    Color(240, 255, 255, 255),     #F0FFFF    rgba( 240, 255, 255, 255)
-
-    "baby blue":                                    Color(137, 207, 240, 255),     #89CFF0    rgba( 137, 207, 240, 255)
-    "baby blue eyes":                               Color(161, 202, 241, 255),     #A1CAF1    rgba( 161, 202, 241, 255)
-    "baby pink":                                    Color(244, 194, 194, 255),     #F4C2C2    rgba( 244, 194, 194, 255)
-    "baby powder":                                  Color(254, 254, 250, 255),     #FEFEFA    rgba( 254, 254, 250, 255)
-    "baker-miller pink":                            Color(255, 145, 175, 255),     #FF91AF    rgba( 255, 145, 175, 255)
-    "banana mania":                                 Color(250, 231, 181, 255),     #FAE7B5    rgba( 250, 231, 181, 255)
-    "barbie pink":                                  Color(218,  24, 132, 255),     #DA1884    rgba( 218,  24, 132, 255)
-    "barn red":                                     Color(124,  10,   2, 255),     #7C0A02    rgba( 124,  10,   2, 255)
-    "battleship grey":                              Color(132, 132, 130, 255),     #848482    rgba( 132, 132, 130, 255)
-    "beau blue":                                    Color(188, 212, 230, 255),     #BCD4E6    rgba( 188, 212, 230, 255)
-    "beaver":                                       Color(159, 129, 112, 255),     #9F8170    rgba( 159, 129, 112, 255)
-    "beige":                                        Color(245, 245, 220, 255),     #F5F5DC    rgba( 245, 245, 220, 255)
-    "b-dazzled blue":                               Color( 46,  88, 148, 255),     #2E5894    rgba(  46,  88, 148, 255)
-    "big dip o-ruby":                               Color(156,  37,  66, 255),     #9C2542    rgba( 156,  37,  66, 255)
-    "bisque":                                       Color(255, 228, 196, 255),     #FFE4C4    rgba( 255, 228, 196, 255)
-    "bistre":                                       Color( 61,  43,  31, 255),     #3D2B1F    rgba(  61,  43,  31, 255)
-    "bistre brown":                                 Color(150, 113,  23, 255),     #967117    rgba( 150, 113,  23, 255)
-    "bitter lemon":                                 Color(202, 224,  13, 255),     #CAE00D    rgba( 202, 224,  13, 255
-    "black":                                        Color(  0,   0,   0, 255),     #000000    rgba(   0,   0,   0, 255)
-    "black bean":                                   Color( 61,  12,   2, 255),     #3D0C02    rgba(  61,  12,   2, 255)
-    "black coral":                                  Color( 84,  98, 111, 255),     #54626F    rgba(  84,  98, 111, 255)
-    "black olive":                                  Color( 59,  60,  54, 255),     #3B3C36    rgba(  59,  60,  54, 255)
-    "black shadows":                                Color(191, 175, 178, 255),     #BFAFB2    rgba( 191, 175, 178, 255)
-    "blanched almond":                              Color(255, 235, 205, 255),     #FFEBCD    rgba( 255, 235, 205, 255)
-    "blast-off bronze":                             Color(165, 113, 100, 255),     #A57164    rgba( 165, 113, 100, 255)
-    "bleu de france":                               Color( 49, 140, 231, 255),     #318CE7    rgba(  49, 140, 231, 255)
-    "blizzard blue":                                Color(172, 229, 238, 255),     #ACE5EE    rgba( 172, 229, 238, 255)
-    "blood red":                                    Color(102,   0,   0, 255),     #660000    rgba( 102,   0,   0, 255)
-    "blue":                                         Color(  0,   0, 255, 255),     #0000FF    rgba(   0,   0, 255, 255)
-    "blue crayola":                                 Color( 31, 117, 254, 255),     #1F75FE    rgba(  31, 117, 254, 255)
-    "blue munsell":                                 Color(  0, 147, 175, 255),     #0093AF    rgba(   0, 147, 175, 255)
-    "blue ncs":                                     Color(  0, 135, 189, 255),     #0087BD    rgba(   0, 135, 189, 255)
-    "blue pantone":                                 Color(  0,  24, 168, 255),     #0018A8    rgba(   0,  24, 168, 255)
-    "blue pigment":                                 Color( 51,  51, 153, 255),     #333399    rgba(  51,  51, 153, 255)
-    "blue bell":                                    Color(162, 162, 208, 255),     #A2A2D0    rgba( 162, 162, 208, 255)
-    "blue gray":                                    Color(102, 153, 204, 255),     #6699CC    rgba( 102, 153, 204, 255)
-    "blue jeans":                                   Color( 93, 173, 236, 255),     #5DADEC    rgba(  93, 173, 236, 255)
-    "blue saphire":                                 Color( 18,  97, 128, 255),     #126180    rgba(  18,  97, 128, 255)
-    "blue violet":                                  Color(138,  43, 226, 255),     #8A2BE2    rgba( 138,  43, 226, 255)
-    "blue yonder":                                  Color( 80, 114, 167, 255),     #5072A7    rgba(  80, 114, 167, 255)
-    "bluetiful":                                    Color( 60, 105, 231, 255),     #3C69E7    rgba(  60, 105, 231, 255)
-    "blush":                                        Color(222,  93, 131, 255),     #DE5D83    rgba( 222,  93, 131, 255)
-    "bole":                                         Color(121,  68,  59, 255),     #79443B    rgba( 121,  68,  59, 255)
-    "bone":                                         Color(227, 218, 201, 255),     #E3DAC9    rgba( 227, 218, 201, 255)
-    "brick red":                                    Color(203,  65,  84, 255),     #CB4154    rgba( 203,  65,  84, 255)
-    "bright liliac":                                Color(216, 145, 239, 255),     #D891EF    rgba( 216, 145, 239, 255)
-    "bright yellow":                                Color(255, 170,  29, 255),     #FFAA1D    rgba( 255, 170,  29, 255)
-    "british racing green":                         Color(  0,  66,  37, 255),     #004225    rgba(   0,  66,  37, 255)
-    "bronze":                                       Color(205, 127,  50, 255),     #CD7F32    rgba( 205, 127,  50, 255)
-    "brown":                                        Color(150,  75,   0, 255),     #964B00    rgba( 150,  75,   0, 255)
-    "brown sugar":                                  Color(175, 110,  77, 255),     #AF6E4D    rgba( 175, 110,  77, 255)
-    "bud green":                                    Color(123, 182,  97, 255),     #7BB661    rgba( 123, 182,  97, 255)
-    "buff":                                         Color(255, 198, 128, 255),     #FFC680    rgba( 255, 198, 128, 255)
-    "burgundy":                                     Color(128,   0,  32, 255),     #800020    rgba( 128,   0,  32, 255)
-    "burlywood":                                    Color(222, 184, 135, 255),     #DEB887    rgba( 222, 184, 135, 255)
-    "burnished brown":                              Color(161, 122, 116, 255),     #A17A74    rgba( 161, 122, 116, 255)
-    "burnt orange":                                 Color(204,  85,   0, 255),     #CC5500    rgba( 204,  85,   0, 255)
-    "burnt sienna":                                 Color(233, 116,  81, 255),     #E97451    rgba( 233, 116,  81, 255)
-    "burnt umber":                                  Color(138,  51,  36, 255),     #8A3324    rgba( 138,  51,  36, 255)
-    "byzantine":                                    Color(189,  51, 164, 255),     #BD33A4    rgba( 189,  51, 164, 255)
-    "byzantium":                                    Color(112,  41,  99, 255),     #702963    rgba( 112,  41,  99, 255)
-
-    "cadet blue":                                   Color( 95, 158, 160, 255),     #5F9EA0    rgba(  95, 158, 160, 255)
-    "cadet grey":                                   Color(145, 163, 176, 255),     #91A3B0    rgba( 145, 163, 176, 255)
-    "cadmium green":                                Color(  0, 107,  60, 255),     #006B3C    rgba(   0, 107,  60, 255)
-    "cadmium orange":                               Color(237, 135,  45, 255),     #ED872D    rgba( 237, 135,  45, 255)
-    "cafe au lait":                                 Color(166, 123,  91, 255),     #A67B5B    rgba( 166, 123,  91, 255)
-    "cafe noir":                                    Color( 75,  54,  33, 255),     #4B3621    rgba(  75,  54,  33, 255)
-    "cambridge blue":                               Color(163, 193, 173, 255),     #A3C1AD    rgba( 163, 193, 173, 255)
-    "camel":                                        Color(193, 154, 107, 255),     #C19A6B    rgba( 193, 154, 107, 255)
-    "cameo pink":                                   Color(239, 187, 204, 255),     #EFBBCC    rgba( 239, 187, 204, 255)
-    "canary":                                       Color(255, 255, 153, 255),     #FFFF99    rgba( 255, 255, 153, 255)
-    "canary yellow":                                Color(255, 239,   0, 255),     #FFEF00    rgba( 255, 239,   0, 255)
-    "candy pink":                                   Color(228, 113, 122, 255),     #E4717A    rgba( 228, 113, 122, 255)
-    "cardinal":                                     Color(196,  30,  58, 255),     #C41E3A    rgba( 196,  30,  58, 255)
-    "caribbean green":                              Color(  0, 204, 153, 255),     #00CC99    rgba(   0, 204, 153, 255)
-    "carmine":                                      Color(150,   0,  24, 255),     #960018    rgba( 150,   0,  24, 255)
-    "carmine m&p":                                  Color(215,   0,  64, 255),     #D70040    rgba( 215,   0,  64, 255)
-    "carnation pink":                               Color(255, 166, 201, 255),     #FFA6C9    rgba( 255, 166, 201, 255)
-    "carnelian":                                    Color(179,  27,  27, 255),     #B31B1B    rgba( 179,  27,  27, 255)
-    "carolina blue":                                Color( 86, 160, 211, 255),     #56A0D3    rgba(  86, 160, 211, 255)
-    "carrot orange":                                Color(237, 145,  33, 255),     #ED9121    rgba( 237, 145,  33, 255)
-    "catawba":                                      Color(112,  54,  66, 255),     #703642    rgba( 112,  54,  66, 255)
-    "cedar chest":                                  Color(201,  90,  73, 255),     #C95A49    rgba( 201,  90,  73, 255)
-    "celadon":                                      Color(172, 225, 175, 255),     #ACE1AF    rgba( 172, 225, 175, 255)
-    "celeste":                                      Color(178, 255, 255, 255),     #B2FFFF    rgba( 178, 255, 255, 255)
-    "cerise":                                       Color(222,  49,  99, 255),     #DE3163    rgba( 222,  49,  99, 255
-    "cerulean":                                     Color(  0, 123, 167, 255),     #007BA7    rgba(   0, 123, 167, 255)
-    "cerulean blue":                                Color( 42,  82, 190, 255),     #2A52BE    rgba(  42,  82, 190, 255)
-    "cerulean frost":                               Color(109, 155, 195, 255),     #6D9BC3    rgba( 109, 155, 195, 255)
-    "cerulean crayola":                             Color( 29, 172, 214, 255),     #1DACD6    rgba(  29, 172, 214, 255)
-    "cerulean rgb":                                 Color(  0,  64, 255, 255),     #0040FF    rgba(   0,  64, 255, 255)
-    "champagne":                                    Color(247, 231, 206, 255),     #F7E7CE    rgba( 247, 231, 206, 255)
-    "champagne pink":                               Color(241, 221, 207, 255),     #F1DDCF    rgba( 241, 221, 207, 255)
-    "charcoal":                                     Color( 54,  69,  79, 255),     #36454F    rgba(  54,  69,  79, 255)
-    "charm pink":                                   Color(230, 143, 172, 255),     #E68FAC    rgba( 230, 143, 172, 255)
-    "chartreuse":                                   Color(128, 255,   0, 255),     #80FF00    rgba( 128, 255,   0, 255)
-    "cherry blossom pink":                          Color(255, 183, 197, 255),     #FFB7C5    rgba( 255, 183, 197, 255)
-    "chestnut":                                     Color(149,  69,  53, 255),     #954535    rgba( 149,  69,  53, 255)
-    "chili red":                                    Color(226,  61,  40, 255),     #E23D28    rgba( 226,  61,  40, 255)
-    "china pink":                                   Color(222, 111, 161, 255),     #DE6FA1    rgba( 222, 111, 161, 255)
-    "chinese red":                                  Color(170,  56,  30, 255),     #AA381E    rgba( 170,  56,  30, 255)
-    "chinese violet":                               Color(133,  96, 136, 255),     #856088    rgba( 133,  96, 136, 255)
-    "chinese yellow":                               Color(255, 178,   0, 255),     #FFB200    rgba( 255, 178,   0, 255)
-    "chocolate":                                    Color(123,  63,   0, 255),     #7B3F00    rgba( 123,  63,   0, 255)
-    "chocolate web":                                Color(210, 105,  30, 255),     #D2691E    rgba( 210, 105,  30, 255)
-    "cinereous":                                    Color(152, 129, 123, 255),     #98817B    rgba( 152, 129, 123, 255)
-    "cinnabar":                                     Color(227,  66,  52, 255),     #E34234    rgba( 227,  66,  52, 255)
-    "cinnamon satin":                               Color(205,  96, 126, 255),     #CD607E    rgba( 205,  96, 126, 255)
-    "citrine":                                      Color(228, 208,  10, 255),     #E4D00A    rgba( 228, 208,  10, 255)
-    "citron":                                       Color(159, 169,  31, 255),     #9FA91F    rgba( 159, 169,  31, 255)
-    "claret":                                       Color(127,  23,  52, 255),     #7F1734    rgba( 127,  23,  52, 255)
-    "coffee":                                       Color(111,  78,  55, 255),     #6F4E37    rgba( 111,  78,  55, 255)
-    "columbia blue":                                Color(185, 217, 235, 255),     #B9D9EB    rgba( 185, 217, 235, 255)
-    "congo pink":                                   Color(248, 131, 121, 255),     #F88379    rgba( 248, 131, 121, 255)
-    "cool grey":                                    Color(140, 146, 172, 255),     #8C92AC    rgba( 140, 146, 172, 255)
-    "copper":                                       Color(184, 115,  51, 255),     #B87333    rgba( 184, 115,  51, 255)
-    "copper crayola":                               Color(218, 138, 103, 255),     #DA8A67    rgba( 218, 138, 103, 255)
-    "copper penny":                                 Color(173, 111, 105, 255),     #AD6F69    rgba( 173, 111, 105, 255)
-    "copper red":                                   Color(203, 109,  81, 255),     #CB6D51    rgba( 203, 109,  81, 255)
-    "coper rose":                                   Color(153, 102, 102, 255),     #996666    rgba( 153, 102, 102, 255)
-    "coquelicot":                                   Color(255,  56,   0, 255),     #FF3800    rgba( 255,  56,   0, 255)
-    "coral":                                        Color(255, 127,  80, 255),     #FF7F50    rgba( 255, 127,  80, 255)
-    "coral pink":                                   Color(248, 131, 121, 255),     #F88379    rgba( 248, 131, 121, 255)
-    "cordovan":                                     Color(137,  63,  69, 255),     #893F45    rgba( 137,  63,  69, 255)
-    "corn":                                         Color(251, 236,  93, 255),     #FBEC5D    rgba( 251, 236,  93, 255)
-    "cornflower blue":                              Color(100, 149, 237, 255),     #6495ED    rgba( 100, 149, 237, 255)
-    "cornsilk":                                     Color(255, 248, 220, 255),     #FFF8DC    rgba( 255, 248, 220, 255)
-    "cosmic cobalt":                                Color( 46,  45, 136, 255),     #2E2D88    rgba(  46,  45, 136, 255)
-    "cosmic latte":                                 Color(255, 248, 231, 255),     #FFF8E7    rgba( 255, 248, 231, 255)
-    "coyote brown":                                 Color(129,  97,  60, 255),     #81613C    rgba( 129,  97,  60, 255)
-    "cotton candy":                                 Color(255, 188, 217, 255),     #FFBCD9    rgba( 255, 188, 217, 255)
-    "cream":                                        Color(255, 253, 208, 255),     #FFFDD0    rgba( 255, 253, 208, 255)
-    "crimson":                                      Color(220,  20,  60, 255),     #DC143C    rgba( 220,  20,  60, 255)
-    "crimson ua":                                   Color(158,  27,  50, 255),     #9E1B32    rgba( 158,  27,  50, 255)
-    "cultured pearl":                               Color(245, 245, 245, 255),     #F5F5F5    rgba( 245, 245, 245, 255)
-    "cyan":                                         Color(  0, 255, 255, 255),     #00FFFF    rgba(   0, 255, 255, 255)
-    "cyan process":                                 Color(  0, 183, 235, 255),     #00B7EB    rgba(   0, 183, 235, 255)
-    "cyber grape":                                  Color( 88,  66, 124, 255),     #58427C    rgba(  88,  66, 124, 255)
-    "cyber yellow":                                 Color(255, 211,   0, 255),     #FFD300    rgba( 255, 211,   0, 255)
-    "cyclamen":                                     Color(245, 111, 161, 255),     #F56FA1    rgba( 245, 111, 161, 255)
-
-    "dandelion":                                    Color(254, 216,  93, 255),     #FED85D    rgba( 254, 216,  93, 255)
-    "dark brown":                                   Color(101,  67,  33, 255),     #654321    rgba( 101,  67,  33, 255)
-    "dark byzantium":                               Color( 93,  57,  84, 255),     #5D3954    rgba(  93,  57,  84, 255)
-    "dark cyan":                                    Color(  0, 139, 139, 255),     #008B8B    rgba(   0, 139, 139, 255)
-    "dark electric blue":                           Color( 83, 104, 120, 255),     #536878    rgba(  83, 104, 120, 255)
-    "dark goldenrod":                               Color(184, 134,  11, 255),     #B8860B    rgba( 184, 134,  11, 255)
-    "dark green":                                   Color(  0, 100,   0, 255),     #006400    rgba(   0, 100,   0, 255)
-    "dark gray":                                    Color( 50,  50,  50, 255),     #323232    rgba(  50,  50,  50, 255)
-    "dark grey":                                    Color( 70,  70,  70, 255),     #323232    rgba(  50,  50,  50, 255)
-    "dark jungle green":                            Color( 26,  36,  33, 255),     #1A2421    rgba(  26,  36,  33, 255)
-    "dark khaki":                                   Color(189, 183, 107, 255),     #BDB76B    rgba( 189, 183, 107, 255)
-    "dark lava":                                    Color( 72,  60,  50, 255),     #483C32    rgba(  72,  60,  50, 255)
-    "dark liver":                                   Color( 84,  61,  55, 255),     #543D37    rgba(  84,  61,  55, 255)
-    "dark magenta":                                 Color(139,   0, 139, 255),     #8B008B    rgba( 139,   0, 139, 255)
-    "dark olive green":                             Color( 85, 107,  47, 255),     #556B2F    rgba(  85, 107,  47, 255)
-    "dark orange":                                  Color(255, 140,   0, 255),     #FF8C00    rgba( 255, 140,   0, 255)
-    "dark orchid":                                  Color(153,  50, 204, 255),     #9932CC    rgba( 153,  50, 204, 255)
-    "dark purple":                                  Color( 48,  25,  52, 255),     #301934    rgba(  48,  25,  52, 255)
-    "dark red":                                     Color(139,   0,   0, 255),     #8B0000    rgba( 139,   0,   0, 255)
-    "dark salmon":                                  Color(233, 150, 122, 255),     #E9967A    rgba( 233, 150, 122, 255)
-    "dark sea green":                               Color(143, 188, 143, 255),     #8FBC8F    rgba( 143, 188, 143, 255)
-    "dark sienna":                                  Color( 60,  20,  20, 255),     #3C1414    rgba(  60,  20,  20, 255)
-    "dark sky blue":                                Color(140, 190, 214, 255),     #8CBED6    rgba( 140, 190, 214, 255)
-    "dark slate blue":                              Color( 72,  61, 139, 255),     #483D8B    rgba(  72,  61, 139, 255)
-    "dark slate gray":                              Color( 47,  79,  79, 255),     #2F4F4F    rgba(  47,  79,  79, 255)
-    "dark spring green":                            Color( 23, 114,  69, 255),     #177245    rgba(  23, 114,  69, 255)
-    "dark turquoise":                               Color(  0, 206, 209, 255),     #00CED1    rgba(   0, 206, 209, 255)
-    "dark violet":                                  Color(148,   0, 211, 255),     #9400D3    rgba( 148,   0, 211, 255)
-    "davy-s grey":                                  Color( 85,  85,  85, 255),     #555555    rgba(  85,  85,  85, 255)
-    "deep cerise":                                  Color(218,  50, 135, 255),     #DA3287    rgba( 218,  50, 135, 255)
-    "deep champagne":                               Color(250, 214, 165, 255),     #FAD6A5    rgba( 250, 214, 165, 255)
-    "deep chestnut":                                Color(185,  78,  72, 255),     #B94E48    rgba( 185,  78,  72, 255)
-    "deep jungle green":                            Color(  0,  75,  73, 255),     #004B49    rgba(   0,  75,  73, 255)
-    "deep pink":                                    Color(255,  20, 147, 255),     #FF1493    rgba( 255,  20, 147, 255)
-    "deep saffron":                                 Color(255, 153,  51, 255),     #FF9933    rgba( 255, 153,  51, 255)
-    "deep sky blue":                                Color(  0, 191, 255, 255),     #00BFFF    rgba(   0, 191, 255, 255)
-    "deep Space Sparkle":                           Color( 74, 100, 108, 255),     #4A646C    rgba(  74, 100, 108, 255)
-    "deep taupe":                                   Color(126,  94,  96, 255),     #7E5E60    rgba( 126,  94,  96, 255)
-    "denim":                                        Color( 21,  96, 189, 255),     #1560BD    rgba(  21,  96, 189, 255)
-    "denim blue":                                   Color( 34,  67, 182, 255),     #2243B6    rgba(  34,  67, 182, 255)
-    "desert":                                       Color(193, 154, 107, 255),     #C19A6B    rgba( 193, 154, 107, 255)
-    "desert sand":                                  Color(237, 201, 175, 255),     #EDC9AF    rgba( 237, 201, 175, 255)
-    "dim gray":                                     Color(105, 105, 105, 255),     #696969    rgba( 105, 105, 105, 255)
-    "dodger blue":                                  Color( 30, 144, 255, 255),     #1E90FF    rgba(  30, 144, 255, 255)
-    "drab dark brown":                              Color( 74,  65,  42, 255),     #4A412A    rgba(  74,  65,  42, 255)
-    "duke blue":                                    Color(  0,   0, 156, 255),     #00009C    rgba(   0,   0, 156, 255)
-    "dutch white":                                  Color(239, 223, 187, 255),     #EFDFBB    rgba( 239, 223, 187, 255)
-
-    "ebony":                                        Color( 85,  93,  80, 255),     #555D50    rgba(  85,  93,  80, 255)
-    "ecru":                                         Color(194, 178, 128, 255),     #C2B280    rgba( 194, 178, 128, 255)
-    "eerie black":                                  Color( 27,  27,  27, 255),     #1B1B1B    rgba(  27,  27,  27, 255)
-    "eggplant":                                     Color( 97,  64,  81, 255),     #614051    rgba(  97,  64,  81, 255)
-    "eggshell":                                     Color(240, 234, 214, 255),     #F0EAD6    rgba( 240, 234, 214, 255)
-    "electric lime":                                Color(204, 255,   0, 255),     #CCFF00    rgba( 204, 255,   0, 255)
-    "electric purple":                              Color(191,   0, 255, 255),     #BF00FF    rgba( 191,   0, 255, 255)
-    "electric violet":                              Color(143,   0, 255, 255),     #8F00FF    rgba( 143,   0, 255, 255)
-    "emerald":                                      Color( 80, 200, 120, 255),     #50C878    rgba(  80, 200, 120, 255)
-    "eminence":                                     Color(108,  48, 130, 255),     #6C3082    rgba( 108,  48, 130, 255)
-    "english lavender":                             Color(180, 131, 149, 255),     #B48395    rgba( 180, 131, 149, 255)
-    "english red":                                  Color(171,  75,  82, 255),     #AB4B52    rgba( 171,  75,  82, 255)
-    "english vermillion":                           Color(204,  71,  75, 255),     #CC474B    rgba( 204,  71,  75, 255)
-    "english violet":                               Color( 86,  60,  92, 255),     #563C5C    rgba(  86,  60,  92, 255)
-    "erin":                                         Color(  0, 255,  64, 255),     #00FF40    rgba(   0, 255,  64, 255)
-    "eton blue":                                    Color(150, 200, 162, 255),     #96C8A2    rgba( 150, 200, 162, 255)
-
-    "fallow":                                       Color(193, 154, 107, 255),     #C19A6B    rgba( 193, 154, 107, 255)
-    "falu red":                                     Color(128,  24,  24, 255),     #801818    rgba( 128,  24,  24, 255)
-    "fandango":                                     Color(181,  51, 137, 255),     #B53389    rgba( 181,  51, 137, 255)
-    "fandango pink":                                Color(222,  82, 133, 255),     #DE5285    rgba( 222,  82, 133, 255)
-    "fawn":                                         Color(229, 170, 112, 255),     #E5AA70    rgba( 229, 170, 112, 255)
-    "fern green":                                   Color( 79, 121,  66, 255),     #4F7942    rgba(  79, 121,  66, 255)
-    "field drab":                                   Color(108,  84,  30, 255),     #6C541E    rgba( 108,  84,  30, 255)
-    "fiery rose":                                   Color(255,  84, 112, 255),     #FF5470    rgba( 255,  84, 112, 255)
-    "finn":                                         Color(104,  48, 104, 255),     #683068    rgba( 104,  48, 104, 255)
-    "firebrick":                                    Color(178,  34,  34, 255),     #B22222    rgba( 178,  34,  34, 255)
-    "fire engine red":                              Color(206,  32,  41, 255),     #CE2029    rgba( 206,  32,  41, 255)
-    "flame":                                        Color(226,  88,  34, 255),     #E25822    rgba( 226,  88,  34, 255)
-    "flax":                                         Color(238, 220, 130, 255),     #EEDC82    rgba( 238, 220, 130, 255)
-    "flirt":                                        Color(162,   0, 109, 255),     #A2006D    rgba( 162,   0, 109, 255)
-    "floral white":                                 Color(255, 250, 240, 255),     #FFFAF0    rgba( 255, 250, 240, 255)
-    "forest green":                                 Color( 34, 139,  34, 255),     #228B22    rgba(  34, 139,  34, 255)
-    "french beige":                                 Color(166, 123,  91, 255),     #A67B5B    rgba( 166, 123,  91, 255)
-    "french bistre":                                Color(133, 109,  77, 255),     #856D4D    rgba( 133, 109,  77, 255)
-    "french blue":                                  Color(  0, 114, 187, 255),     #0072BB    rgba(   0, 114, 187, 255)
-    "french fuchsia":                               Color(253,  63, 146, 255),     #FD3F92    rgba( 253,  63, 146, 255)
-    "french lilac":                                 Color(134,  96, 142, 255),     #86608E    rgba( 134,  96, 142, 255)
-    "french lime":                                  Color(158, 253,  56, 255),     #9EFD38    rgba( 158, 253,  56, 255)
-    "french mauve":                                 Color(212, 115, 212, 255),     #D473D4    rgba( 212, 115, 212, 255)
-    "french pink":                                  Color(253, 108, 158, 255),     #FD6C9E    rgba( 253, 108, 158, 255)
-    "french raspberry":                             Color(199,  44,  72, 255),     #C72C48    rgba( 199,  44,  72, 255)
-    "french sky blue":                              Color(119, 181, 254, 255),     #77B5FE    rgba( 119, 181, 254, 255)
-    "french violet":                                Color(136,   6, 206, 255),     #8806CE    rgba( 136,   6, 206, 255)
-    "frostbite":                                    Color(233,  54, 167, 255),     #E936A7    rgba( 233,  54, 167, 255)
-    "fuchsia":                                      Color(255,   0, 255, 255),     #FF00FF    rgba( 255,   0, 255, 255)
-    "fuchsia  crayola":                             Color(193,  84, 193, 255),     #C154C1    rgba( 193,  84, 193, 255)
-    "fulvous":                                      Color(228, 132,   0, 255),     #E48400    rgba( 228, 132,   0, 255)
-    "fuzzy wuzzy":                                  Color(135,  66,  31, 255),     #87421F    rgba( 135,  66,  31, 255)
-
-    "gainsboro":                                    Color(220, 220, 220, 255),     #DCDCDC     rgba( 220, 220, 220, 255)
-    "gamboge":                                      Color(228, 155,  15, 255),     #E49B0F     rgba( 228, 155,  15, 255)
-    "generic viridian":                             Color(  0, 127, 102, 255),     #007F66     rgba(   0, 127, 102, 255)
-    "ghost white":                                  Color(248, 248, 255, 255),     #F8F8FF     rgba( 248, 248, 255, 255)
-    "glaucous":                                     Color( 96, 130, 182, 255),     #6082B6     rgba(  96, 130, 182, 255)
-    "glossy grape":                                 Color(171, 146, 179, 255),     #AB92B3     rgba( 171, 146, 179, 255)
-    "go green":                                     Color(  0, 171, 102, 255),     #00AB66     rgba(   0, 171, 102, 255)
-    "gold metallic":                                Color(212, 175,  55, 255),     #D4AF37     rgba( 212, 175,  55, 255)
-    "gold web golden":                              Color(255, 215,   0, 255),     #FFD700     rgba( 255, 215,   0, 255)
-    "gold crayola":                                 Color(230, 190, 138, 255),     #E6BE8A     rgba( 230, 190, 138, 255)
-    "gold fusion":                                  Color(133, 117,  78, 255),     #85754E     rgba( 133, 117,  78, 255)
-    "golden brown":                                 Color(153, 101,  21, 255),     #996515     rgba( 153, 101,  21, 255)
-    "golden poppy":                                 Color(252, 194,   0, 255),     #FCC200     rgba( 252, 194,   0, 255)
-    "golden yellow":                                Color(255, 223,   0, 255),     #FFDF00     rgba( 255, 223,   0, 255)
-    "goldenrod":                                    Color(218, 165,  32, 255),     #DAA520     rgba( 218, 165,  32, 255)
-    "gotham green":                                 Color(  0,  87,  63, 255),     #00573F     rgba(   0,  87,  63, 255)
-    "granite gray":                                 Color(103, 103, 103, 255),     #676767     rgba( 103, 103, 103, 255)
-    "granny smith apple":                           Color(168, 228, 160, 255),     #A8E4A0     rgba( 168, 228, 160, 255)
-    "gray":                                         Color(128, 128, 128, 255),     #808080     rgba( 128, 128, 128, 255)
-    "grey":                                         Color(190, 190, 190, 255),     #BEBEBE     rgba( 190, 190, 190, 255)
-    "green":                                        Color(  0, 255,   0, 255),     #00FF00     rgba(   0, 255,   0, 255)
-    "green crayola":                                Color( 28, 172, 120, 255),     #1CAC78     rgba(  28, 172, 120, 255)
-    "green web":                                    Color(  0, 128,   0, 255),     #008000     rgba(   0, 128,   0, 255)
-    "green munsell":                                Color(  0, 168, 119, 255),     #00A877     rgba(   0, 168, 119, 255)
-    "green ncs":                                    Color(  0, 159, 107, 255),     #009F6B     rgba(   0, 159, 107, 255)
-    "green pantone":                                Color(  0, 173,  67, 255),     #00AD43     rgba(   0, 173,  67, 255)
-    "green pigment":                                Color(  0, 165,  80, 255),     #00A550     rgba(   0, 165,  80, 255)
-    "green-blue":                                   Color( 17, 100, 180, 255),     #1164B4     rgba(  17, 100, 180, 255)
-    "green lizard":                                 Color(167, 244,  50, 255),     #A7F432     rgba( 167, 244,  50, 255)
-    "green sheen":                                  Color(110, 174, 161, 255),     #6EAEA1     rgba( 110, 174, 161, 255)
-    "gunmetal":                                     Color( 42,  52,  57, 255),     #2a3439     rgba(  42,  52,  57, 255)
-
-    "hansa yellow":                                 Color(233, 214, 107, 255),     #E9D66B     rgba( 233, 214, 107, 255)
-    "harlequin":                                    Color( 63, 255,   0, 255),     #3FFF00     rgba(  63, 255,   0, 255)
-    "harvest gold":                                 Color(218, 145,   0, 255),     #DA9100     rgba( 218, 145,   0, 255)
-    "heat wave":                                    Color(255, 122,   0, 255),     #FF7A00     rgba( 255, 122,   0, 255)
-    "heliotrope":                                   Color(223, 115, 255, 255),     #DF73FF     rgba( 223, 115, 255, 255)
-    "heliotrope gray":                              Color(170, 152, 169, 255),     #AA98A9     rgba( 170, 152, 169, 255)
-    "hollywood cerise":                             Color(244,   0, 161, 255),     #F400A1     rgba( 244,   0, 161, 255)
-    "honolulu blue":                                Color(  0, 109, 176, 255),     #006DB0     rgba(   0, 109, 176, 255)
-    "hooker-s green":                               Color( 73, 121, 107, 255),     #49796B     rgba(  73, 121, 107, 255)
-    "hot magenta":                                  Color(255,  29, 206, 255),     #FF1DCE     rgba( 255,  29, 206, 255)
-    "hot pink":                                     Color(255, 105, 180, 255),     #FF69B4     rgba( 255, 105, 180, 255)
-    "hunter green":                                 Color( 53,  94,  59, 255),     #355E3B     rgba(  53,  94,  59, 255)
-
-    "iceberg":                                      Color(113, 166, 210, 255),     #71A6D2     rgba( 113, 166, 210, 255)
-    "illuminating emerald":                         Color( 49, 145, 119, 255),     #319177     rgba(  49, 145, 119, 255)
-    "imperial red":                                 Color(237,  41,  57, 255),     #ED2939     rgba( 237,  41,  57, 255)
-    "inchworm":                                     Color(178, 236,  93, 255),     #B2EC5D     rgba( 178, 236,  93, 255)
-    "independence":                                 Color( 76,  81, 109, 255),     #4C516D     rgba(  76,  81, 109, 255)
-    "india green":                                  Color( 19, 136,   8, 255),     #138808     rgba(  19, 136,   8, 255)
-    "indian red":                                   Color(205,  92,  92, 255),     #CD5C5C     rgba( 205,  92,  92, 255)
-    "indian yellow":                                Color(227, 168,  87, 255),     #E3A857     rgba( 227, 168,  87, 255)
-    "indigo":                                       Color(106,  93, 255, 255),     #6A5DFF     rgba( 106,  93, 255, 255)
-    "indigo dye":                                   Color(  0,  65, 106, 255),     #00416A     rgba(   0,  65, 106, 255)
-    "international klein blue":                     Color( 19,  10, 143, 255),     #130a8f     rgba(  19,  10, 143, 255)
-    "international orange engineering":             Color(186,  22,  12, 255),     #BA160C     rgba( 186,  22,  12, 255)
-    "international orange":                         Color(192,  54,  44, 255),     #C0362C     rgba( 192,  54,  44, 255)
-    "irresistible":                                 Color(179,  68, 108, 255),     #B3446C     rgba( 179,  68, 108, 255)
-    "isabelline":                                   Color(244, 240, 236, 255),     #F4F0EC     rgba( 244, 240, 236, 255)
-    "italian sky blue":                             Color(178, 255, 255, 255),     #B2FFFF     rgba( 178, 255, 255, 255)
-    "ivory":                                        Color(255, 255, 240, 255),     #FFFFF0     rgba( 255, 255, 240, 255)
-
-    "japanese carmine":                             Color(157,  41,  51, 255),     #9D2933     rgba( 157,  41,  51, 255)
-    "japanese violet":                              Color( 91,  50,  86, 255),     #5B3256     rgba(  91,  50,  86, 255)
-    "jasmine":                                      Color(248, 222, 126, 255),     #F8DE7E     rgba( 248, 222, 126, 255)
-    "jazzberry jam":                                Color(165,  11,  94, 255),     #A50B5E     rgba( 165,  11,  94, 255)
-    "jet":                                          Color( 52,  52,  52, 255),     #343434     rgba(  52,  52,  52, 255)
-    "jonquil":                                      Color(244, 202,  22, 255),     #F4CA16     rgba( 244, 202,  22, 255)
-    "june bud":                                     Color(189, 218,  87, 255),     #BDDA57     rgba( 189, 218,  87, 255)
-    "jungle green":                                 Color( 41, 171, 135, 255),     #29AB87     rgba(  41, 171, 135, 255)
-
-    "kelly green":                                  Color( 76, 187,  23, 255),     #4CBB17     rgba(  76, 187,  23, 255)
-    "keppel":                                       Color( 58, 176, 158, 255),     #3AB09E     rgba(  58, 176, 158, 255)
-    "key lime":                                     Color(232, 244, 140, 255),     #E8F48C     rgba( 232, 244, 140, 255)
-    "khakiweb":                                     Color(195, 176, 145, 255),     #C3B091     rgba( 195, 176, 145, 255)
-    "kobe":                                         Color(240, 230, 140, 255),     #F0E68C     rgba( 240, 230, 140, 255)
-    "kobi":                                         Color(136,  45,  23, 255),     #882D17     rgba( 136,  45,  23, 255)
-    "kobicha":                                      Color(231, 159, 196, 255),     #E79FC4     rgba( 231, 159, 196, 255)
-    "ksu purple":                                   Color(107,  68,  35, 255),     #6B4423     rgba( 107,  68,  35, 255)
-
-    "languid lavender":                             Color( 81,  40, 136, 255),     #512888     rgba(  81,  40, 136, 255)
-    "lapis lazuli":                                 Color(214, 202, 221, 255),     #D6CADD     rgba( 214, 202, 221, 255)
-    "laser lemon":                                  Color( 38,  97, 156, 255),     #26619C     rgba(  38,  97, 156, 255)
-    "laurel green":                                 Color(255, 255, 102, 255),     #FFFF66     rgba( 255, 255, 102, 255)
-    "lava":                                         Color(169, 186, 157, 255),     #A9BA9D     rgba( 169, 186, 157, 255)
-    "lavenderfloral":                               Color(207,  16,  32, 255),     #CF1020     rgba( 207,  16,  32, 255)
-    "lavenderweb":                                  Color(181, 126, 220, 255),     #B57EDC     rgba( 181, 126, 220, 255)
-    "lavender blue":                                Color(230, 230, 250, 255),     #E6E6FA     rgba( 230, 230, 250, 255)
-    "lavender blush":                               Color(204, 204, 255, 255),     #CCCCFF     rgba( 204, 204, 255, 255)
-    "lavender gray":                                Color(255, 240, 245, 255),     #FFF0F5     rgba( 255, 240, 245, 255)
-    "lawn green":                                   Color(196, 195, 208, 255),     #C4C3D0     rgba( 196, 195, 208, 255)
-    "lemon":                                        Color(124, 252,   0, 255),     #7CFC00     rgba( 124, 252,   0, 255)
-    "lemon chiffon":                                Color(255, 247,   0, 255),     #FFF700     rgba( 255, 247,   0, 255)
-    "lemon curry":                                  Color(255, 250, 205, 255),     #FFFACD     rgba( 255, 250, 205, 255)
-    "lemon glacier":                                Color(204, 160,  29, 255),     #CCA01D     rgba( 204, 160,  29, 255)
-    "lemon meringue":                               Color(253, 255,   0, 255),     #FDFF00     rgba( 253, 255,   0, 255)
-    "lemon yellow":                                 Color(246, 234, 190, 255),     #F6EABE     rgba( 246, 234, 190, 255)
-    "lemon yellowcrayola":                          Color(255, 244,  79, 255),     #FFF44F     rgba( 255, 244,  79, 255)
-    "liberty":                                      Color(255, 255, 159, 255),     #FFFF9F     rgba( 255, 255, 159, 255)
-    "light blue":                                   Color( 84,  90, 167, 255),     #545AA7     rgba(  84,  90, 167, 255)
-    "light coral":                                  Color(173, 216, 230, 255),     #ADD8E6     rgba( 173, 216, 230, 255)
-    "light cornflower blue":                        Color(240, 128, 128, 255),     #F08080     rgba( 240, 128, 128, 255)
-    "light cyan":                                   Color(147, 204, 234, 255),     #93CCEA     rgba( 147, 204, 234, 255)
-    "light french beige":                           Color(224, 255, 255, 255),     #E0FFFF     rgba( 224, 255, 255, 255)
-    "light khaki":                                  Color(200, 173, 127, 255),     #C8AD7F     rgba( 200, 173, 127, 255)
-    "light goldenrod yellow":                       Color(250, 250, 210, 255),     #FAFAD2     rgba( 250, 250, 210, 255)
-    "light gray":                                   Color(211, 211, 211, 255),     #D3D3D3     rgba( 211, 211, 211, 255)
-    "light green":                                  Color(144, 238, 144, 255),     #90EE90     rgba( 144, 238, 144, 255)
-    "light orange":                                 Color(254, 216, 177, 255),     #FED8B1     rgba( 254, 216, 177, 255)
-    "light periwinkle":                             Color(197, 203, 225, 255),     #C5CBE1     rgba( 197, 203, 225, 255)
-    "light pink":                                   Color(255, 182, 193, 255),     #FFB6C1     rgba( 255, 182, 193, 255)
-    "light salmon":                                 Color(255, 160, 122, 255),     #FFA07A     rgba( 255, 160, 122, 255)
-    "light sea green":                              Color( 32, 178, 170, 255),     #20B2AA     rgba(  32, 178, 170, 255)
-    "light sky blue":                               Color(135, 206, 250, 255),     #87CEFA     rgba( 135, 206, 250, 255)
-    "light slate gray":                             Color(119, 136, 153, 255),     #778899     rgba( 119, 136, 153, 255)
-    "light steel blue":                             Color(176, 196, 222, 255),     #B0C4DE     rgba( 176, 196, 222, 255)
-    "light yellow":                                 Color(255, 255, 224, 255),     #FFFFE0     rgba( 255, 255, 224, 255)
-    "lilac":                                        Color(200, 162, 200, 255),     #C8A2C8     rgba( 200, 162, 200, 255)
-    "lilac luster":                                 Color(174, 152, 170, 255),     #AE98AA     rgba( 174, 152, 170, 255)
-    "limecolor wheel":                              Color(191, 255,   0, 255),     #BFFF00     rgba( 191, 255,   0, 255)
-    "limeweb)x11 green":                            Color(  0, 255,   0, 255),     #00FF00     rgba(   0, 255,   0, 255)
-    "lime green":                                   Color( 50, 205,  50, 255),     #32CD32     rgba(  50, 205,  50, 255)
-    "lincoln green":                                Color( 25,  89,   5, 255),     #195905     rgba(  25,  89,   5, 255)
-    "linen":                                        Color(250, 240, 230, 255),     #FAF0E6     rgba( 250, 240, 230, 255)
-    "lion":                                         Color(222, 204, 156, 255),     #DECC9C     rgba( 222, 204, 156, 255)
-    "liseran purple":                               Color(222, 111, 161, 255),     #DE6FA1     rgba( 222, 111, 161, 255)
-    "little boy blue":                              Color(108, 160, 220, 255),     #6CA0DC     rgba( 108, 160, 220, 255)
-    "liver":                                        Color(103,  76,  71, 255),     #674C47     rgba( 103,  76,  71, 255)
-    "liverdogs":                                    Color(184, 109,  41, 255),     #B86D29     rgba( 184, 109,  41, 255)
-    "liverorgan":                                   Color(108,  46,  31, 255),     #6C2E1F     rgba( 108,  46,  31, 255)
-    "liver chestnut":                               Color(152, 116,  86, 255),     #987456     rgba( 152, 116,  86, 255)
-    "livid":                                        Color(102, 153, 204, 255),     #6699CC     rgba( 102, 153, 204, 255)
-
-    "macaroni and cheese":                          Color(255, 189, 136, 255),     #FFBD88     rgba( 255, 189, 136, 255)
-    "madder lake":                                  Color(204,  51,  54, 255),     #CC3336     rgba( 204,  51,  54, 255)
-    "magenta":                                      Color(255,   0, 255, 255),     #FF00FF     rgba( 255,   0, 255, 255)
-    "magenta crayola":                              Color(246,  83, 166, 255),     #F653A6     rgba( 246,  83, 166, 255)
-    "magenta dye":                                  Color(202,  31, 123, 255),     #CA1F7B     rgba( 202,  31, 123, 255)
-    "magenta pantone":                              Color(208,  65, 126, 255),     #D0417E     rgba( 208,  65, 126, 255)
-    "magenta process":                              Color(255,   0, 144, 255),     #FF0090     rgba( 255,   0, 144, 255)
-    "magenta haze":                                 Color(159,  69, 118, 255),     #9F4576     rgba( 159,  69, 118, 255)
-    "magic mint":                                   Color(170, 240, 209, 255),     #AAF0D1     rgba( 170, 240, 209, 255)
-    "magnolia":                                     Color(242, 232, 215, 255),     #F2E8D7     rgba( 242, 232, 215, 255)
-    "mahogany":                                     Color(192,  64,   0, 255),     #C04000     rgba( 192,  64,   0, 255)
-    "maize":                                        Color(251, 236,  93, 255),     #FBEC5D     rgba( 251, 236,  93, 255)
-    "maize crayola":                                Color(242, 198,  73, 255),     #F2C649     rgba( 242, 198,  73, 255)
-    "majorelle blue":                               Color( 96,  80, 220, 255),     #6050DC     rgba(  96,  80, 220, 255)
-    "malachite":                                    Color( 11, 218,  81, 255),     #0BDA51     rgba(  11, 218,  81, 255)
-    "manatee":                                      Color(151, 154, 170, 255),     #979AAA     rgba( 151, 154, 170, 255)
-    "mandarin":                                     Color(243, 122,  72, 255),     #F37A48     rgba( 243, 122,  72, 255)
-    "mango":                                        Color(253, 190,   2, 255),     #FDBE02     rgba( 253, 190,   2, 255)
-    "mango tango":                                  Color(255, 130,  67, 255),     #FF8243     rgba( 255, 130,  67, 255)
-    "mantis":                                       Color(116, 195, 101, 255),     #74C365     rgba( 116, 195, 101, 255)
-    "mardi gras":                                   Color(136,   0, 133, 255),     #880085     rgba( 136,   0, 133, 255)
-    "marigold":                                     Color(234, 162,  33, 255),     #EAA221     rgba( 234, 162,  33, 255)
-    "marooncrayola":                                Color(195,  33,  72, 255),     #C32148     rgba( 195,  33,  72, 255)
-    "maroon web":                                   Color(128,   0,   0, 255),     #800000     rgba( 128,   0,   0, 255)
-    "maroon":                                       Color(176,  48,  96, 255),     #B03060     rgba( 176,  48,  96, 255)
-    "mauve":                                        Color(224, 176, 255, 255),     #E0B0FF     rgba( 224, 176, 255, 255)
-    "mauve taupe":                                  Color(145,  95, 109, 255),     #915F6D     rgba( 145,  95, 109, 255)
-    "mauvelous":                                    Color(239, 152, 170, 255),     #EF98AA     rgba( 239, 152, 170, 255)
-    "maximum blue":                                 Color( 71, 171, 204, 255),     #47ABCC     rgba(  71, 171, 204, 255)
-    "maximum blue green":                           Color( 48, 191, 191, 255),     #30BFBF     rgba(  48, 191, 191, 255)
-    "maximum blue purple":                          Color(172, 172, 230, 255),     #ACACE6     rgba( 172, 172, 230, 255)
-    "maximum green":                                Color( 94, 140,  49, 255),     #5E8C31     rgba(  94, 140,  49, 255)
-    "maximum green yellow":                         Color(217, 230,  80, 255),     #D9E650     rgba( 217, 230,  80, 255)
-    "maximum purple":                               Color(115,  51, 128, 255),     #733380     rgba( 115,  51, 128, 255)
-    "maximum red":                                  Color(217,  33,  33, 255),     #D92121     rgba( 217,  33,  33, 255)
-    "maximum red purple":                           Color(166,  58, 121, 255),     #A63A79     rgba( 166,  58, 121, 255)
-    "maximum yellow":                               Color(250, 250,  55, 255),     #FAFA37     rgba( 250, 250,  55, 255)
-    "maximum yellow red":                           Color(242, 186,  73, 255),     #F2BA49     rgba( 242, 186,  73, 255)
-    "may green":                                    Color( 76, 145,  65, 255),     #4C9141     rgba(  76, 145,  65, 255)
-    "maya blue":                                    Color(115, 194, 251, 255),     #73C2FB     rgba( 115, 194, 251, 255)
-    "medium aquamarine":                            Color(102, 221, 170, 255),     #66DDAA     rgba( 102, 221, 170, 255)
-    "medium blue":                                  Color(  0,   0, 205, 255),     #0000CD     rgba(   0,   0, 205, 255)
-    "medium candy apple red":                       Color(226,   6,  44, 255),     #E2062C     rgba( 226,   6,  44, 255)
-    "medium carmine":                               Color(175,  64,  53, 255),     #AF4035     rgba( 175,  64,  53, 255)
-    "medium champagne":                             Color(243, 229, 171, 255),     #F3E5AB     rgba( 243, 229, 171, 255)
-    "medium orchid":                                Color(186,  85, 211, 255),     #BA55D3     rgba( 186,  85, 211, 255)
-    "medium purple":                                Color(147, 112, 219, 255),     #9370DB     rgba( 147, 112, 219, 255)
-    "medium sea green":                             Color( 60, 179, 113, 255),     #3CB371     rgba(  60, 179, 113, 255)
-    "medium slate blue":                            Color(123, 104, 238, 255),     #7B68EE     rgba( 123, 104, 238, 255)
-    "medium spring green":                          Color(  0, 250, 154, 255),     #00FA9A     rgba(   0, 250, 154, 255)
-    "medium turquoise":                             Color( 72, 209, 204, 255),     #48D1CC     rgba(  72, 209, 204, 255)
-    "medium violet-red":                            Color(199,  21, 133, 255),     #C71585     rgba( 199,  21, 133, 255)
-    "mellow apricot":                               Color(248, 184, 120, 255),     #F8B878     rgba( 248, 184, 120, 255)
-    "mellow yellow":                                Color(248, 222, 126, 255),     #F8DE7E     rgba( 248, 222, 126, 255)
-    "melon":                                        Color(254, 186, 173, 255),     #FEBAAD     rgba( 254, 186, 173, 255)
-    "metallic gold":                                Color(211, 175,  55, 255),     #D3AF37     rgba( 211, 175,  55, 255)
-    "metallic seaweed":                             Color( 10, 126, 140, 255),     #0A7E8C     rgba(  10, 126, 140, 255)
-    "metallic sunburst":                            Color(156, 124,  56, 255),     #9C7C38     rgba( 156, 124,  56, 255)
-    "mexican pink":                                 Color(228,   0, 124, 255),     #E4007C     rgba( 228,   0, 124, 255)
-    "middle blue":                                  Color(126, 212, 230, 255),     #7ED4E6     rgba( 126, 212, 230, 255)
-    "middle blue green":                            Color(141, 217, 204, 255),     #8DD9CC     rgba( 141, 217, 204, 255)
-    "middle blue purple":                           Color(139, 114, 190, 255),     #8B72BE     rgba( 139, 114, 190, 255)
-    "middle grey":                                  Color(139, 134, 128, 255),     #8B8680     rgba( 139, 134, 128, 255)
-    "middle green":                                 Color( 77, 140,  87, 255),     #4D8C57     rgba(  77, 140,  87, 255)
-    "middle green yellow":                          Color(172, 191,  96, 255),     #ACBF60     rgba( 172, 191,  96, 255)
-    "middle purple":                                Color(217, 130, 181, 255),     #D982B5     rgba( 217, 130, 181, 255)
-    "middle red":                                   Color(229, 142, 115, 255),     #E58E73     rgba( 229, 142, 115, 255)
-    "middle red purple":                            Color(165,  83,  83, 255),     #A55353     rgba( 165,  83,  83, 255)
-    "middle yellow":                                Color(255, 235,   0, 255),     #FFEB00     rgba( 255, 235,   0, 255)
-    "middle yellow red":                            Color(236, 177, 118, 255),     #ECB176     rgba( 236, 177, 118, 255)
-    "midnight":                                     Color(112,  38, 112, 255),     #702670     rgba( 112,  38, 112, 255)
-    "midnight blue":                                Color( 25,  25, 112, 255),     #191970     rgba(  25,  25, 112, 255)
-    "midnight green":                               Color(  0,  73,  83, 255),     #004953     rgba(   0,  73,  83, 255)
-    "mikado yellow":                                Color(255, 196,  12, 255),     #FFC40C     rgba( 255, 196,  12, 255)
-    "mimi pink":                                    Color(255, 218, 233, 255),     #FFDAE9     rgba( 255, 218, 233, 255)
-    "mindaro":                                      Color(227, 249, 136, 255),     #E3F988     rgba( 227, 249, 136, 255)
-    "ming":                                         Color( 54, 116, 125, 255),     #36747D     rgba(  54, 116, 125, 255)
-    "minion yellow":                                Color(245, 224,  80, 255),     #F5E050     rgba( 245, 224,  80, 255)
-    "mint":                                         Color( 62, 180, 137, 255),     #3EB489     rgba(  62, 180, 137, 255)
-    "mint cream":                                   Color(245, 255, 250, 255),     #F5FFFA     rgba( 245, 255, 250, 255)
-    "mint green":                                   Color(152, 255, 152, 255),     #98FF98     rgba( 152, 255, 152, 255)
-    "misty moss":                                   Color(187, 180, 119, 255),     #BBB477     rgba( 187, 180, 119, 255)
-    "misty rose":                                   Color(255, 228, 225, 255),     #FFE4E1     rgba( 255, 228, 225, 255)
-    "moccasin":                                     Color(255, 228, 181, 255),     #FFE4B5     rgba( 255, 228, 181, 255)
-    "mode beige":                                   Color(150, 113,  23, 255),     #967117     rgba( 150, 113,  23, 255)
-    "mona lisa":                                    Color(255, 148, 142, 255),     #FF948E     rgba( 255, 148, 142, 255)
-    "morning blue":                                 Color(141, 163, 153, 255),     #8DA399     rgba( 141, 163, 153, 255)
-    "moss green":                                   Color(138, 154,  91, 255),     #8A9A5B     rgba( 138, 154,  91, 255)
-    "mountain meadow":                              Color( 48, 186, 143, 255),     #30BA8F     rgba(  48, 186, 143, 255)
-    "mountbatten pink":                             Color(153, 122, 141, 255),     #997A8D     rgba( 153, 122, 141, 255)
-    "msu green":                                    Color( 24,  69,  59, 255),     #18453B     rgba(  24,  69,  59, 255)
-    "mulberry":                                     Color(197,  75, 140, 255),     #C54B8C     rgba( 197,  75, 140, 255)
-    "mulberrycrayola":                              Color(200,  80, 155, 255),     #C8509B     rgba( 200,  80, 155, 255)
-    "mustard":                                      Color(255, 219,  88, 255),     #FFDB58     rgba( 255, 219,  88, 255)
-    "myrtle green":                                 Color( 49, 120, 115, 255),     #317873     rgba(  49, 120, 115, 255)
-    "mystic":                                       Color(214,  82, 130, 255),     #D65282     rgba( 214,  82, 130, 255)
-    "mystic maroon":                                Color(173,  67, 121, 255),     #AD4379     rgba( 173,  67, 121, 255)
-
-    "nadeshiko pink":                               Color(246, 173, 198, 255),     #F6ADC6     rgba( 246, 173, 198, 255)
-    "naples yellow":                                Color(250, 218,  94, 255),     #FADA5E     rgba( 250, 218,  94, 255)
-    "navajo white":                                 Color(255, 222, 173, 255),     #FFDEAD     rgba( 255, 222, 173, 255)
-    "navy blue":                                    Color(  0,   0, 128, 255),     #000080     rgba(   0,   0, 128, 255)
-    "navy blue crayola":                            Color( 25, 116, 210, 255),     #1974D2     rgba(  25, 116, 210, 255)
-    "neon blue":                                    Color( 70, 102, 255, 255),     #4666FF     rgba(  70, 102, 255, 255)
-    "neon green":                                   Color( 57, 255,  20, 255),     #39FF14     rgba(  57, 255,  20, 255)
-    "neon fuchsia":                                 Color(254,  65, 100, 255),     #FE4164     rgba( 254,  65, 100, 255)
-    "new car":                                      Color( 33,  79, 198, 255),     #214FC6     rgba(  33,  79, 198, 255)
-    "new york pink":                                Color(215, 131, 127, 255),     #D7837F     rgba( 215, 131, 127, 255)
-    "nickel":                                       Color(114, 116, 114, 255),     #727472     rgba( 114, 116, 114, 255)
-    "non-photo blue":                               Color(164, 221, 237, 255),     #A4DDED     rgba( 164, 221, 237, 255)
-    "nyanza":                                       Color(233, 255, 219, 255),     #E9FFDB     rgba( 233, 255, 219, 255)
-
-    "ochre":                                        Color(204, 119,  34, 255),     #CC7722     rgba( 204, 119,  34, 255)
-    "old burgundy":                                 Color( 67,  48,  46, 255),     #43302E     rgba(  67,  48,  46, 255)
-    "old gold":                                     Color(207, 181,  59, 255),     #CFB53B     rgba( 207, 181,  59, 255)
-    "old lace":                                     Color(253, 245, 230, 255),     #FDF5E6     rgba( 253, 245, 230, 255)
-    "old lavender":                                 Color(121, 104, 120, 255),     #796878     rgba( 121, 104, 120, 255)
-    "old mauve":                                    Color(103,  49,  71, 255),     #673147     rgba( 103,  49,  71, 255)
-    "old rose":                                     Color(192, 128, 129, 255),     #C08081     rgba( 192, 128, 129, 255)
-    "old silver":                                   Color(132, 132, 130, 255),     #848482     rgba( 132, 132, 130, 255)
-    "olive":                                        Color(128, 128,   0, 255),     #808000     rgba( 128, 128,   0, 255)
-    "olive drab 3":                                 Color(107, 142,  35, 255),     #6B8E23     rgba( 107, 142,  35, 255)
-    "olive drab 7":                                 Color( 60,  52,  31, 255),     #3C341F     rgba(  60,  52,  31, 255)
-    "olive green":                                  Color(181, 179,  92, 255),     #B5B35C     rgba( 181, 179,  92, 255)
-    "olivine":                                      Color(154, 185, 115, 255),     #9AB973     rgba( 154, 185, 115, 255)
-    "onyx":                                         Color( 53,  56,  57, 255),     #353839     rgba(  53,  56,  57, 255)
-    "opal":                                         Color(168, 195, 188, 255),     #A8C3BC     rgba( 168, 195, 188, 255)
-    "opera mauve":                                  Color(183, 132, 167, 255),     #B784A7     rgba( 183, 132, 167, 255)
-    "orange":                                       Color(255, 127,   0, 255),     #FF7F00     rgba( 255, 127,   0, 255)
-    "orange crayola":                               Color(255, 117,  56, 255),     #FF7538     rgba( 255, 117,  56, 255)
-    "orange pantone":                               Color(255,  88,   0, 255),     #FF5800     rgba( 255,  88,   0, 255)
-    "orange web":                                   Color(255, 165,   0, 255),     #FFA500     rgba( 255, 165,   0, 255)
-    "orange peel":                                  Color(255, 159,   0, 255),     #FF9F00     rgba( 255, 159,   0, 255)
-    "orange-red":                                   Color(255, 104,  31, 255),     #FF681F     rgba( 255, 104,  31, 255)
-    "orange-red crayola":                           Color(255,  83,  73, 255),     #FF5349     rgba( 255,  83,  73, 255)
-    "orange soda":                                  Color(250,  91,  61, 255),     #FA5B3D     rgba( 250,  91,  61, 255)
-    "orange-yellow":                                Color(245, 189,  31, 255),     #F5BD1F     rgba( 245, 189,  31, 255)
-    "orange-yellow crayola":                        Color(248, 213, 104, 255),     #F8D568     rgba( 248, 213, 104, 255)
-    "orchid":                                       Color(218, 112, 214, 255),     #DA70D6     rgba( 218, 112, 214, 255)
-    "orchid pink":                                  Color(242, 189, 205, 255),     #F2BDCD     rgba( 242, 189, 205, 255)
-    "orchid crayola":                               Color(226, 156, 210, 255),     #E29CD2     rgba( 226, 156, 210, 255)
-    "outer space crayola":                          Color( 45,  56,  58, 255),     #2D383A     rgba(  45,  56,  58, 255)
-    "outrageous orange":                            Color(255, 110,  74, 255),     #FF6E4A     rgba( 255, 110,  74, 255)
-    "oxblood":                                      Color( 74,   0,   0, 255),     #4A0000     rgba(  74,   0,   0, 255)
-    "oxford blue":                                  Color(  0,  33,  71, 255),     #002147     rgba(   0,  33,  71, 255)
-    "ou crimson red":                               Color(132,  22,  23, 255),     #841617     rgba( 132,  22,  23, 255)
-
-    "pacific blue":                                 Color( 28, 169, 201, 255),     #1CA9C9     rgba(  28, 169, 201, 255)
-    "pakistan green":                               Color(  0, 102,   0, 255),     #006600     rgba(   0, 102,   0, 255)
-    "palatinate purple":                            Color(104,  40,  96, 255),     #682860     rgba( 104,  40,  96, 255)
-    "pale aqua":                                    Color(190, 211, 229, 255),     #BED3E5     rgba( 190, 211, 229, 255)
-    "pale cerulean":                                Color(155, 196, 226, 255),     #9BC4E2     rgba( 155, 196, 226, 255)
-    "pale dogwood":                                 Color(237, 122, 155, 255),     #ED7A9B     rgba( 237, 122, 155, 255)
-    "pale pink":                                    Color(250, 218, 221, 255),     #FADADD     rgba( 250, 218, 221, 255)
-    "pale purple pantone":                          Color(250, 230, 250, 255),     #FAE6FA     rgba( 250, 230, 250, 255)
-    "pale spring bud":                              Color(236, 235, 189, 255),     #ECEBBD     rgba( 236, 235, 189, 255)
-    "pansy purple":                                 Color(120,  24,  74, 255),     #78184A     rgba( 120,  24,  74, 255)
-    "paolo veronese green":                         Color(  0, 155, 125, 255),     #009B7D     rgba(   0, 155, 125, 255)
-    "papaya whip":                                  Color(255, 239, 213, 255),     #FFEFD5     rgba( 255, 239, 213, 255)
-    "paradise pink":                                Color(230,  62,  98, 255),     #E63E62     rgba( 230,  62,  98, 255)
-    "parchment":                                    Color(241, 233, 210, 255),     #F1E9D2     rgba( 241, 233, 210, 255)
-    "paris green":                                  Color( 80, 200, 120, 255),     #50C878     rgba(  80, 200, 120, 255)
-    "pastel pink":                                  Color(222, 165, 164, 255),     #DEA5A4     rgba( 222, 165, 164, 255)
-    "patriarch":                                    Color(128,   0, 128, 255),     #800080     rgba( 128,   0, 128, 255)
-    "paua":                                         Color( 31,   0,  94, 255),     #1F005E     rgba(  31,   0,  94, 255)
-    "payne-s grey":                                 Color( 83, 104, 120, 255),     #536878     rgba(  83, 104, 120, 255)
-    "peach":                                        Color(255, 229, 180, 255),     #FFE5B4     rgba( 255, 229, 180, 255)
-    "peach crayola":                                Color(255, 203, 164, 255),     #FFCBA4     rgba( 255, 203, 164, 255)
-    "peach puff":                                   Color(255, 218, 185, 255),     #FFDAB9     rgba( 255, 218, 185, 255)
-    "pear":                                         Color(209, 226,  49, 255),     #D1E231     rgba( 209, 226,  49, 255)
-    "pearly purple":                                Color(183, 104, 162, 255),     #B768A2     rgba( 183, 104, 162, 255)
-    "periwinkle":                                   Color(204, 204, 255, 255),     #CCCCFF     rgba( 204, 204, 255, 255)
-    "periwinkle crayola":                           Color(195, 205, 230, 255),     #C3CDE6     rgba( 195, 205, 230, 255)
-    "permanent geranium lake":                      Color(225,  44,  44, 255),     #E12C2C     rgba( 225,  44,  44, 255)
-    "persian blue":                                 Color( 28,  57, 187, 255),     #1C39BB     rgba(  28,  57, 187, 255)
-    "persian green":                                Color(  0, 166, 147, 255),     #00A693     rgba(   0, 166, 147, 255)
-    "persian indigo":                               Color( 50,  18, 122, 255),     #32127A     rgba(  50,  18, 122, 255)
-    "persian orange":                               Color(217, 144,  88, 255),     #D99058     rgba( 217, 144,  88, 255)
-    "persian pink":                                 Color(247, 127, 190, 255),     #F77FBE     rgba( 247, 127, 190, 255)
-    "persian plum":                                 Color(112,  28,  28, 255),     #701C1C     rgba( 112,  28,  28, 255)
-    "persian red":                                  Color(204,  51,  51, 255),     #CC3333     rgba( 204,  51,  51, 255)
-    "persian rose":                                 Color(254,  40, 162, 255),     #FE28A2     rgba( 254,  40, 162, 255)
-    "persimmon":                                    Color(236,  88,   0, 255),     #EC5800     rgba( 236,  88,   0, 255)
-    "pewter blue":                                  Color(139, 168, 183, 255),     #8BA8B7     rgba( 139, 168, 183, 255)
-    "phlox":                                        Color(223,   0, 255, 255),     #DF00FF     rgba( 223,   0, 255, 255)
-    "phthalo blue":                                 Color(  0,  15, 137, 255),     #000F89     rgba(   0,  15, 137, 255)
-    "phthalo green":                                Color( 18,  53,  36, 255),     #123524     rgba(  18,  53,  36, 255)
-    "picotee blue":                                 Color( 46,  39, 135, 255),     #2E2787     rgba(  46,  39, 135, 255)
-    "pictorial carmine":                            Color(195,  11,  78, 255),     #C30B4E     rgba( 195,  11,  78, 255)
-    "piggy pink":                                   Color(253, 221, 230, 255),     #FDDDE6     rgba( 253, 221, 230, 255)
-    "pine green":                                   Color(  1, 121, 111, 255),     #01796F     rgba(   1, 121, 111, 255)
-    "pine green 2":                                 Color( 42,  47,  35, 255),     #2A2F23     rgba(  42,  47,  35, 255)
-    "pink":                                         Color(255, 192, 203, 255),     #FFC0CB     rgba( 255, 192, 203, 255)
-    "pink pantone":                                 Color(215,  72, 148, 255),     #D74894     rgba( 215,  72, 148, 255)
-    "pink lace":                                    Color(255, 221, 244, 255),     #FFDDF4     rgba( 255, 221, 244, 255)
-    "pink lavender":                                Color(216, 178, 209, 255),     #D8B2D1     rgba( 216, 178, 209, 255)
-    "pink sherbet":                                 Color(247, 143, 167, 255),     #F78FA7     rgba( 247, 143, 167, 255)
-    "pistachio":                                    Color(147, 197, 114, 255),     #93C572     rgba( 147, 197, 114, 255)
-    "platinum":                                     Color(229, 228, 226, 255),     #E5E4E2     rgba( 229, 228, 226, 255)
-    "plum":                                         Color(142,  69, 133, 255),     #8E4585     rgba( 142,  69, 133, 255)
-    "plum web":                                     Color(221, 160, 221, 255),     #DDA0DD     rgba( 221, 160, 221, 255)
-    "plump purple":                                 Color( 89,  70, 178, 255),     #5946B2     rgba(  89,  70, 178, 255)
-    "polished pine":                                Color( 93, 164, 147, 255),     #5DA493     rgba(  93, 164, 147, 255)
-    "pomp and power":                               Color(134,  96, 142, 255),     #86608E     rgba( 134,  96, 142, 255)
-    "popstar":                                      Color(190,  79,  98, 255),     #BE4F62     rgba( 190,  79,  98, 255)
-    "portland orange":                              Color(255,  90,  54, 255),     #FF5A36     rgba( 255,  90,  54, 255)
-    "powder blue":                                  Color(176, 224, 230, 255),     #B0E0E6     rgba( 176, 224, 230, 255)
-    "prairie gold":                                 Color(225, 202, 122, 255),     #E1CA7A     rgba( 225, 202, 122, 255)
-    "princeton orange":                             Color(245, 128,  37, 255),     #F58025     rgba( 245, 128,  37, 255)
-    "prune":                                        Color(112,  28,  28, 255),     #701C1C     rgba( 112,  28,  28, 255)
-    "prussian blue":                                Color(  0,  49,  83, 255),     #003153     rgba(   0,  49,  83, 255)
-    "psychedelic purple":                           Color(223,   0, 255, 255),     #DF00FF     rgba( 223,   0, 255, 255)
-    "puce":                                         Color(204, 136, 153, 255),     #CC8899     rgba( 204, 136, 153, 255)
-    "pullman brown ups brown":                      Color(100,  65,  23, 255),     #644117     rgba( 100,  65,  23, 255)
-    "pumpkin":                                      Color(255, 117,  24, 255),     #FF7518     rgba( 255, 117,  24, 255)
-    "purple":                                       Color(106,  13, 173, 255),     #6A0DAD     rgba( 106,  13, 173, 255)
-    "purple web":                                   Color(128,   0, 128, 255),     #800080     rgba( 128,   0, 128, 255)
-    "purple munsell":                               Color(159,   0, 197, 255),     #9F00C5     rgba( 159,   0, 197, 255)
-    "purple x11":                                   Color(160,  32, 240, 255),     #A020F0     rgba( 160,  32, 240, 255)
-    "purple mountain majesty":                      Color(150, 120, 182, 255),     #9678B6     rgba( 150, 120, 182, 255)
-    "purple navy":                                  Color( 78,  81, 128, 255),     #4E5180     rgba(  78,  81, 128, 255)
-    "purple pizza":                                 Color(254,  78, 218, 255),     #FE4EDA     rgba( 254,  78, 218, 255)
-    "purple plum":                                  Color(156,  81, 182, 255),     #9C51B6     rgba( 156,  81, 182, 255)
-    "purpureus":                                    Color(154,  78, 174, 255),     #9A4EAE     rgba( 154,  78, 174, 255)
-
-    "queen blue":                                   Color( 67, 107, 149, 255),     #436B95     rgba(  67, 107, 149, 255)
-    "queen pink":                                   Color(232, 204, 215, 255),     #E8CCD7     rgba( 232, 204, 215, 255)
-    "quick silver":                                 Color(166, 166, 166, 255),     #A6A6A6     rgba( 166, 166, 166, 255)
-    "quinacridone magenta":                         Color(142,  58,  89, 255),     #8E3A59     rgba( 142,  58,  89, 255)
-
-    "radical red":                                  Color(255,  53,  94, 255),     #FF355E     rgba( 255,  53,  94, 255)
-    "raisin black":                                 Color( 36,  33,  36, 255),     #242124     rgba(  36,  33,  36, 255)
-    "rajah":                                        Color(251, 171,  96, 255),     #FBAB60     rgba( 251, 171,  96, 255)
-    "raspberry":                                    Color(227,  11,  93, 255),     #E30B5D     rgba( 227,  11,  93, 255)
-    "raspberry glacé":                              Color(145,  95, 109, 255),     #915F6D     rgba( 145,  95, 109, 255)
-    "raspberry rose":                               Color(179,  68, 108, 255),     #B3446C     rgba( 179,  68, 108, 255)
-    "raw sienna":                                   Color(214, 138,  89, 255),     #D68A59     rgba( 214, 138,  89, 255)
-    "raw umber":                                    Color(130, 102,  68, 255),     #826644     rgba( 130, 102,  68, 255)
-    "razzle dazzle rose":                           Color(255,  51, 204, 255),     #FF33CC     rgba( 255,  51, 204, 255)
-    "razzmatazz":                                   Color(227,  37, 107, 255),     #E3256B     rgba( 227,  37, 107, 255)
-    "razzmic berry":                                Color(141,  78, 133, 255),     #8D4E85     rgba( 141,  78, 133, 255)
-    "rebecca purple":                               Color(102,  51, 153, 255),     #663399     rgba( 102,  51, 153, 255)
-    "red":                                          Color(255,   0,   0, 255),     #FF0000     rgba( 255,   0,   0, 255)
-    "red crayola":                                  Color(238,  32,  77, 255),     #EE204D     rgba( 238,  32,  77, 255)
-    "red munsell":                                  Color(242,   0,  60, 255),     #F2003C     rgba( 242,   0,  60, 255)
-    "red ncs":                                      Color(196,   2,  51, 255),     #C40233     rgba( 196,   2,  51, 255)
-    "red pantone":                                  Color(237,  41,  57, 255),     #ED2939     rgba( 237,  41,  57, 255)
-    "red pigment":                                  Color(237,  28,  36, 255),     #ED1C24     rgba( 237,  28,  36, 255)
-    "red ryb":                                      Color(254,  39,  18, 255),     #FE2712     rgba( 254,  39,  18, 255)
-    "red-orange":                                   Color(255,  83,  73, 255),     #FF5349     rgba( 255,  83,  73, 255)
-    "red-orange crayola":                           Color(255, 104,  31, 255),     #FF681F     rgba( 255, 104,  31, 255)
-    "red-orange color wheel":                       Color(255,  69,   0, 255),     #FF4500     rgba( 255,  69,   0, 255)
-    "red-purple":                                   Color(228,   0, 120, 255),     #E40078     rgba( 228,   0, 120, 255)
-    "red salsa":                                    Color(253,  58,  74, 255),     #FD3A4A     rgba( 253,  58,  74, 255)
-    "red-violet":                                   Color(199,  21, 133, 255),     #C71585     rgba( 199,  21, 133, 255)
-    "red-violet crayola":                           Color(192,  68, 143, 255),     #C0448F     rgba( 192,  68, 143, 255)
-    "red-violet color wheel":                       Color(146,  43,  62, 255),     #922B3E     rgba( 146,  43,  62, 255)
-    "redwood":                                      Color(164,  90,  82, 255),     #A45A52     rgba( 164,  90,  82, 255)
-    "resolution blue":                              Color(  0,  35, 135, 255),     #002387     rgba(   0,  35, 135, 255)
-    "rhythm":                                       Color(119, 118, 150, 255),     #777696     rgba( 119, 118, 150, 255)
-    "rich black":                                   Color(  0,  64,  64, 255),     #004040     rgba(   0,  64,  64, 255)
-    "rich black fogra29":                           Color(  1,  11,  19, 255),     #010B13     rgba(   1,  11,  19, 255)
-    "rich black fogra39":                           Color(  1,   2,   3, 255),     #010203     rgba(   1,   2,   3, 255)
-    "rifle green":                                  Color( 68,  76,  56, 255),     #444C38     rgba(  68,  76,  56, 255)
-    "robin egg blue":                               Color(  0, 204, 204, 255),     #00CCCC     rgba(   0, 204, 204, 255)
-    "rocket metallic":                              Color(138, 127, 128, 255),     #8A7F80     rgba( 138, 127, 128, 255)
-    "rojo spanish red":                             Color(169,  17,   1, 255),     #A91101     rgba( 169,  17,   1, 255)
-    "roman silver":                                 Color(131, 137, 150, 255),     #838996     rgba( 131, 137, 150, 255)
-    "rose":                                         Color(255,   0, 127, 255),     #FF007F     rgba( 255,   0, 127, 255)
-    "rose bonbon":                                  Color(249,  66, 158, 255),     #F9429E     rgba( 249,  66, 158, 255)
-    "rose dust":                                    Color(158,  94, 111, 255),     #9E5E6F     rgba( 158,  94, 111, 255)
-    "rose ebony":                                   Color(103,  72,  70, 255),     #674846     rgba( 103,  72,  70, 255)
-    "rose madder":                                  Color(227,  38,  54, 255),     #E32636     rgba( 227,  38,  54, 255)
-    "rose pink":                                    Color(255, 102, 204, 255),     #FF66CC     rgba( 255, 102, 204, 255)
-    "rose pompadour":                               Color(237, 122, 155, 255),     #ED7A9B     rgba( 237, 122, 155, 255)
-    "rose red":                                     Color(194,  30,  86, 255),     #C21E56     rgba( 194,  30,  86, 255)
-    "rose taupe":                                   Color(144,  93,  93, 255),     #905D5D     rgba( 144,  93,  93, 255)
-    "rose vale":                                    Color(171,  78,  82, 255),     #AB4E52     rgba( 171,  78,  82, 255)
-    "rosewood":                                     Color(101,   0,  11, 255),     #65000B     rgba( 101,   0,  11, 255)
-    "rosso corsa":                                  Color(212,   0,   0, 255),     #D40000     rgba( 212,   0,   0, 255)
-    "rosy brown":                                   Color(188, 143, 143, 255),     #BC8F8F     rgba( 188, 143, 143, 255)
-    "royal blue dark":                              Color(  0,  35, 102, 255),     #002366     rgba(   0,  35, 102, 255)
-    "royal blue light":                             Color( 65, 105, 225, 255),     #4169E1     rgba(  65, 105, 225, 255)
-    "royal purple":                                 Color(120,  81, 169, 255),     #7851A9     rgba( 120,  81, 169, 255)
-    "royal yellow":                                 Color(250, 218,  94, 255),     #FADA5E     rgba( 250, 218,  94, 255)
-    "ruber":                                        Color(206,  70, 118, 255),     #CE4676     rgba( 206,  70, 118, 255)
-    "rubine red":                                   Color(209,   0,  86, 255),     #D10056     rgba( 209,   0,  86, 255)
-    "ruby":                                         Color(224,  17,  95, 255),     #E0115F     rgba( 224,  17,  95, 255)
-    "ruby red":                                     Color(155,  17,  30, 255),     #9B111E     rgba( 155,  17,  30, 255)
-    "rufous":                                       Color(168,  28,   7, 255),     #A81C07     rgba( 168,  28,   7, 255)
-    "russet":                                       Color(128,  70,  27, 255),     #80461B     rgba( 128,  70,  27, 255)
-    "russian green":                                Color(103, 146, 103, 255),     #679267     rgba( 103, 146, 103, 255)
-    "russian violet":                               Color( 50,  23,  77, 255),     #32174D     rgba(  50,  23,  77, 255)
-    "rust":                                         Color(183,  65,  14, 255),     #B7410E     rgba( 183,  65,  14, 255)
-    "rusty red":                                    Color(218,  44,  67, 255),     #DA2C43     rgba( 218,  44,  67, 255)
-
-    "sacramento state green":                       Color(  4,  57,  39, 255),     #043927     rgba(   4,  57,  39, 255)
-    "saddle brown":                                 Color(139,  69,  19, 255),     #8B4513     rgba( 139,  69,  19, 255)
-    "safety orange":                                Color(255, 120,   0, 255),     #FF7800     rgba( 255, 120,   0, 255)
-    "safety orange blaze orange":                   Color(255, 103,   0, 255),     #FF6700     rgba( 255, 103,   0, 255)
-    "safety yellow":                                Color(238, 210,   2, 255),     #EED202     rgba( 238, 210,   2, 255)
-    "saffron":                                      Color(244, 196,  48, 255),     #F4C430     rgba( 244, 196,  48, 255)
-    "sage":                                         Color(188, 184, 138, 255),     #BCB88A     rgba( 188, 184, 138, 255)
-    "st patrick-s blue":                            Color( 35,  41, 122, 255),     #23297A     rgba(  35,  41, 122, 255)
-    "salmon":                                       Color(250, 128, 114, 255),     #FA8072     rgba( 250, 128, 114, 255)
-    "salmon pink":                                  Color(255, 145, 164, 255),     #FF91A4     rgba( 255, 145, 164, 255)
-    "sand":                                         Color(194, 178, 128, 255),     #C2B280     rgba( 194, 178, 128, 255)
-    "sand dune":                                    Color(150, 113,  23, 255),     #967117     rgba( 150, 113,  23, 255)
-    "sandy brown":                                  Color(244, 164,  96, 255),     #F4A460     rgba( 244, 164,  96, 255)
-    "sap green":                                    Color( 80, 125,  42, 255),     #507D2A     rgba(  80, 125,  42, 255)
-    "sapphire":                                     Color( 15,  82, 186, 255),     #0F52BA     rgba(  15,  82, 186, 255)
-    "sapphire blue":                                Color(  0, 103, 165, 255),     #0067A5     rgba(   0, 103, 165, 255)
-    "sapphire crayola":                             Color( 45,  93, 161, 255),     #2D5DA1     rgba(  45,  93, 161, 255)
-    "satin sheen gold":                             Color(203, 161,  53, 255),     #CBA135     rgba( 203, 161,  53, 255)
-    "scarlet":                                      Color(255,  36,   0, 255),     #FF2400     rgba( 255,  36,   0, 255)
-    "schauss pink":                                 Color(255, 145, 175, 255),     #FF91AF     rgba( 255, 145, 175, 255)
-    "school bus yellow":                            Color(255, 216,   0, 255),     #FFD800     rgba( 255, 216,   0, 255)
-    "screamin green":                               Color(102, 255, 102, 255),     #66FF66     rgba( 102, 255, 102, 255)
-    "sea green":                                    Color( 46, 139,  87, 255),     #2E8B57     rgba(  46, 139,  87, 255)
-    "sea green crayola":                            Color(  0, 255, 205, 255),     #00FFCD     rgba(   0, 255, 205, 255)
-    "seance":                                       Color( 97,  32, 134, 255),     #612086     rgba(  97,  32, 134, 255)
-    "seal brown":                                   Color( 89,  38,  11, 255),     #59260B     rgba(  89,  38,  11, 255)
-    "seashell":                                     Color(255, 245, 238, 255),     #FFF5EE     rgba( 255, 245, 238, 255)
-    "secret":                                       Color(118,  67, 116, 255),     #764374     rgba( 118,  67, 116, 255)
-    "selective yellow":                             Color(255, 186,   0, 255),     #FFBA00     rgba( 255, 186,   0, 255)
-    "sepia":                                        Color(112,  66,  20, 255),     #704214     rgba( 112,  66,  20, 255)
-    "shadow":                                       Color(138, 121,  93, 255),     #8A795D     rgba( 138, 121,  93, 255)
-    "shadow blue":                                  Color(119, 139, 165, 255),     #778BA5     rgba( 119, 139, 165, 255)
-    "shamrock green":                               Color(  0, 158,  96, 255),     #009E60     rgba(   0, 158,  96, 255)
-    "sheen green":                                  Color(143, 212,   0, 255),     #8FD400     rgba( 143, 212,   0, 255)
-    "shimmering blush":                             Color(217, 134, 149, 255),     #D98695     rgba( 217, 134, 149, 255)
-    "shiny shamrock":                               Color( 95, 167, 120, 255),     #5FA778     rgba(  95, 167, 120, 255)
-    "shocking pink":                                Color(252,  15, 192, 255),     #FC0FC0     rgba( 252,  15, 192, 255)
-    "shocking pink crayola":                        Color(255, 111, 255, 255),     #FF6FFF     rgba( 255, 111, 255, 255)
-    "sienna":                                       Color(136,  45,  23, 255),     #882D17     rgba( 136,  45,  23, 255)
-    "silver":                                       Color(192, 192, 192, 255),     #C0C0C0     rgba( 192, 192, 192, 255)
-    "silver crayola":                               Color(201, 192, 187, 255),     #C9C0BB     rgba( 201, 192, 187, 255)
-    "silver metallic":                              Color(170, 169, 173, 255),     #AAA9AD     rgba( 170, 169, 173, 255)
-    "silver chalice":                               Color(172, 172, 172, 255),     #ACACAC     rgba( 172, 172, 172, 255)
-    "silver pink":                                  Color(196, 174, 173, 255),     #C4AEAD     rgba( 196, 174, 173, 255)
-    "silver sand":                                  Color(191, 193, 194, 255),     #BFC1C2     rgba( 191, 193, 194, 255)
-    "sinopia":                                      Color(203,  65,  11, 255),     #CB410B     rgba( 203,  65,  11, 255)
-    "sizzling red":                                 Color(255,  56,  85, 255),     #FF3855     rgba( 255,  56,  85, 255)
-    "sizzling sunrise":                             Color(255, 219,   0, 255),     #FFDB00     rgba( 255, 219,   0, 255)
-    "skobeloff":                                    Color(  0, 116, 116, 255),     #007474     rgba(   0, 116, 116, 255)
-    "sky blue":                                     Color(135, 206, 235, 255),     #87CEEB     rgba( 135, 206, 235, 255)
-    "sky blue crayola":                             Color(118, 215, 234, 255),     #76D7EA     rgba( 118, 215, 234, 255)
-    "sky magenta":                                  Color(207, 113, 175, 255),     #CF71AF     rgba( 207, 113, 175, 255)
-    "slate blue":                                   Color(106,  90, 205, 255),     #6A5ACD     rgba( 106,  90, 205, 255)
-    "slate gray":                                   Color(112, 128, 144, 255),     #708090     rgba( 112, 128, 144, 255)
-    "slimy green":                                  Color( 41, 150,  23, 255),     #299617     rgba(  41, 150,  23, 255)
-    "smitten":                                      Color(200,  65, 134, 255),     #C84186     rgba( 200,  65, 134, 255)
-    "smoky black":                                  Color( 16,  12,   8, 255),     #100C08     rgba(  16,  12,   8, 255)
-    "snow":                                         Color(255, 250, 250, 255),     #FFFAFA     rgba( 255, 250, 250, 255)
-    "solid pink":                                   Color(137,  56,  67, 255),     #893843     rgba( 137,  56,  67, 255)
-    "sonic silver":                                 Color(117, 117, 117, 255),     #757575     rgba( 117, 117, 117, 255)
-    "space cadet":                                  Color( 29,  41,  81, 255),     #1D2951     rgba(  29,  41,  81, 255)
-    "spanish bistre":                               Color(128, 117,  50, 255),     #807532     rgba( 128, 117,  50, 255)
-    "spanish blue":                                 Color(  0, 112, 184, 255),     #0070B8     rgba(   0, 112, 184, 255)
-    "spanish carmine":                              Color(209,   0,  71, 255),     #D10047     rgba( 209,   0,  71, 255)
-    "spanish gray":                                 Color(152, 152, 152, 255),     #989898     rgba( 152, 152, 152, 255)
-    "spanish green":                                Color(  0, 145,  80, 255),     #009150     rgba(   0, 145,  80, 255)
-    "spanish orange":                               Color(232,  97,   0, 255),     #E86100     rgba( 232,  97,   0, 255)
-    "spanish pink":                                 Color(247, 191, 190, 255),     #F7BFBE     rgba( 247, 191, 190, 255)
-    "spanish red":                                  Color(230,   0,  38, 255),     #E60026     rgba( 230,   0,  38, 255)
-    "spanish sky blue":                             Color(  0, 255, 254, 255),     #00FFFE     rgba(   0, 255, 254, 255)
-    "spanish violet":                               Color( 76,  40, 130, 255),     #4C2882     rgba(  76,  40, 130, 255)
-    "spanish viridian":                             Color(  0, 127,  92, 255),     #007F5C     rgba(   0, 127,  92, 255)
-    "spring bud":                                   Color(167, 252,   0, 255),     #A7FC00     rgba( 167, 252,   0, 255)
-    "spring frost":                                 Color(135, 255,  42, 255),     #87FF2A     rgba( 135, 255,  42, 255)
-    "spring green":                                 Color(  0, 255, 127, 255),     #00FF7F     rgba(   0, 255, 127, 255)
-    "spring green crayola":                         Color(236, 235, 189, 255),     #ECEBBD     rgba( 236, 235, 189, 255)
-    "star command blue":                            Color(  0, 123, 184, 255),     #007BB8     rgba(   0, 123, 184, 255)
-    "steel blue":                                   Color( 70, 130, 180, 255),     #4682B4     rgba(  70, 130, 180, 255)
-    "steel pink":                                   Color(204,  51, 204, 255),     #CC33CC     rgba( 204,  51, 204, 255)
-    "stil de grain yellow":                         Color(250, 218,  94, 255),     #FADA5E     rgba( 250, 218,  94, 255)
-    "straw":                                        Color(228, 217, 111, 255),     #E4D96F     rgba( 228, 217, 111, 255)
-    "strawberry":                                   Color(250,  80,  83, 255),     #FA5053     rgba( 250,  80,  83, 255)
-    "strawberry blonde":                            Color(255, 147,  97, 255),     #FF9361     rgba( 255, 147,  97, 255)
-    "strong lime green":                            Color( 51, 204,  51, 255),     #33CC33     rgba(  51, 204,  51, 255)
-    "sugar plum":                                   Color(145,  78, 117, 255),     #914E75     rgba( 145,  78, 117, 255)
-    "sunglow":                                      Color(255, 204,  51, 255),     #FFCC33     rgba( 255, 204,  51, 255)
-    "sunray":                                       Color(227, 171,  87, 255),     #E3AB57     rgba( 227, 171,  87, 255)
-    "sunset":                                       Color(250, 214, 165, 255),     #FAD6A5     rgba( 250, 214, 165, 255)
-    "super pink":                                   Color(207, 107, 169, 255),     #CF6BA9     rgba( 207, 107, 169, 255)
-    "sweet brown":                                  Color(168,  55,  49, 255),     #A83731     rgba( 168,  55,  49, 255)
-    "syracuse orange":                              Color(212,  69,   0, 255),     #D44500     rgba( 212,  69,   0, 255)
-
-    "tan":                                          Color(210, 180, 140, 255),     #D2B48C     rgba( 210, 180, 140, 255)
-    "tan crayola":                                  Color(217, 154, 108, 255),     #D99A6C     rgba( 217, 154, 108, 255)
-    "tangerine":                                    Color(242, 133,   0, 255),     #F28500     rgba( 242, 133,   0, 255)
-    "tango pink":                                   Color(228, 113, 122, 255),     #E4717A     rgba( 228, 113, 122, 255)
-    "tart orange":                                  Color(251,  77,  70, 255),     #FB4D46     rgba( 251,  77,  70, 255)
-    "taupe":                                        Color( 72,  60,  50, 255),     #483C32     rgba(  72,  60,  50, 255)
-    "taupe gray":                                   Color(139, 133, 137, 255),     #8B8589     rgba( 139, 133, 137, 255)
-    "tea green":                                    Color(208, 240, 192, 255),     #D0F0C0     rgba( 208, 240, 192, 255)
-    "tea rose":                                     Color(244, 194, 194, 255),     #F4C2C2     rgba( 244, 194, 194, 255)
-    "teal":                                         Color(  0, 128, 128, 255),     #008080     rgba(   0, 128, 128, 255)
-    "teal blue":                                    Color( 54, 117, 136, 255),     #367588     rgba(  54, 117, 136, 255)
-    "technobotanica":                               Color(  0, 255, 191, 255),     #00FFBF     rgba(   0, 255, 191, 255)
-    "telemagenta":                                  Color(207,  52, 118, 255),     #CF3476     rgba( 207,  52, 118, 255)
-    "tenné tawny":                                  Color(205,  87,   0, 255),     #CD5700     rgba( 205,  87,   0, 255)
-    "terra cotta":                                  Color(226, 114,  91, 255),     #E2725B     rgba( 226, 114,  91, 255)
-    "thistle":                                      Color(216, 191, 216, 255),     #D8BFD8     rgba( 216, 191, 216, 255)
-    "thulian pink":                                 Color(222, 111, 161, 255),     #DE6FA1     rgba( 222, 111, 161, 255)
-    "tickle me pink":                               Color(252, 137, 172, 255),     #FC89AC     rgba( 252, 137, 172, 255)
-    "tiffany blue":                                 Color( 10, 186, 181, 255),     #0ABAB5     rgba(  10, 186, 181, 255)
-    "timberwolf":                                   Color(219, 215, 210, 255),     #DBD7D2     rgba( 219, 215, 210, 255)
-    "titanium yellow":                              Color(238, 230,   0, 255),     #EEE600     rgba( 238, 230,   0, 255)
-    "tomato":                                       Color(255,  99,  71, 255),     #FF6347     rgba( 255,  99,  71, 255)
-    "tourmaline":                                   Color(134, 161, 169, 255),     #86A1A9     rgba( 134, 161, 169, 255)
-    "tropical rainforest":                          Color(  0, 117,  94, 255),     #00755E     rgba(   0, 117,  94, 255)
-    "true blue":                                    Color( 45, 104, 196, 255),     #2D68C4     rgba(  45, 104, 196, 255)
-    "trypan blue":                                  Color( 28,   5, 179, 255),     #1C05B3     rgba(  28,   5, 179, 255)
-    "tufts blue":                                   Color( 62, 142, 222, 255),     #3E8EDE     rgba(  62, 142, 222, 255)
-    "tumbleweed":                                   Color(222, 170, 136, 255),     #DEAA88     rgba( 222, 170, 136, 255)
-    "turquoise":                                    Color( 64, 224, 208, 255),     #40E0D0     rgba(  64, 224, 208, 255)
-    "turquoise blue":                               Color(  0, 255, 239, 255),     #00FFEF     rgba(   0, 255, 239, 255)
-    "turquoise green":                              Color(160, 214, 180, 255),     #A0D6B4     rgba( 160, 214, 180, 255)
-    "turtle green":                                 Color(138, 154,  91, 255),     #8A9A5B     rgba( 138, 154,  91, 255)
-    "tuscan":                                       Color(250, 214, 165, 255),     #FAD6A5     rgba( 250, 214, 165, 255)
-    "tuscan brown":                                 Color(111,  78,  55, 255),     #6F4E37     rgba( 111,  78,  55, 255)
-    "tuscan red":                                   Color(124,  72,  72, 255),     #7C4848     rgba( 124,  72,  72, 255)
-    "tuscan tan":                                   Color(166, 123,  91, 255),     #A67B5B     rgba( 166, 123,  91, 255)
-    "tuscany":                                      Color(192, 153, 153, 255),     #C09999     rgba( 192, 153, 153, 255)
-    "twilight lavender":                            Color(138,  73, 107, 255),     #8A496B     rgba( 138,  73, 107, 255)
-    "tyrian purple":                                Color(102,   2,  60, 255),     #66023C     rgba( 102,   2,  60, 255)
-
-    "ua blue":                                      Color(  0,  51, 170, 255),     #0033AA     rgba(   0,  51, 170, 255)
-    "ua red":                                       Color(217,   0,  76, 255),     #D9004C     rgba( 217,   0,  76, 255)
-    "ultramarine":                                  Color( 63,   0, 255, 255),     #3F00FF     rgba(  63,   0, 255, 255)
-    "ultramarine blue":                             Color( 65, 102, 245, 255),     #4166F5     rgba(  65, 102, 245, 255)
-    "ultra pink":                                   Color(255, 111, 255, 255),     #FF6FFF     rgba( 255, 111, 255, 255)
-    "ultra red":                                    Color(252, 108, 133, 255),     #FC6C85     rgba( 252, 108, 133, 255)
-    "umber":                                        Color( 99,  81,  71, 255),     #635147     rgba(  99,  81,  71, 255)
-    "unbleached silk":                              Color(255, 221, 202, 255),     #FFDDCA     rgba( 255, 221, 202, 255)
-    "united nations blue":                          Color(  0, 158, 219, 255),     #009EDB     rgba(   0, 158, 219, 255)
-    "university of pennsylvania red":               Color(165,   0,  33, 255),     #A50021     rgba( 165,   0,  33, 255)
-    "unmellow yellow":                              Color(255, 255, 102, 255),     #FFFF66     rgba( 255, 255, 102, 255)
-    "up forest green":                              Color(  1,  68,  33, 255),     #014421     rgba(   1,  68,  33, 255)
-    "up maroon":                                    Color(123,  17,  19, 255),     #7B1113     rgba( 123,  17,  19, 255)
-    "upsdell red":                                  Color(174,  32,  41, 255),     #AE2029     rgba( 174,  32,  41, 255)
-    "uranian blue":                                 Color(175, 219, 245, 255),     #AFDBF5     rgba( 175, 219, 245, 255)
-    "usafa blue":                                   Color(  0,  79, 152, 255),     #004F98     rgba(   0,  79, 152, 255)
-
-    "van dyke brown":                               Color(102,  66,  40, 255),     #664228     rgba( 102,  66,  40, 255)
-    "vanilla":                                      Color(243, 229, 171, 255),     #F3E5AB     rgba( 243, 229, 171, 255)
-    "vanilla ice":                                  Color(243, 143, 169, 255),     #F38FA9     rgba( 243, 143, 169, 255)
-    "vegas gold":                                   Color(197, 179,  88, 255),     #C5B358     rgba( 197, 179,  88, 255)
-    "venetian red":                                 Color(200,   8,  21, 255),     #C80815     rgba( 200,   8,  21, 255)
-    "verdigris":                                    Color( 67, 179, 174, 255),     #43B3AE     rgba(  67, 179, 174, 255)
-    "vermilion":                                    Color(227,  66,  52, 255),     #E34234     rgba( 227,  66,  52, 255)
-    "vermilion 2":                                  Color(217,  56,  30, 255),     #D9381E     rgba( 217,  56,  30, 255)
-    "veronica":                                     Color(160,  32, 240, 255),     #A020F0     rgba( 160,  32, 240, 255)
-    "very dark gray":                               Color( 18,  18,  18, 255),     #323232     rgba(  50,  50,  50, 255)
-    "very dark grey":                               Color( 26,  26,  26, 255),     #323232     rgba(  50,  50,  50, 255)
-    "violet":                                       Color(143,   0, 255, 255),     #8F00FF     rgba( 143,   0, 255, 255)
-    "violet color wheel":                           Color(127,   0, 255, 255),     #7F00FF     rgba( 127,   0, 255, 255)
-    "violet crayola":                               Color(150,  61, 127, 255),     #963D7F     rgba( 150,  61, 127, 255)
-    "violet ryb":                                   Color(134,   1, 175, 255),     #8601AF     rgba( 134,   1, 175, 255)
-    "violet web":                                   Color(238, 130, 238, 255),     #EE82EE     rgba( 238, 130, 238, 255)
-    "violet-blue":                                  Color( 50,  74, 178, 255),     #324AB2     rgba(  50,  74, 178, 255)
-    "violet-blue crayola":                          Color(118, 110, 200, 255),     #766EC8     rgba( 118, 110, 200, 255)
-    "violet-red":                                   Color(247,  83, 148, 255),     #F75394     rgba( 247,  83, 148, 255)
-    "violet-redperbang":                            Color(240,  89, 156, 255),     #F0599C     rgba( 240,  89, 156, 255)
-    "viridian":                                     Color( 64, 130, 109, 255),     #40826D     rgba(  64, 130, 109, 255)
-    "viridian green":                               Color(  0, 150, 152, 255),     #009698     rgba(   0, 150, 152, 255)
-    "vivid burgundy":                               Color(159,  29,  53, 255),     #9F1D35     rgba( 159,  29,  53, 255)
-    "vivid sky blue":                               Color(  0, 204, 255, 255),     #00CCFF     rgba(   0, 204, 255, 255)
-    "vivid tangerine":                              Color(255, 160, 137, 255),     #FFA089     rgba( 255, 160, 137, 255)
-    "vivid violet":                                 Color(159,   0, 255, 255),     #9F00FF     rgba( 159,   0, 255, 255)
-    "volt":                                         Color(206, 255,   0, 255),     #CEFF00     rgba( 206, 255,   0, 255)
-
-    "warm black":                                   Color(  0,  66,  66, 255),     #004242     rgba(   0,  66,  66, 255)
-    "weezy blue":                                   Color( 24, 155, 204, 255),     #189BCC     rgba(  24, 155, 204, 255)
-    "wheat":                                        Color(245, 222, 179, 255),     #F5DEB3     rgba( 245, 222, 179, 255)
-    "white":                                        Color(255, 255, 255, 255),     #FFFFFF     rgba( 255, 255, 255, 255)
-    "wild blue yonder":                             Color(162, 173, 208, 255),     #A2ADD0     rgba( 162, 173, 208, 255)
-    "wild orchid":                                  Color(212, 112, 162, 255),     #D470A2     rgba( 212, 112, 162, 255)
-    "wild strawberry":                              Color(255,  67, 164, 255),     #FF43A4     rgba( 255,  67, 164, 255)
-    "wild watermelon":                              Color(252, 108, 133, 255),     #FC6C85     rgba( 252, 108, 133, 255)
-    "windsor tan":                                  Color(167,  85,   2, 255),     #A75502     rgba( 167,  85,   2, 255)
-    "wine":                                         Color(114,  47,  55, 255),     #722F37     rgba( 114,  47,  55, 255)
-    "wine dregs":                                   Color(103,  49,  71, 255),     #673147     rgba( 103,  49,  71, 255)
-    "winter sky":                                   Color(255,   0, 124, 255),     #FF007C     rgba( 255,   0, 124, 255)
-    "wintergreen dream":                            Color( 86, 136, 125, 255),     #56887D     rgba(  86, 136, 125, 255)
-    "wisteria":                                     Color(201, 160, 220, 255),     #C9A0DC     rgba( 201, 160, 220, 255)
-    "wood brown":                                   Color(193, 154, 107, 255),     #C19A6B     rgba( 193, 154, 107, 255)
-
-    "xanadu":                                       Color(115, 134, 120, 255),     #738678     rgba( 115, 134, 120, 255)
-    "xanthic":                                      Color(238, 237,   9, 255),     #EEED09     rgba( 238, 237,   9, 255)
-    "xanthous":                                     Color(241, 180,  47, 255),     #F1B42F     rgba( 241, 180,  47, 255)
-
-    "yale blue":                                    Color(  0,  53, 107, 255),     #00356B     rgba(   0,  53, 107, 255)
-    "yellow":                                       Color(255, 255,   0, 255),     #FFFF00     rgba( 255, 255,   0, 255)
-    "yellow crayola":                               Color(252, 232, 131, 255),     #FCE883     rgba( 252, 232, 131, 255)
-    "yellow munsell":                               Color(239, 204,   0, 255),     #EFCC00     rgba( 239, 204,   0, 255)
-    "yellow ncs":                                   Color(255, 211,   0, 255),     #FFD300     rgba( 255, 211,   0, 255)
-    "yellow pantone":                               Color(254, 223,   0, 255),     #FEDF00     rgba( 254, 223,   0, 255)
-    "yellow process":                               Color(255, 239,   0, 255),     #FFEF00     rgba( 255, 239,   0, 255)
-    "yellow ryb":                                   Color(254, 254,  51, 255),     #FEFE33     rgba( 254, 254,  51, 255)
-    "yellow-green":                                 Color(154, 205,  50, 255),     #9ACD32     rgba( 154, 205,  50, 255)
-    "yellow-green crayola":                         Color(197, 227, 132, 255),     #C5E384     rgba( 197, 227, 132, 255)
-    "yellow-green color wheel":                     Color( 48, 178,  26, 255),     #30B21A     rgba(  48, 178,  26, 255)
-    "yellow orange":                                Color(255, 174,  66, 255),     #FFAE42     rgba( 255, 174,  66, 255)
-    "yellow orange color wheel":                    Color(255, 149,   5, 255),     #FF9505     rgba( 255, 149,   5, 255)
-    "yellow sunshine":                              Color(255, 247,   0, 255),     #FFF700     rgba( 255, 247,   0, 255)
-
-    "yinmn blue":                                   Color( 46,  80, 144, 255),     #2E5090     rgba(  46,  80, 144, 255)
-    "zaffre":                                       Color(  0,  20, 168, 255),     #0014A8     rgba(   0,  20, 168, 255)
-    "zinnwaldite brown":                            Color( 44,  22,   8, 255),     #2C1608     rgba(  44,  22,   8, 255)
-    "zomp":                                         Color( 57, 167, 142, 255)      #39A78E     rgba(  57, 167, 142, 255)
-}
\ No newline at end of file
+
+# Color name -> offset of its RRGGBB code in _COLORS_TABLE (built on first lookup)
+_COLORS_INDEX: Optional[dict[str, int]] = None
+
+# Colors already looked up, shared by all the lookups of a same name
+_COLORS_CACHE: dict[str, FrozenColor] = {}
+
+
+def _colors_index() -> dict[str, int]:
+    """
+    Get the index of the color names, parsing the packed table on first use.
+    """
+
+    global _COLORS_INDEX
+
+    if _COLORS_INDEX is None:
+
+        index: dict[str, int] = {}
+        offset: int = 0
+
+        for line in _COLORS_TABLE.split("\n"):
+
+            if len(line) > 6:
+                index[line[:-6].rstrip()] = offset + len(line) - 6
+
+            offset += len(line) + 1
+
+        _COLORS_INDEX = index
+
+    return _COLORS_INDEX
+
+
+def get_named_color(name: str) -> Optional[FrozenColor]:
+    """
+    Get the color of a (lowercase) color name.
+
+    Args:
+        name: The color name
+
+    Returns:
+        The shared immutable color, None for an unknown name
+    """
+
+    color: Optional[FrozenColor] = _COLORS_CACHE.get(name, None)
+
+    if color is not None:
+        return color
+
+    offset: Optional[int] = _colors_index().get(name, None)
+
+    if offset is None:
+        return None
+
+    rgb: bytes = bytes.fromhex(_COLORS_TABLE[offset:offset + 6])
+
+    color = FrozenColor(rgb[0], rgb[1], rgb[2], 255)
+
+    _COLORS_CACHE[name] = color
+
+    return color
+
+
+def get_colors_names() -> list[str]:
+    """
+    Get all the color names, in the table order.
+    """
+
+    return list(_colors_index().keys())
+
+
+def __getattr__(name: str) -> Any:
+
+    # COLORS_DICT is only materialized when it is used
+    if name == "COLORS_DICT":
+
+        colors_dict: dict[str, FrozenColor] = {}
+
+        for color_name in get_colors_names():
+
+            color: Optional[FrozenColor] = get_named_color(color_name)
+
+            if color is not None:
+                colors_dict[color_name] = color
+
+        globals()["COLORS_DICT"] = colors_dict
+
+        return colors_dict
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,431 @@
+from typing import Optional, Any
+import copy
+
+import os
+import json
+import hashlib
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .color import FrozenColor
+from .naxel import NaxelDataFrame, NaxelGeneralData
+from .voxel_arrays import VoxelArrays
+from .vec import Vec3
+from .voxel_grid import VoxelGrid
+from .voxel_grid_morton import MortonVoxelGrid
+from .voxel_grid_chunked import ChunkedVoxelGrid
+from .voxel_value import VoxelValueImportVoxel
+from .model_cache import MODEL_CACHE
+
+
+# Version of the grid builder, part of the cache keys:
+# change it when the built voxels of a same frame change
+BUILDER_VERSION: str = "3"
+
+# Files of a cached grid: <key>.<part>.npy, and the <key>.json description
+CACHE_ARRAYS: tuple[str, ...] = ("coords", "indices", "table")
+
+# Files of the storage variants of a cached grid: sorted Morton codes and their
+# color slots (see MortonVoxelGrid), compressed chunks (see ChunkedVoxelGrid)
+CACHE_MORTON_ARRAYS: tuple[str, ...] = ("morton_codes", "morton_slots")
+CACHE_CHUNKED_FILE: str = "naxc"
+
+# Voxel storages a grid can be loaded as
+CACHE_STORAGES: tuple[str, ...] = ("dict", "morton", "chunked")
+
+
+def _hash_frame(
+    h: Any,
+    frame: NaxelDataFrame,
+    source_dir: str
+) -> None:
+    """
+    Feed the content of a frame (and of its base frames and imported models) to a hash.
+    """
+
+    # Base frames first, from the key frame
+    chain: list[NaxelDataFrame] = [frame]
+
+    base_frame: Optional[NaxelDataFrame] = frame.get_base_frame()
+
+    while base_frame is not None:
+
+        chain.append(base_frame)
+        base_frame = base_frame.get_base_frame()
+
+    for chain_frame in reversed(chain):
+        _hash_frame_content(h, chain_frame, source_dir)
+
+
+def _hash_frame_content(
+    h: Any,
+    frame: NaxelDataFrame,
+    source_dir: str
+) -> None:
+    """
+    Feed the content of a single frame (and of its imported models) to a hash.
+    """
+
+    # The resolved arrays are hashed as raw bytes, the rest as JSON
+    content: NaxelDataFrame = copy.copy(frame)
+    content.voxels_arrays = None
+
+    h.update(json.dumps(content.export_to_dict(), sort_keys=True, default=str).encode("utf-8"))
+
+    if frame.voxels_arrays is not None:
+
+        for array in (frame.voxels_arrays.coords, frame.voxels_arrays.indices, frame.voxels_arrays.table):
+            h.update(np.ascontiguousarray(array).tobytes())
+
+    # Imported models can change without the frame changing (their own nested
+    # imports are checked against the dependencies saved with the grid)
+    for voxel_value in frame.voxels_list or []:
+
+        if isinstance(voxel_value, VoxelValueImportVoxel):
+
+            abs_path: str = os.path.abspath(os.path.join(source_dir, voxel_value.path))
+
+            h.update(f"{abs_path}:{MODEL_CACHE.file_digest(abs_path)}".encode("utf-8"))
+
+
+def frame_dependencies(
+    frame: NaxelDataFrame,
+    general_data: NaxelGeneralData
+) -> list[str]:
+    """
+    Get all the files the grid of a frame depends on: the files imported by
+    the frame and its base frames, and the files they import, recursively.
+
+    Args:
+        frame: The data frame
+        general_data: General data of the naxel object
+
+    Returns:
+        The sorted absolute paths of the files
+    """
+
+    dependencies: set[str] = set()
+
+    current: Optional[NaxelDataFrame] = frame
+
+    while current is not None:
+
+        for voxel_value in current.voxels_list or []:
+
+            if isinstance(voxel_value, VoxelValueImportVoxel):
+
+                dependencies.update(
+                    MODEL_CACHE.get_dependencies(voxel_value.path, general_data.source_dir)
+                )
+
+        current = current.get_base_frame()
+
+    return sorted(dependencies)
+
+
+def frame_cache_key(
+    frame: NaxelDataFrame,
+    general_data: NaxelGeneralData
+) -> str:
+    """
+    Get the cache key of the grid of a frame: a hash of the frame content,
+    of the general data (palette, default color) and of the builder version.
+
+    Args:
+        frame: The data frame
+        general_data: General data of the naxel object
+
+    Returns:
+        The hexadecimal SHA-256 key
+    """
+
+    h: Any = hashlib.sha256()
+
+    h.update(BUILDER_VERSION.encode("utf-8"))
+    h.update(json.dumps(general_data.export_to_dict(), sort_keys=True, default=str).encode("utf-8"))
+
+    _hash_frame(h, frame, general_data.source_dir)
+
+    return h.hexdigest()
+
+
+class GridCache:
+    """
+    Persistent cache of built voxel grids in a directory, so that a frame
+    whose content did not change is not parsed and rasterized again.
+
+    Each grid is saved as its compact arrays (.npy files), with a small JSON file
+    holding the palette keys of its color table, its bounds, and the digests of
+    the files it was built from (nested imports included): a grid is not loaded
+    once one of them changed. The storage variants are saved with their own
+    structures, written on first use: the sorted Morton codes, loaded memory-mapped
+    without copying, and the compressed chunks with their index, memory-mapped
+    and decompressed on demand. The dict storage is filled from the memory-mapped
+    arrays, which copies the voxels into its dictionary.
+
+    The least recently used grids are deleted when the directory exceeds `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 1 << 30
+    ) -> None:
+
+        self.cache_dir: str = cache_dir
+        self.max_bytes: int = max_bytes
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(
+        self,
+        key: str,
+        part: str
+    ) -> str:
+
+        return os.path.join(self.cache_dir, f"{key}.{part}")
+
+    def _set_colors(
+        self,
+        grid: VoxelGrid,
+        table: NDArray[np.uint8],
+        palette_keys: list[Optional[str | int]]
+    ) -> None:
+        """
+        Fill the color table of a loaded grid, binding the palette colors to their keys.
+        """
+
+        grid._color_table = []
+        grid._rgba_slots = {}
+        grid._palette_slots = {}
+
+        for slot, rgba in enumerate(np.asarray(table).tolist()):
+
+            grid._color_table.append(FrozenColor(*rgba))
+
+            palette_key: Optional[str | int] = palette_keys[slot] if slot < len(palette_keys) else None
+
+            if palette_key is not None:
+                grid._palette_slots[palette_key] = slot
+            else:
+                grid._rgba_slots.setdefault(tuple(rgba), slot)
+
+    def _save_storage(
+        self,
+        key: str,
+        grid: VoxelGrid,
+        storage: str
+    ) -> None:
+        """
+        Save the structures of a storage variant of a grid (nothing for the dict storage).
+        """
+
+        if storage == "morton":
+
+            morton: MortonVoxelGrid = MortonVoxelGrid.from_grid(grid)
+
+            np.save(self._path(key, "morton_codes.npy"), morton._codes)
+            np.save(self._path(key, "morton_slots.npy"), morton._slots)
+
+        elif storage == "chunked":
+
+            ChunkedVoxelGrid.from_grid(grid).save(self._path(key, CACHE_CHUNKED_FILE))
+
+    def load(
+        self,
+        key: str,
+        storage: str = "dict"
+    ) -> Optional[VoxelGrid]:
+        """
+        Load a cached grid.
+
+        Args:
+            key: The cache key (see `frame_cache_key`)
+            storage: Voxel storage of the loaded grid: "dict", "morton" or "chunked"
+
+        Returns:
+            The voxel grid, None if it is not in the cache
+        """
+
+        if storage not in CACHE_STORAGES:
+            raise ValueError(f"Unknown voxel storage: {storage}")
+
+        info_path: str = self._path(key, "json")
+
+        try:
+
+            with open(info_path, "r", encoding="utf-8") as f:
+                info: dict[str, Any] = json.load(f)
+
+            arrays: dict[str, NDArray[Any]] = {
+                part: np.load(self._path(key, f"{part}.npy"), mmap_mode="r")
+                for part in CACHE_ARRAYS
+            }
+
+        except (OSError, ValueError):
+            return None
+
+        # Rebuilt if a file it depends on changed
+        dependency: str
+        digest: Optional[str]
+
+        for dependency, digest in info.get("dependencies", {}).items():
+
+            if MODEL_CACHE.file_digest(dependency) != digest:
+                return None
+
+        # Mark as recently used
+        os.utime(info_path)
+
+        palette_keys: list[Optional[str | int]] = info.get("palette_keys", [])
+
+        grid: VoxelGrid = VoxelGrid()
+
+        self._set_colors(grid, arrays["table"], palette_keys)
+
+        if storage == "dict":
+
+            grid._set_voxels_slots(arrays["coords"], arrays["indices"])
+
+            return grid
+
+        # Structures of the storage variant (written now if the grid was saved with another storage)
+        try:
+
+            if storage == "morton":
+
+                codes: NDArray[np.uint64] = np.load(self._path(key, "morton_codes.npy"), mmap_mode="r")
+                slots: NDArray[np.unsignedinteger[Any]] = np.load(self._path(key, "morton_slots.npy"), mmap_mode="r")
+
+            else:
+
+                chunked: ChunkedVoxelGrid = ChunkedVoxelGrid.open(self._path(key, CACHE_CHUNKED_FILE))
+
+        except (OSError, ValueError):
+
+            grid._set_voxels_slots(arrays["coords"], arrays["indices"])
+
+            self._save_storage(key, grid, storage)
+
+            if storage == "morton":
+                return MortonVoxelGrid.from_grid(grid)
+
+            return ChunkedVoxelGrid.from_grid(grid)
+
+        bounds: list[list[int]] = info.get("bounds", [[0, 0, 0], [0, 0, 0]])
+
+        res: VoxelGrid
+
+        if storage == "morton":
+
+            morton: MortonVoxelGrid = MortonVoxelGrid()
+
+            # Views on the mapped files: the voxels are not copied
+            morton._codes = codes
+            morton._slots = slots
+
+            res = morton
+
+        else:
+
+            res = chunked
+
+        res._color_table = grid._color_table
+        res._rgba_slots = grid._rgba_slots
+        res._palette_slots = grid._palette_slots
+
+        res._min_bounds = Vec3(*bounds[0])
+        res._max_bounds = Vec3(*bounds[1])
+        res._is_empty = len(arrays["coords"]) == 0
+
+        return res
+
+    def save(
+        self,
+        key: str,
+        grid: VoxelGrid,
+        dependencies: list[str] = [],
+        storage: str = "dict"
+    ) -> None:
+        """
+        Save a built grid in the cache, then evict the least recently used grids
+        if the cache is too big. Grids with instances are not cached.
+
+        Args:
+            key: The cache key (see `frame_cache_key`)
+            grid: The built voxel grid (with the dict storage)
+            dependencies: The files the grid was built from (see `frame_dependencies`)
+            storage: Voxel storage the grid will be loaded as, whose structures are also saved
+        """
+
+        if len(grid.instances) > 0:
+            return
+
+        arrays: VoxelArrays = grid.export_arrays()
+
+        palette_keys: list[Optional[str | int]] = [None] * len(arrays.table)
+
+        for palette_key, slot in grid._palette_slots.items():
+            palette_keys[slot] = palette_key
+
+        for part in CACHE_ARRAYS:
+            np.save(self._path(key, f"{part}.npy"), getattr(arrays, part))
+
+        self._save_storage(key, grid, storage)
+
+        bounds_min: Vec3
+        bounds_max: Vec3
+        bounds_min, bounds_max = grid.get_voxel_bounds()
+
+        # Written last: a grid is only visible once complete
+        with open(self._path(key, "json"), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "builder_version": BUILDER_VERSION,
+                    "palette_keys": palette_keys,
+                    "bounds": [
+                        [int(bounds_min.x), int(bounds_min.y), int(bounds_min.z)],
+                        [int(bounds_max.x), int(bounds_max.y), int(bounds_max.z)]
+                    ],
+                    "dependencies": {path: MODEL_CACHE.file_digest(path) for path in dependencies}
+                },
+                f
+            )
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Delete the least recently used grids until the cache fits in `max_bytes`.
+        """
+
+        sizes: dict[str, int] = {}
+        last_used: dict[str, float] = {}
+
+        for name in os.listdir(self.cache_dir):
+
+            key: str = name.split(".", 1)[0]
+            stat: os.stat_result = os.stat(os.path.join(self.cache_dir, name))
+
+            sizes[key] = sizes.get(key, 0) + stat.st_size
+
+            if name.endswith(".json"):
+                last_used[key] = stat.st_mtime
+
+        total: int = sum(sizes.values())
+
+        for key in sorted(sizes, key=lambda k: last_used.get(k, 0.0)):
+
+            if total <= self.max_bytes:
+                break
+
+            for part in [f"{p}.npy" for p in CACHE_ARRAYS + CACHE_MORTON_ARRAYS] + [CACHE_CHUNKED_FILE, "json"]:
+
+                try:
+                    os.remove(self._path(key, part))
+
+                except OSError:
+                    pass
+
+            total -= sizes[key]
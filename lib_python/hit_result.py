@@ -16,7 +16,10 @@ class HitResult:
         t: float = 0.0,
         position: Optional[Vec3] = None,
         color: Optional[Color] = None,
-        normal: Optional[Vec3NP] = None
+        normal: Optional[Vec3NP] = None,
+        steps: int = 0,
+        t_enter: float = float('inf'),
+        t_exit: float = float('-inf')
     ) -> None:
 
         self.hit: bool = hit
@@ -25,23 +28,45 @@ class HitResult:
         self.color: Optional[Color] = color
         self.normal: Optional[Vec3NP] = normal
 
+        # Marching statistics (debug / profiling)
+        self.steps: int = steps
+        self.t_enter: float = t_enter
+        self.t_exit: float = t_exit
+
     @staticmethod
-    def miss() -> "HitResult":
+    def miss(
+        steps: int = 0,
+        t_enter: float = float('inf'),
+        t_exit: float = float('-inf')
+    ) -> "HitResult":
         """
         Create a HitResult representing a ray miss (no intersection).
 
+        Args:
+            steps: Number of DDA iterations done before giving up
+            t_enter: Distance where the ray enters the grid AABB
+            t_exit: Distance where the ray exits the grid AABB
+
         Returns:
             HitResult: A miss result with hit=False
         """
 
-        return HitResult(hit=False)
+        return HitResult(
+            hit=False,
+            steps=steps,
+            t_enter=t_enter,
+            t_exit=t_exit
+        )
 
     @staticmethod
     def create_hit(
         t: float,
         position: Vec3,
         color: Color,
-        normal: Vec3NP
+        normal: Vec3NP,
+        steps: int = 0,
+        t_enter: float = float('inf'),
+        t_exit: float = float('-inf')
     ) -> "HitResult":
         """
         Create a HitResult representing a successful ray hit.
@@ -51,6 +76,9 @@ class HitResult:
             position: Integer voxel position that was hit
             color: Color of the hit voxel
             normal: Surface normal at the hit point
+            steps: Number of DDA iterations done to find the hit
+            t_enter: Distance where the ray enters the grid AABB
+            t_exit: Distance where the ray exits the grid AABB
 
         Returns:
             HitResult: A hit result with all intersection data
@@ -61,6 +89,9 @@ class HitResult:
             t=t,
             position=position,
             color=color,
-            normal=normal
+            normal=normal,
+            steps=steps,
+            t_enter=t_enter,
+            t_exit=t_exit
         )
 
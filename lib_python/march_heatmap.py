@@ -0,0 +1,136 @@
+import numpy as np
+from numpy.typing import NDArray
+
+from PIL import Image
+
+from .hit_result import HitResult
+
+
+# Anchor colors of the false-color ramp (low -> high)
+HEATMAP_RAMP: NDArray[np.float32] = np.array(
+    [
+        [  0,   0,   0],
+        [ 48,  18, 160],
+        [ 30, 150, 230],
+        [ 60, 220,  90],
+        [250, 220,  40],
+        [230,  40,  30],
+        [255, 255, 255],
+    ],
+    dtype=np.float32
+)
+
+
+class MarchHeatmap:
+    """
+    Per-pixel ray marching statistics collected alongside a render.
+    Stores the number of DDA iterations of each pixel ray and the
+    distances where the ray enters and exits the grid AABB, to spot the
+    camera angles and scene regions where marching is expensive.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int
+    ) -> None:
+
+        self.width: int = width
+        self.height: int = height
+
+        self.steps: NDArray[np.int32] = np.zeros((height, width), dtype=np.int32)
+
+        # NaN where the ray does not touch the grid AABB
+        self.t_enter: NDArray[np.float32] = np.full((height, width), np.nan, dtype=np.float32)
+        self.t_exit: NDArray[np.float32] = np.full((height, width), np.nan, dtype=np.float32)
+
+    def record(
+        self,
+        x: int,
+        y: int,
+        hit: HitResult
+    ) -> None:
+        """
+        Record the marching statistics of the ray of a pixel.
+
+        Args:
+            x: Pixel X coordinate
+            y: Pixel Y coordinate
+            hit: The result returned by the ray marcher for this pixel
+        """
+
+        self.steps[y, x] = hit.steps
+
+        if hit.t_enter <= hit.t_exit:
+
+            self.t_enter[y, x] = hit.t_enter
+            self.t_exit[y, x] = hit.t_exit
+
+    def false_color(
+        self,
+        values: NDArray[np.float32] | NDArray[np.int32] | None = None
+    ) -> NDArray[np.uint8]:
+        """
+        Map a per-pixel array to a false-color RGBA image.
+
+        Args:
+            values: Array to colorize (default: the step counts).
+                NaN values are rendered as transparent pixels.
+
+        Returns:
+            RGBA image array of shape (height, width, 4)
+        """
+
+        data: NDArray[np.float32] = (
+            self.steps if values is None else values
+        ).astype(np.float32)
+
+        valid: NDArray[np.bool_] = ~np.isnan(data)
+
+        max_value: float = float(data[valid].max()) if valid.any() else 0.0
+
+        # Normalize to [0, 1]
+        norm: NDArray[np.float32] = np.zeros_like(data)
+
+        if max_value > 0:
+            norm[valid] = data[valid] / max_value
+
+        # Piecewise linear interpolation along the color ramp
+        anchors: NDArray[np.float32] = np.linspace(0.0, 1.0, len(HEATMAP_RAMP))
+
+        image: NDArray[np.uint8] = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+
+        for c in range(3):
+            image[..., c] = np.interp(norm, anchors, HEATMAP_RAMP[:, c]).astype(np.uint8)
+
+        image[..., 3] = np.where(valid, 255, 0)
+
+        return image
+
+    def save(
+        self,
+        path_prefix: str
+    ) -> None:
+        """
+        Save the raw statistics and the step count false-color image.
+
+        Writes:
+            - `{path_prefix}.npz`: arrays `steps`, `t_enter` and `t_exit`
+            - `{path_prefix}_steps.png`: false-color image of the step counts
+
+        Args:
+            path_prefix: Path of the outputs, without extension
+        """
+
+        np.savez(
+            f"{path_prefix}.npz",
+            steps=self.steps,
+            t_enter=self.t_enter,
+            t_exit=self.t_exit
+        )
+
+        image = Image.fromarray(self.false_color(), mode='RGBA')
+        image.save(f"{path_prefix}_steps.png")
+
+        print(f"Max DDA steps: {int(self.steps.max())}, mean: {float(self.steps.mean()):.2f}")
+        print(f"Heatmap saved to: {path_prefix}_steps.png and {path_prefix}.npz")
@@ -0,0 +1,334 @@
+from typing import Optional, Any, TYPE_CHECKING
+from collections import OrderedDict
+
+import os
+import json
+import hashlib
+
+from .voxel_arrays import VoxelArrays
+
+if TYPE_CHECKING:
+    from .voxel_grid import VoxelGrid
+
+
+class ModelCache:
+    """
+    Content-addressed cache of the imported naxel models (`import_voxel`).
+
+    Each distinct file content (SHA-256 of the file bytes) is parsed and
+    rasterized once, and kept as compact voxel arrays, so the same asset
+    referenced many times, or from several paths, is only built once.
+    The digest of a path is remembered with the file modification time and
+    size, so a cached model does not even need to read its file again.
+
+    A model is keyed by its content digest, the directory its own imports are
+    resolved from, and the digests of all the files it imports (recursively),
+    so a change in a nested import rebuilds the models including it.
+    """
+
+    def __init__(
+        self,
+        max_models: int = 64
+    ) -> None:
+
+        self.max_models: int = max(1, max_models)
+
+        # Model key -> voxels of the model (None if the model could not be built)
+        self._models: OrderedDict[str, Optional[VoxelArrays]] = OrderedDict()
+
+        # Model key -> voxel grid of the model, for instancing (built on demand)
+        self._grids: dict[str, VoxelGrid] = {}
+
+        # "content digest:directory" -> absolute paths of all the files imported
+        # by the model (recursively), recorded when it is built
+        self._dependencies: dict[str, list[str]] = {}
+
+        # Imported paths collected by the models being built (one set per model)
+        self._collecting: list[set[str]] = []
+
+        # Absolute path -> (modification time, size, content digest)
+        self._digests: dict[str, tuple[int, int, str]] = {}
+
+        # Absolute paths of the models being built, to detect import cycles
+        self._loading: list[str] = []
+
+    def clear(self) -> None:
+
+        self._models = OrderedDict()
+        self._grids = {}
+        self._digests = {}
+        self._dependencies = {}
+
+    def file_digest(
+        self,
+        path: str
+    ) -> Optional[str]:
+        """
+        Get the SHA-256 digest of the content of a file, None if it cannot be read.
+        The digests are cached, and only computed again when the file is modified.
+
+        Args:
+            path: Path of the file
+
+        Returns:
+            The hexadecimal digest, or None
+        """
+
+        try:
+            stat: os.stat_result = os.stat(path)
+
+        except OSError:
+            return None
+
+        cached: Optional[tuple[int, int, str]] = self._digests.get(path, None)
+
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        with open(path, "rb") as f:
+            digest: str = hashlib.sha256(f.read()).hexdigest()
+
+        self._digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+
+        return digest
+
+    def _model_key(
+        self,
+        base_key: str,
+        dependencies: list[str]
+    ) -> str:
+        """
+        Get the key of a model from its "content digest:directory" and the
+        current digests of the files it imports.
+        """
+
+        h: Any = hashlib.sha256(base_key.encode("utf-8"))
+
+        for dependency in dependencies:
+            h.update(f"\n{dependency}:{self.file_digest(dependency)}".encode("utf-8"))
+
+        return h.hexdigest()
+
+    def _record_dependencies(
+        self,
+        dependencies: list[str]
+    ) -> None:
+        """
+        Add imported paths to the dependencies of the model being built, if any.
+        """
+
+        if len(self._collecting) > 0:
+            self._collecting[-1].update(dependencies)
+
+    def get_dependencies(
+        self,
+        path: str,
+        source_dir: str = ""
+    ) -> list[str]:
+        """
+        Get all the files an imported model depends on: the model file itself
+        and the files it imports, recursively (building the model if needed).
+
+        Args:
+            path: Path of the model file (.json or .naxb), relative to `source_dir`
+            source_dir: Directory of the including naxel file
+
+        Returns:
+            The absolute paths of the files
+        """
+
+        abs_path: str = os.path.abspath(os.path.join(source_dir, path))
+
+        self._load_model(path, source_dir)
+
+        digest: Optional[str] = self.file_digest(abs_path)
+
+        if digest is None:
+            return [abs_path]
+
+        return [abs_path] + self._dependencies.get(f"{digest}:{os.path.dirname(abs_path)}", [])
+
+    def get_model(
+        self,
+        path: str,
+        source_dir: str = ""
+    ) -> Optional[VoxelArrays]:
+        """
+        Get the voxels of an imported naxel model (first frame), building it on first use.
+
+        Args:
+            path: Path of the model file (.json or .naxb), relative to `source_dir`
+            source_dir: Directory of the including naxel file
+
+        Returns:
+            The voxels of the model, or None if it cannot be loaded
+        """
+
+        key: Optional[str] = self._load_model(path, source_dir)
+
+        if key is None:
+            return None
+
+        return self._models[key]
+
+    def get_model_grid(
+        self,
+        path: str,
+        source_dir: str = ""
+    ) -> Optional["VoxelGrid"]:
+        """
+        Get the voxel grid of an imported naxel model, shared by all its instances.
+
+        Args:
+            path: Path of the model file (.json or .naxb), relative to `source_dir`
+            source_dir: Directory of the including naxel file
+
+        Returns:
+            The voxel grid of the model, or None if it cannot be loaded
+        """
+
+        # Import here to avoid circular dependency
+        from .voxel_grid import VoxelGrid
+
+        key: Optional[str] = self._load_model(path, source_dir)
+
+        if key is None:
+            return None
+
+        grid: Optional[VoxelGrid] = self._grids.get(key, None)
+
+        if grid is None:
+
+            model: Optional[VoxelArrays] = self._models[key]
+
+            if model is None:
+                return None
+
+            grid = VoxelGrid.from_arrays(model)
+
+            self._grids[key] = grid
+
+        return grid
+
+    def _load_model(
+        self,
+        path: str,
+        source_dir: str
+    ) -> Optional[str]:
+        """
+        Make sure the model of a file is built, and get its model key
+        (None if the file cannot be loaded, or is part of an import cycle).
+        """
+
+        abs_path: str = os.path.abspath(os.path.join(source_dir, path))
+
+        self._record_dependencies([abs_path])
+
+        if abs_path in self._loading:
+
+            print(f"Warning: Import cycle on {abs_path}, import ignored")
+
+            return None
+
+        digest: Optional[str] = self.file_digest(abs_path)
+
+        if digest is None:
+
+            print(f"Warning: Imported file not found: {abs_path}")
+
+            return None
+
+        # The same content imports different files from another directory
+        base_key: str = f"{digest}:{os.path.dirname(abs_path)}"
+
+        dependencies: Optional[list[str]] = self._dependencies.get(base_key, None)
+
+        if dependencies is not None:
+
+            key: str = self._model_key(base_key, dependencies)
+
+            if key in self._models:
+
+                self._models.move_to_end(key)
+                self._record_dependencies(dependencies)
+
+                if self._models[key] is None:
+                    return None
+
+                return key
+
+        self._loading.append(abs_path)
+        self._collecting.append(set())
+
+        try:
+            model: Optional[VoxelArrays] = self._build_model(abs_path)
+
+        finally:
+            self._loading.pop()
+            collected: set[str] = self._collecting.pop()
+
+        dependencies = sorted(collected)
+
+        self._dependencies[base_key] = dependencies
+        self._record_dependencies(dependencies)
+
+        key = self._model_key(base_key, dependencies)
+
+        self._models[key] = model
+
+        if len(self._models) > self.max_models:
+
+            evicted: str
+            evicted, _ = self._models.popitem(last=False)
+
+            self._grids.pop(evicted, None)
+
+        if model is None:
+            return None
+
+        return key
+
+    def _build_model(
+        self,
+        abs_path: str
+    ) -> Optional[VoxelArrays]:
+        """
+        Load a naxel file and build the voxels of its first frame.
+        The imports of the model are resolved relative to its own directory.
+        """
+
+        # Import here to avoid circular dependency
+        from .naxel import Naxel
+        from .naxel_loader import load_naxel
+        from .naxel_binary import load_naxel_binary
+        from .voxel_grid import VoxelGrid
+
+        naxel: Naxel
+
+        if abs_path.endswith(".naxb"):
+
+            naxel = load_naxel_binary(abs_path)
+
+        else:
+
+            with open(abs_path, "r", encoding="utf-8") as f:
+                json_dict: dict[str, Any] = json.load(f)
+
+            naxel = load_naxel(
+                json_dict,
+                lazy_frames=True,
+                source_dir=os.path.dirname(abs_path)
+            )
+
+        if len(naxel.data_frames) == 0:
+            return None
+
+        grid: VoxelGrid = VoxelGrid()
+        grid.model_cache = self
+        grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+        return grid.export_arrays()
+
+
+# Model cache shared by the voxel grids
+MODEL_CACHE: ModelCache = ModelCache()
@@ -1,4 +1,7 @@
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
 
 from .vec import Vec3
 from .color import Color
@@ -8,6 +11,8 @@ from .light_value import LightValue
 from .environment import Environment
 from .camera import Camera
 from .utils_dicts import merge_dicts
+from .voxel_key import format_voxel_key
+from .voxel_arrays import VoxelArrays, compute_voxels_delta
 
 
 class NaxelGeneralData:
@@ -18,6 +23,7 @@ class NaxelGeneralData:
         color_palette: ColorPalette = ColorPalette(palette={}),
         grid_thickness: int = 0,
         grid_color: Color = Color(),
+        source_dir: str = "",
     ) -> None:
 
         self.default_color: Color = default_color
@@ -25,6 +31,106 @@ class NaxelGeneralData:
         self.grid_thickness: int = grid_thickness
         self.grid_color: Color = grid_color
 
+        # Directory of the naxel file, the imported files are relative to it
+        self.source_dir: str = source_dir
+
+    def export_to_dict(self) -> dict[str, Any]:
+
+        return {
+            "default_color": self.default_color.export_to_lst(),
+            "color_palette": self.color_palette.export_to_dict(),
+            "grid_thickness": self.grid_thickness,
+            "grid_color": self.grid_color.export_to_lst(),
+        }
+
+
+def export_frame_voxels(
+    arrays: VoxelArrays,
+    voxels_format: str = "dict",
+    rle_axis: str = "x"
+) -> dict[str, Any]:
+    """
+    Export the resolved voxels of a frame as a post-processed voxels field.
+
+    Args:
+        arrays: The voxels of the built frame
+        voxels_format: "dict" for a "voxels_dict" field, "rle" for a "voxels_rle" field
+        rle_axis: Axis of the runs of the "rle" format ("x", "y" or "z")
+
+    Returns:
+        Dictionary with the voxels field, to merge into the frame dictionary
+    """
+
+    if voxels_format == "rle":
+        return {"voxels_rle": arrays.export_to_rle(rle_axis)}
+
+    return {"voxels_dict": arrays.export_to_dict()}
+
+
+def export_frames_voxels(
+    frames_timing: list[tuple[int, float]],
+    frames_arrays: list[VoxelArrays],
+    voxels_format: str = "dict",
+    rle_axis: str = "x",
+    delta_frames: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Export the resolved voxels of the frames of an animated naxel object.
+
+    With `delta_frames`, a frame only lists its changes from the last key frame
+    ("base_frame": index of the key frame, "voxels_removed": removed positions,
+    and the added or recolored voxels). A frame becomes a new key frame, exported
+    in full, when its changes are at least half its size.
+
+    Args:
+        frames_timing: The (frame_id, frame_duration) of each frame
+        frames_arrays: The voxels of each built frame
+        voxels_format: "dict" or "rle" (see `export_frame_voxels`)
+        rle_axis: Axis of the runs of the "rle" format
+        delta_frames: Export the frames as changes from a previous key frame
+
+    Returns:
+        The list of frame dictionaries
+    """
+
+    frames_data: list[dict[str, Any]] = []
+
+    key_frame_index: int = -1
+
+    for idx, ((frame_id, frame_duration), arrays) in enumerate(zip(frames_timing, frames_arrays)):
+
+        frame_dict: dict[str, Any] = {
+            "frame_id": frame_id,
+            "frame_duration": frame_duration,
+        }
+
+        if delta_frames and key_frame_index >= 0:
+
+            removed: NDArray[np.int64]
+            changed: VoxelArrays
+            removed, changed = compute_voxels_delta(frames_arrays[key_frame_index], arrays)
+
+            if 2 * (len(removed) + len(changed)) < len(arrays):
+
+                frame_dict["base_frame"] = key_frame_index
+                frame_dict["voxels_removed"] = [
+                    f"{x},{y},{z}" for x, y, z in removed.tolist()
+                ]
+
+                frames_data.append(
+                    merge_dicts(frame_dict, export_frame_voxels(changed, voxels_format, rle_axis))
+                )
+
+                continue
+
+        key_frame_index = idx
+
+        frames_data.append(
+            merge_dicts(frame_dict, export_frame_voxels(arrays, voxels_format, rle_axis))
+        )
+
+    return frames_data
+
 
 class NaxelDataFrame:
 
@@ -39,10 +145,21 @@ class NaxelDataFrame:
         frame_duration: float,
 
         # --- Voxels ---
-        voxels_dict: Optional[dict[Vec3, VoxelValue]] = None,
+        # (voxels_dict keys are packed integer coordinates, see voxel_key.py)
+        voxels_dict: Optional[dict[int, VoxelValue]] = None,
         voxels_list: Optional[list[VoxelValue]] = None,
         voxels_grid: Optional[list[list[list[VoxelValue]]]] = None,
 
+        # Already resolved voxels (post-processed naxel objects)
+        voxels_arrays: Optional[VoxelArrays] = None,
+
+        # --- Delta Frame ---
+        # (the voxels of the base frame, minus the removed voxels, plus the voxels of this frame;
+        # the base frame is the frame at base_frame_index in the frames sequence, see `get_base_frame`)
+        frames: Optional[Sequence["NaxelDataFrame"]] = None,
+        base_frame_index: Optional[int] = None,
+        voxels_removed: Optional[list[int]] = None,
+
         # -- Light Emission --
         light_emission_dict: Optional[dict[Vec3, LightValue]] = None,
         light_emission_items: Optional[list[tuple[Vec3, LightValue]]] = None,
@@ -62,9 +179,15 @@ class NaxelDataFrame:
         self.frame_duration: float = frame_duration
 
         # --- Voxels ---
-        self.voxels_dict: Optional[dict[Vec3, VoxelValue]] = voxels_dict
+        self.voxels_dict: Optional[dict[int, VoxelValue]] = voxels_dict
         self.voxels_list: Optional[list[VoxelValue]] = voxels_list
         self.voxels_grid: Optional[list[list[list[VoxelValue]]]] = voxels_grid
+        self.voxels_arrays: Optional[VoxelArrays] = voxels_arrays
+
+        # --- Delta Frame ---
+        self.frames: Optional[Sequence[NaxelDataFrame]] = frames
+        self.base_frame_index: Optional[int] = base_frame_index
+        self.voxels_removed: Optional[list[int]] = voxels_removed
 
         # -- Light Emission --
         self.light_emission_dict: Optional[dict[Vec3, LightValue]] = light_emission_dict
@@ -75,6 +198,19 @@ class NaxelDataFrame:
         self.light_value_list: Optional[list[tuple[Vec3, LightValue]]] = light_value_list
         self.light_value_grid: Optional[list[list[list[LightValue]]]] = light_value_grid
 
+    def get_base_frame(self) -> Optional["NaxelDataFrame"]:
+        """
+        Get the base frame of a delta frame, None if it is a full frame.
+
+        The base frame is looked up by index in the frames sequence instead of being
+        referenced, so lazily parsed frames (see `LazyFrameList`) can be evicted.
+        """
+
+        if self.base_frame_index is None or self.frames is None:
+            return None
+
+        return self.frames[self.base_frame_index]
+
     def export_to_dict(self, as_a_frame: bool = False) -> dict[str, Any]:
 
         dict_res: dict[str, Any] = {}
@@ -83,12 +219,26 @@ class NaxelDataFrame:
             dict_res["frame_id"] = self.frame_id
             dict_res["frame_duration"] = self.frame_duration
 
+        if self.base_frame_index is not None:
+            dict_res["base_frame"] = self.base_frame_index
+
+        if self.voxels_removed is not None:
+            dict_res["voxels_removed"] = [
+                format_voxel_key(k) for k in self.voxels_removed
+            ]
+
         if self.voxels_dict is not None:
             dict_res["voxels_dict"] = {
-                k.export_to_str(): v.export_to_dictable()
+                format_voxel_key(k): v.export_to_dictable()
                 for k, v in self.voxels_dict.items()
             }
 
+        if self.voxels_arrays is not None:
+            dict_res["voxels_dict"] = merge_dicts(
+                dict_res.get("voxels_dict", {}),
+                self.voxels_arrays.export_to_dict()
+            )
+
         if self.voxels_list is not None:
             dict_res["voxels_list"] = [
                 v.export_to_dictable()
@@ -167,7 +317,7 @@ class Naxel:
         general_data: NaxelGeneralData = NaxelGeneralData(),
 
         # --- Data Frames ---
-        data_frames: list[NaxelDataFrame] = [],
+        data_frames: Sequence[NaxelDataFrame] = [],
 
         # --- Environment ---
         environment: Environment = Environment(),
@@ -191,7 +341,7 @@ class Naxel:
         self.general_data: NaxelGeneralData = general_data
 
         # --- Data Frame ---
-        self.data_frames: list[NaxelDataFrame] = data_frames
+        self.data_frames: Sequence[NaxelDataFrame] = data_frames
 
         # --- Environment ---
         self.environment: Environment = environment
@@ -254,7 +404,13 @@ class Naxel:
 
         return res
 
-    def export_to_dict_preprocessed(self) -> dict[str, Any]:
+    def export_to_dict_preprocessed(
+        self,
+        workers: int = 1,
+        voxels_format: str = "dict",
+        rle_axis: str = "x",
+        delta_frames: bool = False
+    ) -> dict[str, Any]:
         """
         Export the naxel object with all shapes expanded to individual voxels.
 
@@ -263,12 +419,21 @@ class Naxel:
         The resulting JSON can be used for faster rendering as it requires
         no shape processing.
 
+        Args:
+            workers: Number of processes building the frames of an animated
+                naxel object (1: build them in this process, 0: one per CPU)
+            voxels_format: "dict" to export each voxel in "voxels_dict", or "rle" to
+                export runs of same-colored voxels in "voxels_rle" (smaller, faster to load)
+            rle_axis: Axis of the runs of the "rle" format ("x", "y" or "z")
+            delta_frames: Export the frames of an animated naxel object as changes
+                from a previous key frame (see `export_frames_voxels`)
+
         Returns:
             Dictionary with metadata, environment, camera, and processed voxels_dict
         """
 
         # Import here to avoid circular dependency
-        from .voxel_grid import VoxelGrid
+        from .voxel_grid import VoxelGrid, build_frames
 
         res: dict[str, Any] = {
             # --- Metadata ---
@@ -298,27 +463,62 @@ class Naxel:
             grid: VoxelGrid = VoxelGrid()
             grid.build_from_frame(self.data_frames[0], self.general_data)
 
-            res["voxels_dict"] = grid.export_to_dict()
+            res = merge_dicts(res, export_frame_voxels(grid.export_arrays(), voxels_format, rle_axis))
 
         else:
 
-            # Process each frame
-            frames_data: list[dict[str, Any]] = []
+            # (frame_id, frame_duration) of each frame
+            frames_timing: list[tuple[int, float]]
+            frames_arrays: list[VoxelArrays]
 
-            for idx, df in enumerate(self.data_frames):
+            frames_json: Optional[list[dict[str, Any]]] = None
 
-                grid = VoxelGrid()
-                grid.build_from_frame(df, self.general_data)
+            if workers != 1:
 
-                frame_dict: dict[str, Any] = {
-                    "frame_id": df.frame_id,
-                    "frame_duration": df.frame_duration,
-                    "voxels_dict": grid.export_to_dict(),
-                }
+                # Import here to avoid circular dependency
+                from .parallel_frames import naxel_frames_data
+
+                frames_json = naxel_frames_data(self)
+
+                # Delta frames need their base frame, they are built in this process
+                if any("base_frame" in frame_json for frame_json in frames_json):
+                    frames_json = None
 
-                frames_data.append(frame_dict)
+            if frames_json is not None:
 
-            res["frames"] = frames_data
+                # Import here to avoid circular dependency
+                from .parallel_frames import build_frames_arrays
+
+                # Frames are parsed and built by worker processes from their JSON
+                frames_arrays = build_frames_arrays(
+                    frames_json,
+                    self.general_data.export_to_dict(),
+                    workers if workers > 0 else None,
+                    self.general_data.source_dir
+                )
+
+                frames_timing = [
+                    (frame_json.get("frame_id", idx), frame_json.get("frame_duration", 1.0))
+                    for idx, frame_json in enumerate(frames_json)
+                ]
+
+            else:
+
+                # Process each frame (delta frames start from the grid of their base frame)
+                frames_arrays = [
+                    frame_grid.export_arrays()
+                    for frame_grid in build_frames(self.data_frames, self.general_data)
+                ]
+
+                frames_timing = [(df.frame_id, df.frame_duration) for df in self.data_frames]
+
+            res["frames"] = export_frames_voxels(
+                frames_timing,
+                frames_arrays,
+                voxels_format,
+                rle_axis,
+                delta_frames
+            )
 
         res = merge_dicts(
             res,
@@ -0,0 +1,465 @@
+"""
+Binary naxel container (`.naxb`), holding a post-processed naxel object.
+
+All integers are little-endian, and every section starts on an 8 bytes boundary,
+so the arrays can be viewed directly from a memory-mapped file without copying.
+
+Layout:
+    - Header (see `_HEADER`)
+    - Metadata: UTF-8 JSON of every non-voxel field of the post-processed naxel object
+    - Palette table: palette_count x [r, g, b, a] uint8
+    - Frame table: frame_count x `_FRAME_ENTRY`
+    - Per-frame sections: voxel_count x [x, y, z] int16/int32 coordinates,
+      then voxel_count x uint8/uint16/uint32 indices into the palette table
+"""
+
+from typing import Optional, Any
+
+import os
+import io
+import mmap
+import json
+import struct
+import argparse
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .naxel import Naxel, NaxelDataFrame
+from .naxel_loader import load_naxel
+from .voxel_arrays import VoxelArrays, coord_dtype_for, merge_color_tables, apply_voxels_delta
+from .voxel_key import parse_voxel_key, unpack_voxel_keys
+
+
+NAXEL_BINARY_MAGIC: bytes = b"NAXB"
+NAXEL_BINARY_VERSION: int = 1
+
+# Set if the frames are stored under "frames" (animated naxel object)
+FLAG_MULTI_FRAME: int = 1
+
+# magic, version, flags, metadata_offset, metadata_size, palette_offset, palette_count, frame_count, frame_table_offset
+_HEADER: struct.Struct = struct.Struct("<4sHHQQQIIQ")
+
+# frame_id, frame_duration, voxel_count, coords_offset, indices_offset, coord_itemsize, index_itemsize
+_FRAME_ENTRY: struct.Struct = struct.Struct("<qdQQQBB6x")
+
+_ALIGNMENT: int = 8
+
+
+def _pad(buffer: io.BytesIO) -> int:
+    """
+    Pad the buffer with zeros to the next aligned offset, and return that offset.
+    """
+
+    offset: int = buffer.tell()
+    padding: int = (-offset) % _ALIGNMENT
+
+    buffer.write(b"\x00" * padding)
+
+    return offset + padding
+
+
+def _frame_voxel_arrays(frame_data: dict[str, Any]) -> VoxelArrays:
+    """
+    Get the resolved voxels of a post-processed frame dictionary ("voxels_rle" or "voxels_dict").
+    """
+
+    if "voxels_rle" in frame_data:
+        return VoxelArrays.from_rle(frame_data["voxels_rle"])
+
+    return VoxelArrays.from_voxels_dict(frame_data.get("voxels_dict", {}))
+
+
+class NaxelBinaryFrame:
+
+    def __init__(
+        self,
+        frame_id: int,
+        frame_duration: float,
+        coords: NDArray[np.signedinteger[Any]],
+        indices: NDArray[np.unsignedinteger[Any]],
+    ) -> None:
+
+        self.frame_id: int = frame_id
+        self.frame_duration: float = frame_duration
+        self.coords: NDArray[np.signedinteger[Any]] = coords
+        self.indices: NDArray[np.unsignedinteger[Any]] = indices
+
+
+class NaxelBinary:
+    """
+    A memory-mapped binary naxel file.
+
+    The palette and the per-frame arrays are read-only views on the mapped file:
+    the mapping is released once the file is closed and no view is referenced anymore.
+    """
+
+    def __init__(
+        self,
+        path: str
+    ) -> None:
+
+        self.path: str = path
+
+        self.is_multi_frame: bool = False
+        self.metadata: dict[str, Any] = {}
+        self.palette: NDArray[np.uint8] = np.zeros((0, 4), dtype=np.uint8)
+        self.frames: list[NaxelBinaryFrame] = []
+
+        # The mapping keeps its own handle on the file, which can be closed right away
+        with open(path, "rb") as f:
+
+            try:
+                self._mmap: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            except ValueError:
+                # Empty file
+                raise ValueError(f"Not a binary naxel file: {path}")
+
+        try:
+            self._read()
+
+        except BaseException:
+            self.close()
+            raise
+
+    def _read(self) -> None:
+        """
+        Read the header and the metadata, and view the palette and the frames arrays.
+        """
+
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"Not a binary naxel file: {self.path}")
+
+        magic: bytes
+        version: int
+        flags: int
+        metadata_offset: int
+        metadata_size: int
+        palette_offset: int
+        palette_count: int
+        frame_count: int
+        frame_table_offset: int
+
+        (
+            magic, version, flags,
+            metadata_offset, metadata_size,
+            palette_offset, palette_count,
+            frame_count, frame_table_offset
+        ) = _HEADER.unpack_from(self._mmap, 0)
+
+        if magic != NAXEL_BINARY_MAGIC:
+            raise ValueError(f"Not a binary naxel file: {self.path}")
+
+        if version > NAXEL_BINARY_VERSION:
+            raise ValueError(f"Unsupported binary naxel version {version}: {self.path}")
+
+        self.is_multi_frame = bool(flags & FLAG_MULTI_FRAME)
+
+        self.metadata = json.loads(
+            self._mmap[metadata_offset:metadata_offset + metadata_size].decode("utf-8")
+        )
+
+        self.palette = np.frombuffer(
+            self._mmap, dtype=np.uint8, count=palette_count * 4, offset=palette_offset
+        ).reshape(-1, 4)
+
+        for i in range(frame_count):
+
+            frame_id: int
+            frame_duration: float
+            voxel_count: int
+            coords_offset: int
+            indices_offset: int
+            coord_itemsize: int
+            index_itemsize: int
+
+            (
+                frame_id, frame_duration, voxel_count,
+                coords_offset, indices_offset,
+                coord_itemsize, index_itemsize
+            ) = _FRAME_ENTRY.unpack_from(self._mmap, frame_table_offset + i * _FRAME_ENTRY.size)
+
+            coords: NDArray[np.signedinteger[Any]] = np.frombuffer(
+                self._mmap,
+                dtype=np.dtype(f"<i{coord_itemsize}"),
+                count=voxel_count * 3,
+                offset=coords_offset
+            ).reshape(-1, 3)
+
+            indices: NDArray[np.unsignedinteger[Any]] = np.frombuffer(
+                self._mmap,
+                dtype=np.dtype(f"<u{index_itemsize}"),
+                count=voxel_count,
+                offset=indices_offset
+            )
+
+            self.frames.append(
+                NaxelBinaryFrame(frame_id, frame_duration, coords, indices)
+            )
+
+    def frame_arrays(
+        self,
+        frame_index: int
+    ) -> VoxelArrays:
+        """
+        Get the voxels of a frame as (zero-copy) voxel arrays.
+        """
+
+        frame: NaxelBinaryFrame = self.frames[frame_index]
+
+        return VoxelArrays(frame.coords, frame.indices, self.palette)
+
+    def export_to_dict(self) -> dict[str, Any]:
+        """
+        Export as a post-processed naxel JSON dictionary, loadable with `load_naxel`.
+        """
+
+        res: dict[str, Any] = dict(self.metadata)
+
+        if not self.is_multi_frame:
+
+            if len(self.frames) > 0:
+                res["voxels_dict"] = self.frame_arrays(0).export_to_dict()
+
+        else:
+
+            res["frames"] = [
+                {
+                    "frame_id": frame.frame_id,
+                    "frame_duration": frame.frame_duration,
+                    "voxels_dict": self.frame_arrays(i).export_to_dict(),
+                }
+                for i, frame in enumerate(self.frames)
+            ]
+
+        return res
+
+    def close(self) -> None:
+
+        self.frames = []
+        self.palette = np.zeros((0, 4), dtype=np.uint8)
+
+        try:
+            self._mmap.close()
+
+        except BufferError:
+            # Some array views are still referenced, the mapping will be
+            # released when they are garbage collected
+            pass
+
+    def __enter__(self) -> "NaxelBinary":
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+
+        self.close()
+
+
+def save_naxel_binary(
+    json_dict: dict[str, Any],
+    path: str
+) -> None:
+    """
+    Save a post-processed naxel JSON dictionary (see `Naxel.export_to_dict_preprocessed`)
+    as a binary naxel file.
+
+    Args:
+        json_dict: The post-processed naxel dictionary
+        path: Path of the binary file to write
+    """
+
+    metadata: dict[str, Any] = {
+        k: v
+        for k, v in json_dict.items()
+        if k not in ("voxels_dict", "voxels_rle", "frames")
+    }
+
+    # (frame_id, frame_duration, voxels)
+    frames: list[tuple[int, float, VoxelArrays]] = []
+
+    flags: int = 0
+
+    if "frames" in json_dict:
+
+        flags |= FLAG_MULTI_FRAME
+
+        for idx, frame_data in enumerate(json_dict["frames"]):
+
+            frames.append((
+                int(frame_data.get("frame_id", idx)),
+                float(frame_data.get("frame_duration", 1.0)),
+                _frame_voxel_arrays(frame_data)
+            ))
+
+            # Delta frames are stored in full, applied to their (already resolved) base frame
+            base_index: Any = frame_data.get("base_frame", None)
+
+            if isinstance(base_index, int) and 0 <= base_index < idx:
+
+                removed: NDArray[np.int32] = unpack_voxel_keys(np.array(
+                    [parse_voxel_key(pos) for pos in frame_data.get("voxels_removed", [])],
+                    dtype=np.int64
+                ))
+
+                frames[idx] = (
+                    frames[idx][0],
+                    frames[idx][1],
+                    apply_voxels_delta(frames[base_index][2], removed, frames[idx][2])
+                )
+
+    elif "voxels_dict" in json_dict or "voxels_rle" in json_dict:
+
+        frames.append((0, 1.0, _frame_voxel_arrays(json_dict)))
+
+    palette: NDArray[np.uint8]
+    frame_indices: list[NDArray[np.unsignedinteger[Any]]]
+    palette, frame_indices = merge_color_tables([va for _, _, va in frames])
+
+    buffer: io.BytesIO = io.BytesIO()
+
+    # Header, written again at the end once the offsets are known
+    buffer.write(b"\x00" * _HEADER.size)
+
+    metadata_offset: int = _pad(buffer)
+    metadata_bytes: bytes = json.dumps(metadata).encode("utf-8")
+    buffer.write(metadata_bytes)
+
+    palette_offset: int = _pad(buffer)
+    buffer.write(np.ascontiguousarray(palette, dtype=np.uint8).tobytes())
+
+    frame_table_offset: int = _pad(buffer)
+    buffer.write(b"\x00" * (_FRAME_ENTRY.size * len(frames)))
+
+    frame_entries: list[bytes] = []
+
+    for (frame_id, frame_duration, va), indices in zip(frames, frame_indices):
+
+        coords_dtype: np.dtype[Any] = np.dtype(coord_dtype_for(va.coords)).newbyteorder("<")
+        indices_dtype: np.dtype[Any] = indices.dtype.newbyteorder("<")
+
+        coords_offset: int = _pad(buffer)
+        buffer.write(np.ascontiguousarray(va.coords, dtype=coords_dtype).tobytes())
+
+        indices_offset: int = _pad(buffer)
+        buffer.write(np.ascontiguousarray(indices, dtype=indices_dtype).tobytes())
+
+        frame_entries.append(_FRAME_ENTRY.pack(
+            frame_id,
+            frame_duration,
+            len(va),
+            coords_offset,
+            indices_offset,
+            coords_dtype.itemsize,
+            indices_dtype.itemsize,
+        ))
+
+    buffer.seek(0)
+
+    buffer.write(_HEADER.pack(
+        NAXEL_BINARY_MAGIC,
+        NAXEL_BINARY_VERSION,
+        flags,
+        metadata_offset,
+        len(metadata_bytes),
+        palette_offset,
+        len(palette),
+        len(frames),
+        frame_table_offset,
+    ))
+
+    buffer.seek(frame_table_offset)
+    buffer.write(b"".join(frame_entries))
+
+    with open(path, "wb") as f:
+        f.write(buffer.getvalue())
+
+
+def export_naxel_binary(
+    naxel: Naxel,
+    path: str
+) -> None:
+    """
+    Pre-process a naxel object and save it as a binary naxel file.
+    """
+
+    save_naxel_binary(naxel.export_to_dict_preprocessed(), path)
+
+
+def open_naxel_binary(path: str) -> NaxelBinary:
+    """
+    Open a binary naxel file with memory mapping.
+    """
+
+    return NaxelBinary(path)
+
+
+def load_naxel_binary(path: str) -> Naxel:
+    """
+    Load a Naxel object from a binary naxel file, without copying its voxels:
+    the voxel arrays of the frames are read-only views on the memory-mapped file,
+    which stays mapped as long as they are referenced.
+    """
+
+    with open_naxel_binary(path) as nb:
+
+        # Metadata only: the frames are built directly from the mapped arrays
+        naxel: Naxel = load_naxel(nb.metadata)
+
+        naxel.data_frames = [
+            NaxelDataFrame(
+                general_data=naxel.general_data,
+                frame_id=frame.frame_id,
+                frame_duration=frame.frame_duration,
+                voxels_arrays=VoxelArrays(frame.coords, frame.indices, nb.palette)
+            )
+            for frame in nb.frames
+        ]
+
+        return naxel
+
+
+if __name__ == "__main__":
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Convert a naxel JSON file to the binary naxel format, or back"
+    )
+
+    parser.add_argument('--file', type=str, required=True, help="Path to a naxel file (.json or .naxb)")
+    parser.add_argument('--output', type=str, default=None, help="Output path")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    filepath: str = args.file
+
+    if not os.path.exists(filepath):
+        print(f"Error: File not found: {filepath}")
+        exit(1)
+
+    output: Optional[str] = args.output
+
+    if filepath.endswith(".json"):
+
+        with open(filepath, "r", encoding="utf-8") as f:
+            json_dict: dict[str, Any] = json.load(f)
+
+        if output is None:
+            output = f"{os.path.splitext(filepath)[0]}.naxb"
+
+        export_naxel_binary(
+            load_naxel(json_dict, source_dir=os.path.dirname(os.path.abspath(filepath))),
+            output
+        )
+
+    else:
+
+        if output is None:
+            output = f"{os.path.splitext(filepath)[0]}_preprocessed.json"
+
+        with open_naxel_binary(filepath) as nb:
+
+            with open(output, "w", encoding="utf-8") as f:
+                json.dump(nb.export_to_dict(), f)
+
+    print(f"Converted naxel saved to: {output}")
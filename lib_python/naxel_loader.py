@@ -1,8 +1,9 @@
-from typing import Optional, Any, cast
+from typing import Optional, Any, Sequence, cast, overload
 
 import os
 import json
 import argparse
+from collections import OrderedDict
 
 from .vec import Vec3, parse_vec3
 from .color import Color
@@ -13,110 +14,312 @@ from .environment import Environment, EnvironmentColor, EnvironmentSkyBox
 from .camera import Camera
 from .naxel import Naxel, NaxelDataFrame, NaxelGeneralData
 from .parse_voxels import parse_voxels_dict, parse_voxels_list
+from .voxel_arrays import VoxelArrays
+from .voxel_key import parse_voxel_key
 
 
 
-def load_dataframes(
+def load_general_data(
     json_dict: dict[str, Any],
-    general_data: Optional[NaxelGeneralData] = None
-) -> list[NaxelDataFrame]:
-
+    source_dir: str = ""
+) -> NaxelGeneralData:
     """
-    Load data frames from the JSON dictionary.
+    Load the general data (default color, color palette, grid) from the JSON dictionary.
 
-    Supports both single-frame and multi-frame formats:
-        - Single frame: voxels_dict/voxels_list at root level
-        - Multi-frame: "frames" array with individual frame data
+    Args:
+        json_dict: The naxel JSON dictionary
+        source_dir: Directory of the naxel file, the imported files are relative to it
     """
 
-    # Create a default general_data if not provided
-    if general_data is None:
-        general_data = NaxelGeneralData()
+    default_color: Color = parse_color(json_dict.get("default_color", [0, 0, 0, 255]))
+    color_palette: ColorPalette = parse_color_palette(json_dict.get("color_palette", {}))
+    grid_thickness: int = json_dict.get("grid_thickness", 0)
+    grid_color: Color = parse_color(json_dict.get("grid_color", [0, 0, 0, 255]))
+
+    return NaxelGeneralData(
+        default_color,
+        color_palette,
+        grid_thickness,
+        grid_color,
+        source_dir,
+    )
+
+
+def load_dataframe(
+    frame_data: dict[str, Any],
+    general_data: NaxelGeneralData,
+    default_frame_id: int = 0,
+    is_post_processed: bool = False,
+    frames: Optional[Sequence[NaxelDataFrame]] = None
+) -> NaxelDataFrame:
+    """
+    Load a single data frame from its JSON dictionary.
+
+    Args:
+        frame_data: The JSON dictionary of the frame (an entry of "frames",
+            or the root dictionary of a single-frame naxel object)
+        general_data: General data of the naxel object (color palette, ...)
+        default_frame_id: Frame id to use if the frame has no "frame_id"
+        is_post_processed: The voxels_dict only contains resolved RGBA colors,
+            it is loaded directly as arrays, without VoxelValue objects
+        frames: The frames sequence of an animated naxel object (the frame being at
+            index `default_frame_id` in it), in which the base frame of a delta frame
+            is looked up (see `frame_base_index`)
+    """
 
     color_palette: ColorPalette = general_data.color_palette
-    data_frames: list[NaxelDataFrame] = []
 
-    # Check for multi-frame format
-    if "frames" in json_dict and isinstance(json_dict["frames"], list):
+    frame_id: int = frame_data.get("frame_id", default_frame_id)
+    frame_duration: float = frame_data.get("frame_duration", 1.0)
 
-        for idx, frame_data in enumerate(cast(Any, json_dict["frames"])):
+    # Parse voxels
+    voxels_dict: Optional[dict[int, VoxelValue]] = None
+    voxels_list: Optional[list[VoxelValue]] = None
+    voxels_arrays: Optional[VoxelArrays] = None
 
-            frame_id: int = frame_data.get("frame_id", idx)
-            frame_duration: float = frame_data.get("frame_duration", 1.0)
+    if "voxels_dict" in frame_data:
 
-            # Parse voxels
-            voxels_dict: Optional[dict[Vec3, VoxelValue]] = None
-            voxels_list: Optional[list[VoxelValue]] = None
+        if is_post_processed:
+            voxels_arrays = VoxelArrays.from_voxels_dict(frame_data["voxels_dict"])
 
-            if "voxels_dict" in frame_data:
-                voxels_dict = parse_voxels_dict(frame_data["voxels_dict"], color_palette)
+        else:
+            voxels_dict = parse_voxels_dict(frame_data["voxels_dict"], color_palette)
 
-            if "voxels_list" in frame_data:
-                voxels_list = parse_voxels_list(frame_data["voxels_list"], color_palette)
+    if "voxels_rle" in frame_data:
+        voxels_arrays = VoxelArrays.from_rle(frame_data["voxels_rle"])
 
-            # Parse light emission
-            light_emission_dict: Optional[dict[Vec3, LightValue]] = None
+    if "voxels_list" in frame_data:
+        voxels_list = parse_voxels_list(frame_data["voxels_list"], color_palette)
 
-            if "light_emission_dict" in frame_data:
+    # Parse delta frame changes (only the changes are parsed, not the base frame voxels)
+    base_frame_index: Optional[int] = None
+    voxels_removed: Optional[list[int]] = None
 
-                light_emission_dict = {}
+    if frames is not None:
+        base_frame_index = frame_base_index(frame_data, default_frame_id)
 
-                for key, value in frame_data["light_emission_dict"].items():
-                    light_emission_dict[parse_vec3(key)] = parse_light_value(value)
+    if "voxels_removed" in frame_data:
+        voxels_removed = [parse_voxel_key(pos) for pos in frame_data["voxels_removed"]]
 
-            data_frame: NaxelDataFrame = NaxelDataFrame(
-                general_data=general_data,
-                frame_id=frame_id,
-                frame_duration=frame_duration,
-                voxels_dict=voxels_dict,
-                voxels_list=voxels_list,
-                light_emission_dict=light_emission_dict,
-            )
+    # Parse light emission
+    light_emission_dict: Optional[dict[Vec3, LightValue]] = None
 
-            data_frames.append(data_frame)
+    if "light_emission_dict" in frame_data:
 
-    else:
+        light_emission_dict = {}
 
-        # Single-frame format: voxels at root level
-        voxels_dict = None
-        voxels_list = None
+        for key, value in frame_data["light_emission_dict"].items():
+            light_emission_dict[parse_vec3(key)] = parse_light_value(value)
 
-        if "voxels_dict" in json_dict:
-            voxels_dict = parse_voxels_dict(json_dict["voxels_dict"], color_palette)
+    return NaxelDataFrame(
+        general_data=general_data,
+        frame_id=frame_id,
+        frame_duration=frame_duration,
+        voxels_dict=voxels_dict,
+        voxels_list=voxels_list,
+        voxels_arrays=voxels_arrays,
+        frames=frames,
+        base_frame_index=base_frame_index,
+        voxels_removed=voxels_removed,
+        light_emission_dict=light_emission_dict,
+    )
 
-        if "voxels_list" in json_dict:
-            voxels_list = parse_voxels_list(json_dict["voxels_list"], color_palette)
 
-        # Parse light emission
-        light_emission_dict = None
+def frame_base_index(
+    frame_data: dict[str, Any],
+    frame_index: int
+) -> Optional[int]:
+    """
+    Get the index of the base frame of a delta frame, None if it is a full frame.
 
-        if "light_emission_dict" in json_dict:
+    A delta frame references an earlier frame of the "frames" list with
+    "base_frame", and only lists its changes: "voxels_removed" positions, and
+    added or recolored voxels in its usual voxels fields.
 
-            light_emission_dict = {}
+    Args:
+        frame_data: The JSON dictionary of the frame
+        frame_index: The index of the frame in the "frames" list
 
-            for key, value in json_dict["light_emission_dict"].items():
-                light_emission_dict[parse_vec3(key)] = parse_light_value(value)
+    Returns:
+        The index of the base frame, or None
+    """
 
-        # Only create a frame if there's actual data
-        if voxels_dict is not None or voxels_list is not None:
+    if "base_frame" not in frame_data:
+        return None
 
-            data_frame = NaxelDataFrame(
-                general_data=general_data,
-                frame_id=0,
-                frame_duration=1.0,
-                voxels_dict=voxels_dict,
-                voxels_list=voxels_list,
-                light_emission_dict=light_emission_dict,
-            )
+    base_index: Any = frame_data["base_frame"]
+
+    # Only earlier frames can be referenced, so there are no reference cycles
+    if not isinstance(base_index, int) or base_index < 0 or base_index >= frame_index:
+
+        print(f"Warning: Invalid base_frame {base_index} for frame {frame_index}, ignored")
+
+        return None
+
+    return base_index
+
+
+class LazyFrameList(Sequence[NaxelDataFrame]):
+    """
+    Read-only sequence of data frames, parsed on first access.
+
+    Keeps the raw JSON of every frame, and at most `max_cached_frames` parsed
+    frames in a LRU cache, so opening a long animation is instant and the
+    memory used by parsed frames stays bounded. Delta frames only keep the
+    index of their base frame, parsed again through the cache when needed.
+    """
+
+    def __init__(
+        self,
+        frames_data: list[dict[str, Any]],
+        general_data: NaxelGeneralData,
+        max_cached_frames: int = 8,
+        is_post_processed: bool = False
+    ) -> None:
+
+        self.frames_data: list[dict[str, Any]] = frames_data
+        self.general_data: NaxelGeneralData = general_data
+        self.max_cached_frames: int = max(1, max_cached_frames)
+        self.is_post_processed: bool = is_post_processed
+
+        self._cache: OrderedDict[int, NaxelDataFrame] = OrderedDict()
+
+    def __len__(self) -> int:
+
+        return len(self.frames_data)
+
+    @overload
+    def __getitem__(self, index: int) -> NaxelDataFrame: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[NaxelDataFrame]: ...
+
+    def __getitem__(self, index: int | slice) -> NaxelDataFrame | list[NaxelDataFrame]:
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self.frames_data)
+
+        if index < 0 or index >= len(self.frames_data):
+            raise IndexError(f"Frame index out of range: {index}")
 
-            data_frames.append(data_frame)
+        frame: Optional[NaxelDataFrame] = self._cache.get(index, None)
 
-    return data_frames
+        if frame is not None:
 
+            self._cache.move_to_end(index)
 
-def load_naxel(json_dict: dict[str, Any]) -> Naxel:
+            return frame
+
+        frame = load_dataframe(
+            self.frames_data[index],
+            self.general_data,
+            index,
+            self.is_post_processed,
+            self
+        )
+
+        self._cache[index] = frame
+
+        if len(self._cache) > self.max_cached_frames:
+            self._cache.popitem(last=False)
+
+        return frame
+
+    def cached_frame_indices(self) -> list[int]:
+        """
+        Get the indices of the currently parsed frames, least recently used first.
+        """
+
+        return list(self._cache.keys())
+
+
+def load_dataframes(
+    json_dict: dict[str, Any],
+    general_data: Optional[NaxelGeneralData] = None,
+    lazy: bool = False,
+    max_cached_frames: int = 8,
+    is_post_processed: bool = False
+) -> Sequence[NaxelDataFrame]:
+
+    """
+    Load data frames from the JSON dictionary.
+
+    Supports both single-frame and multi-frame formats:
+        - Single frame: voxels_dict/voxels_rle/voxels_list at root level
+        - Multi-frame: "frames" array with individual frame data
+
+    If `lazy` is set, the frames of a multi-frame naxel object are returned
+    as a LazyFrameList, parsing each frame on first access.
+
+    If `is_post_processed` is set, the voxels_dict entries are loaded directly
+    as coordinate / color arrays (see VoxelArrays.from_voxels_dict).
+    """
+
+    # Create a default general_data if not provided
+    if general_data is None:
+        general_data = NaxelGeneralData()
+
+    # Check for multi-frame format
+    if "frames" in json_dict and isinstance(json_dict["frames"], list):
+
+        frames_data: list[dict[str, Any]] = cast(list[dict[str, Any]], json_dict["frames"])
+
+        if lazy:
+            return LazyFrameList(frames_data, general_data, max_cached_frames, is_post_processed)
+
+        frames: list[NaxelDataFrame] = []
+
+        for idx, frame_data in enumerate(frames_data):
+
+            frames.append(load_dataframe(
+                frame_data,
+                general_data,
+                idx,
+                is_post_processed,
+                frames
+            ))
+
+        return frames
+
+    # Single-frame format: voxels at root level
+    # Only create a frame if there's actual data
+    if "voxels_dict" in json_dict or "voxels_rle" in json_dict or "voxels_list" in json_dict:
+
+        return [
+            load_dataframe(
+                {
+                    k: json_dict[k]
+                    for k in ("voxels_dict", "voxels_rle", "voxels_list", "light_emission_dict")
+                    if k in json_dict
+                },
+                general_data,
+                0,
+                is_post_processed
+            )
+        ]
+
+    return []
+
+
+def load_naxel(
+    json_dict: dict[str, Any],
+    lazy_frames: bool = False,
+    max_cached_frames: int = 8,
+    source_dir: str = ""
+) -> Naxel:
     """
     Load a Naxel object from a JSON dictionary.
+
+    Args:
+        json_dict: The naxel JSON dictionary
+        lazy_frames: Parse the frames of an animated naxel object on first access
+            (see LazyFrameList)
+        max_cached_frames: Maximum number of parsed frames kept by lazy frames
+        source_dir: Directory of the naxel file, the paths of the imported files
+            ("import_voxel") are relative to it
     """
 
     # --- Metadata ---
@@ -130,17 +333,7 @@ def load_naxel(json_dict: dict[str, Any]) -> Naxel:
     is_post_processed: bool = json_dict.get("is_post_processed", False)
 
     # --- General Data ---
-    default_color: Color = parse_color(json_dict.get("default_color", [0, 0, 0, 255]))
-    color_palette: ColorPalette = parse_color_palette(json_dict.get("color_palette", {}))
-    grid_thickness: int = json_dict.get("grid_thickness", 0)
-    grid_color: Color = parse_color(json_dict.get("grid_color", [0, 0, 0, 255]))
-
-    general_data: NaxelGeneralData = NaxelGeneralData(
-        default_color,
-        color_palette,
-        grid_thickness,
-        grid_color,
-    )
+    general_data: NaxelGeneralData = load_general_data(json_dict, source_dir)
 
     # --- Camera Data ---
     camera_position: Vec3 = parse_vec3(json_dict.get("camera_position", [0, 0, 0]))
@@ -247,7 +440,13 @@ def load_naxel(json_dict: dict[str, Any]) -> Naxel:
         general_data=general_data,
 
         # --- Data Frames ---
-        data_frames=load_dataframes(json_dict=json_dict, general_data=general_data),
+        data_frames=load_dataframes(
+            json_dict=json_dict,
+            general_data=general_data,
+            lazy=lazy_frames,
+            max_cached_frames=max_cached_frames,
+            is_post_processed=is_post_processed
+        ),
 
         # --- Environment ---
         environment=environment,
@@ -0,0 +1,118 @@
+from typing import Optional, Any, Sequence
+
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+
+from .naxel import Naxel, NaxelDataFrame, NaxelGeneralData
+from .naxel_loader import LazyFrameList, load_general_data, load_dataframe
+from .voxel_grid import VoxelGrid, build_frames
+from .voxel_arrays import VoxelArrays
+
+
+def build_frame_arrays(
+    frame_data: dict[str, Any],
+    general_json: dict[str, Any],
+    default_frame_id: int = 0,
+    source_dir: str = ""
+) -> VoxelArrays:
+    """
+    Parse the JSON of a frame and build its voxel grid.
+    Runs in the worker processes: only the compact arrays are sent back,
+    not the VoxelValue objects.
+
+    Args:
+        frame_data: The JSON dictionary of the frame
+        general_json: The JSON dictionary of the general data (palette, default color, ...)
+        default_frame_id: Frame id to use if the frame has no "frame_id"
+        source_dir: Directory of the naxel file, for the imported files
+
+    Returns:
+        The voxel arrays of the built grid
+    """
+
+    general_data: NaxelGeneralData = load_general_data(general_json, source_dir)
+
+    frame: NaxelDataFrame = load_dataframe(frame_data, general_data, default_frame_id)
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.build_from_frame(frame, general_data)
+
+    return grid.export_arrays()
+
+
+def build_frames_arrays(
+    frames_data: Sequence[dict[str, Any]],
+    general_json: dict[str, Any],
+    workers: Optional[int] = None,
+    source_dir: str = ""
+) -> list[VoxelArrays]:
+    """
+    Parse and build the voxel grids of several frames in a process pool.
+
+    Args:
+        frames_data: The JSON dictionaries of the frames
+        general_json: The JSON dictionary of the general data
+        workers: Number of worker processes (default: number of CPUs)
+        source_dir: Directory of the naxel file, for the imported files
+
+    Returns:
+        The voxel arrays of each frame, in order
+    """
+
+    if len(frames_data) == 0:
+        return []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        return list(executor.map(
+            build_frame_arrays,
+            frames_data,
+            repeat(general_json),
+            range(len(frames_data)),
+            repeat(source_dir),
+        ))
+
+
+def naxel_frames_data(naxel: Naxel) -> list[dict[str, Any]]:
+    """
+    Get the JSON dictionaries of the frames of a naxel object, to send them to
+    worker processes. Lazy frames give their raw JSON without being parsed.
+    """
+
+    if isinstance(naxel.data_frames, LazyFrameList):
+        return naxel.data_frames.frames_data
+
+    return [df.export_to_dict(True) for df in naxel.data_frames]
+
+
+def build_naxel_grids(
+    naxel: Naxel,
+    workers: Optional[int] = None
+) -> list[VoxelGrid]:
+    """
+    Build the voxel grids of all the frames of a naxel object in a process pool.
+    Delta frames need their base frame, so naxel objects with delta frames are
+    built in this process (each delta frame from a copy of its base frame grid).
+
+    Args:
+        naxel: The naxel object
+        workers: Number of worker processes (default: number of CPUs)
+
+    Returns:
+        The voxel grid of each frame, in order
+    """
+
+    frames_data: list[dict[str, Any]] = naxel_frames_data(naxel)
+
+    if any("base_frame" in frame_data for frame_data in frames_data):
+        return list(build_frames(naxel.data_frames, naxel.general_data))
+
+    return [
+        VoxelGrid.from_arrays(arrays)
+        for arrays in build_frames_arrays(
+            frames_data,
+            naxel.general_data.export_to_dict(),
+            workers,
+            naxel.general_data.source_dir
+        )
+    ]
@@ -2,9 +2,10 @@ from typing import Optional, Any, cast
 
 
 from .vec import Vec3, parse_vec3
+from .voxel_key import parse_voxel_key
 from .pos import Pos, parse_pos
 from .color import Color
-from .color_palette import ColorPalette, parse_color
+from .color_palette import ColorPalette, COLOR_DICT_TYPES, parse_color
 from .voxel_value import (
     VoxelValue,
     VoxelValueColor,
@@ -30,11 +31,15 @@ def parse_voxel_value(
     Parse a VoxelValue from various JSON formats.
 
     Supported formats:
-        - color data (string/list) -> VoxelValueColor
+        - color data (string/list/gradient or zones dict) -> VoxelValueColor
         - dict with "type" key -> shape-specific VoxelValue
         - palette key reference -> VoxelValueFromPalette
     """
 
+    # Dict color (gradient, color zones) -> VoxelValueColor
+    if isinstance(data, dict) and data.get("type", None) in COLOR_DICT_TYPES:
+        return VoxelValueColor(color=parse_color(data, color_palette))
+
     # Dict with type key -> shape
     if isinstance(data, dict) and "type" in data:
 
@@ -173,21 +178,20 @@ def parse_voxel_value(
 def parse_voxels_dict(
     data: dict[str, Any],
     color_palette: Optional[ColorPalette] = None
-) -> dict[Vec3, VoxelValue]:
+) -> dict[int, VoxelValue]:
     """
     Parse a voxels_dict from JSON format.
 
     Expected format: {"x,y,z": color_or_voxel_data, ...}
+
+    The keys of the result are packed integer coordinates (see voxel_key.py).
     """
 
-    result: dict[Vec3, VoxelValue] = {}
+    result: dict[int, VoxelValue] = {}
 
     for key, value in data.items():
 
-        vec: Vec3 = parse_vec3(key)
-        voxel: VoxelValue = parse_voxel_value(value, color_palette)
-
-        result[vec] = voxel
+        result[parse_voxel_key(key)] = parse_voxel_value(value, color_palette)
 
     return result
 
@@ -58,6 +58,28 @@ class PixelRenderer:
             Color: The rendered color for this pixel
         """
 
+        color: Color
+        color, _ = self.trace_pixel(x, y)
+
+        return color
+
+    def trace_pixel(
+        self,
+        x: int,
+        y: int
+    ) -> tuple[Color, HitResult]:
+        """
+        Render a single pixel and also return the raw marching result,
+        so callers can collect per-pixel statistics (see MarchHeatmap).
+
+        Args:
+            x: Pixel X coordinate (0 to width-1)
+            y: Pixel Y coordinate (0 to height-1)
+
+        Returns:
+            Tuple of (rendered Color, HitResult of the ray march)
+        """
+
         # Create ray for this pixel
         ray: Ray = self._create_ray(x, y)
 
@@ -70,12 +92,12 @@ class PixelRenderer:
 
         if hit.hit and hit.color is not None:
 
-            return hit.color
+            return hit.color, hit
 
         else:
 
             # Sample environment for background
-            return self.env_sampler.sample(ray)
+            return self.env_sampler.sample(ray), hit
 
     def _create_ray(
         self,
@@ -0,0 +1,174 @@
+import math
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .vec import Vec3
+from .pos import Pos
+
+
+def _vec3_array(v: Vec3) -> NDArray[np.float64]:
+
+    return np.array([v.x, v.y, v.z], dtype=np.float64)
+
+
+def has_pos_transform(pos: Pos) -> bool:
+    """
+    Check if a Pos has any transform that changes the voxels it places.
+
+    Args:
+        pos: The position
+
+    Returns:
+        True if one of shift, scale, rotation, flip or crop is not neutral
+    """
+
+    return bool(
+        (pos.shift is not None and np.any(_vec3_array(pos.shift) != 0))
+        or (pos.scale is not None and np.any(_vec3_array(pos.scale) != 1))
+        or (pos.rotation is not None and np.any(_vec3_array(pos.rotation) % 360 != 0))
+        or (pos.flip is not None and np.any(_vec3_array(pos.flip) != 0))
+        or (pos.crop is not None and np.any(_vec3_array(pos.crop) != 0))
+    )
+
+
+def rotation_matrix(rotation: Vec3) -> NDArray[np.float64]:
+    """
+    Build the rotation matrix of angles in degrees around the x, then y, then z axes.
+
+    Args:
+        rotation: Angles in degrees
+
+    Returns:
+        The (3, 3) rotation matrix, with quarter turns exact
+    """
+
+    ax, ay, az = (math.radians(float(a)) for a in (rotation.x, rotation.y, rotation.z))
+
+    rx: NDArray[np.float64] = np.array([
+        [1.0, 0.0, 0.0],
+        [0.0, math.cos(ax), -math.sin(ax)],
+        [0.0, math.sin(ax), math.cos(ax)],
+    ])
+    ry: NDArray[np.float64] = np.array([
+        [math.cos(ay), 0.0, math.sin(ay)],
+        [0.0, 1.0, 0.0],
+        [-math.sin(ay), 0.0, math.cos(ay)],
+    ])
+    rz: NDArray[np.float64] = np.array([
+        [math.cos(az), -math.sin(az), 0.0],
+        [math.sin(az), math.cos(az), 0.0],
+        [0.0, 0.0, 1.0],
+    ])
+
+    # Remove the float noise, so that quarter turns map voxels on voxels
+    return np.round(rz @ ry @ rx, 12)
+
+
+def _scale_axis(
+    rel: NDArray[np.int64],
+    source: NDArray[np.intp],
+    axis: int,
+    factor: float
+) -> tuple[NDArray[np.int64], NDArray[np.intp]]:
+    """
+    Scale the voxels along one axis: the voxel v covers the cells
+    [floor(v * factor), floor((v + 1) * factor)), at least one cell.
+    """
+
+    lo: NDArray[np.int64] = np.floor(rel[:, axis] * factor).astype(np.int64)
+    hi: NDArray[np.int64] = np.floor((rel[:, axis] + 1) * factor).astype(np.int64)
+
+    counts: NDArray[np.int64] = np.maximum(hi - lo, 1)
+
+    if np.all(counts == 1):
+
+        rel = rel.copy()
+        rel[:, axis] = lo
+
+        return rel, source
+
+    # Offset of each output voxel inside the run of its source voxel
+    starts: NDArray[np.int64] = np.cumsum(counts) - counts
+    offsets: NDArray[np.int64] = np.arange(int(counts.sum()), dtype=np.int64) - np.repeat(starts, counts)
+
+    rel = np.repeat(rel, counts, axis=0)
+    rel[:, axis] = np.repeat(lo, counts) + offsets
+
+    return rel, np.repeat(source, counts)
+
+
+def transform_coords(
+    coords: NDArray[np.integer],
+    pos: Pos
+) -> tuple[NDArray[np.int64], NDArray[np.intp]]:
+    """
+    Apply the transforms of a Pos to the (N, 3) voxels placed at it, all at once.
+
+    The voxels are transformed relative to the anchor `pos.xyz`, in this order:
+    scale, flip, rotation, crop, then shift.
+
+    Args:
+        coords: (N, 3) integer positions of the voxels
+        pos: The position carrying the transforms
+
+    Returns:
+        Tuple of the (M, 3) transformed positions, and for each of them
+        the index of its source voxel in `coords` (a scale can repeat voxels,
+        a crop can drop some)
+    """
+
+    anchor: NDArray[np.int64] = _vec3_array(pos.xyz).astype(np.int64)
+
+    rel: NDArray[np.int64] = np.asarray(coords, dtype=np.int64).reshape(-1, 3) - anchor
+    source: NDArray[np.intp] = np.arange(len(rel), dtype=np.intp)
+
+    flip: NDArray[np.bool_] = np.zeros(3, dtype=np.bool_)
+
+    if pos.flip is not None:
+        flip |= _vec3_array(pos.flip) != 0
+
+    # Scale (a negative factor also mirrors the axis)
+    if pos.scale is not None:
+
+        scale: NDArray[np.float64] = _vec3_array(pos.scale)
+
+        for axis in range(3):
+
+            if scale[axis] < 0:
+                flip[axis] = not flip[axis]
+
+            factor: float = abs(float(scale[axis]))
+
+            if factor != 0 and factor != 1:
+                rel, source = _scale_axis(rel, source, axis, factor)
+
+    # Flip: mirror around the anchor plane of the axis
+    if np.any(flip):
+        rel = np.where(flip, -rel, rel)
+
+    # Rotation around the anchor, rounded to the nearest voxel
+    if pos.rotation is not None and np.any(_vec3_array(pos.rotation) % 360 != 0):
+        rel = np.rint(rel @ rotation_matrix(pos.rotation).T).astype(np.int64)
+
+    # Crop: a positive c keeps [0, c) on its axis, a negative c keeps (c, 0], 0 keeps all
+    if pos.crop is not None:
+
+        crop: NDArray[np.float64] = _vec3_array(pos.crop)
+
+        keep: NDArray[np.bool_] = np.all(
+            (crop == 0)
+            | ((crop > 0) & (rel >= 0) & (rel < crop))
+            | ((crop < 0) & (rel <= 0) & (rel > crop)),
+            axis=1
+        )
+
+        if not np.all(keep):
+            rel = rel[keep]
+            source = source[keep]
+
+    # Shift
+    if pos.shift is not None:
+        rel = rel + np.rint(_vec3_array(pos.shift)).astype(np.int64)
+
+    return rel + anchor, source
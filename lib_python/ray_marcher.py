@@ -41,23 +41,24 @@ class RayMarcher:
             HitResult: The intersection result
         """
 
-        if self.grid.is_empty():
+        if not self.grid.has_voxels():
             return HitResult.miss()
 
-        # Get grid bounds
-        bounds_min, bounds_max = self.grid.get_bounds()
+        # Get grid bounds (instances are marched by InstancedRayMarcher)
+        bounds_min, bounds_max = self.grid.get_voxel_bounds()
 
         # Find intersection with bounding box
         t_enter, t_exit = self._intersect_aabb(ray, bounds_min, bounds_max)
 
         if t_enter > t_exit or t_exit < clip_start or t_enter > clip_end:
-            return HitResult.miss()
+            return HitResult.miss(t_enter=t_enter, t_exit=t_exit)
 
         # Clamp t_enter to clip_start
         t_start = max(t_enter, clip_start)
 
         # Get starting position
-        start_point: Vec3NP = ray.point_at(t_start + 0.001)
+        t_origin: float = t_start + 0.001
+        start_point: Vec3NP = ray.point_at(t_origin)
 
         # Current voxel position
         x: int = int(math.floor(start_point.data[0]))
@@ -79,14 +80,14 @@ class RayMarcher:
         t_delta_y: float = abs(1.0 / dy) if abs(dy) > 1e-10 else float('inf')
         t_delta_z: float = abs(1.0 / dz) if abs(dz) > 1e-10 else float('inf')
 
-        # t_max: distance to next voxel boundary for each axis
-        t_max_x: float = self._compute_t_max(
+        # t_max: distance along the ray to the next voxel boundary for each axis
+        t_max_x: float = t_origin + self._compute_t_max(
             start_point.data[0], dx, step_x
         )
-        t_max_y: float = self._compute_t_max(
+        t_max_y: float = t_origin + self._compute_t_max(
             start_point.data[1], dy, step_y
         )
-        t_max_z: float = self._compute_t_max(
+        t_max_z: float = t_origin + self._compute_t_max(
             start_point.data[2], dz, step_z
         )
 
@@ -98,15 +99,20 @@ class RayMarcher:
 
         last_axis: int = -1  # 0=x, 1=y, 2=z
 
+        # Number of visited voxels, reported for debug heatmaps
+        steps: int = 0
+
         for _ in range(max_iterations):
 
+            steps += 1
+
             # Check if we're still within bounds
             if not self._in_bounds(x, y, z, bounds_min, bounds_max):
-                return HitResult.miss()
+                return HitResult.miss(steps, t_enter, t_exit)
 
             # Check if we've exceeded clip_end
             if t_current > clip_end:
-                return HitResult.miss()
+                return HitResult.miss(steps, t_enter, t_exit)
 
             # Check for voxel at current position
             color = self.grid.get_voxel(x, y, z)
@@ -120,7 +126,10 @@ class RayMarcher:
                     t=t_current,
                     position=Vec3(x, y, z),
                     color=color,
-                    normal=normal
+                    normal=normal,
+                    steps=steps,
+                    t_enter=t_enter,
+                    t_exit=t_exit
                 )
 
             # Advance to next voxel using DDA
@@ -156,7 +165,7 @@ class RayMarcher:
                     t_max_z += t_delta_z
                     last_axis = 2
 
-        return HitResult.miss()
+        return HitResult.miss(steps, t_enter, t_exit)
 
     def _compute_t_max(
         self,
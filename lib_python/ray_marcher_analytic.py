@@ -0,0 +1,48 @@
+from .ray import Ray
+from .hit_result import HitResult
+from .analytic_shape import AnalyticShape
+from .ray_marcher import RayMarcher
+
+
+class AnalyticShapeMarcher(RayMarcher):
+    """
+    Ray marcher of a single analytic shape (see `analytic_shape.py`).
+
+    The ray is only marched over the closed-form distance range where it can
+    meet the voxels of the shape, so a huge shape costs a few DDA steps
+    around its surface instead of its whole volume in memory.
+    """
+
+    def __init__(
+        self,
+        shape: AnalyticShape
+    ) -> None:
+
+        super().__init__(shape)
+
+        self.shape: AnalyticShape = shape
+
+    def march(
+        self,
+        ray: Ray,
+        clip_start: float,
+        clip_end: float
+    ) -> HitResult:
+        """
+        March a ray through the voxels of the shape.
+
+        Args:
+            ray: The ray to march
+            clip_start: Near clipping plane distance
+            clip_end: Far clipping plane distance
+
+        Returns:
+            HitResult: The intersection result
+        """
+
+        t_near, t_far = self.shape.ray_range(ray)
+
+        if t_near > t_far or t_far < clip_start or t_near > clip_end:
+            return HitResult.miss()
+
+        return super().march(ray, max(clip_start, t_near), min(clip_end, t_far))
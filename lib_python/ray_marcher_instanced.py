@@ -0,0 +1,195 @@
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .vec import Vec3
+from .ray import Ray
+from .hit_result import HitResult
+from .voxel_grid import VoxelGrid
+from .ray_marcher import RayMarcher
+from .ray_marcher_analytic import AnalyticShapeMarcher
+from .analytic_shape import AnalyticShape
+from .render_math import Vec3NP
+from .bvh import BVH, slab_test
+
+
+# Distance tolerance to find the instances hitting the same voxel as the best hit
+TIE_EPSILON: float = 1e-4
+
+# Number of instances from which their boxes are searched with a BVH
+BVH_MIN_INSTANCES: int = 16
+
+
+class InstancedRayMarcher(RayMarcher):
+    """
+    Two-level ray marcher for grids with instanced models (see `VoxelGrid.add_instance`).
+
+    The top level is the list of the instance bounding boxes, stored as arrays
+    and tested against each ray at once (through a BVH for many instances). Only the instances whose box is hit
+    are marched, nearest first, in the space of their shared model grid
+    (the ray is moved by the instance offset), and the marching stops as soon
+    as the next box is farther than the closest hit.
+    """
+
+    def __init__(
+        self,
+        grid: VoxelGrid
+    ) -> None:
+
+        super().__init__(grid)
+
+        count: int = len(grid.instances)
+
+        # Instance bounding boxes and offsets, in grid space
+        self.instances_min: NDArray[np.float64] = np.zeros((count, 3), dtype=np.float64)
+        self.instances_max: NDArray[np.float64] = np.zeros((count, 3), dtype=np.float64)
+        self.instances_offset: NDArray[np.float64] = np.zeros((count, 3), dtype=np.float64)
+
+        for i, instance in enumerate(grid.instances):
+
+            bounds_min, bounds_max = instance.get_bounds()
+
+            self.instances_min[i] = (bounds_min.x, bounds_min.y, bounds_min.z)
+            self.instances_max[i] = (bounds_max.x, bounds_max.y, bounds_max.z)
+            self.instances_offset[i] = instance.offset
+
+        # Hierarchy over the instance boxes, for scenes with many instances
+        self.bvh: Optional[BVH] = None
+
+        if count >= BVH_MIN_INSTANCES:
+            self.bvh = BVH(self.instances_min, self.instances_max)
+
+        # One marcher per shared model grid (or analytic shape)
+        self._model_marchers: dict[int, RayMarcher] = {}
+
+        for instance in grid.instances:
+
+            if id(instance.grid) in self._model_marchers:
+                continue
+
+            if isinstance(instance.grid, AnalyticShape):
+                self._model_marchers[id(instance.grid)] = AnalyticShapeMarcher(instance.grid)
+
+            else:
+                self._model_marchers[id(instance.grid)] = RayMarcher(instance.grid)
+
+    def _intersect_instances(
+        self,
+        ray: Ray,
+        t_min: float,
+        t_max: float
+    ) -> tuple[NDArray[np.intp], NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Find the instances whose bounding box is hit by a ray between two distances
+        (with the BVH of the instances, or a slab test of all the boxes at once).
+
+        Returns:
+            Tuple of (instance indices, t_enter, t_exit) of the boxes hit, sorted by t_enter
+        """
+
+        origin: NDArray[np.float64] = ray.origin.data.astype(np.float64)
+        direction: NDArray[np.float64] = ray.direction.data.astype(np.float64)
+
+        if self.bvh is not None:
+            return self.bvh.query_ray(origin, direction, t_min, t_max)
+
+        t_enter: NDArray[np.float64]
+        t_exit: NDArray[np.float64]
+        t_enter, t_exit = slab_test(origin, direction, self.instances_min, self.instances_max)
+
+        candidates: NDArray[np.intp] = np.flatnonzero(
+            (t_enter <= t_exit) & (t_exit >= t_min) & (t_enter <= t_max)
+        )
+
+        candidates = candidates[np.argsort(t_enter[candidates], kind="stable")]
+
+        return candidates, t_enter[candidates], t_exit[candidates]
+
+    def march(
+        self,
+        ray: Ray,
+        clip_start: float,
+        clip_end: float
+    ) -> HitResult:
+        """
+        March a ray through the voxels of the grid, then through the instances it may hit.
+
+        Args:
+            ray: The ray to march
+            clip_start: Near clipping plane distance
+            clip_end: Far clipping plane distance
+
+        Returns:
+            HitResult: The closest intersection result
+        """
+
+        best: HitResult = super().march(ray, clip_start, clip_end)
+
+        if len(self.grid.instances) == 0:
+            return best
+
+        steps: int = best.steps
+
+        best_t: float = best.t if best.hit else clip_end
+
+        # Index of the instance of the best hit (-1 for the voxels of the grid)
+        best_index: int = -1
+
+        # Instances hitting the same voxel at the same distance are also marched,
+        # the last placed one wins (like overlapping voxels)
+        candidates: NDArray[np.intp]
+        t_enter: NDArray[np.float64]
+        candidates, t_enter, _ = self._intersect_instances(ray, clip_start, best_t + TIE_EPSILON)
+
+        for i, instance_t_enter in zip(candidates.tolist(), t_enter.tolist()):
+
+            if instance_t_enter > best_t + TIE_EPSILON:
+                break
+
+            instance = self.grid.instances[i]
+
+            offset: NDArray[np.float64] = self.instances_offset[i]
+
+            local_ray: Ray = Ray(
+                Vec3NP((ray.origin.data - offset).astype(np.float32)),
+                ray.direction
+            )
+
+            hit: HitResult = self._model_marchers[id(instance.grid)].march(
+                local_ray,
+                clip_start,
+                best_t + TIE_EPSILON
+            )
+
+            steps += hit.steps
+
+            if not hit.hit or hit.position is None:
+                continue
+
+            ox, oy, oz = instance.offset
+
+            position: Vec3 = Vec3(hit.position.x + ox, hit.position.y + oy, hit.position.z + oz)
+
+            same_voxel: bool = (
+                best.hit
+                and best.position is not None
+                and position.check_equal(best.position)
+            )
+
+            if (hit.t < best_t and not same_voxel) or (same_voxel and i > best_index):
+
+                best = hit
+                best.position = position
+                best_t = min(best_t, hit.t)
+                best_index = i
+
+        # Statistics over the whole scene (voxels and instances)
+        bounds_min, bounds_max = self.grid.get_bounds()
+        scene_t_enter, scene_t_exit = self._intersect_aabb(ray, bounds_min, bounds_max)
+
+        best.steps = steps
+        best.t_enter = scene_t_enter
+        best.t_exit = scene_t_exit
+
+        return best
@@ -2,11 +2,18 @@ from .naxel import Naxel, NaxelDataFrame
 from .naxel_loader import load_naxel
 from .camera import Camera
 from .color import Color
+from .color_palette import ColorPalette
 from .vec import Vec3
 from .voxel_grid import VoxelGrid
+from .voxel_grid_morton import MortonVoxelGrid
+from .voxel_grid_chunked import ChunkedVoxelGrid
 from .ray_marcher import RayMarcher
+from .ray_marcher_instanced import InstancedRayMarcher
 from .environment_sampler import EnvironmentSampler
 from .pixel_renderer import PixelRenderer
+from .hit_result import HitResult
+from .march_heatmap import MarchHeatmap
+from .grid_cache import GridCache, frame_cache_key, frame_dependencies
 
 from typing import Optional, List
 
@@ -27,15 +34,116 @@ class RendererNaive:
     Uses modular components for ray marching and pixel rendering.
     """
 
-    def __init__(self, naxel: Naxel) -> None:
+    def __init__(
+        self,
+        naxel: Naxel,
+        grid_storage: str = "dict",
+        instancing: bool = False,
+        analytic_shapes: bool = False,
+        grid_cache: Optional[GridCache] = None,
+        shapes_region: Optional[tuple[tuple[int, int, int], tuple[int, int, int]]] = None
+    ) -> None:
 
         self.naxel: Naxel = naxel
 
+        # Voxel storage used by the built grids: "dict", "morton" or "chunked"
+        self.grid_storage: str = grid_storage
+
+        # Place the imported models as instances of shared grids instead of copying them
+        self.instancing: bool = instancing
+
+        # Intersect the boxes, spheres and cylinders in closed form instead of rasterizing them
+        self.analytic_shapes: bool = analytic_shapes
+
+        # On-disk cache of the built grids (not used for instances and analytic shapes)
+        self.grid_cache: Optional[GridCache] = grid_cache
+
+        # Box outside which the shapes are not rasterized (see `VoxelGrid.shapes_region`)
+        self.shapes_region: Optional[tuple[tuple[int, int, int], tuple[int, int, int]]] = shapes_region
+
+    def _build_grid(
+        self,
+        frame: NaxelDataFrame
+    ) -> VoxelGrid:
+        """
+        Build the voxel grid of a frame, with the selected voxel storage.
+
+        Args:
+            frame: The data frame to build
+
+        Returns:
+            The built voxel grid
+        """
+
+        grid: VoxelGrid
+
+        if (
+            self.grid_cache is not None
+            and not self.instancing
+            and not self.analytic_shapes
+            and self.shapes_region is None
+        ):
+
+            key: str = frame_cache_key(frame, self.naxel.general_data)
+
+            # Loaded with the selected storage (see `GridCache.load`)
+            cached: Optional[VoxelGrid] = self.grid_cache.load(key, self.grid_storage)
+
+            if cached is not None:
+                return cached
+
+            built: VoxelGrid = VoxelGrid()
+            built.build_from_frame(frame, self.naxel.general_data)
+
+            self.grid_cache.save(
+                key,
+                built,
+                frame_dependencies(frame, self.naxel.general_data),
+                self.grid_storage
+            )
+
+            if self.grid_storage == "morton":
+                return MortonVoxelGrid.from_grid(built)
+
+            if self.grid_storage == "chunked":
+                return ChunkedVoxelGrid.from_grid(built)
+
+            return built
+
+        if self.grid_storage == "morton":
+            grid = MortonVoxelGrid()
+        elif self.grid_storage == "chunked":
+            grid = ChunkedVoxelGrid()
+        else:
+            grid = VoxelGrid()
+
+        grid.instance_imports = self.instancing
+        grid.analytic_shapes = self.analytic_shapes
+        grid.shapes_region = self.shapes_region
+        grid.build_from_frame(frame, self.naxel.general_data)
+
+        return grid
+
+    def _create_marcher(
+        self,
+        grid: VoxelGrid
+    ) -> RayMarcher:
+        """
+        Create the ray marcher of a built grid (two-level if it has instances or analytic shapes).
+        """
+
+        if len(grid.instances) > 0:
+            return InstancedRayMarcher(grid)
+
+        return RayMarcher(grid)
+
     def render_single_frame(
         self,
         frame_index: int = 0,
         camera_override: Optional[Camera] = None,
         image_save_path: Optional[str] = None,
+        debug_heatmap: bool = False,
+        palette_override: Optional[ColorPalette] = None,
     ) -> None:
         """
         Render a single frame of the naxel object.
@@ -44,6 +152,10 @@ class RendererNaive:
             frame_index: Index of the frame to render (for animations)
             camera_override: Optional camera to use instead of naxel's camera
             image_save_path: Optional path to save the image
+            debug_heatmap: Also save the per-pixel ray marching statistics
+                (DDA step counts, AABB entry/exit distances) next to the image
+            palette_override: Optional palette whose entries replace the colors
+                of the naxel's palette keys (palette variants)
         """
 
         # Select camera
@@ -63,15 +175,17 @@ class RendererNaive:
         ]
 
         # Build voxel grid from frame
-        grid: VoxelGrid = VoxelGrid()
-        grid.build_from_frame(frame, self.naxel.general_data)
+        grid: VoxelGrid = self._build_grid(frame)
+
+        if palette_override is not None:
+            grid.apply_palette(palette_override)
 
         if grid.is_empty():
 
             print("Warning: No voxels in frame")
 
         # Create rendering components
-        marcher: RayMarcher = RayMarcher(grid)
+        marcher: RayMarcher = self._create_marcher(grid)
         env_sampler: EnvironmentSampler = EnvironmentSampler(self.naxel.environment)
         pixel_renderer: PixelRenderer = PixelRenderer(
             grid,
@@ -86,13 +200,23 @@ class RendererNaive:
             dtype=np.uint8
         )
 
+        heatmap: Optional[MarchHeatmap] = None
+
+        if debug_heatmap:
+            heatmap = MarchHeatmap(camera.camera_width, camera.camera_height)
+
         # Render each pixel
         for y in range(camera.camera_height):
 
             for x in range(camera.camera_width):
 
                 # Render pixel using the modular pixel renderer
-                color: Color = pixel_renderer.render_pixel(x, y)
+                color: Color
+                hit: HitResult
+                color, hit = pixel_renderer.trace_pixel(x, y)
+
+                if heatmap is not None:
+                    heatmap.record(x, y, hit)
 
                 # Write to image buffer
                 image_data[y, x, 0] = max(0, min(255, color.r))
@@ -112,6 +236,9 @@ class RendererNaive:
 
         print(f"Rendered frame saved to: {save_path}")
 
+        if heatmap is not None:
+            heatmap.save(f"{os.path.splitext(save_path)[0]}_heatmap")
+
     def render_rotation_gif(
         self,
         frame_index: int = 0,
@@ -144,8 +271,7 @@ class RendererNaive:
         ]
 
         # Build voxel grid from frame
-        grid: VoxelGrid = VoxelGrid()
-        grid.build_from_frame(frame, self.naxel.general_data)
+        grid: VoxelGrid = self._build_grid(frame)
 
         if grid.is_empty():
             print("Warning: No voxels in frame")
@@ -169,7 +295,7 @@ class RendererNaive:
         elevation_height: float = radius * math.sin(elevation_angle) + radius * 0.3
 
         # Create rendering components
-        marcher: RayMarcher = RayMarcher(grid)
+        marcher: RayMarcher = self._create_marcher(grid)
         env_sampler: EnvironmentSampler = EnvironmentSampler(self.naxel.environment)
 
         # Render each rotation frame
@@ -327,6 +453,54 @@ if __name__ == "__main__":
         help="Rotate camera around object and generate a GIF"
     )
 
+    parser.add_argument(
+        "--debug_heatmap",
+        action="store_true",
+        help="Also save per-pixel DDA step counts and AABB distances (.npz + false-color PNG)"
+    )
+
+    parser.add_argument(
+        "--grid_storage",
+        type=str,
+        choices=["dict", "morton", "chunked"],
+        default="dict",
+        help="Voxel storage: Python dict, Morton-ordered sorted arrays, or compressed chunks"
+    )
+
+    parser.add_argument(
+        "--instancing",
+        action="store_true",
+        help="Place imported models as instances of shared grids instead of copying their voxels"
+    )
+
+    parser.add_argument(
+        "--analytic_shapes",
+        action="store_true",
+        help="Intersect boxes, spheres and cylinders in closed form instead of rasterizing them"
+    )
+
+    parser.add_argument(
+        "--grid_cache",
+        type=str,
+        default=None,
+        help="Directory of the on-disk cache of built voxel grids (reused while the frames do not change)"
+    )
+
+    parser.add_argument(
+        "--shapes_region",
+        type=int,
+        nargs=6,
+        default=None,
+        metavar=("X0", "Y0", "Z0", "X1", "Y1", "Z1"),
+        help="Only rasterize the shapes overlapping the box [X0, X1) x [Y0, Y1) x [Z0, Z1)"
+    )
+
+    parser.add_argument(
+        "--lazy_frames",
+        action="store_true",
+        help="Parse only the frames that are rendered (animated naxel objects)"
+    )
+
     args = parser.parse_args()
 
     # Load naxel from JSON file
@@ -337,9 +511,23 @@ if __name__ == "__main__":
     with open(args.file, "r", encoding="utf-8") as f:
         json_dict = json.load(f)
 
-    naxel = load_naxel(json_dict)
+    naxel = load_naxel(
+        json_dict,
+        lazy_frames=args.lazy_frames,
+        source_dir=os.path.dirname(os.path.abspath(args.file))
+    )
 
-    renderer = RendererNaive(naxel)
+    renderer = RendererNaive(
+        naxel,
+        grid_storage=args.grid_storage,
+        instancing=args.instancing,
+        analytic_shapes=args.analytic_shapes,
+        grid_cache=GridCache(args.grid_cache) if args.grid_cache is not None else None,
+        shapes_region=(
+            (args.shapes_region[0], args.shapes_region[1], args.shapes_region[2]),
+            (args.shapes_region[3], args.shapes_region[4], args.shapes_region[5])
+        ) if args.shapes_region is not None else None
+    )
 
     if args.rotate_around_object:
 
@@ -352,5 +540,6 @@ if __name__ == "__main__":
 
         renderer.render_single_frame(
             frame_index=args.frame,
-            image_save_path=args.output
+            image_save_path=args.output,
+            debug_heatmap=args.debug_heatmap
         )
@@ -0,0 +1,247 @@
+from typing import Optional, Any
+import copy
+from collections import OrderedDict
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .vec import Vec3
+from .pos import Pos
+from .pos_transform import has_pos_transform, transform_coords
+from .shape_rasterizer import rasterize_shape
+from .voxel_value import (
+    VoxelValueShape,
+    VoxelValueShapePoint,
+    VoxelValueShapeLine,
+    VoxelValueShapeTriangle,
+    VoxelValueShapeCircle,
+    VoxelValueShapeCube,
+    VoxelValueShapeRect,
+    VoxelValueShapeSphere,
+    VoxelValueShapeCylinder,
+    VoxelValueShapePolygon,
+)
+
+
+def _int_xyz(pos: Pos) -> tuple[int, int, int]:
+
+    return int(pos.xyz.x), int(pos.xyz.y), int(pos.xyz.z)
+
+
+def _vec3_key(v: Optional[Vec3]) -> Optional[tuple[float, float, float]]:
+
+    if v is None:
+        return None
+
+    return float(v.x), float(v.y), float(v.z)
+
+
+def shape_key(voxel_value: VoxelValueShape) -> Optional[tuple[tuple[Any, ...], tuple[int, int, int]]]:
+    """
+    Get the canonical parameters of a shape, independent of its position.
+
+    Two shapes with the same key have the same voxels, up to a translation
+    by the difference of their anchors (the integer `position` of the shape).
+
+    Args:
+        voxel_value: The shape
+
+    Returns:
+        Tuple of (key, anchor), None for an unknown shape
+    """
+
+    anchor: tuple[int, int, int] = _int_xyz(voxel_value.position)
+
+    def relative(pos: Pos) -> tuple[int, int, int]:
+
+        x, y, z = _int_xyz(pos)
+
+        return x - anchor[0], y - anchor[1], z - anchor[2]
+
+    params: tuple[Any, ...]
+
+    if isinstance(voxel_value, VoxelValueShapePoint):
+        params = ()
+
+    elif isinstance(voxel_value, VoxelValueShapeCube):
+        params = (voxel_value.size,)
+
+    elif isinstance(voxel_value, (VoxelValueShapeRect, VoxelValueShapeLine)):
+        params = (relative(voxel_value.position2),)
+
+    elif isinstance(voxel_value, VoxelValueShapeTriangle):
+        params = (relative(voxel_value.position2), relative(voxel_value.position3))
+
+    elif isinstance(voxel_value, VoxelValueShapeSphere):
+        params = (voxel_value.radius,)
+
+    elif isinstance(voxel_value, VoxelValueShapeCircle):
+        params = (voxel_value.radius, voxel_value.axis)
+
+    elif isinstance(voxel_value, VoxelValueShapeCylinder):
+        params = (voxel_value.radius, voxel_value.height, voxel_value.axis)
+
+    elif isinstance(voxel_value, VoxelValueShapePolygon):
+        params = tuple(relative(p) for p in voxel_value.polygon)
+
+    else:
+        return None
+
+    position: Pos = voxel_value.position
+
+    transforms: tuple[Any, ...] = ()
+
+    if has_pos_transform(position):
+
+        transforms = tuple(
+            _vec3_key(v)
+            for v in (position.shift, position.scale, position.rotation, position.flip, position.crop)
+        )
+
+    return (type(voxel_value).__name__, params, transforms), anchor
+
+
+def _shape_at_origin(
+    voxel_value: VoxelValueShape,
+    anchor: tuple[int, int, int]
+) -> VoxelValueShape:
+    """
+    Get a copy of a shape translated so that its anchor is at the origin.
+
+    The positions are truncated to integers before being moved, as the rasterizer
+    and the cache key do (truncation does not commute with the translation).
+    """
+
+    ax, ay, az = anchor
+
+    def moved(pos: Pos) -> Pos:
+
+        x, y, z = _int_xyz(pos)
+
+        moved_pos: Pos = copy.copy(pos)
+        moved_pos.xyz = Vec3(x - ax, y - ay, z - az)
+
+        return moved_pos
+
+    shape: VoxelValueShape = copy.copy(voxel_value)
+
+    for attr in ("position", "position2", "position3"):
+
+        if isinstance(getattr(shape, attr, None), Pos):
+            setattr(shape, attr, moved(getattr(shape, attr)))
+
+    if isinstance(shape, VoxelValueShapePolygon):
+        shape.polygon = [moved(p) for p in shape.polygon]
+
+    return shape
+
+
+class ShapeRasterCache:
+    """
+    Memoized shape rasterization: the voxels of each distinct shape (type,
+    parameters and position transforms, see `shape_key`) are rasterized once,
+    relative to the shape anchor, and only translated for the next shapes with
+    the same key, in any frame or file. Shapes are always rasterized with their
+    anchor at the origin, so the voxels do not depend on the cache content
+    (the triangle and polygon fills are not exactly translation invariant).
+
+    The least recently used shapes are evicted when the cached voxels exceed
+    `max_voxels`.
+    """
+
+    def __init__(
+        self,
+        max_voxels: int = 4_000_000
+    ) -> None:
+
+        self.max_voxels: int = max_voxels
+
+        # Shape key -> (N, 3) voxel positions relative to the anchor
+        self._shapes: OrderedDict[tuple[Any, ...], NDArray[np.int64]] = OrderedDict()
+
+        self._voxels_count: int = 0
+
+        # Statistics
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def clear(self) -> None:
+
+        self._shapes = OrderedDict()
+        self._voxels_count = 0
+
+    def get_coords(
+        self,
+        voxel_value: VoxelValueShape
+    ) -> Optional[NDArray[np.int64]]:
+        """
+        Get the voxel positions of a shape, with its position transforms applied.
+
+        Args:
+            voxel_value: The shape
+
+        Returns:
+            The (N, 3) voxel positions (a new array), None for an unknown shape
+        """
+
+        keyed: Optional[tuple[tuple[Any, ...], tuple[int, int, int]]] = shape_key(voxel_value)
+
+        if keyed is None:
+            return None
+
+        key, anchor = keyed
+
+        offsets: Optional[NDArray[np.int64]] = self._shapes.get(key, None)
+
+        if offsets is not None:
+
+            self.hits += 1
+            self._shapes.move_to_end(key)
+
+        else:
+
+            self.misses += 1
+
+            shape: VoxelValueShape = _shape_at_origin(voxel_value, anchor)
+
+            coords: Optional[NDArray[np.int64]] = rasterize_shape(shape)
+
+            if coords is None:
+                return None
+
+            if has_pos_transform(shape.position):
+                coords, _ = transform_coords(coords, shape.position)
+
+            offsets = coords
+
+            self._store(key, offsets)
+
+        return offsets + np.array(anchor, dtype=np.int64)
+
+    def _store(
+        self,
+        key: tuple[Any, ...],
+        offsets: NDArray[np.int64]
+    ) -> None:
+        """
+        Cache the voxels of a shape, evicting the least recently used ones if needed.
+        """
+
+        if len(offsets) > self.max_voxels:
+            return
+
+        offsets.setflags(write=False)
+
+        self._shapes[key] = offsets
+        self._voxels_count += len(offsets)
+
+        while self._voxels_count > self.max_voxels:
+
+            evicted: NDArray[np.int64]
+            _, evicted = self._shapes.popitem(last=False)
+
+            self._voxels_count -= len(evicted)
+
+
+# Shape rasterization cache shared by the voxel grids
+SHAPE_CACHE: ShapeRasterCache = ShapeRasterCache()
@@ -0,0 +1,466 @@
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .pos import Pos
+from .pos_transform import has_pos_transform, transform_coords
+from .voxel_value import (
+    VoxelValueShape,
+    VoxelValueShapePoint,
+    VoxelValueShapeLine,
+    VoxelValueShapeTriangle,
+    VoxelValueShapeCircle,
+    VoxelValueShapeCube,
+    VoxelValueShapeRect,
+    VoxelValueShapeSphere,
+    VoxelValueShapeCylinder,
+    VoxelValueShapePolygon,
+)
+
+
+# Axis letter -> coordinate index
+AXIS_INDICES: dict[str, int] = {"x": 0, "y": 1, "z": 2}
+
+
+def box_coords(
+    x_min: int,
+    y_min: int,
+    z_min: int,
+    x_max: int,
+    y_max: int,
+    z_max: int
+) -> NDArray[np.int64]:
+    """
+    Rasterize an axis-aligned box, both corners included.
+
+    Returns:
+        The (N, 3) voxel positions, in x, then y, then z order
+    """
+
+    if x_max < x_min or y_max < y_min or z_max < z_min:
+        return np.zeros((0, 3), dtype=np.int64)
+
+    grid: NDArray[np.int64] = np.mgrid[
+        x_min:x_max + 1,
+        y_min:y_max + 1,
+        z_min:z_max + 1
+    ].astype(np.int64)
+
+    return grid.reshape(3, -1).T
+
+
+def sphere_coords(
+    cx: int,
+    cy: int,
+    cz: int,
+    radius: int
+) -> NDArray[np.int64]:
+    """
+    Rasterize a filled sphere: the voxels at a distance at most `radius` from the center.
+
+    Returns:
+        The (N, 3) voxel positions
+    """
+
+    if radius < 0:
+        return np.zeros((0, 3), dtype=np.int64)
+
+    offsets: NDArray[np.int64] = box_coords(-radius, -radius, -radius, radius, radius, radius)
+
+    inside: NDArray[np.bool_] = np.einsum("ij,ij->i", offsets, offsets) <= radius * radius
+
+    return offsets[inside] + np.array([cx, cy, cz], dtype=np.int64)
+
+
+def line_coords(
+    x0: int,
+    y0: int,
+    z0: int,
+    x1: int,
+    y1: int,
+    z1: int
+) -> NDArray[np.int64]:
+    """
+    Rasterize a 3D line, one voxel per step along its major axis:
+    at step i, each axis has moved by round(i * d / dm) voxels
+    (d the length of the line on the axis, dm the major one).
+
+    Returns:
+        The (dm + 1, 3) voxel positions, from the first end to the second
+    """
+
+    start: NDArray[np.int64] = np.array([x0, y0, z0], dtype=np.int64)
+    delta: NDArray[np.int64] = np.array([x1, y1, z1], dtype=np.int64) - start
+
+    dm: int = int(np.abs(delta).max())
+
+    if dm == 0:
+        return start.reshape(1, 3)
+
+    steps: NDArray[np.int64] = np.arange(dm + 1, dtype=np.int64).reshape(-1, 1)
+
+    # Integer form of floor(i * |d| / dm + 0.5)
+    moved: NDArray[np.int64] = (2 * steps * np.abs(delta) + dm) // (2 * dm)
+
+    return start + np.sign(delta) * moved
+
+
+def plane_axes(axis: str) -> Optional[tuple[int, int, int]]:
+    """
+    Get the coordinate indices of a circle / cylinder axis.
+
+    Args:
+        axis: The two axes of the plane of the disk ("xy", "xz" or "yz"),
+            or the single axis perpendicular to it ("x", "y" or "z")
+
+    Returns:
+        Tuple (u, v, normal) of coordinate indices, None if the axis is invalid
+    """
+
+    letters: str = axis.strip().lower()
+
+    if len(letters) == 1 and letters in AXIS_INDICES:
+
+        normal: int = AXIS_INDICES[letters]
+        u, v = (i for i in range(3) if i != normal)
+
+        return u, v, normal
+
+    if len(letters) == 2 and letters[0] in AXIS_INDICES and letters[1] in AXIS_INDICES:
+
+        u, v = AXIS_INDICES[letters[0]], AXIS_INDICES[letters[1]]
+
+        if u != v:
+            return u, v, 3 - u - v
+
+    print(f"Warning: Invalid shape axis: {axis}")
+
+    return None
+
+
+def cylinder_coords(
+    cx: int,
+    cy: int,
+    cz: int,
+    radius: int,
+    height: int,
+    axis: str
+) -> NDArray[np.int64]:
+    """
+    Rasterize a filled cylinder: a disk of `radius` around the center, in the plane of
+    `axis`, repeated on `height` layers from the center along the perpendicular axis.
+    A circle is a cylinder of height 1.
+
+    Returns:
+        The (N, 3) voxel positions
+    """
+
+    axes: Optional[tuple[int, int, int]] = plane_axes(axis)
+
+    if axes is None or radius < 0 or height <= 0:
+        return np.zeros((0, 3), dtype=np.int64)
+
+    u, v, normal = axes
+
+    disk: NDArray[np.int64] = box_coords(-radius, -radius, 0, radius, radius, height - 1)
+
+    inside: NDArray[np.bool_] = disk[:, 0] ** 2 + disk[:, 1] ** 2 <= radius * radius
+
+    coords: NDArray[np.int64] = np.zeros((int(inside.sum()), 3), dtype=np.int64)
+
+    coords[:, u] = disk[inside, 0]
+    coords[:, v] = disk[inside, 1]
+    coords[:, normal] = disk[inside, 2]
+
+    return coords + np.array([cx, cy, cz], dtype=np.int64)
+
+
+def polyline_coords(
+    vertices: NDArray[np.int64]
+) -> NDArray[np.int64]:
+    """
+    Rasterize the lines between the consecutive (K, 3) vertices.
+
+    Returns:
+        The (N, 3) voxel positions
+    """
+
+    if len(vertices) == 1:
+        return vertices.reshape(1, 3)
+
+    return np.concatenate([
+        line_coords(*vertices[i].tolist(), *vertices[i + 1].tolist())
+        for i in range(len(vertices) - 1)
+    ]).reshape(-1, 3)
+
+
+def planar_fill_coords(
+    vertices: NDArray[np.int64]
+) -> NDArray[np.int64]:
+    """
+    Rasterize the inside of a closed planar polygon of (K, 3) vertices.
+
+    The polygon is projected along the dominant axis of its normal, the points
+    of its projected bounding box are tested all at once against every edge
+    (even-odd rule), and each covered point gets the voxel of the plane above it.
+
+    Returns:
+        The (N, 3) voxel positions, without the edges
+    """
+
+    points: NDArray[np.float64] = vertices.astype(np.float64)
+
+    # Newell normal, robust for any planar polygon
+    following: NDArray[np.float64] = np.roll(points, -1, axis=0)
+
+    normal: NDArray[np.float64] = np.array([
+        np.sum((points[:, 1] - following[:, 1]) * (points[:, 2] + following[:, 2])),
+        np.sum((points[:, 2] - following[:, 2]) * (points[:, 0] + following[:, 0])),
+        np.sum((points[:, 0] - following[:, 0]) * (points[:, 1] + following[:, 1])),
+    ])
+
+    w: int = int(np.argmax(np.abs(normal)))
+
+    if normal[w] == 0:
+        return np.zeros((0, 3), dtype=np.int64)
+
+    u, v = (i for i in range(3) if i != w)
+
+    lo: NDArray[np.int64] = vertices.min(axis=0)
+    hi: NDArray[np.int64] = vertices.max(axis=0)
+
+    plane: NDArray[np.int64] = np.mgrid[lo[u]:hi[u] + 1, lo[v]:hi[v] + 1].reshape(2, -1).T
+
+    pu: NDArray[np.float64] = plane[:, 0].astype(np.float64)
+    pv: NDArray[np.float64] = plane[:, 1].astype(np.float64)
+
+    inside: NDArray[np.bool_] = np.zeros(len(plane), dtype=np.bool_)
+
+    for (au, av), (bu, bv) in zip(points[:, [u, v]].tolist(), following[:, [u, v]].tolist()):
+
+        if av == bv:
+            continue
+
+        crosses: NDArray[np.bool_] = (av > pv) != (bv > pv)
+
+        inside ^= crosses & (pu < au + (pv - av) * (bu - au) / (bv - av))
+
+    coords: NDArray[np.int64] = np.zeros((int(inside.sum()), 3), dtype=np.int64)
+
+    coords[:, u] = plane[inside, 0]
+    coords[:, v] = plane[inside, 1]
+
+    # Height of the plane above each covered point
+    coords[:, w] = np.rint(
+        points[0, w] - (
+            normal[u] * (pu[inside] - points[0, u])
+            + normal[v] * (pv[inside] - points[0, v])
+        ) / normal[w]
+    ).astype(np.int64)
+
+    return coords
+
+
+def polygon_coords(
+    vertices: NDArray[np.int64],
+    fill: bool = True
+) -> NDArray[np.int64]:
+    """
+    Rasterize a polygon given by its (K, 3) vertices: its edges, and its inside
+    if it is closed (last vertex equal to the first one) and `fill` is set.
+
+    Returns:
+        The (N, 3) voxel positions
+    """
+
+    if len(vertices) == 0:
+        return np.zeros((0, 3), dtype=np.int64)
+
+    edges: NDArray[np.int64] = polyline_coords(vertices)
+
+    if not fill or len(vertices) < 4 or np.any(vertices[0] != vertices[-1]):
+        return edges
+
+    return np.concatenate([planar_fill_coords(vertices[:-1]), edges])
+
+
+def _pos_array(positions: list[Pos]) -> NDArray[np.int64]:
+
+    return np.array(
+        [[int(p.xyz.x), int(p.xyz.y), int(p.xyz.z)] for p in positions],
+        dtype=np.int64
+    ).reshape(-1, 3)
+
+
+def rasterize_shape(voxel_value: VoxelValueShape) -> Optional[NDArray[np.int64]]:
+    """
+    Rasterize a shape into the (N, 3) array of its voxel positions.
+
+    Args:
+        voxel_value: The shape to rasterize
+
+    Returns:
+        The voxel positions, None for an unknown shape
+    """
+
+    pos = voxel_value.position.xyz
+
+    if isinstance(voxel_value, VoxelValueShapePoint):
+
+        return np.array([[int(pos.x), int(pos.y), int(pos.z)]], dtype=np.int64)
+
+    if isinstance(voxel_value, VoxelValueShapeCube):
+
+        size: int = voxel_value.size
+
+        return box_coords(
+            int(pos.x), int(pos.y), int(pos.z),
+            int(pos.x) + size - 1, int(pos.y) + size - 1, int(pos.z) + size - 1
+        )
+
+    if isinstance(voxel_value, VoxelValueShapeRect):
+
+        pos2 = voxel_value.position2.xyz
+
+        return box_coords(
+            int(min(pos.x, pos2.x)), int(min(pos.y, pos2.y)), int(min(pos.z, pos2.z)),
+            int(max(pos.x, pos2.x)), int(max(pos.y, pos2.y)), int(max(pos.z, pos2.z))
+        )
+
+    if isinstance(voxel_value, VoxelValueShapeSphere):
+
+        return sphere_coords(int(pos.x), int(pos.y), int(pos.z), voxel_value.radius)
+
+    if isinstance(voxel_value, VoxelValueShapeLine):
+
+        pos2 = voxel_value.position2.xyz
+
+        return line_coords(
+            int(pos.x), int(pos.y), int(pos.z),
+            int(pos2.x), int(pos2.y), int(pos2.z)
+        )
+
+    if isinstance(voxel_value, VoxelValueShapeTriangle):
+
+        triangle: NDArray[np.int64] = _pos_array([
+            voxel_value.position,
+            voxel_value.position2,
+            voxel_value.position3,
+            voxel_value.position,
+        ])
+
+        return polygon_coords(triangle)
+
+    if isinstance(voxel_value, VoxelValueShapeCircle):
+
+        return cylinder_coords(
+            int(pos.x), int(pos.y), int(pos.z),
+            voxel_value.radius, 1, voxel_value.axis
+        )
+
+    if isinstance(voxel_value, VoxelValueShapeCylinder):
+
+        return cylinder_coords(
+            int(pos.x), int(pos.y), int(pos.z),
+            voxel_value.radius, voxel_value.height, voxel_value.axis
+        )
+
+    if isinstance(voxel_value, VoxelValueShapePolygon):
+
+        # The position is the first point, unless the vertices already start with it
+        vertices: NDArray[np.int64] = _pos_array(voxel_value.polygon)
+        first: NDArray[np.int64] = _pos_array([voxel_value.position])
+
+        if len(vertices) == 0 or np.any(vertices[0] != first[0]):
+            vertices = np.concatenate([first, vertices])
+
+        return polygon_coords(vertices)
+
+    return None
+
+
+def shape_bounds(voxel_value: VoxelValueShape) -> Optional[tuple[NDArray[np.int64], NDArray[np.int64]]]:
+    """
+    Get the bounding box of the voxels of a shape, without rasterizing it
+    (except for the shapes with position transforms).
+
+    Args:
+        voxel_value: The shape
+
+    Returns:
+        Tuple of (min corner inclusive, max corner exclusive), None for an unknown
+        or empty shape
+    """
+
+    if has_pos_transform(voxel_value.position):
+
+        coords: Optional[NDArray[np.int64]] = rasterize_shape(voxel_value)
+
+        if coords is None:
+            return None
+
+        coords, _ = transform_coords(coords, voxel_value.position)
+
+        if len(coords) == 0:
+            return None
+
+        return coords.min(axis=0), coords.max(axis=0) + 1
+
+    pos: NDArray[np.int64] = _pos_array([voxel_value.position])[0]
+
+    vertices: Optional[NDArray[np.int64]] = None
+
+    if isinstance(voxel_value, VoxelValueShapePoint):
+
+        vertices = pos.reshape(1, 3)
+
+    elif isinstance(voxel_value, VoxelValueShapeCube):
+
+        if voxel_value.size <= 0:
+            return None
+
+        vertices = np.stack([pos, pos + voxel_value.size - 1])
+
+    elif isinstance(voxel_value, (VoxelValueShapeRect, VoxelValueShapeLine)):
+
+        vertices = _pos_array([voxel_value.position, voxel_value.position2])
+
+    elif isinstance(voxel_value, VoxelValueShapeTriangle):
+
+        vertices = _pos_array([voxel_value.position, voxel_value.position2, voxel_value.position3])
+
+    elif isinstance(voxel_value, VoxelValueShapePolygon):
+
+        vertices = _pos_array([voxel_value.position] + voxel_value.polygon)
+
+    elif isinstance(voxel_value, VoxelValueShapeSphere):
+
+        if voxel_value.radius < 0:
+            return None
+
+        vertices = np.stack([pos - voxel_value.radius, pos + voxel_value.radius])
+
+    elif isinstance(voxel_value, (VoxelValueShapeCircle, VoxelValueShapeCylinder)):
+
+        height: int = voxel_value.height if isinstance(voxel_value, VoxelValueShapeCylinder) else 1
+        axes: Optional[tuple[int, int, int]] = plane_axes(voxel_value.axis)
+
+        if axes is None or voxel_value.radius < 0 or height <= 0:
+            return None
+
+        u, v, normal = axes
+
+        low: NDArray[np.int64] = pos.copy()
+        high: NDArray[np.int64] = pos.copy()
+
+        low[[u, v]] -= voxel_value.radius
+        high[[u, v]] += voxel_value.radius
+        high[normal] += height - 1
+
+        vertices = np.stack([low, high])
+
+    if vertices is None:
+        return None
+
+    return vertices.min(axis=0), vertices.max(axis=0) + 1
@@ -50,7 +50,7 @@ class Vec3:
 
     def __hash__(self) -> int:
 
-        return hash(self.__str__())
+        return hash((self.x, self.y, self.z))
 
 
 def parse_vec3(data: Any) -> Vec3:
@@ -0,0 +1,422 @@
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .vec import parse_vec3
+from .color_palette import parse_color
+from .voxel_key import pack_voxel_keys
+
+
+# Axes along which the voxel runs of a "voxels_rle" field can be encoded
+RLE_AXES: tuple[str, ...] = ("x", "y", "z")
+
+
+def index_dtype_for(count: int) -> type[np.unsignedinteger[Any]]:
+    """
+    Get the smallest unsigned integer type able to index `count` colors.
+    """
+
+    if count <= 1 << 8:
+        return np.uint8
+
+    if count <= 1 << 16:
+        return np.uint16
+
+    return np.uint32
+
+
+def coord_dtype_for(coords: NDArray[np.integer[Any]]) -> type[np.signedinteger[Any]]:
+    """
+    Get the smallest signed integer type able to store the given coordinates
+    (int16 for scenes that fit in [-32768, 32767], else int32).
+    """
+
+    if len(coords) == 0:
+        return np.int16
+
+    if int(coords.min()) >= -(1 << 15) and int(coords.max()) < (1 << 15):
+        return np.int16
+
+    return np.int32
+
+
+class VoxelArrays:
+    """
+    Compact array representation of a set of resolved voxels:
+        - coords: (N, 3) integer voxel coordinates
+        - indices: (N,) unsigned indices into the color table
+        - table: (K, 4) uint8 RGBA color table
+    """
+
+    def __init__(
+        self,
+        coords: NDArray[np.integer[Any]],
+        indices: NDArray[np.unsignedinteger[Any]],
+        table: NDArray[np.uint8]
+    ) -> None:
+
+        self.coords: NDArray[np.integer[Any]] = coords
+        self.indices: NDArray[np.unsignedinteger[Any]] = indices
+        self.table: NDArray[np.uint8] = table
+
+    def __len__(self) -> int:
+
+        return len(self.coords)
+
+    def colors(self) -> NDArray[np.uint8]:
+        """
+        Get the (N, 4) RGBA color of each voxel.
+        """
+
+        return self.table[self.indices]
+
+    def translated(
+        self,
+        x: int,
+        y: int,
+        z: int
+    ) -> "VoxelArrays":
+        """
+        Get the voxels moved by an integer offset (the color table is shared).
+        """
+
+        coords: NDArray[np.int64] = np.asarray(self.coords, dtype=np.int64).reshape(-1, 3) \
+                                  + np.array([x, y, z], dtype=np.int64)
+
+        return VoxelArrays(coords, self.indices, self.table)
+
+    def rgba_words(self) -> NDArray[np.uint32]:
+        """
+        Get the RGBA color of each voxel packed into a single 32 bits word,
+        to compare colors at once.
+        """
+
+        return np.ascontiguousarray(
+            self.table.astype(np.uint8)
+        ).view(np.uint32).reshape(-1)[self.indices]
+
+    def export_to_dict(self) -> dict[str, list[int]]:
+        """
+        Export as a post-processed voxels_dict.
+
+        Returns:
+            Dictionary where keys are position strings "x,y,z" and values are RGBA color lists
+        """
+
+        table_lst: list[list[int]] = self.table.tolist()
+
+        return {
+            f"{x},{y},{z}": table_lst[i]
+            for (x, y, z), i in zip(self.coords.tolist(), self.indices.tolist())
+        }
+
+    def export_to_rle(
+        self,
+        axis: str = "x"
+    ) -> dict[str, Any]:
+        """
+        Export as a post-processed voxels_rle: runs of consecutive voxels of
+        the same color along an axis.
+
+        Format:
+            {
+                "axis": "x",
+                "colors": [[r, g, b, a], ...],
+                "runs": [x, y, z, length, color_index, ...]
+            }
+            where (x, y, z) is the first voxel of the run, the next `length - 1`
+            voxels following it along the axis.
+
+        Args:
+            axis: Axis of the runs ("x", "y" or "z")
+
+        Returns:
+            The voxels_rle dictionary
+        """
+
+        a: int = RLE_AXES.index(axis)
+        o1: int = (a + 1) % 3
+        o2: int = (a + 2) % 3
+
+        # Only keep the used colors
+        used: NDArray[np.intp]
+        indices: NDArray[np.intp]
+        used, indices = np.unique(np.asarray(self.indices).reshape(-1), return_inverse=True)
+        indices = indices.reshape(-1)
+
+        coords: NDArray[np.int64] = np.asarray(self.coords, dtype=np.int64).reshape(-1, 3)
+
+        # Sort the voxels into lines along the axis
+        order: NDArray[np.intp] = np.lexsort((coords[:, a], coords[:, o2], coords[:, o1]))
+
+        coords = coords[order]
+        indices = indices[order]
+
+        # A run starts where the line, the color or the continuity changes
+        is_start: NDArray[np.bool_] = np.ones(len(coords), dtype=np.bool_)
+        is_start[1:] = (coords[1:, o1] != coords[:-1, o1]) \
+                     | (coords[1:, o2] != coords[:-1, o2]) \
+                     | (coords[1:, a] != coords[:-1, a] + 1) \
+                     | (indices[1:] != indices[:-1])
+
+        starts: NDArray[np.intp] = np.flatnonzero(is_start)
+        lengths: NDArray[np.intp] = np.diff(np.append(starts, len(coords)))
+
+        runs: NDArray[np.int64] = np.column_stack(
+            [coords[starts], lengths, indices[starts]]
+        ).astype(np.int64)
+
+        return {
+            "axis": axis,
+            "colors": self.table[used].tolist(),
+            "runs": runs.reshape(-1).tolist(),
+        }
+
+    @staticmethod
+    def from_rle(data: dict[str, Any]) -> "VoxelArrays":
+        """
+        Build voxel arrays from a post-processed voxels_rle (see `export_to_rle`).
+
+        Args:
+            data: The voxels_rle, as loaded from JSON
+
+        Returns:
+            The VoxelArrays
+        """
+
+        a: int = RLE_AXES.index(data.get("axis", "x"))
+
+        table: NDArray[np.uint8] = np.array(
+            data.get("colors", []), dtype=np.int64
+        ).reshape(-1, 4).clip(0, 255).astype(np.uint8)
+
+        runs: NDArray[np.int64] = np.array(data.get("runs", []), dtype=np.int64).reshape(-1, 5)
+
+        lengths: NDArray[np.int64] = runs[:, 3]
+
+        # Run of each voxel, and position of the voxel in its run
+        run_of_voxel: NDArray[np.intp] = np.repeat(np.arange(len(runs)), lengths)
+        offsets: NDArray[np.int64] = np.arange(int(lengths.sum())) \
+                                   - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+        coords: NDArray[np.int64] = runs[run_of_voxel, :3]
+        coords[:, a] += offsets
+
+        return VoxelArrays(
+            coords=coords.astype(coord_dtype_for(coords)),
+            indices=runs[run_of_voxel, 4].astype(index_dtype_for(len(table))),
+            table=table
+        )
+
+    @staticmethod
+    def from_colors(
+        coords: NDArray[np.integer[Any]],
+        colors: NDArray[np.integer[Any]]
+    ) -> "VoxelArrays":
+        """
+        Build voxel arrays from per-voxel RGBA colors, deduplicating them
+        into a color table.
+
+        Args:
+            coords: (N, 3) integer voxel coordinates
+            colors: (N, 4) RGBA colors
+
+        Returns:
+            The VoxelArrays
+        """
+
+        colors_u8: NDArray[np.uint8] = np.clip(colors, 0, 255).astype(np.uint8).reshape(-1, 4)
+
+        # Unique over packed RGBA words (much faster than a row-wise unique)
+        packed: NDArray[np.uint32] = np.ascontiguousarray(colors_u8).view(np.uint32).reshape(-1)
+
+        packed_table: NDArray[np.uint32]
+        inverse: NDArray[np.intp]
+        packed_table, inverse = np.unique(packed, return_inverse=True)
+
+        table: NDArray[np.uint8] = packed_table.view(np.uint8).reshape(-1, 4)
+
+        coords_arr: NDArray[np.integer[Any]] = np.asarray(coords).reshape(-1, 3)
+
+        return VoxelArrays(
+            coords=coords_arr.astype(coord_dtype_for(coords_arr)),
+            indices=inverse.reshape(-1).astype(index_dtype_for(len(table))),
+            table=table
+        )
+
+    @staticmethod
+    def from_voxels_dict(data: dict[str, Any]) -> "VoxelArrays":
+        """
+        Build voxel arrays from a post-processed voxels_dict
+        ({"x,y,z": [r, g, b, a], ...}).
+
+        Args:
+            data: The voxels_dict, as loaded from JSON
+
+        Returns:
+            The VoxelArrays
+        """
+
+        if len(data) == 0:
+
+            return VoxelArrays(
+                coords=np.zeros((0, 3), dtype=np.int16),
+                indices=np.zeros((0,), dtype=np.uint8),
+                table=np.zeros((0, 4), dtype=np.uint8)
+            )
+
+        coords: NDArray[np.int64]
+
+        try:
+
+            # Parse all the "x,y,z" keys at once
+            flat_keys: list[str] = ",".join(data.keys()).replace("_", ",").split(",")
+
+            coords = np.array(flat_keys, dtype=np.float64).reshape(-1, 3).astype(np.int64)
+
+        except ValueError:
+
+            coords = np.array(
+                [
+                    [int(v.x), int(v.y), int(v.z)]
+                    for v in map(parse_vec3, data.keys())
+                ],
+                dtype=np.int64
+            )
+
+        values: list[Any] = list(data.values())
+
+        colors: NDArray[np.int64]
+
+        if all(isinstance(v, list) and len(v) == 4 for v in values):
+            colors = np.array(values, dtype=np.int64)
+
+        else:
+            colors = np.array(
+                [parse_color(v).export_to_lst() for v in values],
+                dtype=np.int64
+            )
+
+        return VoxelArrays.from_colors(coords, colors)
+
+
+def merge_color_tables(
+    arrays: list[VoxelArrays]
+) -> tuple[NDArray[np.uint8], list[NDArray[np.unsignedinteger[Any]]]]:
+    """
+    Merge the color tables of several voxel arrays into a single shared table.
+
+    Args:
+        arrays: The voxel arrays (e.g. one per frame)
+
+    Returns:
+        Tuple of (shared color table, indices of each voxel arrays remapped into it)
+    """
+
+    if len(arrays) == 0:
+        return np.zeros((0, 4), dtype=np.uint8), []
+
+    all_tables: NDArray[np.uint8] = np.concatenate(
+        [va.table.reshape(-1, 4) for va in arrays], axis=0
+    )
+
+    table: NDArray[np.uint8]
+    inverse: NDArray[np.intp]
+    table, inverse = np.unique(all_tables, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    dtype: type[np.unsignedinteger[Any]] = index_dtype_for(len(table))
+
+    remapped: list[NDArray[np.unsignedinteger[Any]]] = []
+
+    offset: int = 0
+
+    for va in arrays:
+
+        remap: NDArray[np.intp] = inverse[offset:offset + len(va.table)]
+        offset += len(va.table)
+
+        remapped.append(remap[va.indices].astype(dtype))
+
+    return table, remapped
+
+
+def compute_voxels_delta(
+    base: VoxelArrays,
+    target: VoxelArrays
+) -> tuple[NDArray[np.int64], VoxelArrays]:
+    """
+    Compute the changes turning the voxels of a base frame into the voxels of a target frame.
+
+    Args:
+        base: The voxels of the base frame
+        target: The voxels of the target frame
+
+    Returns:
+        Tuple of ((N, 3) coordinates of the removed voxels, added or recolored voxels)
+    """
+
+    base_keys: NDArray[np.int64] = pack_voxel_keys(base.coords)
+    target_keys: NDArray[np.int64] = pack_voxel_keys(target.coords)
+
+    order: NDArray[np.intp] = np.argsort(base_keys)
+
+    sorted_keys: NDArray[np.int64] = base_keys[order]
+    sorted_rgba: NDArray[np.uint32] = base.rgba_words()[order]
+
+    changed: NDArray[np.bool_] = np.ones(len(target_keys), dtype=np.bool_)
+
+    if len(sorted_keys) > 0:
+
+        pos: NDArray[np.intp] = np.minimum(
+            np.searchsorted(sorted_keys, target_keys), len(sorted_keys) - 1
+        )
+
+        changed = (sorted_keys[pos] != target_keys) | (sorted_rgba[pos] != target.rgba_words())
+
+    removed: NDArray[np.bool_] = ~np.isin(base_keys, target_keys)
+
+    return (
+        np.asarray(base.coords, dtype=np.int64).reshape(-1, 3)[removed],
+        VoxelArrays.from_colors(
+            np.asarray(target.coords).reshape(-1, 3)[changed],
+            target.colors().reshape(-1, 4)[changed]
+        )
+    )
+
+
+def apply_voxels_delta(
+    base: VoxelArrays,
+    removed: NDArray[np.integer[Any]],
+    changed: VoxelArrays
+) -> VoxelArrays:
+    """
+    Apply the changes of a delta frame to the voxels of its base frame (see `compute_voxels_delta`).
+
+    Args:
+        base: The voxels of the base frame
+        removed: (N, 3) coordinates of the removed voxels
+        changed: The added or recolored voxels
+
+    Returns:
+        The voxels of the delta frame
+    """
+
+    base_keys: NDArray[np.int64] = pack_voxel_keys(base.coords)
+
+    keep: NDArray[np.bool_] = ~np.isin(
+        base_keys,
+        np.concatenate([pack_voxel_keys(removed), pack_voxel_keys(changed.coords)])
+    )
+
+    return VoxelArrays.from_colors(
+        np.concatenate([
+            np.asarray(base.coords, dtype=np.int64).reshape(-1, 3)[keep],
+            np.asarray(changed.coords, dtype=np.int64).reshape(-1, 3)
+        ]),
+        np.concatenate([
+            base.colors().reshape(-1, 4)[keep],
+            changed.colors().reshape(-1, 4)
+        ])
+    )
@@ -1,33 +1,104 @@
-from typing import Optional, Any
+from typing import Optional, Any, Iterator, Sequence
+import copy
 import math
 
+import numpy as np
+from numpy.typing import NDArray
+
 from .vec import Vec3
-from .color import Color
+from .color import Color, FrozenColor, ColorGradient, ColorZones
 from .color_palette import ColorPalette
 from .naxel import NaxelDataFrame, NaxelGeneralData
+from .voxel_arrays import VoxelArrays, index_dtype_for
+from .voxel_key import pack_voxel_key, pack_voxel_keys, unpack_voxel_key, unpack_voxel_keys, voxel_key_in_range
+from .model_cache import ModelCache, MODEL_CACHE
+from .pos_transform import has_pos_transform, transform_coords
+from .shape_cache import ShapeRasterCache, SHAPE_CACHE
+from .bvh import BVH, shapes_bvh
 from .voxel_value import (
     VoxelValue,
     VoxelValueColor,
     VoxelValueFromPalette,
+    VoxelValueImportVoxel,
     VoxelValueShape,
-    VoxelValueShapePoint,
-    VoxelValueShapeLine,
-    VoxelValueShapeCube,
-    VoxelValueShapeRect,
-    VoxelValueShapeSphere,
 )
 
 
+class VoxelInstance:
+    """
+    A placement of a shared model grid, moved by an integer offset.
+    """
+
+    def __init__(
+        self,
+        grid: "VoxelGrid",
+        offset: tuple[int, int, int]
+    ) -> None:
+
+        self.grid: VoxelGrid = grid
+        self.offset: tuple[int, int, int] = offset
+
+    def get_bounds(self) -> tuple[Vec3, Vec3]:
+        """
+        Get the axis-aligned bounding box of the instance, in grid space.
+        """
+
+        bounds_min, bounds_max = self.grid.get_bounds()
+
+        ox, oy, oz = self.offset
+
+        return (
+            Vec3(bounds_min.x + ox, bounds_min.y + oy, bounds_min.z + oz),
+            Vec3(bounds_max.x + ox, bounds_max.y + oy, bounds_max.z + oz)
+        )
+
+
 class VoxelGrid:
     """
     Efficient voxel storage with AABB bounds for ray marching optimization.
     Converts various voxel representations (dict, list, grid) into a unified
     sparse dictionary format.
+
+    Voxels store a small integer index into a color table. Colors coming from
+    the color palette get one table entry per palette key, so a palette change
+    only rewrites the table (see `apply_palette`).
     """
 
     def __init__(self) -> None:
 
-        self._voxels: dict[tuple[int, int, int], Color] = {}
+        # Packed position key (see voxel_key.py) -> index in the color table
+        self._voxels: dict[int, int] = {}
+
+        self._color_table: list[Color] = []
+        self._rgba_slots: dict[tuple[int, int, int, int], int] = {}
+        self._palette_slots: dict[str | int, int] = {}
+
+        # id() of the palette colors -> palette key, set by build_from_frame
+        self._palette_keys_by_id: dict[int, str | int] = {}
+
+        # Imported models (import_voxel), and the directory they are relative to
+        self.model_cache: ModelCache = MODEL_CACHE
+        self._source_dir: str = ""
+
+        # Rasterized shapes, shared between frames and files
+        self.shape_cache: ShapeRasterCache = SHAPE_CACHE
+
+        # If set, imported models are placed as instances of a shared model grid
+        # instead of being copied into the grid (see InstancedRayMarcher)
+        self.instance_imports: bool = False
+        self.instances: list[VoxelInstance] = []
+
+        # Grid receiving the voxels written after the last instance (see `_placement_grid`)
+        self._layer: Optional[VoxelGrid] = None
+
+        # If set, the shapes that have a closed form (boxes, spheres, cylinders)
+        # are placed as analytic instances instead of being rasterized
+        self.analytic_shapes: bool = False
+
+        # If set, (min corner inclusive, max corner exclusive) box outside which
+        # the shapes of a voxels_list are not rasterized (see `_shapes_in_region`)
+        self.shapes_region: Optional[tuple[tuple[int, int, int], tuple[int, int, int]]] = None
+
         self._min_bounds: Vec3 = Vec3(0, 0, 0)
         self._max_bounds: Vec3 = Vec3(0, 0, 0)
         self._is_empty: bool = True
@@ -50,7 +121,16 @@ class VoxelGrid:
             Color if voxel exists at position, None otherwise
         """
 
-        return self._voxels.get((x, y, z), None)
+        # No voxel can be stored out of the packed key range
+        if not voxel_key_in_range(x, y, z):
+            return None
+
+        slot: Optional[int] = self._voxels.get(pack_voxel_key(x, y, z), None)
+
+        if slot is None:
+            return None
+
+        return self._color_table[slot]
 
     def set_voxel(
         self,
@@ -69,10 +149,156 @@ class VoxelGrid:
             color: Color of the voxel
         """
 
-        self._voxels[(x, y, z)] = color
+        self._set_voxel_slot(x, y, z, self._color_slot(color))
+
+    def set_voxels(
+        self,
+        coords: NDArray[np.integer[Any]],
+        colors: NDArray[np.integer[Any]]
+    ) -> None:
+        """
+        Set many voxels at once, updating the bounds once for all of them.
+
+        Args:
+            coords: (N, 3) integer coordinates of the voxels
+            colors: (N, 4) RGBA colors of the voxels
+        """
+
+        self.load_arrays(VoxelArrays.from_colors(coords, colors))
+
+    def _set_voxel_slot(
+        self,
+        x: int,
+        y: int,
+        z: int,
+        slot: int
+    ) -> None:
+        """
+        Set a voxel at the given integer coordinates to a color table index.
+        """
+
+        self._voxels[pack_voxel_key(x, y, z)] = slot
 
         self._update_bounds(x, y, z)
 
+    def _set_voxels_slot(
+        self,
+        coords: NDArray[np.integer[Any]],
+        slot: int
+    ) -> None:
+        """
+        Set all the (N, 3) given voxels to the same color table index at once.
+        """
+
+        if len(coords) == 0:
+            return
+
+        self._voxels.update(dict.fromkeys(pack_voxel_keys(coords).tolist(), slot))
+
+        self._update_bounds_from_coords(coords)
+
+    def _set_voxels_slots(
+        self,
+        coords: NDArray[np.integer[Any]],
+        slots: NDArray[np.integer[Any]]
+    ) -> None:
+        """
+        Set all the (N, 3) given voxels to their (N,) color table indices at once.
+        """
+
+        if len(coords) == 0:
+            return
+
+        self._voxels.update(zip(pack_voxel_keys(coords).tolist(), np.asarray(slots).tolist()))
+
+        self._update_bounds_from_coords(coords)
+
+    def _color_slot(
+        self,
+        color: Color
+    ) -> int:
+        """
+        Get the color table index of a literal color, adding it if needed.
+        """
+
+        rgba: tuple[int, int, int, int] = (color.r, color.g, color.b, color.a)
+
+        slot: Optional[int] = self._rgba_slots.get(rgba, None)
+
+        if slot is None:
+
+            slot = len(self._color_table)
+
+            self._color_table.append(color)
+            self._rgba_slots[rgba] = slot
+
+        return slot
+
+    def _palette_slot(
+        self,
+        palette_key: str | int,
+        color: Color
+    ) -> int:
+        """
+        Get the color table index bound to a palette key, adding it if needed.
+        """
+
+        slot: Optional[int] = self._palette_slots.get(palette_key, None)
+
+        if slot is None:
+
+            slot = len(self._color_table)
+
+            self._color_table.append(color)
+            self._palette_slots[palette_key] = slot
+
+        return slot
+
+    def get_color_table(self) -> list[Color]:
+        """
+        Get the color table, indexed by the voxels color indices.
+        """
+
+        return self._color_table
+
+    def apply_palette(
+        self,
+        palette: ColorPalette
+    ) -> None:
+        """
+        Recolor all the voxels that were built from palette entries by rewriting
+        the color table entries of the palette keys defined in `palette`.
+        No voxel is touched, so this is independent of the number of voxels.
+
+        Args:
+            palette: Palette with the new colors of the palette keys
+        """
+
+        for palette_key, slot in self._palette_slots.items():
+
+            color: Optional[Color] = palette.get_color(palette_key)
+
+            if color is not None:
+                self._color_table[slot] = color
+
+    def set_palette_color(
+        self,
+        palette_key: str | int,
+        color: Color
+    ) -> None:
+        """
+        Recolor all the voxels built from a palette key.
+
+        Args:
+            palette_key: The palette key
+            color: The new color of the palette key
+        """
+
+        slot: Optional[int] = self._palette_slots.get(palette_key, None)
+
+        if slot is not None:
+            self._color_table[slot] = color
+
     def _update_bounds(
         self,
         x: int,
@@ -89,6 +315,15 @@ class VoxelGrid:
             self._max_bounds = Vec3(x + 1, y + 1, z + 1)
             self._is_empty = False
 
+        elif (
+            self._min_bounds.x <= x < self._max_bounds.x
+            and self._min_bounds.y <= y < self._max_bounds.y
+            and self._min_bounds.z <= z < self._max_bounds.z
+        ):
+
+            # Already inside the bounds, nothing to allocate
+            return
+
         else:
 
             self._min_bounds = Vec3(
@@ -103,9 +338,99 @@ class VoxelGrid:
                 max(self._max_bounds.z, z + 1)
             )
 
+    def _update_bounds_from_coords(
+        self,
+        coords: NDArray[np.integer[Any]]
+    ) -> None:
+        """
+        Update the AABB bounds to include all the (N, 3) given positions at once.
+        """
+
+        if len(coords) == 0:
+            return
+
+        self._update_bounds(*(int(v) for v in coords.min(axis=0)))
+        self._update_bounds(*(int(v) for v in coords.max(axis=0)))
+
+    def add_instance(
+        self,
+        grid: "VoxelGrid",
+        offset: tuple[int, int, int]
+    ) -> None:
+        """
+        Place an instance of a shared model grid, without copying its voxels.
+
+        Args:
+            grid: The model grid
+            offset: Integer position of the model origin in this grid
+        """
+
+        if grid.is_empty():
+            return
+
+        self.instances.append(VoxelInstance(grid, offset))
+
+    def _placement_grid(self) -> "VoxelGrid":
+        """
+        Get the grid the next rasterized voxels must be written to.
+
+        Overlapping voxels are resolved by placement order, and the instanced
+        ray marcher gives the later instances priority over the voxels of the
+        grid itself. So once an instance has been placed, the following voxels
+        go into a layer grid placed as the next instance, sharing the color
+        table of this grid.
+
+        Returns:
+            This grid, or the current layer grid
+        """
+
+        if len(self.instances) == 0:
+            return self
+
+        if self._layer is not None and self.instances[-1].grid is self._layer:
+            return self._layer
+
+        layer: VoxelGrid = VoxelGrid()
+
+        layer._color_table = self._color_table
+        layer._rgba_slots = self._rgba_slots
+        layer._palette_slots = self._palette_slots
+
+        # Placed even while empty, to keep its rank (empty layers are dropped after the build)
+        self.instances.append(VoxelInstance(layer, (0, 0, 0)))
+        self._layer = layer
+
+        return layer
+
     def get_bounds(self) -> tuple[Vec3, Vec3]:
         """
-        Get the axis-aligned bounding box of all voxels.
+        Get the axis-aligned bounding box of all voxels, including the instances.
+
+        Returns:
+            Tuple of (min_corner, max_corner) Vec3
+        """
+
+        if len(self.instances) == 0:
+            return (self._min_bounds, self._max_bounds)
+
+        corners: list[Vec3] = [
+            corner
+            for instance in self.instances
+            for corner in instance.get_bounds()
+        ]
+
+        if not self._is_empty:
+            corners += [self._min_bounds, self._max_bounds]
+
+        return (
+            Vec3(min(c.x for c in corners), min(c.y for c in corners), min(c.z for c in corners)),
+            Vec3(max(c.x for c in corners), max(c.y for c in corners), max(c.z for c in corners))
+        )
+
+    def get_voxel_bounds(self) -> tuple[Vec3, Vec3]:
+        """
+        Get the axis-aligned bounding box of the voxels stored in the grid itself
+        (without the instances).
 
         Returns:
             Tuple of (min_corner, max_corner) Vec3
@@ -115,13 +440,20 @@ class VoxelGrid:
 
     def is_empty(self) -> bool:
         """
-        Check if the grid contains any voxels.
+        Check if the grid contains any voxels, including the instances.
 
         Returns:
             True if no voxels, False otherwise
         """
 
-        return self._is_empty
+        return self._is_empty and len(self.instances) == 0
+
+    def has_voxels(self) -> bool:
+        """
+        Check if the grid itself (without the instances) contains any voxels.
+        """
+
+        return not self._is_empty
 
     def export_to_dict(self) -> dict[str, list[int]]:
         """
@@ -131,45 +463,275 @@ class VoxelGrid:
             Dictionary where keys are position strings "x,y,z" and values are RGBA color lists
         """
 
-        return {
-            f"{x},{y},{z}": color.export_to_lst()
-            for (x, y, z), color in self._voxels.items()
-        }
+        table_lst: list[list[int]] = [
+            color.export_to_lst() for color in self._color_table
+        ]
+
+        res: dict[str, list[int]] = {}
+
+        for key, slot in self._voxels.items():
+
+            x, y, z = unpack_voxel_key(key)
+
+            res[f"{x},{y},{z}"] = table_lst[slot]
+
+        return res
+
+    def _color_table_array(self) -> NDArray[np.uint8]:
+        """
+        Get the color table as a (K, 4) uint8 RGBA array.
+        """
+
+        return np.array(
+            [color.export_to_lst() for color in self._color_table],
+            dtype=np.int64
+        ).reshape(-1, 4).clip(0, 255).astype(np.uint8)
+
+    def export_arrays(self) -> VoxelArrays:
+        """
+        Export the processed voxel grid as compact arrays.
+
+        Returns:
+            VoxelArrays with int32 coordinates, uint8/uint16 color indices
+            (depending on the color count) and the RGBA color table
+        """
+
+        table: NDArray[np.uint8] = self._color_table_array()
+
+        coords: NDArray[np.int32] = unpack_voxel_keys(
+            np.fromiter(self._voxels.keys(), dtype=np.int64, count=len(self._voxels))
+        )
+
+        indices: NDArray[np.unsignedinteger[Any]] = np.fromiter(
+            self._voxels.values(),
+            dtype=index_dtype_for(len(table)),
+            count=len(self._voxels)
+        )
+
+        return VoxelArrays(coords, indices, table)
+
+    @staticmethod
+    def from_arrays(arrays: VoxelArrays) -> "VoxelGrid":
+        """
+        Build a voxel grid from compact voxel arrays (see `export_arrays`).
+
+        Args:
+            arrays: The voxel arrays
+
+        Returns:
+            The voxel grid
+        """
+
+        grid: VoxelGrid = VoxelGrid()
+        grid.load_arrays(arrays)
+
+        return grid
+
+    def load_arrays(
+        self,
+        arrays: VoxelArrays
+    ) -> None:
+        """
+        Insert compact voxel arrays into the grid in bulk, without creating
+        any per-voxel object.
+
+        Args:
+            arrays: The voxel arrays
+        """
+
+        if len(arrays) == 0:
+            return
+
+        # Color table of the arrays -> color table of the grid
+        table_slots: NDArray[np.int64] = np.array(
+            [self._color_slot(FrozenColor(*rgba)) for rgba in arrays.table.tolist()],
+            dtype=np.int64
+        )
+
+        self._set_voxels_slots(arrays.coords, table_slots[arrays.indices])
+
+    def copy_from(
+        self,
+        grid: "VoxelGrid"
+    ) -> None:
+        """
+        Replace the voxels, colors and instances of this grid by a copy of those
+        of another grid (built with the dict storage). The layers of the grid
+        and its analytic shapes are copied, the shared model grids are not.
+
+        Args:
+            grid: The grid to copy
+        """
+
+        # Import here to avoid circular dependency
+        from .analytic_shape import AnalyticShape
+
+        self._voxels = dict(grid._voxels)
+
+        self._color_table = list(grid._color_table)
+        self._rgba_slots = dict(grid._rgba_slots)
+        self._palette_slots = dict(grid._palette_slots)
+
+        self._min_bounds = Vec3(grid._min_bounds.x, grid._min_bounds.y, grid._min_bounds.z)
+        self._max_bounds = Vec3(grid._max_bounds.x, grid._max_bounds.y, grid._max_bounds.z)
+        self._is_empty = grid._is_empty
+
+        self.instances = []
+        self._layer = None
+
+        for instance in grid.instances:
+
+            instance_grid: VoxelGrid = instance.grid
+
+            if isinstance(instance_grid, AnalyticShape) and instance_grid.owner is grid:
+
+                shape: AnalyticShape = copy.copy(instance_grid)
+                shape.owner = self
+
+                instance_grid = shape
+
+            elif instance_grid._color_table is grid._color_table:
+
+                layer: VoxelGrid = VoxelGrid()
+
+                layer._voxels = dict(instance_grid._voxels)
+                layer._color_table = self._color_table
+                layer._rgba_slots = self._rgba_slots
+                layer._palette_slots = self._palette_slots
+                layer._min_bounds = Vec3(instance_grid._min_bounds.x, instance_grid._min_bounds.y, instance_grid._min_bounds.z)
+                layer._max_bounds = Vec3(instance_grid._max_bounds.x, instance_grid._max_bounds.y, instance_grid._max_bounds.z)
+                layer._is_empty = instance_grid._is_empty
+
+                if instance_grid is grid._layer:
+                    self._layer = layer
+
+                instance_grid = layer
+
+            self.instances.append(VoxelInstance(instance_grid, instance.offset))
 
     def build_from_frame(
         self,
         frame: NaxelDataFrame,
-        general_data: NaxelGeneralData
+        general_data: NaxelGeneralData,
+        base_grid: Optional["VoxelGrid"] = None
     ) -> None:
         """
         Build the voxel grid from a NaxelDataFrame.
         Processes voxels_dict, voxels_list, and voxels_grid.
 
+        A delta frame starts from the voxels of its base frame: the changes of
+        its base frames are applied one after the other from the key frame, or
+        the built grid of its base frame is copied if given.
+
         Args:
             frame: The data frame containing voxel data
             general_data: General data containing color palette
+            base_grid: The built grid of the base frame of a delta frame
+                (with the dict storage, see `copy_from`)
         """
 
         palette: ColorPalette = general_data.color_palette
         default_color: Color = general_data.default_color
 
+        # Palette colors are recognized by identity, to bind them to their key
+        self._palette_keys_by_id = {
+            id(c): k for k, c in palette.palette.items()
+        }
+
+        self._source_dir = general_data.source_dir
+
+        # Frames to apply, from the key frame (or the copied base frame) to this frame
+        chain: list[NaxelDataFrame] = [frame]
+
+        base_frame: Optional[NaxelDataFrame] = frame.get_base_frame()
+
+        if base_frame is not None and base_grid is not None:
+
+            self.copy_from(base_grid)
+
+        else:
+
+            while base_frame is not None:
+
+                chain.append(base_frame)
+                base_frame = base_frame.get_base_frame()
+
+        for chain_frame in reversed(chain):
+
+            self._apply_frame(chain_frame, palette, default_color)
+
+        # Layers left empty (see `_placement_grid`)
+        self.instances = [instance for instance in self.instances if not instance.grid.is_empty()]
+
+    def _apply_frame(
+        self,
+        frame: NaxelDataFrame,
+        palette: ColorPalette,
+        default_color: Color
+    ) -> None:
+        """
+        Write the voxels of a frame into the grid (for a delta frame, its changes
+        from the voxels of its base frame already in the grid).
+
+        Args:
+            frame: The data frame
+            palette: Color palette for palette references
+            default_color: Default color if resolution fails
+        """
+
+        # Delta frame: remove voxels of the base frame
+        # (the bounds are not shrunk, they stay a valid enclosing box)
+        if frame.voxels_removed is not None:
+
+            layers: list[VoxelGrid] = [
+                instance.grid for instance in self.instances
+                if instance.grid._color_table is self._color_table
+            ]
+
+            for key in frame.voxels_removed:
+
+                self._voxels.pop(key, None)
+
+                for layer in layers:
+                    layer._voxels.pop(key, None)
+
         # Process voxels_dict
         if frame.voxels_dict is not None:
 
-            for pos, voxel_value in frame.voxels_dict.items():
+            target: VoxelGrid = self._placement_grid()
+
+            for key, voxel_value in frame.voxels_dict.items():
 
-                color: Color = self._resolve_voxel_color(
+                slot: int = self._resolve_voxel_slot(
                     voxel_value,
                     palette,
-                    default_color
+                    default_color,
+                    key
                 )
 
-                self.set_voxel(int(pos.x), int(pos.y), int(pos.z), color)
+                # Keys are already packed, only the bounds need the coordinates
+                target._voxels[key] = slot
+
+            target._update_bounds_from_coords(
+                unpack_voxel_keys(
+                    np.fromiter(frame.voxels_dict.keys(), dtype=np.int64, count=len(frame.voxels_dict))
+                )
+            )
+
+        # Process already resolved voxels (post-processed naxel objects)
+        if frame.voxels_arrays is not None:
+
+            self._placement_grid().load_arrays(frame.voxels_arrays)
 
         # Process voxels_list
         if frame.voxels_list is not None:
 
-            for voxel_value in frame.voxels_list:
+            voxel_values: list[VoxelValue] = frame.voxels_list
+
+            if self.shapes_region is not None:
+                voxel_values = self._shapes_in_region(voxel_values, *self.shapes_region)
+
+            for voxel_value in voxel_values:
 
                 self._rasterize_voxel_value(
                     voxel_value,
@@ -180,19 +742,117 @@ class VoxelGrid:
         # Process voxels_grid
         if frame.voxels_grid is not None:
 
+            grid_positions: list[tuple[int, int, int]] = []
+            grid_slots: list[int] = []
+
             for z, layer in enumerate(frame.voxels_grid):
 
                 for y, row in enumerate(layer):
 
                     for x, voxel_value in enumerate(row):
 
-                        color = self._resolve_voxel_color(
-                            voxel_value,
-                            palette,
-                            default_color
+                        grid_positions.append((x, y, z))
+                        grid_slots.append(
+                            self._resolve_voxel_slot(
+                                voxel_value,
+                                palette,
+                                default_color
+                            )
                         )
 
-                        self.set_voxel(x, y, z, color)
+            self._placement_grid()._set_voxels_slots(
+                np.array(grid_positions, dtype=np.int64).reshape(-1, 3),
+                np.array(grid_slots, dtype=np.int64)
+            )
+
+    def _shapes_in_region(
+        self,
+        voxel_values: list[VoxelValue],
+        region_min: tuple[int, int, int],
+        region_max: tuple[int, int, int]
+    ) -> list[VoxelValue]:
+        """
+        Get the voxel values of a voxels_list without the shapes whose bounds are
+        outside a region, found with a BVH over the shape bounds (see `shapes_bvh`).
+
+        Args:
+            voxel_values: The voxel values, in placement order
+            region_min: Minimum corner of the region (inclusive)
+            region_max: Maximum corner of the region (exclusive)
+
+        Returns:
+            The kept voxel values, in the same order
+        """
+
+        bvh: BVH
+        shape_indices: NDArray[np.intp]
+        bvh, shape_indices = shapes_bvh(voxel_values)
+
+        # The shape bounds [min, max) overlap [region_min, region_max)
+        # when min <= region_max - 1 and max >= region_min + 1
+        overlapping: NDArray[np.intp] = shape_indices[
+            bvh.query_box(np.array(region_min) + 1, np.array(region_max) - 1)
+        ]
+
+        skipped: set[int] = set(shape_indices.tolist()) - set(overlapping.tolist())
+
+        return [v for i, v in enumerate(voxel_values) if i not in skipped]
+
+    def _resolve_voxel_slot(
+        self,
+        voxel_value: VoxelValue,
+        palette: ColorPalette,
+        default_color: Color,
+        key: Optional[int] = None
+    ) -> int:
+        """
+        Resolve a VoxelValue to a color table index, keeping palette colors
+        bound to their palette key.
+
+        Args:
+            voxel_value: The voxel value to resolve
+            palette: Color palette for palette references
+            default_color: Default color if resolution fails
+            key: Packed position of the voxel, to evaluate gradients and zones
+                (their flat color is used without it)
+
+        Returns:
+            The color table index
+        """
+
+        if isinstance(voxel_value, VoxelValueFromPalette):
+
+            palette_color: Optional[Color] = palette.get_color(
+                voxel_value.palette_key
+            )
+
+            if palette_color is not None:
+                return self._palette_slot(voxel_value.palette_key, palette_color)
+
+            return self._color_slot(default_color)
+
+        color: Color = self._resolve_voxel_color(voxel_value, palette, default_color)
+
+        if key is not None and isinstance(color, (ColorGradient, ColorZones)):
+            return self._color_slot(FrozenColor(*color.color_at_pixel(Vec3(*unpack_voxel_key(key)))))
+
+        return self._shape_color_slot(color)
+
+    def _shape_color_slot(
+        self,
+        color: Color
+    ) -> int:
+        """
+        Get the color table index of a resolved color, binding it to its
+        palette key if it comes from the color palette.
+        """
+
+        palette_key: Optional[str | int] = self._palette_keys_by_id.get(id(color), None)
+
+        if palette_key is not None:
+            return self._palette_slot(palette_key, color)
+
+        return self._color_slot(color)
 
     def _resolve_voxel_color(
         self,
@@ -239,6 +899,9 @@ class VoxelGrid:
     ) -> None:
         """
         Rasterize a VoxelValue (potentially a shape) into discrete voxels.
+        The shapes are rasterized as coordinate arrays (see `shape_rasterizer`),
+        passed through the transforms of their position (see `pos_transform`),
+        memoized (see `shape_cache`), and written into the grid at once.
 
         Args:
             voxel_value: The voxel value to rasterize
@@ -246,135 +909,116 @@ class VoxelGrid:
             default_color: Default color if resolution fails
         """
 
-        if isinstance(voxel_value, VoxelValueShapePoint):
+        if isinstance(voxel_value, VoxelValueImportVoxel):
 
             pos = voxel_value.position.xyz
-            color = voxel_value.color
+            transformed: bool = has_pos_transform(voxel_value.position)
 
-            self.set_voxel(int(pos.x), int(pos.y), int(pos.z), color)
+            # Instances are only translated, transformed imports are copied
+            if self.instance_imports and not transformed:
 
-        elif isinstance(voxel_value, VoxelValueShapeCube):
+                model_grid: Optional[VoxelGrid] = self.model_cache.get_model_grid(
+                    voxel_value.path,
+                    self._source_dir
+                )
 
-            pos = voxel_value.position.xyz
-            size = voxel_value.size
-            color = voxel_value.color
-
-            for dx in range(size):
-                for dy in range(size):
-                    for dz in range(size):
-
-                        self.set_voxel(
-                            int(pos.x) + dx,
-                            int(pos.y) + dy,
-                            int(pos.z) + dz,
-                            color
-                        )
+                if model_grid is not None:
+                    self.add_instance(model_grid, (int(pos.x), int(pos.y), int(pos.z)))
 
-        elif isinstance(voxel_value, VoxelValueShapeRect):
+            else:
 
-            pos1 = voxel_value.position.xyz
-            pos2 = voxel_value.position2.xyz
-            color = voxel_value.color
+                model: Optional[VoxelArrays] = self.model_cache.get_model(
+                    voxel_value.path,
+                    self._source_dir
+                )
 
-            x_min = int(min(pos1.x, pos2.x))
-            x_max = int(max(pos1.x, pos2.x))
-            y_min = int(min(pos1.y, pos2.y))
-            y_max = int(max(pos1.y, pos2.y))
-            z_min = int(min(pos1.z, pos2.z))
-            z_max = int(max(pos1.z, pos2.z))
+                if model is None:
+                    return
 
-            for x in range(x_min, x_max + 1):
-                for y in range(y_min, y_max + 1):
-                    for z in range(z_min, z_max + 1):
+                model = model.translated(int(pos.x), int(pos.y), int(pos.z))
 
-                        self.set_voxel(x, y, z, color)
+                if transformed:
 
-        elif isinstance(voxel_value, VoxelValueShapeSphere):
+                    coords: NDArray[np.int64]
+                    source: NDArray[np.intp]
+                    coords, source = transform_coords(model.coords, voxel_value.position)
 
-            center = voxel_value.position.xyz
-            radius = voxel_value.radius
-            color = voxel_value.color
+                    model = VoxelArrays(coords, model.indices[source], model.table)
 
-            cx, cy, cz = int(center.x), int(center.y), int(center.z)
+                self._placement_grid().load_arrays(model)
 
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    for dz in range(-radius, radius + 1):
+        elif isinstance(voxel_value, VoxelValueShape):
 
-                        dist_sq = dx * dx + dy * dy + dz * dz
+            spatial_color: bool = isinstance(voxel_value.color, (ColorGradient, ColorZones))
 
-                        if dist_sq <= radius * radius:
+            if self.analytic_shapes and not spatial_color:
 
-                            self.set_voxel(cx + dx, cy + dy, cz + dz, color)
+                # Import here to avoid circular dependency
+                from .analytic_shape import AnalyticShape, analytic_shape_for
 
-        elif isinstance(voxel_value, VoxelValueShapeLine):
+                shape: Optional[AnalyticShape] = analytic_shape_for(
+                    voxel_value,
+                    self,
+                    self._shape_color_slot(voxel_value.color)
+                )
 
-            pos1 = voxel_value.position.xyz
-            pos2 = voxel_value.position2.xyz
-            color = voxel_value.color
+                if shape is not None:
 
-            self._rasterize_line(
-                int(pos1.x), int(pos1.y), int(pos1.z),
-                int(pos2.x), int(pos2.y), int(pos2.z),
-                color
-            )
+                    self.add_instance(shape, (0, 0, 0))
 
-    def _rasterize_line(
-        self,
-        x0: int,
-        y0: int,
-        z0: int,
-        x1: int,
-        y1: int,
-        z1: int,
-        color: Color
-    ) -> None:
-        """
-        Rasterize a 3D line using Bresenham's algorithm.
-        """
+                    return
 
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        dz = abs(z1 - z0)
+            shape_coords: Optional[NDArray[np.int64]] = self.shape_cache.get_coords(voxel_value)
 
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        sz = 1 if z0 < z1 else -1
+            if shape_coords is None:
+                return
 
-        dm = max(dx, dy, dz)
+            # Gradients and zones color all the voxels of the shape in one call
+            if spatial_color:
 
-        x, y, z = x0, y0, z0
+                self._placement_grid().set_voxels(shape_coords, voxel_value.color.colors_at_positions(shape_coords))
 
-        self.set_voxel(x, y, z, color)
+                return
 
-        if dm == 0:
-            return
+            self._placement_grid()._set_voxels_slot(shape_coords, self._shape_color_slot(voxel_value.color))
 
-        x_inc = dx / dm
-        y_inc = dy / dm
-        z_inc = dz / dm
 
-        x_acc = 0.0
-        y_acc = 0.0
-        z_acc = 0.0
+def build_frames(
+    frames: Sequence[NaxelDataFrame],
+    general_data: NaxelGeneralData
+) -> Iterator[VoxelGrid]:
+    """
+    Build the voxel grids of the frames of an animated naxel object, in order.
+
+    A delta frame starts from a copy of the built grid of its base frame, so it
+    only costs a copy and its changes, instead of building its base frames again.
+    Only the grids of the frames used as a base frame are kept.
+
+    Args:
+        frames: The data frames
+        general_data: General data of the naxel object
+
+    Returns:
+        Iterator over the voxel grid of each frame
+    """
 
-        for _ in range(dm):
+    base_indices: set[int] = {
+        df.base_frame_index for df in frames if df.base_frame_index is not None
+    }
 
-            x_acc += x_inc
-            y_acc += y_inc
-            z_acc += z_inc
+    base_grids: dict[int, VoxelGrid] = {}
 
-            if x_acc >= 0.5:
-                x += sx
-                x_acc -= 1.0
+    for idx, df in enumerate(frames):
 
-            if y_acc >= 0.5:
-                y += sy
-                y_acc -= 1.0
+        grid: VoxelGrid = VoxelGrid()
 
-            if z_acc >= 0.5:
-                z += sz
-                z_acc -= 1.0
+        grid.build_from_frame(
+            df,
+            general_data,
+            base_grids.get(df.base_frame_index, None) if df.base_frame_index is not None else None
+        )
 
-            self.set_voxel(x, y, z, color)
+        if idx in base_indices:
+            base_grids[idx] = grid
 
+        yield grid
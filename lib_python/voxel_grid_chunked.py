@@ -0,0 +1,634 @@
+"""
+Chunked voxel file (`.naxc`), holding a ChunkedVoxelGrid.
+
+All integers are little-endian. The chunks are only read (and decompressed)
+when a query touches them, the file being memory-mapped.
+
+Layout:
+    - Header (see `_HEADER`)
+    - Color table: table_count x [r, g, b, a] uint8
+    - Chunk index: chunk_count x `_CHUNK_ENTRY`
+    - Compressed chunks
+"""
+
+from typing import Optional, Any, Iterator
+from collections import OrderedDict
+
+import mmap
+import lzma
+import zlib
+import struct
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .vec import Vec3
+from .color import Color, FrozenColor
+from .voxel_grid import VoxelGrid
+from .voxel_arrays import VoxelArrays, index_dtype_for
+from .voxel_key import (
+    pack_voxel_key,
+    pack_voxel_keys,
+    unpack_voxel_keys,
+    voxel_key_in_range,
+    VOXEL_KEY_OFFSET,
+)
+
+
+CHUNKED_GRID_MAGIC: bytes = b"NAXC"
+CHUNKED_GRID_VERSION: int = 1
+
+CHUNK_CODECS: tuple[str, ...] = ("zlib", "lzma")
+
+# magic, version, chunk_bits, codec, table_count, chunk_count, min bounds xyz, max bounds xyz
+_HEADER: struct.Struct = struct.Struct("<4sHBBII6i")
+
+# chunk key, offset, compressed size, item size of the decoded cells
+_CHUNK_ENTRY: struct.Struct = struct.Struct("<qQIB3x")
+
+
+class ChunkedVoxelGrid(VoxelGrid):
+    """
+    VoxelGrid storage variant splitting the space into cubic chunks of
+    2^chunk_bits voxels per side.
+
+    Each chunk is stored as a compressed dense array of color table indices
+    (0 = empty, slot + 1 otherwise), and is only decompressed when a lookup or
+    a query touches it. The decoded chunks are kept in a small LRU cache, so a
+    ray marching through a region only decompresses the chunks along its path.
+
+    Voxels set with `set_voxel` or `build_from_frame` are staged in the parent
+    dictionary and merged into the chunks on the next query (see `compact`).
+    """
+
+    def __init__(
+        self,
+        chunk_bits: int = 4,
+        codec: str = "zlib",
+        max_cached_chunks: int = 64
+    ) -> None:
+
+        super().__init__()
+
+        if codec not in CHUNK_CODECS:
+            raise ValueError(f"Unknown chunk codec: {codec}")
+
+        self.chunk_bits: int = chunk_bits
+        self.chunk_mask: int = (1 << chunk_bits) - 1
+        self.codec: str = codec
+        self.max_cached_chunks: int = max(1, max_cached_chunks)
+
+        # Chunk key (packed chunk coordinates) -> (compressed cells, cell item size)
+        self._chunks: dict[int, tuple[bytes | memoryview, int]] = {}
+
+        # LRU of the decoded chunks: chunk key -> flat list of cells (slot + 1)
+        self._decoded: OrderedDict[int, list[int]] = OrderedDict()
+
+        # Last decoded chunk, for consecutive lookups in the same chunk
+        self._last_chunk_key: Optional[int] = None
+        self._last_chunk: Optional[list[int]] = None
+
+        # Memory mapping of an opened chunked file
+        self._mmap: Optional[mmap.mmap] = None
+
+    @staticmethod
+    def from_grid(
+        grid: VoxelGrid,
+        chunk_bits: int = 4,
+        codec: str = "zlib",
+        max_cached_chunks: int = 64
+    ) -> "ChunkedVoxelGrid":
+        """
+        Build a chunked grid from a built VoxelGrid (sharing its color table).
+
+        Args:
+            grid: The source voxel grid
+            chunk_bits: Chunks have 2^chunk_bits voxels per side
+            codec: Compression of the chunks ("zlib" or "lzma")
+            max_cached_chunks: Number of decoded chunks kept in memory
+
+        Returns:
+            The chunked voxel grid
+        """
+
+        res: ChunkedVoxelGrid = ChunkedVoxelGrid(chunk_bits, codec, max_cached_chunks)
+
+        res._color_table = grid._color_table
+        res._rgba_slots = grid._rgba_slots
+        res._palette_slots = grid._palette_slots
+
+        res._min_bounds, res._max_bounds = grid.get_voxel_bounds()
+        res._is_empty = not grid.has_voxels()
+
+        # The indices of the exported arrays are slots of the shared color table
+        arrays: VoxelArrays = grid.export_arrays()
+
+        res._write_cells(arrays.coords.astype(np.int64), arrays.indices.astype(np.int64))
+
+        return res
+
+    def _compress(
+        self,
+        data: bytes
+    ) -> bytes:
+
+        if self.codec == "lzma":
+            return lzma.compress(data)
+
+        return zlib.compress(data)
+
+    def _decompress(
+        self,
+        data: bytes | memoryview
+    ) -> bytes:
+
+        if self.codec == "lzma":
+            return lzma.decompress(data)
+
+        return zlib.decompress(data)
+
+    def _decode_chunk(
+        self,
+        chunk_key: int
+    ) -> Optional[list[int]]:
+        """
+        Get the decoded cells of a chunk (through the LRU cache), None if the chunk is empty.
+        """
+
+        if chunk_key == self._last_chunk_key:
+            return self._last_chunk
+
+        cells: Optional[list[int]] = self._decoded.get(chunk_key, None)
+
+        if cells is not None:
+            self._decoded.move_to_end(chunk_key)
+
+        else:
+
+            entry: Optional[tuple[bytes | memoryview, int]] = self._chunks.get(chunk_key, None)
+
+            if entry is not None:
+
+                cells = np.frombuffer(
+                    self._decompress(entry[0]), dtype=np.dtype(f"<u{entry[1]}")
+                ).tolist()
+
+                self._decoded[chunk_key] = cells
+
+                if len(self._decoded) > self.max_cached_chunks:
+                    self._decoded.popitem(last=False)
+
+        self._last_chunk_key = chunk_key
+        self._last_chunk = cells
+
+        return cells
+
+    def _chunk_cells_array(
+        self,
+        chunk_key: int
+    ) -> NDArray[np.int64]:
+        """
+        Get the cells of a chunk as a flat array (zeros if the chunk does not exist).
+        """
+
+        cells: Optional[list[int]] = self._decode_chunk(chunk_key)
+
+        if cells is None:
+            return np.zeros((1 << (3 * self.chunk_bits),), dtype=np.int64)
+
+        return np.array(cells, dtype=np.int64)
+
+    def _cell_indices(
+        self,
+        coords: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Get the chunk keys and the flat cell indices of (N, 3) voxel coordinates.
+        """
+
+        b: int = self.chunk_bits
+        m: int = self.chunk_mask
+
+        chunk_keys: NDArray[np.int64] = pack_voxel_keys(coords >> b)
+
+        local: NDArray[np.int64] = coords & m
+        cells: NDArray[np.int64] = (((local[:, 0] << b) | local[:, 1]) << b) | local[:, 2]
+
+        return chunk_keys, cells
+
+    def _write_cells(
+        self,
+        coords: NDArray[np.int64],
+        slots: NDArray[np.int64]
+    ) -> None:
+        """
+        Write (N, 3) voxel coordinates with their color slots into the chunks,
+        re-compressing only the chunks they touch.
+        """
+
+        if len(coords) == 0:
+            return
+
+        chunk_keys: NDArray[np.int64]
+        cells: NDArray[np.int64]
+        chunk_keys, cells = self._cell_indices(coords.reshape(-1, 3))
+
+        # Group the voxels by chunk (stable: the last write of a cell wins)
+        order: NDArray[np.intp] = np.argsort(chunk_keys, kind="stable")
+
+        chunk_keys = chunk_keys[order]
+        cells = cells[order]
+        values: NDArray[np.int64] = slots[order] + 1
+
+        starts: NDArray[np.intp] = np.flatnonzero(
+            np.concatenate([[True], chunk_keys[1:] != chunk_keys[:-1]])
+        )
+        ends: NDArray[np.intp] = np.append(starts[1:], len(chunk_keys))
+
+        dtype: np.dtype[Any] = np.dtype(index_dtype_for(len(self._color_table) + 1)).newbyteorder("<")
+
+        for start, end in zip(starts.tolist(), ends.tolist()):
+
+            chunk_key: int = int(chunk_keys[start])
+
+            chunk: NDArray[np.int64] = self._chunk_cells_array(chunk_key)
+            chunk[cells[start:end]] = values[start:end]
+
+            self._chunks[chunk_key] = (
+                self._compress(chunk.astype(dtype).tobytes()),
+                dtype.itemsize
+            )
+
+            self._decoded.pop(chunk_key, None)
+
+        self._last_chunk_key = None
+        self._last_chunk = None
+
+    def compact(self) -> None:
+        """
+        Merge the staged voxels into the compressed chunks.
+        A staged voxel replaces an existing voxel at the same position.
+        """
+
+        if len(self._voxels) == 0:
+            return
+
+        staged_keys: NDArray[np.int64] = np.fromiter(
+            self._voxels.keys(), dtype=np.int64, count=len(self._voxels)
+        )
+        staged_slots: NDArray[np.int64] = np.fromiter(
+            self._voxels.values(), dtype=np.int64, count=len(self._voxels)
+        )
+
+        self._voxels = {}
+
+        self._write_cells(unpack_voxel_keys(staged_keys).astype(np.int64), staged_slots)
+
+    def __len__(self) -> int:
+
+        return len(self.export_arrays())
+
+    def get_voxel(
+        self,
+        x: int,
+        y: int,
+        z: int
+    ) -> Optional[Color]:
+        """
+        Get the color of a voxel at the given integer coordinates,
+        decompressing its chunk if needed.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            z: Z coordinate
+
+        Returns:
+            Color if voxel exists at position, None otherwise
+        """
+
+        if len(self._voxels) > 0:
+            self.compact()
+
+        # No voxel can be stored out of the packed key range
+        if not voxel_key_in_range(x, y, z):
+            return None
+
+        b: int = self.chunk_bits
+        m: int = self.chunk_mask
+
+        cells: Optional[list[int]] = self._decode_chunk(pack_voxel_key(x >> b, y >> b, z >> b))
+
+        if cells is None:
+            return None
+
+        value: int = cells[((((x & m) << b) | (y & m)) << b) | (z & m)]
+
+        if value == 0:
+            return None
+
+        return self._color_table[value - 1]
+
+    def _chunk_arrays(
+        self,
+        chunk_key: int
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Get the (N, 3) voxel coordinates and the color slots of the voxels of a chunk.
+        """
+
+        b: int = self.chunk_bits
+
+        chunk: NDArray[np.int64] = self._chunk_cells_array(chunk_key)
+
+        filled: NDArray[np.intp] = np.flatnonzero(chunk)
+
+        local: NDArray[np.int64] = np.stack(
+            [filled >> (2 * b), (filled >> b) & self.chunk_mask, filled & self.chunk_mask],
+            axis=1
+        ).astype(np.int64)
+
+        origin: NDArray[np.int64] = unpack_voxel_keys(np.array([chunk_key])).astype(np.int64) << b
+
+        return local + origin, chunk[filled] - 1
+
+    def query_box(
+        self,
+        min_corner: Vec3,
+        max_corner: Vec3
+    ) -> VoxelArrays:
+        """
+        Extract the voxels inside an axis-aligned box, decompressing only the
+        chunks overlapping the box.
+
+        Args:
+            min_corner: Minimum corner of the box (inclusive)
+            max_corner: Maximum corner of the box (exclusive)
+
+        Returns:
+            VoxelArrays of the voxels in the box
+        """
+
+        self.compact()
+
+        b: int = self.chunk_bits
+
+        # Voxels whose cell [v, v + 1) overlaps the box, within the packed key range
+        lo: NDArray[np.int64] = np.floor(np.clip(
+            np.array([min_corner.x, min_corner.y, min_corner.z], dtype=np.float64),
+            -VOXEL_KEY_OFFSET, VOXEL_KEY_OFFSET
+        )).astype(np.int64)
+        hi: NDArray[np.int64] = np.ceil(np.clip(
+            np.array([max_corner.x, max_corner.y, max_corner.z], dtype=np.float64),
+            -VOXEL_KEY_OFFSET, VOXEL_KEY_OFFSET
+        )).astype(np.int64) - 1
+
+        all_coords: list[NDArray[np.int64]] = [np.zeros((0, 3), dtype=np.int64)]
+        all_slots: list[NDArray[np.int64]] = [np.zeros((0,), dtype=np.int64)]
+
+        if np.all(hi >= lo):
+
+            chunk_lo: NDArray[np.int64] = lo >> b
+            chunk_hi: NDArray[np.int64] = hi >> b
+
+            for chunk_key in self._chunks.keys():
+
+                chunk_pos: NDArray[np.int64] = unpack_voxel_keys(np.array([chunk_key]))[0]
+
+                if np.any(chunk_pos < chunk_lo) or np.any(chunk_pos > chunk_hi):
+                    continue
+
+                coords: NDArray[np.int64]
+                slots: NDArray[np.int64]
+                coords, slots = self._chunk_arrays(chunk_key)
+
+                inside: NDArray[np.bool_] = np.all((coords >= lo) & (coords <= hi), axis=1)
+
+                all_coords.append(coords[inside])
+                all_slots.append(slots[inside])
+
+        table: NDArray[np.uint8] = self._color_table_array()
+
+        return VoxelArrays(
+            np.concatenate(all_coords).astype(np.int32),
+            np.concatenate(all_slots).astype(index_dtype_for(len(table))),
+            table
+        )
+
+    def iter_voxels(self) -> Iterator[tuple[int, int, int, Color]]:
+        """
+        Iterate over the voxels, chunk by chunk.
+
+        Yields:
+            Tuples of (x, y, z, color)
+        """
+
+        arrays: VoxelArrays = self.export_arrays()
+
+        for (x, y, z), slot in zip(arrays.coords.tolist(), arrays.indices.tolist()):
+            yield x, y, z, self._color_table[slot]
+
+    def export_to_dict(self) -> dict[str, list[int]]:
+        """
+        Export the processed voxel grid as a dictionary.
+
+        Returns:
+            Dictionary where keys are position strings "x,y,z" and values are RGBA color lists
+        """
+
+        return self.export_arrays().export_to_dict()
+
+    def export_arrays(self) -> VoxelArrays:
+        """
+        Export the processed voxel grid as compact arrays, chunk by chunk.
+        """
+
+        self.compact()
+
+        all_coords: list[NDArray[np.int64]] = [np.zeros((0, 3), dtype=np.int64)]
+        all_slots: list[NDArray[np.int64]] = [np.zeros((0,), dtype=np.int64)]
+
+        for chunk_key in self._chunks.keys():
+
+            coords: NDArray[np.int64]
+            slots: NDArray[np.int64]
+            coords, slots = self._chunk_arrays(chunk_key)
+
+            all_coords.append(coords)
+            all_slots.append(slots)
+
+        table: NDArray[np.uint8] = self._color_table_array()
+
+        return VoxelArrays(
+            np.concatenate(all_coords).astype(np.int32),
+            np.concatenate(all_slots).astype(index_dtype_for(len(table))),
+            table
+        )
+
+    def compressed_size(self) -> int:
+        """
+        Get the total size in bytes of the compressed chunks.
+        """
+
+        self.compact()
+
+        return sum(len(data) for data, _ in self._chunks.values())
+
+    def save(
+        self,
+        path: str
+    ) -> None:
+        """
+        Save the chunked grid to a chunked voxel file (`.naxc`).
+        The palette keys are not saved, the colors are stored as literal RGBA values.
+
+        Args:
+            path: Path of the file to write
+        """
+
+        self.compact()
+
+        table: NDArray[np.uint8] = self._color_table_array()
+
+        header: bytes = _HEADER.pack(
+            CHUNKED_GRID_MAGIC,
+            CHUNKED_GRID_VERSION,
+            self.chunk_bits,
+            CHUNK_CODECS.index(self.codec),
+            len(table),
+            len(self._chunks),
+            int(self._min_bounds.x), int(self._min_bounds.y), int(self._min_bounds.z),
+            int(self._max_bounds.x), int(self._max_bounds.y), int(self._max_bounds.z),
+        )
+
+        offset: int = _HEADER.size + table.nbytes + _CHUNK_ENTRY.size * len(self._chunks)
+
+        entries: list[bytes] = []
+
+        for chunk_key, (data, itemsize) in self._chunks.items():
+
+            entries.append(_CHUNK_ENTRY.pack(chunk_key, offset, len(data), itemsize))
+
+            offset += len(data)
+
+        with open(path, "wb") as f:
+
+            f.write(header)
+            f.write(table.tobytes())
+            f.write(b"".join(entries))
+
+            for data, _ in self._chunks.values():
+                f.write(data)
+
+    @staticmethod
+    def open(
+        path: str,
+        max_cached_chunks: int = 64
+    ) -> "ChunkedVoxelGrid":
+        """
+        Open a chunked voxel file with memory mapping.
+        Only the color table and the chunk index are read, the chunks are read
+        and decompressed on demand.
+
+        Args:
+            path: Path of the chunked voxel file
+            max_cached_chunks: Number of decoded chunks kept in memory
+
+        Returns:
+            The chunked voxel grid
+        """
+
+        # The mapping keeps its own handle on the file, which can be closed right away
+        with open(path, "rb") as f:
+
+            try:
+                mm: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            except ValueError:
+                # Empty file
+                raise ValueError(f"Not a supported chunked voxel file: {path}")
+
+        magic: bytes
+        version: int
+        chunk_bits: int
+        codec_id: int
+        table_count: int
+        chunk_count: int
+        bounds: tuple[int, ...]
+
+        entries: list[tuple[int, int, int, int]]
+
+        index_offset: int
+
+        # Everything is checked before any view on the mapping is created, so it can be closed on error
+        try:
+            magic, version, chunk_bits, codec_id, table_count, chunk_count, *bounds = _HEADER.unpack_from(mm, 0)
+
+            if magic != CHUNKED_GRID_MAGIC or version > CHUNKED_GRID_VERSION or codec_id >= len(CHUNK_CODECS):
+                raise ValueError(f"Not a supported chunked voxel file: {path}")
+
+            index_offset = _HEADER.size + table_count * 4
+
+            entries = [
+                _CHUNK_ENTRY.unpack_from(mm, index_offset + i * _CHUNK_ENTRY.size)
+                for i in range(chunk_count)
+            ]
+
+            if any(offset + size > len(mm) for _, offset, size, _ in entries):
+                raise ValueError(f"Truncated chunked voxel file: {path}")
+
+        except struct.error:
+            # File shorter than its header or its chunk index
+            mm.close()
+            raise ValueError(f"Not a supported chunked voxel file: {path}")
+
+        except BaseException:
+            mm.close()
+            raise
+
+        grid: ChunkedVoxelGrid = ChunkedVoxelGrid(chunk_bits, CHUNK_CODECS[codec_id], max_cached_chunks)
+
+        grid._mmap = mm
+
+        table: NDArray[np.uint8] = np.frombuffer(
+            mm, dtype=np.uint8, count=table_count * 4, offset=_HEADER.size
+        ).reshape(-1, 4)
+
+        for slot, rgba in enumerate(table.tolist()):
+
+            grid._color_table.append(FrozenColor(*rgba))
+            grid._rgba_slots.setdefault(tuple(rgba), slot)
+
+        view: memoryview = memoryview(mm)
+
+        for chunk_key, offset, size, itemsize in entries:
+            grid._chunks[chunk_key] = (view[offset:offset + size], itemsize)
+
+        grid._min_bounds = Vec3(bounds[0], bounds[1], bounds[2])
+        grid._max_bounds = Vec3(bounds[3], bounds[4], bounds[5])
+        grid._is_empty = chunk_count == 0
+
+        return grid
+
+    def close(self) -> None:
+        """
+        Release the memory mapping of an opened chunked voxel file.
+        The chunks are dropped, the grid is empty afterwards.
+        """
+
+        self._chunks = {}
+        self._decoded = OrderedDict()
+        self._last_chunk_key = None
+        self._last_chunk = None
+
+        if self._mmap is not None:
+
+            try:
+                self._mmap.close()
+
+            except BufferError:
+                # Some chunk views are still referenced, the mapping will be
+                # released when they are garbage collected
+                pass
+
+            self._mmap = None
@@ -0,0 +1,229 @@
+from typing import Optional, Any, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .vec import Vec3
+from .color import Color
+from .voxel_grid import VoxelGrid
+from .voxel_arrays import VoxelArrays, index_dtype_for
+from .voxel_key import (
+    unpack_voxel_keys,
+    morton_encode,
+    morton_decode,
+    morton_encode_one,
+    voxel_key_in_range,
+    VOXEL_KEY_OFFSET,
+)
+
+
+class MortonVoxelGrid(VoxelGrid):
+    """
+    VoxelGrid storage variant keeping the voxels sorted by Morton (Z-order) code
+    in parallel NumPy arrays (codes, color indices).
+
+    Lookups are binary searches, axis-aligned boxes map to a contiguous code range,
+    and iteration follows the Z-order curve, so nearby voxels stay close in memory.
+    This is a compact sparse structure for scenes too sparse for a dense volume
+    but too big for a Python dict.
+
+    Voxels set with `set_voxel` or `build_from_frame` are staged in the parent
+    dictionary and merged into the sorted arrays on the next query (see `compact`).
+    """
+
+    def __init__(self) -> None:
+
+        super().__init__()
+
+        self._codes: NDArray[np.uint64] = np.zeros((0,), dtype=np.uint64)
+        self._slots: NDArray[np.unsignedinteger[Any]] = np.zeros((0,), dtype=np.uint8)
+
+    @staticmethod
+    def from_grid(grid: VoxelGrid) -> "MortonVoxelGrid":
+        """
+        Build a Morton-ordered grid from a built VoxelGrid (sharing its color table).
+
+        Args:
+            grid: The source voxel grid
+
+        Returns:
+            The Morton-ordered voxel grid
+        """
+
+        res: MortonVoxelGrid = MortonVoxelGrid()
+
+        res._color_table = grid._color_table
+        res._rgba_slots = grid._rgba_slots
+        res._palette_slots = grid._palette_slots
+
+        res._min_bounds, res._max_bounds = grid.get_voxel_bounds()
+        res._is_empty = not grid.has_voxels()
+
+        res._voxels = dict(grid._voxels)
+        res.compact()
+
+        return res
+
+    def compact(self) -> None:
+        """
+        Merge the staged voxels into the sorted arrays.
+        A staged voxel replaces an existing voxel at the same position.
+        """
+
+        if len(self._voxels) == 0:
+            return
+
+        staged_keys: NDArray[np.int64] = np.fromiter(
+            self._voxels.keys(), dtype=np.int64, count=len(self._voxels)
+        )
+        staged_slots: NDArray[np.int64] = np.fromiter(
+            self._voxels.values(), dtype=np.int64, count=len(self._voxels)
+        )
+
+        self._voxels = {}
+
+        codes: NDArray[np.uint64] = np.concatenate(
+            [self._codes, morton_encode(unpack_voxel_keys(staged_keys))]
+        )
+        slots: NDArray[np.int64] = np.concatenate(
+            [self._slots.astype(np.int64), staged_slots]
+        )
+
+        # Stable sort: for equal codes, the staged voxel comes last
+        order: NDArray[np.intp] = np.argsort(codes, kind="stable")
+
+        codes = codes[order]
+        slots = slots[order]
+
+        # Keep the last voxel of each run of equal codes
+        keep: NDArray[np.bool_] = np.ones(len(codes), dtype=np.bool_)
+        keep[:-1] = codes[:-1] != codes[1:]
+
+        self._codes = codes[keep]
+        self._slots = slots[keep].astype(index_dtype_for(len(self._color_table)))
+
+    def __len__(self) -> int:
+
+        self.compact()
+
+        return len(self._codes)
+
+    def get_voxel(
+        self,
+        x: int,
+        y: int,
+        z: int
+    ) -> Optional[Color]:
+        """
+        Get the color of a voxel at the given integer coordinates (binary search).
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            z: Z coordinate
+
+        Returns:
+            Color if voxel exists at position, None otherwise
+        """
+
+        if len(self._voxels) > 0:
+            self.compact()
+
+        # No voxel can be stored out of the Morton code range
+        if not voxel_key_in_range(x, y, z):
+            return None
+
+        code: int = morton_encode_one(x, y, z)
+
+        i: int = int(np.searchsorted(self._codes, np.uint64(code)))
+
+        if i < len(self._codes) and int(self._codes[i]) == code:
+            return self._color_table[int(self._slots[i])]
+
+        return None
+
+    def query_box(
+        self,
+        min_corner: Vec3,
+        max_corner: Vec3
+    ) -> VoxelArrays:
+        """
+        Extract the voxels inside an axis-aligned box.
+
+        Args:
+            min_corner: Minimum corner of the box (inclusive)
+            max_corner: Maximum corner of the box (exclusive)
+
+        Returns:
+            VoxelArrays of the voxels in the box, in Morton order
+        """
+
+        self.compact()
+
+        # Voxels whose cell [v, v + 1) overlaps the box, within the Morton code range
+        lo: NDArray[np.int64] = np.floor(np.clip(
+            np.array([min_corner.x, min_corner.y, min_corner.z], dtype=np.float64),
+            -VOXEL_KEY_OFFSET, VOXEL_KEY_OFFSET
+        )).astype(np.int64)
+        hi: NDArray[np.int64] = np.ceil(np.clip(
+            np.array([max_corner.x, max_corner.y, max_corner.z], dtype=np.float64),
+            -VOXEL_KEY_OFFSET, VOXEL_KEY_OFFSET
+        )).astype(np.int64) - 1
+
+        if np.any(hi < lo):
+            return VoxelArrays(
+                np.zeros((0, 3), dtype=np.int32), self._slots[:0], self._color_table_array()
+            )
+
+        # Every voxel of the box has a code between the codes of its two corners
+        code_lo: int = morton_encode_one(int(lo[0]), int(lo[1]), int(lo[2]))
+        code_hi: int = morton_encode_one(int(hi[0]), int(hi[1]), int(hi[2]))
+
+        start: int = int(np.searchsorted(self._codes, np.uint64(code_lo), side="left"))
+        end: int = int(np.searchsorted(self._codes, np.uint64(code_hi), side="right"))
+
+        coords: NDArray[np.int32] = morton_decode(self._codes[start:end])
+        slots: NDArray[np.unsignedinteger[Any]] = self._slots[start:end]
+
+        inside: NDArray[np.bool_] = np.all((coords >= lo) & (coords <= hi), axis=1)
+
+        return VoxelArrays(coords[inside], slots[inside], self._color_table_array())
+
+    def iter_voxels(self) -> Iterator[tuple[int, int, int, Color]]:
+        """
+        Iterate over the voxels in Morton order.
+
+        Yields:
+            Tuples of (x, y, z, color)
+        """
+
+        self.compact()
+
+        coords: NDArray[np.int32] = morton_decode(self._codes)
+
+        for (x, y, z), slot in zip(coords.tolist(), self._slots.tolist()):
+            yield x, y, z, self._color_table[slot]
+
+    def export_to_dict(self) -> dict[str, list[int]]:
+        """
+        Export the processed voxel grid as a dictionary, in Morton order.
+
+        Returns:
+            Dictionary where keys are position strings "x,y,z" and values are RGBA color lists
+        """
+
+        return self.export_arrays().export_to_dict()
+
+    def export_arrays(self) -> VoxelArrays:
+        """
+        Export the processed voxel grid as compact arrays, in Morton order.
+        """
+
+        self.compact()
+
+        return VoxelArrays(
+            morton_decode(self._codes),
+            self._slots,
+            self._color_table_array()
+        )
+
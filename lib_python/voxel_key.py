@@ -0,0 +1,244 @@
+"""
+Packed integer keys of voxel coordinates.
+
+Each coordinate is offset by VOXEL_KEY_OFFSET and stored on VOXEL_KEY_BITS bits,
+so integer coordinates in [-2^20, 2^20) are packed into a single 63 bits integer,
+which is much cheaper to hash than a Vec3 or a string. Packing coordinates out of
+this range raises a ValueError (they would overlap other voxels).
+
+Voxel coordinates also have Morton (Z-order) codes, interleaving the bits of the
+three offset coordinates (x in the highest bit of each triplet), so sorting by code
+keeps nearby voxels close in memory, and every axis-aligned box [min, max] maps to
+the code range [code(min), code(max)].
+"""
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .vec import parse_vec3
+
+
+VOXEL_KEY_BITS: int = 21
+VOXEL_KEY_OFFSET: int = 1 << (VOXEL_KEY_BITS - 1)
+VOXEL_KEY_MASK: int = (1 << VOXEL_KEY_BITS) - 1
+
+
+def voxel_key_in_range(
+    x: int,
+    y: int,
+    z: int
+) -> bool:
+    """
+    Check if integer voxel coordinates can be packed into a key.
+    """
+
+    return -VOXEL_KEY_OFFSET <= x < VOXEL_KEY_OFFSET \
+       and -VOXEL_KEY_OFFSET <= y < VOXEL_KEY_OFFSET \
+       and -VOXEL_KEY_OFFSET <= z < VOXEL_KEY_OFFSET
+
+
+def pack_voxel_key(
+    x: int,
+    y: int,
+    z: int
+) -> int:
+    """
+    Pack integer voxel coordinates into a single integer key.
+
+    Raises:
+        ValueError: If a coordinate is out of [-2^20, 2^20)
+    """
+
+    if not voxel_key_in_range(x, y, z):
+        raise ValueError(f"Voxel coordinates out of the packed key range [-2^20, 2^20): {x}, {y}, {z}")
+
+    return ((x + VOXEL_KEY_OFFSET) << (2 * VOXEL_KEY_BITS)) \
+         | ((y + VOXEL_KEY_OFFSET) << VOXEL_KEY_BITS) \
+         | (z + VOXEL_KEY_OFFSET)
+
+
+def unpack_voxel_key(key: int) -> tuple[int, int, int]:
+    """
+    Unpack an integer key into integer voxel coordinates.
+    """
+
+    return (
+        ((key >> (2 * VOXEL_KEY_BITS)) & VOXEL_KEY_MASK) - VOXEL_KEY_OFFSET,
+        ((key >> VOXEL_KEY_BITS) & VOXEL_KEY_MASK) - VOXEL_KEY_OFFSET,
+        (key & VOXEL_KEY_MASK) - VOXEL_KEY_OFFSET
+    )
+
+
+def pack_voxel_keys(coords: NDArray[np.integer[Any]]) -> NDArray[np.int64]:
+    """
+    Pack (N, 3) integer voxel coordinates into (N,) integer keys.
+
+    Raises:
+        ValueError: If a coordinate is out of [-2^20, 2^20)
+    """
+
+    c: NDArray[np.int64] = np.asarray(coords, dtype=np.int64).reshape(-1, 3) + VOXEL_KEY_OFFSET
+
+    if c.size > 0 and (int(c.min()) < 0 or int(c.max()) > VOXEL_KEY_MASK):
+
+        bad: NDArray[np.int64] = c[((c < 0) | (c > VOXEL_KEY_MASK)).any(axis=1)][0] - VOXEL_KEY_OFFSET
+
+        raise ValueError(
+            f"Voxel coordinates out of the packed key range [-2^20, 2^20): {bad[0]}, {bad[1]}, {bad[2]}"
+        )
+
+    return (c[:, 0] << (2 * VOXEL_KEY_BITS)) | (c[:, 1] << VOXEL_KEY_BITS) | c[:, 2]
+
+
+def unpack_voxel_keys(keys: NDArray[np.integer[Any]]) -> NDArray[np.int32]:
+    """
+    Unpack (N,) integer keys into (N, 3) integer voxel coordinates.
+    """
+
+    k: NDArray[np.int64] = np.asarray(keys, dtype=np.int64).reshape(-1)
+
+    coords: NDArray[np.int64] = np.stack(
+        [
+            (k >> (2 * VOXEL_KEY_BITS)) & VOXEL_KEY_MASK,
+            (k >> VOXEL_KEY_BITS) & VOXEL_KEY_MASK,
+            k & VOXEL_KEY_MASK,
+        ],
+        axis=1
+    )
+
+    return (coords - VOXEL_KEY_OFFSET).astype(np.int32)
+
+
+def format_voxel_key(key: int) -> str:
+    """
+    Format an integer key as a "x, y, z" position string.
+    """
+
+    x, y, z = unpack_voxel_key(key)
+
+    return f"{x}, {y}, {z}"
+
+
+def parse_voxel_key(data: Any) -> int:
+    """
+    Parse voxel coordinates into an integer key.
+
+    Supported formats:
+        - string: "x,y,z" or "x, y, z" (fast path for integer strings)
+        - any format supported by parse_vec3 (coordinates are truncated to integers)
+    """
+
+    if isinstance(data, str):
+
+        parts: list[str] = data.replace("_", ",").split(",")
+
+        if len(parts) == 3:
+
+            try:
+                return pack_voxel_key(int(parts[0]), int(parts[1]), int(parts[2]))
+
+            except ValueError:
+                pass
+
+    vec = parse_vec3(data)
+
+    return pack_voxel_key(int(vec.x), int(vec.y), int(vec.z))
+
+
+def _spread_bits(v: NDArray[np.uint64]) -> NDArray[np.uint64]:
+    """
+    Spread the 21 lowest bits of each value so that they are 3 bits apart.
+    """
+
+    v = v & np.uint64(0x1FFFFF)
+    v = (v | (v << np.uint64(32))) & np.uint64(0x1F00000000FFFF)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x1F0000FF0000FF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x100F00F00F00F00F)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x10C30C30C30C30C3)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x1249249249249249)
+
+    return v
+
+
+def _compact_bits(v: NDArray[np.uint64]) -> NDArray[np.uint64]:
+    """
+    Inverse of _spread_bits.
+    """
+
+    v = v & np.uint64(0x1249249249249249)
+    v = (v | (v >> np.uint64(2))) & np.uint64(0x10C30C30C30C30C3)
+    v = (v | (v >> np.uint64(4))) & np.uint64(0x100F00F00F00F00F)
+    v = (v | (v >> np.uint64(8))) & np.uint64(0x1F0000FF0000FF)
+    v = (v | (v >> np.uint64(16))) & np.uint64(0x1F00000000FFFF)
+    v = (v | (v >> np.uint64(32))) & np.uint64(0x1FFFFF)
+
+    return v
+
+
+def morton_encode(coords: NDArray[np.integer[Any]]) -> NDArray[np.uint64]:
+    """
+    Compute the Morton codes of (N, 3) integer voxel coordinates.
+    """
+
+    c: NDArray[np.uint64] = (
+        np.asarray(coords, dtype=np.int64).reshape(-1, 3) + VOXEL_KEY_OFFSET
+    ).astype(np.uint64)
+
+    return (_spread_bits(c[:, 0]) << np.uint64(2)) \
+         | (_spread_bits(c[:, 1]) << np.uint64(1)) \
+         | _spread_bits(c[:, 2])
+
+
+def morton_decode(codes: NDArray[np.uint64]) -> NDArray[np.int32]:
+    """
+    Compute the (N, 3) integer voxel coordinates of Morton codes.
+    """
+
+    c: NDArray[np.uint64] = np.asarray(codes, dtype=np.uint64).reshape(-1)
+
+    coords: NDArray[np.int64] = np.stack(
+        [
+            _compact_bits(c >> np.uint64(2)),
+            _compact_bits(c >> np.uint64(1)),
+            _compact_bits(c),
+        ],
+        axis=1
+    ).astype(np.int64)
+
+    return (coords - VOXEL_KEY_OFFSET).astype(np.int32)
+
+
+# Bits of each byte value spread 3 bits apart, for scalar Morton codes
+_SPREAD_BYTE: list[int] = [
+    int(v) for v in _spread_bits(np.arange(256, dtype=np.uint64))
+]
+
+
+def morton_encode_one(
+    x: int,
+    y: int,
+    z: int
+) -> int:
+    """
+    Compute the Morton code of a single voxel (pure Python, for lookups).
+
+    Raises:
+        ValueError: If a coordinate is out of [-2^20, 2^20)
+    """
+
+    if not voxel_key_in_range(x, y, z):
+        raise ValueError(f"Voxel coordinates out of the Morton code range [-2^20, 2^20): {x}, {y}, {z}")
+
+    ox: int = x + VOXEL_KEY_OFFSET
+    oy: int = y + VOXEL_KEY_OFFSET
+    oz: int = z + VOXEL_KEY_OFFSET
+
+    t: list[int] = _SPREAD_BYTE
+
+    sx: int = t[ox & 0xFF] | (t[(ox >> 8) & 0xFF] << 24) | (t[(ox >> 16) & 0xFF] << 48)
+    sy: int = t[oy & 0xFF] | (t[(oy >> 8) & 0xFF] << 24) | (t[(oy >> 16) & 0xFF] << 48)
+    sz: int = t[oz & 0xFF] | (t[(oz >> 8) & 0xFF] << 24) | (t[(oz >> 16) & 0xFF] << 48)
+
+    return (sx << 2) | (sy << 1) | sz
@@ -29,7 +29,7 @@ class VoxelValueColor(VoxelValue):
 
     def export_to_dictable(self) -> Any | dict[str, Any]:
 
-        return self.color.export_to_lst()
+        return self.color.export_to_json()
 
 
 class VoxelValueFromPalette(VoxelValue):
@@ -87,7 +87,7 @@ class VoxelValueShape(VoxelValue):
 
         return {
             "type": "shape_",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict()
         }
 
@@ -106,7 +106,7 @@ class VoxelValueShapePoint(VoxelValueShape):
 
         return {
             "type": "shape_point",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict()
         }
 
@@ -128,7 +128,7 @@ class VoxelValueShapeLine(VoxelValueShape):
 
         return {
             "type": "shape_line",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict(),
             "position2": self.position2.export_to_dict(),
         }
@@ -153,7 +153,7 @@ class VoxelValueShapeTriangle(VoxelValueShape):
 
         return {
             "type": "shape_triangle",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict(),
             "position2": self.position2.export_to_dict(),
             "position3": self.position3.export_to_dict()
@@ -179,7 +179,7 @@ class VoxelValueShapeCircle(VoxelValueShape):
 
         return {
             "type": "shape_circle",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict(),
             "radius": self.radius,
             "axis": self.axis
@@ -203,7 +203,7 @@ class VoxelValueShapeCube(VoxelValueShape):
 
         return {
             "type": "shape_cube",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict(),
             "size": self.size
         }
@@ -226,7 +226,7 @@ class VoxelValueShapeRect(VoxelValueShape):
 
         return {
             "type": "shape_rect",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict(),
             "position2": self.position2.export_to_dict()
         }
@@ -249,7 +249,7 @@ class VoxelValueShapeSphere(VoxelValueShape):
 
         return {
             "type": "shape_sphere",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict(),
             "radius": self.radius
         }
@@ -276,7 +276,7 @@ class VoxelValueShapeCylinder(VoxelValueShape):
 
         return {
             "type": "shape_cylinder",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict(),
             "radius": self.radius,
             "height": self.height,
@@ -301,7 +301,7 @@ class VoxelValueShapePolygon(VoxelValueShape):
 
         return {
             "type": "shape_polygon",
-            "color": self.color.export_to_lst(),
+            "color": self.color.export_to_json(),
             "position": self.position.export_to_dict(),
             "polygon": [
                 p.export_to_dict()
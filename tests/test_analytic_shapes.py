@@ -0,0 +1,159 @@
+from typing import Any
+
+import os
+
+import numpy as np
+from PIL import Image
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.ray import Ray
+from lib_python.render_math import Vec3NP
+from lib_python.hit_result import HitResult
+from lib_python.ray_marcher_instanced import InstancedRayMarcher
+from lib_python.analytic_shape import AnalyticShape, analytic_shape_for
+from lib_python.shape_rasterizer import rasterize_shape
+from lib_python.renderer_naive import RendererNaive
+
+
+def _build(
+    voxels_list: list[dict[str, Any]],
+    analytic_shapes: bool
+) -> VoxelGrid:
+
+    naxel = load_naxel({"name": "test", "voxels_list": voxels_list})
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.analytic_shapes = analytic_shapes
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    return grid
+
+
+def _hit_color(
+    grid: VoxelGrid,
+    x: float,
+    z: float
+) -> list[int]:
+
+    # Ray going down the y axis, through the plane y = 0
+    ray: Ray = Ray(
+        Vec3NP(np.array([x, 20.0, z], dtype=np.float32)),
+        Vec3NP(np.array([0.0, -1.0, 0.0], dtype=np.float32))
+    )
+
+    hit: HitResult = InstancedRayMarcher(grid).march(ray, 0.1, 100.0)
+
+    assert hit.hit and hit.color is not None
+
+    return hit.color.export_to_lst()
+
+
+def test_line_drawn_over_rect() -> None:
+
+    voxels_list: list[dict[str, Any]] = [
+        {"type": "shape_rect", "position": [-10, 0, -10], "position2": [10, 0, 10], "color": "green"},
+        {"type": "shape_line", "position": [-10, 0, 0], "position2": [10, 0, 0], "color": "red"},
+    ]
+
+    for analytic_shapes in (False, True):
+
+        grid: VoxelGrid = _build(voxels_list, analytic_shapes)
+
+        assert _hit_color(grid, 3.5, 0.5) == [255, 0, 0, 255]
+        assert _hit_color(grid, 3.5, 5.5) == [0, 255, 0, 255]
+
+
+def test_rect_drawn_over_line() -> None:
+
+    voxels_list: list[dict[str, Any]] = [
+        {"type": "shape_line", "position": [-10, 0, 0], "position2": [10, 0, 0], "color": "red"},
+        {"type": "shape_rect", "position": [-10, 0, -10], "position2": [10, 0, 10], "color": "green"},
+    ]
+
+    for analytic_shapes in (False, True):
+
+        assert _hit_color(_build(voxels_list, analytic_shapes), 3.5, 0.5) == [0, 255, 0, 255]
+
+
+def test_membership_matches_rasterized_voxels() -> None:
+
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    owner: VoxelGrid = VoxelGrid()
+
+    for _ in range(20):
+
+        p0: list[int] = rng.integers(-10, 10, size=3).tolist()
+        p1: list[int] = rng.integers(-10, 10, size=3).tolist()
+
+        radius: int = int(rng.integers(0, 6))
+        height: int = int(rng.integers(1, 5))
+        axis: str = str(rng.choice(["x", "y", "z", "xy", "xz", "yz"]))
+
+        shapes: list[dict[str, Any]] = [
+            {"type": "shape_point", "position": p0},
+            {"type": "shape_cube", "position": p0, "size": int(rng.integers(1, 5))},
+            {"type": "shape_rect", "position": p0, "position2": p1},
+            {"type": "shape_sphere", "position": p0, "radius": radius},
+            {"type": "shape_circle", "position": p0, "radius": radius, "axis": axis},
+            {"type": "shape_cylinder", "position": p0, "radius": radius, "height": height, "axis": axis},
+        ]
+
+        for data in shapes:
+
+            voxel_value = load_naxel({"voxels_list": [data]}).data_frames[0].voxels_list[0]
+
+            shape = analytic_shape_for(voxel_value, owner, 0)
+
+            assert isinstance(shape, AnalyticShape)
+
+            bounds_min, bounds_max = shape.get_bounds()
+
+            members: set[tuple[int, int, int]] = {
+                (x, y, z)
+                for x in range(int(bounds_min.x) - 1, int(bounds_max.x) + 1)
+                for y in range(int(bounds_min.y) - 1, int(bounds_max.y) + 1)
+                for z in range(int(bounds_min.z) - 1, int(bounds_max.z) + 1)
+                if shape._in_bounds(x, y, z) and shape.contains(x, y, z)
+            }
+
+            coords = rasterize_shape(voxel_value)
+
+            assert coords is not None
+            assert members == {tuple(c) for c in coords.tolist()}
+
+
+def test_analytic_render_matches_rasterized(tmp_path: Any) -> None:
+
+    naxel = load_naxel({
+        "name": "analytic",
+        # Off the voxel lattice, so no ray goes exactly through a voxel edge
+        "camera_position": [0.1234, -25.0, 6.2173],
+        "camera_focal": 20,
+        "camera_width": 40,
+        "camera_height": 30,
+        "voxels_list": [
+            {"type": "shape_rect", "position": [-15, 0, 0], "position2": [15, 30, 0], "color": [90, 90, 60, 255]},
+            {"type": "shape_sphere", "position": [-5, 10, 5], "radius": 4, "color": [200, 40, 40, 255]},
+            {"type": "shape_cylinder", "position": [6, 12, 1], "radius": 3, "height": 6, "axis": "xy",
+             "color": [40, 40, 200, 255]},
+            {"type": "shape_circle", "position": [0, 4, 2], "radius": 2, "axis": "xz", "color": [240, 240, 0, 255]},
+            {"type": "shape_cube", "position": [4, 5, 1], "size": 2, "color": [0, 200, 200, 255]},
+            {"type": "shape_line", "position": [-10, 6, 1], "position2": [10, 6, 9], "color": [255, 255, 255, 255]},
+            {"type": "shape_point", "position": [-5, 6, 5], "color": [255, 0, 255, 255]},
+        ]
+    })
+
+    images: list[np.ndarray] = []
+
+    for analytic_shapes in (False, True):
+
+        path: str = os.path.join(str(tmp_path), f"{analytic_shapes}.png")
+
+        RendererNaive(naxel, analytic_shapes=analytic_shapes).render_single_frame(image_save_path=path)
+
+        images.append(np.asarray(Image.open(path)))
+
+    assert len(np.unique(images[0].reshape(-1, 4), axis=0)) >= 6
+    assert np.array_equal(images[0], images[1])
@@ -0,0 +1,154 @@
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from lib_python.bvh import BVH, slab_test, shapes_bvh
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+
+
+def _random_boxes(
+    rng: np.random.Generator,
+    count: int
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+
+    boxes_min: NDArray[np.float64] = rng.uniform(-50.0, 50.0, size=(count, 3))
+
+    return boxes_min, boxes_min + rng.uniform(0.5, 8.0, size=(count, 3))
+
+
+def test_ray_query_matches_brute_force() -> None:
+
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    boxes_min, boxes_max = _random_boxes(rng, 500)
+
+    bvh: BVH = BVH(boxes_min, boxes_max)
+
+    for _ in range(100):
+
+        origin: NDArray[np.float64] = rng.uniform(-80.0, 80.0, size=3)
+        direction: NDArray[np.float64] = rng.normal(size=3)
+
+        # Some rays parallel to an axis
+        direction[rng.integers(0, 3)] = 0.0
+
+        t_enter, t_exit = slab_test(origin, direction, boxes_min, boxes_max)
+        expected: NDArray[np.intp] = np.flatnonzero((t_enter <= t_exit) & (t_exit >= 0.0))
+
+        hits, hits_enter, _ = bvh.query_ray(origin, direction, 0.0)
+
+        assert sorted(hits.tolist()) == expected.tolist()
+        assert np.all(np.diff(hits_enter) >= 0.0)
+
+
+def test_box_query_matches_brute_force() -> None:
+
+    rng: np.random.Generator = np.random.default_rng(1)
+
+    boxes_min, boxes_max = _random_boxes(rng, 500)
+
+    bvh: BVH = BVH(boxes_min, boxes_max)
+
+    for _ in range(100):
+
+        lo: NDArray[np.float64] = rng.uniform(-60.0, 60.0, size=3)
+        hi: NDArray[np.float64] = lo + rng.uniform(0.0, 30.0, size=3)
+
+        expected: NDArray[np.intp] = np.flatnonzero(
+            np.all((boxes_min <= hi) & (boxes_max >= lo), axis=1)
+        )
+
+        assert bvh.query_box(lo, hi).tolist() == expected.tolist()
+
+
+def _shapes_naxel(count: int) -> Any:
+
+    rng: np.random.Generator = np.random.default_rng(2)
+
+    voxels_list: list[dict[str, Any]] = []
+
+    for i in range(count):
+
+        x, y, z = rng.integers(-40, 40, size=3).tolist()
+
+        if i % 3 == 0:
+            voxels_list.append({"type": "shape_cube", "position": [x, y, z], "size": 3, "color": [255, 0, 0, 255]})
+        elif i % 3 == 1:
+            voxels_list.append({"type": "shape_sphere", "position": [x, y, z], "radius": 2, "color": [0, 255, 0, 255]})
+        else:
+            voxels_list.append({
+                "type": "shape_line", "position": [x, y, z], "position2": [x + 5, y - 3, z], "color": [0, 0, 255, 255]
+            })
+
+    return load_naxel({"voxels_list": voxels_list})
+
+
+def test_shapes_bvh_matches_shape_voxels() -> None:
+
+    naxel = _shapes_naxel(60)
+    voxel_values = naxel.data_frames[0].voxels_list
+
+    bvh, shape_indices = shapes_bvh(voxel_values)
+
+    assert shape_indices.tolist() == list(range(60))
+
+    # The box of each shape contains all its voxels
+    for i, voxel_value in enumerate(voxel_values):
+
+        naxel.data_frames[0].voxels_list = [voxel_value]
+
+        grid: VoxelGrid = VoxelGrid()
+        grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+        coords: NDArray[np.int64] = grid.export_arrays().coords
+
+        assert np.all(coords >= bvh.boxes_min[i]) and np.all(coords < bvh.boxes_max[i])
+
+
+def test_shapes_region_build() -> None:
+
+    naxel = _shapes_naxel(60)
+    frame = naxel.data_frames[0]
+
+    region_min: tuple[int, int, int] = (-10, -10, -10)
+    region_max: tuple[int, int, int] = (15, 12, 20)
+
+    full: VoxelGrid = VoxelGrid()
+    full.build_from_frame(frame, naxel.general_data)
+
+    region: VoxelGrid = VoxelGrid()
+    region.shapes_region = (region_min, region_max)
+    region.build_from_frame(frame, naxel.general_data)
+
+    full_voxels: dict[str, list[int]] = full.export_to_dict()
+    region_voxels: dict[str, list[int]] = region.export_to_dict()
+
+    def in_region(key: str) -> bool:
+
+        xyz: list[int] = [int(c) for c in key.split(",")]
+
+        return all(region_min[a] <= xyz[a] < region_max[a] for a in range(3))
+
+    # Same voxels inside the region, and only the shapes overlapping it are rasterized
+    assert {k: v for k, v in full_voxels.items() if in_region(k)} \
+        == {k: v for k, v in region_voxels.items() if in_region(k)}
+
+    assert 0 < len(region_voxels) < len(full_voxels)
+
+
+def test_shapes_region_bounds_are_half_open() -> None:
+
+    naxel = load_naxel({"voxels_list": [
+        {"type": "shape_cube", "position": [-3, 0, 0], "size": 3, "color": [255, 0, 0, 255]},
+        {"type": "shape_cube", "position": [4, 0, 0], "size": 3, "color": [0, 255, 0, 255]},
+        {"type": "shape_cube", "position": [2, 0, 0], "size": 3, "color": [0, 0, 255, 255]},
+    ]})
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.shapes_region = ((0, 0, 0), (4, 4, 4))
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    # The cubes ending at x = 0 and starting at x = 4 are outside [0, 4)
+    assert {tuple(v) for v in grid.export_to_dict().values()} == {(0, 0, 255, 255)}
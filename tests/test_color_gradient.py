@@ -0,0 +1,86 @@
+from typing import Any
+
+import numpy as np
+
+from lib_python.vec import Vec3
+from lib_python.color import Color, ColorGradient
+from lib_python.color_palette import parse_color
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+
+
+def _scalar_gradient(gradient: ColorGradient, p: Vec3) -> list[int]:
+    """
+    Per-voxel inverse squared distance weighting of the gradient colors.
+    """
+
+    total: float = 0.0
+    acc: list[float] = [0.0, 0.0, 0.0, 0.0]
+
+    for color, stop in zip(gradient.colors, gradient.positions):
+
+        dist: float = (p.x - stop.x) ** 2 + (p.y - stop.y) ** 2 + (p.z - stop.z) ** 2
+
+        if dist == 0:
+            return list(color.color_at_pixel(p))
+
+        total += 1.0 / dist
+
+        for c, v in enumerate(color.color_at_pixel(p)):
+            acc[c] += v / dist
+
+    return [min(255, max(0, int(np.rint(v / total)))) for v in acc]
+
+
+def test_vectorized_gradient_matches_scalar() -> None:
+
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    for count in (1, 2, 5):
+
+        gradient: ColorGradient = ColorGradient(
+            colors=[Color(*rng.integers(0, 256, size=4).tolist()) for _ in range(count)],
+            positions=[Vec3(*rng.integers(-10, 10, size=3).tolist()) for _ in range(count)]
+        )
+
+        points: np.ndarray = np.concatenate([
+            rng.integers(-15, 15, size=(200, 3)),
+            np.array([[p.x, p.y, p.z] for p in gradient.positions])
+        ])
+
+        expected: list[list[int]] = [_scalar_gradient(gradient, Vec3(*p)) for p in points.tolist()]
+
+        assert gradient.colors_at_positions(points).tolist() == expected
+        assert [list(gradient.color_at_pixel(Vec3(*p))) for p in points.tolist()] == expected
+
+    # Channels are weighted separately
+    two: ColorGradient = ColorGradient([Color(255, 0, 0, 255), Color(0, 0, 255, 255)], [Vec3(0, 0, 0), Vec3(4, 0, 0)])
+
+    assert two.color_at_pixel(Vec3(2, 0, 0)) == (128, 0, 128, 255)
+
+
+def test_gradient_shape_colors() -> None:
+
+    gradient_data: dict[str, Any] = {
+        "type": "gradient_lst",
+        "colors": ["red", [0, 0, 255, 255], "#00ff00"],
+        "positions": [[0, 0, 0], [10, 0, 0], [5, 8, 0]]
+    }
+
+    naxel = load_naxel({"voxels_list": [
+        {"type": "shape_rect", "position": [-2, -2, 0], "position2": [12, 10, 1], "color": gradient_data},
+    ]})
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    gradient = parse_color(gradient_data)
+
+    assert isinstance(gradient, ColorGradient)
+
+    expected: dict[str, list[int]] = {
+        f"{x},{y},{z}": _scalar_gradient(gradient, Vec3(x, y, z))
+        for x in range(-2, 13) for y in range(-2, 11) for z in range(2)
+    }
+
+    assert grid.export_to_dict() == expected
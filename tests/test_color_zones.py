@@ -0,0 +1,83 @@
+import numpy as np
+
+from lib_python.vec import Vec3
+from lib_python.color import Color, ColorGradient, ColorZone, ColorZones, ZONE_INDEX_MIN_ZONES
+
+
+RED: Color = Color(255, 0, 0)
+GREY: Color = Color(128, 128, 128)
+
+
+def _zones() -> ColorZones:
+    """
+    Indexed zones: zone 0 is red at the origin, the others far away.
+    """
+
+    zones: list[ColorZone] = [ColorZone(RED, Vec3(0, 0, 0), Vec3(1, 1, 1))]
+
+    for i in range(1, ZONE_INDEX_MIN_ZONES):
+        zones.append(ColorZone(Color(0, 0, 255), Vec3(10 * i, 0, 0), Vec3(10 * i + 1, 1, 1)))
+
+    return ColorZones(GREY, zones)
+
+
+def test_zone_moved_in_place() -> None:
+
+    zones: ColorZones = _zones()
+
+    assert zones.get_index() is not None
+    assert zones.color_at_pixel(Vec3(0, 0, 0)) == (255, 0, 0, 255)
+
+    zones.zones[0].pos1 = Vec3(5, 0, 0)
+    zones.zones[0].pos2.x = 6
+
+    assert zones.color_at_pixel(Vec3(0, 0, 0)) == (128, 128, 128, 255)
+    assert zones.color_at_pixel(Vec3(5, 1, 1)) == (255, 0, 0, 255)
+
+    colors = zones.colors_at_positions(np.array([[0, 0, 0], [6, 0, 1]]))
+
+    assert colors.tolist() == [[128, 128, 128, 255], [255, 0, 0, 255]]
+
+
+def _scalar_zones(zones: ColorZones, p: Vec3) -> list[int]:
+    """
+    Per-voxel search of the first zone containing the voxel.
+    """
+
+    for zone in zones.zones:
+        if zone.check_in_zone(p):
+            return list(zone.color.color_at_pixel(p))
+
+    return list(zones.default_color.color_at_pixel(p))
+
+
+def test_vectorized_zones_match_scalar() -> None:
+
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    gradient: ColorGradient = ColorGradient([RED, Color(0, 0, 255)], [Vec3(0, 0, 0), Vec3(8, 0, 0)])
+
+    # Without and with the zone index, with overlapping zones and a gradient zone
+    for count in (3, ZONE_INDEX_MIN_ZONES + 5):
+
+        zones: list[ColorZone] = []
+
+        for i in range(count):
+
+            corner: list[int] = rng.integers(-20, 20, size=3).tolist()
+            size: list[int] = rng.integers(-8, 8, size=3).tolist()
+
+            color: Color = gradient if i == 1 else Color(*rng.integers(0, 256, size=3).tolist())
+
+            zones.append(ColorZone(color, Vec3(*corner), Vec3(*[c + s for c, s in zip(corner, size)])))
+
+        color_zones: ColorZones = ColorZones(GREY, zones)
+
+        assert (color_zones.get_index() is not None) == (count >= ZONE_INDEX_MIN_ZONES)
+
+        points: np.ndarray = rng.integers(-25, 25, size=(2000, 3))
+
+        expected: list[list[int]] = [_scalar_zones(color_zones, Vec3(*p)) for p in points.tolist()]
+
+        assert color_zones.colors_at_positions(points).tolist() == expected
+        assert [list(color_zones.color_at_pixel(Vec3(*p))) for p in points.tolist()] == expected
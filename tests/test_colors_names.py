@@ -0,0 +1,37 @@
+import os
+import sys
+import subprocess
+
+from lib_python import colors_names
+from lib_python.color_palette import parse_color
+
+
+def test_import_builds_no_color() -> None:
+
+    code: str = (
+        "import lib_python.colors_names as c; "
+        "assert c._COLORS_INDEX is None and len(c._COLORS_CACHE) == 0; "
+        "assert 'COLORS_DICT' not in vars(c)"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_named_colors() -> None:
+
+    names: list[str] = colors_names.get_colors_names()
+
+    assert len(names) == 894
+    assert names[0] == "absolute zero" and "alice blue" in names
+
+    assert colors_names.get_named_color("absolute zero").export_to_lst() == [0, 72, 186, 255]
+    assert colors_names.get_named_color("alice blue").export_to_lst() == [240, 248, 255, 255]
+    assert colors_names.get_named_color("not a color") is None
+
+    # Every line of the packed table holds a color
+    assert all(colors_names.get_named_color(name) is not None for name in names)
+
+    # Looked up colors are shared with COLORS_DICT and parse_color
+    assert colors_names.COLORS_DICT["amber"] is colors_names.get_named_color("amber")
+    assert parse_color("Amber") is colors_names.get_named_color("amber")
+    assert list(colors_names.COLORS_DICT.keys()) == names
@@ -0,0 +1,90 @@
+from typing import Any
+
+import sys
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid, build_frames
+
+
+def _walk_cycle(count: int) -> dict[str, Any]:
+    """
+    An animation of a static body with a moving arm, recolored every other frame.
+    """
+
+    body: dict[str, list[int]] = {f"{x},{y},0": [128, 128, 128, 255] for x in range(6) for y in range(6)}
+
+    frames: list[dict[str, Any]] = []
+
+    for i in range(count):
+
+        voxels: dict[str, list[int]] = dict(body)
+
+        voxels[f"{i % 6},6,0"] = [255, 0, 0, 255] if i % 2 == 0 else [0, 0, 255, 255]
+        voxels["0,0,0"] = [0, 255, 0, 255] if i % 2 == 0 else [128, 128, 128, 255]
+
+        frames.append({"frame_id": i, "voxels_dict": voxels})
+
+    return {"name": "walk", "frames": frames}
+
+
+def _frame_voxels(naxel: Any) -> list[dict[str, list[int]]]:
+
+    res: list[dict[str, list[int]]] = []
+
+    for df in naxel.data_frames:
+
+        grid: VoxelGrid = VoxelGrid()
+        grid.build_from_frame(df, naxel.general_data)
+
+        res.append(grid.export_to_dict())
+
+    return res
+
+
+def test_delta_export_round_trip() -> None:
+
+    original = load_naxel(_walk_cycle(6))
+
+    exported: dict[str, Any] = original.export_to_dict_preprocessed(delta_frames=True)
+
+    # Frames after the first key frame only list their changes
+    assert [frame.get("base_frame", None) for frame in exported["frames"]] == [None, 0, 0, 0, 0, 0]
+    assert all(len(frame["voxels_dict"]) <= 3 for frame in exported["frames"][1:])
+
+    expected: list[dict[str, list[int]]] = _frame_voxels(original)
+
+    for lazy_frames in (False, True):
+
+        loaded = load_naxel(exported, lazy_frames=lazy_frames, max_cached_frames=2)
+
+        # Built one by one, and incrementally from the grids of the base frames
+        assert _frame_voxels(loaded) == expected
+        assert [grid.export_to_dict() for grid in build_frames(loaded.data_frames, loaded.general_data)] == expected
+
+        # Exported again without deltas
+        assert loaded.export_to_dict_preprocessed()["frames"] == original.export_to_dict_preprocessed()["frames"]
+
+
+def test_long_delta_chain_build() -> None:
+
+    count: int = sys.getrecursionlimit() * 2
+
+    frames: list[dict[str, Any]] = [{"voxels_dict": {"0,0,0": [255, 0, 0, 255]}}]
+
+    for i in range(1, count):
+        frames.append({
+            "base_frame": i - 1,
+            "voxels_removed": [f"{i - 1},1,0"],
+            "voxels_dict": {f"{i},0,0": [0, 0, 255, 255], f"{i},1,0": [0, 255, 0, 255]}
+        })
+
+    naxel = load_naxel({"frames": frames}, lazy_frames=True, max_cached_frames=4)
+
+    last: VoxelGrid = VoxelGrid()
+    last.build_from_frame(naxel.data_frames[count - 1], naxel.general_data)
+
+    assert len(last.export_to_dict()) == count + 1
+
+    sizes: list[int] = [len(grid.export_to_dict()) for grid in build_frames(naxel.data_frames, naxel.general_data)]
+
+    assert sizes == [1] + [i + 2 for i in range(1, count)]
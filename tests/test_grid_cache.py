@@ -0,0 +1,117 @@
+from typing import Any, Optional
+
+import os
+import json
+
+import numpy as np
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.voxel_grid_morton import MortonVoxelGrid
+from lib_python.voxel_grid_chunked import ChunkedVoxelGrid
+from lib_python.grid_cache import GridCache, frame_cache_key, frame_dependencies
+
+
+def _write(
+    path: str,
+    voxels_list: list[dict[str, Any]]
+) -> None:
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"name": os.path.basename(path), "voxels_list": voxels_list}, f)
+
+
+def _cached_grid(
+    cache: GridCache,
+    root: str
+) -> tuple[VoxelGrid, bool]:
+    """
+    Get the grid of a.json as the renderer does, and whether it came from the cache.
+    """
+
+    with open(os.path.join(root, "a.json"), "r", encoding="utf-8") as f:
+        naxel = load_naxel(json.load(f), source_dir=root)
+
+    frame = naxel.data_frames[0]
+    key: str = frame_cache_key(frame, naxel.general_data)
+
+    grid: Optional[VoxelGrid] = cache.load(key)
+
+    if grid is not None:
+        return grid, True
+
+    grid = VoxelGrid()
+    grid.build_from_frame(frame, naxel.general_data)
+
+    cache.save(key, grid, frame_dependencies(frame, naxel.general_data))
+
+    return grid, False
+
+
+def test_nested_import_change_invalidates_grid(tmp_path: Any) -> None:
+
+    root: str = str(tmp_path / "scene")
+    os.makedirs(root)
+
+    _write(os.path.join(root, "a.json"), [{"type": "import_voxel", "path": "b.json", "position": [0, 0, 0]}])
+    _write(os.path.join(root, "b.json"), [{"type": "import_voxel", "path": "c.json", "position": [0, 0, 0]}])
+    _write(os.path.join(root, "c.json"), [{"type": "shape_point", "position": [0, 0, 0], "color": "blue"}])
+
+    cache: GridCache = GridCache(str(tmp_path / "cache"))
+
+    grid, from_cache = _cached_grid(cache, root)
+    assert not from_cache and grid.export_to_dict() == {"0,0,0": [0, 0, 255, 255]}
+
+    grid, from_cache = _cached_grid(cache, root)
+    assert from_cache and grid.export_to_dict() == {"0,0,0": [0, 0, 255, 255]}
+
+    _write(os.path.join(root, "c.json"), [{"type": "shape_point", "position": [0, 0, 0], "color": "red"}])
+
+    grid, from_cache = _cached_grid(cache, root)
+    assert not from_cache and grid.export_to_dict() == {"0,0,0": [255, 0, 0, 255]}
+
+
+def test_storages_round_trip(tmp_path: Any) -> None:
+
+    naxel = load_naxel({
+        "color_palette": {"skin": [200, 150, 100, 255]},
+        "voxels_list": [
+            {"type": "shape_sphere", "position": [-3, 2, 40], "radius": 4, "color": "skin"},
+            {"type": "shape_line", "position": [-20, 0, 0], "position2": [20, 5, -3], "color": [0, 0, 255, 255]},
+        ]
+    })
+
+    frame = naxel.data_frames[0]
+    key: str = frame_cache_key(frame, naxel.general_data)
+
+    built: VoxelGrid = VoxelGrid()
+    built.build_from_frame(frame, naxel.general_data)
+
+    expected: dict[str, list[int]] = built.export_to_dict()
+
+    # Saved for the morton storage: the chunked one is written on its first load
+    cache: GridCache = GridCache(str(tmp_path / "cache"))
+    cache.save(key, built, [], "morton")
+
+    for storage, grid_type in (("dict", VoxelGrid), ("morton", MortonVoxelGrid), ("chunked", ChunkedVoxelGrid)):
+
+        for _ in range(2):
+
+            loaded: Optional[VoxelGrid] = cache.load(key, storage)
+
+            assert type(loaded) is grid_type
+            assert loaded.export_to_dict() == expected
+            assert loaded.get_voxel_bounds()[0] == built.get_voxel_bounds()[0]
+            assert loaded.get_voxel_bounds()[1] == built.get_voxel_bounds()[1]
+
+            for x, y, z in ((-3, 2, 40), (-20, 0, 0), (20, 5, -3), (0, 0, 0), (100, 100, 100)):
+                assert (loaded.get_voxel(x, y, z) is None) == (built.get_voxel(x, y, z) is None)
+
+            # Palette colors stay bound to their key
+            assert "skin" in loaded._palette_slots
+
+    # The Morton arrays are views on the mapped files
+    morton: Optional[VoxelGrid] = cache.load(key, "morton")
+
+    assert isinstance(morton, MortonVoxelGrid)
+    assert isinstance(morton._codes, np.memmap) and isinstance(morton._slots, np.memmap)
@@ -0,0 +1,85 @@
+from typing import Any
+
+import os
+import json
+
+import numpy as np
+from PIL import Image
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.renderer_naive import RendererNaive
+
+
+def _scene(root: str) -> dict[str, Any]:
+    """
+    A small forest: the same tree model imported several times, over a ground rect.
+    """
+
+    with open(os.path.join(root, "tree.json"), "w", encoding="utf-8") as f:
+        json.dump({"voxels_list": [
+            {"type": "shape_line", "position": [0, 0, 0], "position2": [0, 0, 3], "color": [110, 70, 30, 255]},
+            {"type": "shape_sphere", "position": [0, 0, 4], "radius": 2, "color": [30, 160, 40, 255]},
+        ]}, f)
+
+    trees: list[dict[str, Any]] = [
+        {"type": "import_voxel", "path": "tree.json", "position": [x, y, 1]}
+        for x, y in ((-4, 6), (3, 8), (8, 14), (-7, 16))
+    ]
+
+    return {
+        "name": "forest",
+        # Off the voxel lattice, so no ray goes exactly through a voxel edge (where
+        # the voxel stepped into depends on the rounding of the ray origin)
+        "camera_position": [0.1234, -20.0, 5.2173],
+        "camera_rotation": [0, 0, 0],
+        "camera_focal": 20,
+        "camera_width": 40,
+        "camera_height": 30,
+        "voxels_list": [
+            {"type": "shape_rect", "position": [-12, 0, 0], "position2": [12, 24, 0], "color": [90, 90, 60, 255]},
+        ] + trees + [
+            # Drawn over an instance
+            {"type": "shape_point", "position": [3, 8, 7], "color": [255, 0, 0, 255]},
+        ]
+    }
+
+
+def _render(naxel: Any, path: str, **options: Any) -> np.ndarray:
+
+    RendererNaive(naxel, **options).render_single_frame(image_save_path=path)
+
+    return np.asarray(Image.open(path))
+
+
+def test_instanced_render_matches_copies(tmp_path: Any) -> None:
+
+    root: str = str(tmp_path)
+
+    naxel = load_naxel(_scene(root), source_dir=root)
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.instance_imports = True
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    # One shared model grid for the four trees, then the layer of the voxels placed after them
+    assert len(grid.instances) == 5
+    assert len({id(instance.grid) for instance in grid.instances[:4]}) == 1
+    assert grid.instances[4].grid.export_to_dict() == {"3,8,7": [255, 0, 0, 255]}
+
+    flat: VoxelGrid = VoxelGrid()
+    flat.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    assert grid.get_bounds()[0] == flat.get_bounds()[0] and grid.get_bounds()[1] == flat.get_bounds()[1]
+
+    expected: np.ndarray = _render(naxel, os.path.join(root, "flat.png"))
+
+    assert len(np.unique(expected.reshape(-1, 4), axis=0)) > 3
+
+    for grid_storage in ("dict", "morton"):
+
+        image: np.ndarray = _render(
+            naxel, os.path.join(root, f"instanced_{grid_storage}.png"), instancing=True, grid_storage=grid_storage
+        )
+
+        assert np.array_equal(image, expected)
@@ -0,0 +1,57 @@
+from typing import Any, Optional
+
+import gc
+import sys
+import weakref
+
+from lib_python.naxel import NaxelDataFrame
+from lib_python.naxel_loader import LazyFrameList, load_naxel
+
+
+def _delta_chain(count: int) -> dict[str, Any]:
+    """
+    An animation where each frame adds a voxel to the previous one.
+    """
+
+    frames: list[dict[str, Any]] = [{"voxels_dict": {"0,0,0": [255, 0, 0, 255]}}]
+
+    for i in range(1, count):
+        frames.append({"base_frame": i - 1, "voxels_dict": {f"{i},0,0": [0, 0, 255, 255]}})
+
+    return {"frames": frames}
+
+
+def test_long_delta_chain_with_small_cache() -> None:
+
+    count: int = sys.getrecursionlimit() * 2
+
+    naxel = load_naxel(_delta_chain(count), lazy_frames=True, max_cached_frames=3)
+
+    frames = naxel.data_frames
+
+    assert isinstance(frames, LazyFrameList)
+
+    first: weakref.ref[NaxelDataFrame] = weakref.ref(frames[0])
+
+    # Walk the whole chain, from the last frame back to the key frame
+    frame: Optional[NaxelDataFrame] = frames[count - 1]
+    depth: int = 0
+
+    while frame is not None:
+
+        assert frame.voxels_dict is not None and len(frame.voxels_dict) == 1
+        assert len(frames.cached_frame_indices()) <= 3
+
+        frame = frame.get_base_frame()
+        depth += 1
+
+    assert depth == count
+
+    # Evicted frames are not kept alive by the frames based on them
+    frames[count - 1]
+    frames[count - 2]
+    frames[count - 3]
+
+    gc.collect()
+
+    assert first() is None
@@ -0,0 +1,80 @@
+from typing import Any
+
+import os
+
+import numpy as np
+from PIL import Image
+
+from lib_python.vec import Vec3
+from lib_python.color import Color
+from lib_python.ray import Ray
+from lib_python.render_math import Vec3NP
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.ray_marcher import RayMarcher
+from lib_python.march_heatmap import MarchHeatmap
+
+
+def _ray(origin: tuple[float, float, float], direction: tuple[float, float, float]) -> Ray:
+
+    return Ray(Vec3NP(np.array(origin, dtype=np.float32)), Vec3NP(np.array(direction, dtype=np.float32)))
+
+
+def _marcher() -> RayMarcher:
+    """
+    A grid spanning [0, 10) x [0, 3) x [0, 1), with a voxel at each end.
+    """
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.set_voxel(9, 0, 0, Color(255, 0, 0))
+    grid.set_voxel(0, 2, 0, Color(0, 0, 255))
+
+    return RayMarcher(grid)
+
+
+def test_march_statistics() -> None:
+
+    marcher: RayMarcher = _marcher()
+
+    # Crosses the 10 voxels of the first row, the last one being hit
+    hit = marcher.march(_ray((-5.0, 0.5, 0.5), (1.0, 0.0, 0.0)), 0.0, 100.0)
+
+    assert hit.hit and hit.position is not None and hit.position.x == 9
+    assert hit.steps == 10
+    assert abs(hit.t_enter - 5.0) < 1e-3 and abs(hit.t_exit - 15.0) < 1e-3
+
+    # Crosses the empty middle row, and leaves the grid
+    miss = marcher.march(_ray((-5.0, 1.5, 0.5), (1.0, 0.0, 0.0)), 0.0, 100.0)
+
+    assert not miss.hit and miss.steps == 11
+
+    # Never touches the grid bounding box
+    outside = marcher.march(_ray((-5.0, 5.5, 0.5), (1.0, 0.0, 0.0)), 0.0, 100.0)
+
+    assert not outside.hit and outside.steps == 0 and outside.t_enter > outside.t_exit
+
+
+def test_heatmap_save(tmp_path: Any) -> None:
+
+    marcher: RayMarcher = _marcher()
+
+    heatmap: MarchHeatmap = MarchHeatmap(3, 1)
+
+    for x, y in enumerate((0.5, 1.5, 5.5)):
+        heatmap.record(x, 0, marcher.march(_ray((-5.0, y, 0.5), (1.0, 0.0, 0.0)), 0.0, 100.0))
+
+    prefix: str = os.path.join(str(tmp_path), "frame_heatmap")
+
+    heatmap.save(prefix)
+
+    data = np.load(f"{prefix}.npz")
+
+    assert data["steps"].tolist() == [[10, 11, 0]]
+    assert np.allclose(data["t_enter"][0, :2], 5.0, atol=1e-3)
+    assert np.isnan(data["t_enter"][0, 2]) and np.isnan(data["t_exit"][0, 2])
+
+    image: Any = np.asarray(Image.open(f"{prefix}_steps.png"))
+
+    # The most expensive pixel has the top color of the ramp, a pixel without steps the bottom one
+    assert image.shape == (1, 3, 4)
+    assert image[0, 1].tolist() == [255, 255, 255, 255]
+    assert image[0, 2].tolist() == [0, 0, 0, 255]
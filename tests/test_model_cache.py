@@ -0,0 +1,72 @@
+from typing import Any, Optional
+
+import os
+import json
+
+from lib_python.model_cache import ModelCache
+from lib_python.voxel_arrays import VoxelArrays
+
+
+def _write(
+    path: str,
+    voxels_list: list[dict[str, Any]]
+) -> None:
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"name": os.path.basename(path), "voxels_list": voxels_list}, f)
+
+
+def _point(color: str) -> dict[str, Any]:
+
+    return {"type": "shape_point", "position": [0, 0, 0], "color": color}
+
+
+def _import(path: str) -> dict[str, Any]:
+
+    return {"type": "import_voxel", "path": path, "position": [0, 0, 0]}
+
+
+def _colors(model: Optional[VoxelArrays]) -> list[list[int]]:
+
+    assert model is not None
+
+    return model.table[model.indices].tolist()
+
+
+def test_nested_import_change_rebuilds_model(tmp_path: Any) -> None:
+
+    root: str = str(tmp_path)
+
+    _write(os.path.join(root, "a.json"), [_import("b.json")])
+    _write(os.path.join(root, "b.json"), [_import("c.json")])
+    _write(os.path.join(root, "c.json"), [_point("blue")])
+
+    cache: ModelCache = ModelCache()
+
+    assert _colors(cache.get_model("a.json", root)) == [[0, 0, 255, 255]]
+
+    _write(os.path.join(root, "c.json"), [_point("red")])
+
+    assert _colors(cache.get_model("a.json", root)) == [[255, 0, 0, 255]]
+    assert cache.get_dependencies("a.json", root) == [
+        os.path.join(root, "a.json"),
+        os.path.join(root, "b.json"),
+        os.path.join(root, "c.json"),
+    ]
+
+
+def test_same_content_in_other_directory(tmp_path: Any) -> None:
+
+    root: str = str(tmp_path)
+
+    for name, color in (("one", "blue"), ("two", "red")):
+
+        _write(os.path.join(root, name, "model.json"), [_import("part.json")])
+        _write(os.path.join(root, name, "part.json"), [_point(color)])
+
+    cache: ModelCache = ModelCache()
+
+    assert _colors(cache.get_model("one/model.json", root)) == [[0, 0, 255, 255]]
+    assert _colors(cache.get_model("two/model.json", root)) == [[255, 0, 0, 255]]
@@ -0,0 +1,59 @@
+from typing import Any
+
+import os
+
+import numpy as np
+import pytest
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.naxel_binary import NAXEL_BINARY_MAGIC, export_naxel_binary, load_naxel_binary, open_naxel_binary
+
+
+def _open_files() -> int:
+
+    return len(os.listdir("/proc/self/fd"))
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+def test_invalid_files_are_closed(tmp_path: Any) -> None:
+
+    contents: list[bytes] = [b"", NAXEL_BINARY_MAGIC + b"\x01\x00", b"NOPE" + b"\x00" * 60]
+
+    for i, content in enumerate(contents):
+
+        path: str = os.path.join(str(tmp_path), f"{i}.naxb")
+
+        with open(path, "wb") as f:
+            f.write(content)
+
+        before: int = _open_files()
+
+        with pytest.raises(ValueError):
+            open_naxel_binary(path)
+
+        assert _open_files() == before
+
+
+def test_load_keeps_mapped_views(tmp_path: Any) -> None:
+
+    path: str = os.path.join(str(tmp_path), "a.naxb")
+
+    export_naxel_binary(
+        load_naxel({"voxels_dict": {"0,0,0": [255, 0, 0, 255], "1,2,3": [0, 0, 255, 255]}}),
+        path
+    )
+
+    naxel = load_naxel_binary(path)
+
+    arrays = naxel.data_frames[0].voxels_arrays
+
+    assert arrays is not None
+
+    # Read-only views on the file mapping, not copies
+    for array in (arrays.coords, arrays.indices, arrays.table):
+
+        assert not array.flags.writeable
+        assert not array.flags.owndata
+
+    assert arrays.export_to_dict() == {"0,0,0": [255, 0, 0, 255], "1,2,3": [0, 0, 255, 255]}
+    assert np.asarray(arrays.coords).tolist() == [[0, 0, 0], [1, 2, 3]]
@@ -0,0 +1,65 @@
+from typing import Any
+
+import copy
+
+from lib_python.color import Color
+from lib_python.color_palette import parse_color_palette
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+
+
+SCENE: dict[str, Any] = {
+    "color_palette": {"skin": [255, 0, 0, 255], "hair": "#0000ff"},
+    "voxels_dict": {"20,0,0": [255, 0, 0, 255], "21,0,0": "skin"},
+    "voxels_list": [
+        {"type": "shape_cube", "position": [0, 0, 0], "size": 3, "color": "skin"},
+        {"type": "shape_sphere", "position": [8, 0, 0], "radius": 2, "color": "hair"},
+        {"type": "shape_line", "position": [0, 5, 0], "position2": [10, 5, 0], "color": [255, 0, 0, 255]},
+    ]
+}
+
+
+def _build(data: dict[str, Any]) -> VoxelGrid:
+
+    naxel = load_naxel(copy.deepcopy(data))
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    return grid
+
+
+def _with_palette(**palette: Any) -> dict[str, Any]:
+
+    data: dict[str, Any] = copy.deepcopy(SCENE)
+    data["color_palette"].update(palette)
+
+    return data
+
+
+def test_palette_swap_matches_rebuild() -> None:
+
+    grid: VoxelGrid = _build(SCENE)
+
+    # Literal colors equal to a palette color are not recolored with it
+    grid.apply_palette(parse_color_palette({"skin": [0, 255, 0, 255], "unused": "white"}))
+
+    assert grid.export_to_dict() == _build(_with_palette(skin=[0, 255, 0, 255])).export_to_dict()
+
+    grid.set_palette_color("hair", Color(1, 2, 3, 255))
+
+    assert grid.export_to_dict() == _build(_with_palette(skin=[0, 255, 0, 255], hair=[1, 2, 3, 255])).export_to_dict()
+
+
+def test_color_table() -> None:
+
+    grid: VoxelGrid = _build(SCENE)
+
+    arrays = grid.export_arrays()
+
+    # One entry per palette key, and one for all the equal literal colors
+    assert len(arrays.table) == 3
+    assert arrays.indices.dtype.itemsize == 1
+    assert len(arrays.coords) == len(grid.export_to_dict())
+
+    assert VoxelGrid.from_arrays(arrays).export_to_dict() == grid.export_to_dict()
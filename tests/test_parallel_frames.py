@@ -0,0 +1,64 @@
+from typing import Any
+
+import os
+import json
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.parallel_frames import build_naxel_grids
+
+
+def _animation(root: str) -> dict[str, Any]:
+    """
+    An animation with palette colors, shapes and an imported model moving across frames.
+    """
+
+    with open(os.path.join(root, "model.json"), "w", encoding="utf-8") as f:
+        json.dump({"voxels_list": [{"type": "shape_cube", "position": [0, 0, 0], "size": 2, "color": "red"}]}, f)
+
+    frames: list[dict[str, Any]] = []
+
+    for i in range(4):
+        frames.append({
+            "frame_id": i * 2,
+            "frame_duration": 0.5 + i,
+            "voxels_list": [
+                {"type": "shape_sphere", "position": [i, 0, 0], "radius": 3, "color": "skin"},
+                {"type": "shape_line", "position": [0, -i, 4], "position2": [6, 3, 4], "color": [0, 0, 255, 255]},
+                {"type": "import_voxel", "path": "model.json", "position": [-5, i, 0]},
+            ]
+        })
+
+    return {"color_palette": {"skin": [200, 150, 100, 255]}, "default_color": "green", "frames": frames}
+
+
+def test_parallel_frames_match_serial(tmp_path: Any) -> None:
+
+    root: str = str(tmp_path)
+
+    data: dict[str, Any] = _animation(root)
+
+    serial = load_naxel(data, source_dir=root)
+
+    expected: list[dict[str, list[int]]] = []
+
+    for frame in serial.data_frames:
+
+        grid: VoxelGrid = VoxelGrid()
+        grid.build_from_frame(frame, serial.general_data)
+
+        expected.append(grid.export_to_dict())
+
+    assert len(set(json.dumps(voxels, sort_keys=True) for voxels in expected)) == 4
+
+    serial_export: dict[str, Any] = serial.export_to_dict_preprocessed()
+
+    for lazy_frames in (False, True):
+
+        naxel = load_naxel(data, lazy_frames=lazy_frames, source_dir=root)
+
+        assert [grid.export_to_dict() for grid in build_naxel_grids(naxel, 2)] == expected
+
+        assert naxel.export_to_dict_preprocessed(workers=2) == serial_export
+        assert naxel.export_to_dict_preprocessed(workers=2, voxels_format="rle") \
+            == serial.export_to_dict_preprocessed(voxels_format="rle")
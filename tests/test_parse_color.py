@@ -0,0 +1,51 @@
+import pytest
+
+from lib_python.color import Color
+from lib_python.color_palette import PARSE_COLOR_CACHE_SIZE, _PARSE_COLOR_CACHE, parse_color, parse_color_palette
+
+
+def test_equal_values_share_one_color() -> None:
+
+    red: Color = parse_color([255, 0, 0, 255])
+
+    assert parse_color((255, 0, 0, 255)) is red
+    assert parse_color([255, 0, 0, 255]) is red
+    assert parse_color("#ff0000") is parse_color("#ff0000")
+    assert parse_color("Red") is parse_color("Red")
+
+    # Same values, different formats
+    for data in ([255, 0, 0], "#FF0000", "#ff0000ff"):
+        assert parse_color(data).export_to_lst() == [255, 0, 0, 255]
+
+    # Shared colors cannot be modified through one of their users
+    with pytest.raises(AttributeError):
+        red.r = 0
+
+    assert parse_color([255, 0, 0, 255]).export_to_lst() == [255, 0, 0, 255]
+
+
+def test_palette_keys_are_not_interned() -> None:
+
+    first = parse_color_palette({"skin": [10, 20, 30, 255]})
+    second = parse_color_palette({"skin": [40, 50, 60, 255]})
+
+    assert parse_color("skin", first).export_to_lst() == [10, 20, 30, 255]
+    assert parse_color("skin", second).export_to_lst() == [40, 50, 60, 255]
+
+    # Unknown strings without a palette
+    assert parse_color("skin").export_to_lst() == Color().export_to_lst()
+
+    # Each palette key has its own color, even for equal values
+    shared = parse_color_palette({"a": "red", "b": "red"})
+
+    assert shared.get_color("a") is not shared.get_color("b")
+
+
+def test_cache_is_bounded() -> None:
+
+    for i in range(PARSE_COLOR_CACHE_SIZE + 10):
+        parse_color([i % 256, i // 256, 0, 255])
+
+    assert len(_PARSE_COLOR_CACHE) <= PARSE_COLOR_CACHE_SIZE
+
+    assert parse_color([3, 1, 0, 255]).export_to_lst() == [3, 1, 0, 255]
@@ -0,0 +1,109 @@
+from typing import Any
+
+import numpy as np
+
+from lib_python.vec import Vec3
+from lib_python.pos import Pos
+from lib_python.pos_transform import has_pos_transform, transform_coords
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+
+
+def _transformed(coords: list[list[int]], pos: Pos) -> list[list[int]]:
+
+    res, _ = transform_coords(np.array(coords), pos)
+
+    return sorted(res.tolist())
+
+
+def test_scale() -> None:
+
+    anchor: Vec3 = Vec3(10, 0, 0)
+
+    # Each voxel becomes a block, relative to the anchor
+    assert _transformed([[10, 0, 0], [11, 0, 0]], Pos(anchor, scale=Vec3(2, 1, 1))) \
+        == [[10, 0, 0], [11, 0, 0], [12, 0, 0], [13, 0, 0]]
+
+    assert _transformed([[10, 0, 0]], Pos(anchor, scale=Vec3(1, 2, 3))) \
+        == [[10, y, z] for y in range(2) for z in range(3)]
+
+    # Shrunk voxels merge
+    assert _transformed([[10, 0, 0], [11, 0, 0], [12, 0, 0]], Pos(anchor, scale=Vec3(0.5, 1, 1))) \
+        == [[10, 0, 0], [10, 0, 0], [11, 0, 0]]
+
+    # A negative factor mirrors the axis
+    assert _transformed([[11, 0, 0]], Pos(anchor, scale=Vec3(-1, 1, 1))) == [[9, 0, 0]]
+
+    _, source = transform_coords(np.array([[10, 0, 0], [11, 0, 0]]), Pos(anchor, scale=Vec3(2, 1, 1)))
+
+    assert source.tolist() == [0, 0, 1, 1]
+
+
+def test_flip() -> None:
+
+    pos: Pos = Pos(Vec3(10, 5, 0), flip=Vec3(1, 0, 1))
+
+    assert _transformed([[12, 7, 3], [10, 5, 0]], pos) == [[8, 7, -3], [10, 5, 0]]
+
+
+def test_rotation() -> None:
+
+    anchor: Vec3 = Vec3(1, 2, 3)
+
+    # Quarter turns around each axis, counterclockwise
+    assert _transformed([[2, 2, 3], [1, 3, 3]], Pos(anchor, rotation=Vec3(0, 0, 90))) == [[0, 2, 3], [1, 3, 3]]
+    assert _transformed([[1, 3, 3]], Pos(anchor, rotation=Vec3(90, 0, 0))) == [[1, 2, 4]]
+    assert _transformed([[1, 2, 4]], Pos(anchor, rotation=Vec3(0, 90, 0))) == [[2, 2, 3]]
+    assert _transformed([[2, 2, 3]], Pos(anchor, rotation=Vec3(0, 0, 180))) == [[0, 2, 3]]
+
+    # Full turns are not transforms
+    assert not has_pos_transform(Pos(anchor, rotation=Vec3(360, -720, 0)))
+
+    # Rounded to the nearest voxel
+    assert _transformed([[3, 2, 3]], Pos(anchor, rotation=Vec3(0, 0, 45))) == [[2, 3, 3]]
+
+
+def test_crop() -> None:
+
+    coords: list[list[int]] = [[x, 0, 0] for x in range(-3, 4)]
+
+    assert _transformed(coords, Pos(Vec3(0, 0, 0), crop=Vec3(2, 0, 0))) == [[0, 0, 0], [1, 0, 0]]
+    assert _transformed(coords, Pos(Vec3(0, 0, 0), crop=Vec3(-2, 0, 0))) == [[-1, 0, 0], [0, 0, 0]]
+    assert _transformed(coords, Pos(Vec3(1, 0, 0), crop=Vec3(0, 0, 0))) == sorted(coords)
+
+    _, source = transform_coords(np.array(coords), Pos(Vec3(0, 0, 0), crop=Vec3(2, 0, 0)))
+
+    assert source.tolist() == [3, 4]
+
+
+def test_transforms_order() -> None:
+
+    # Scale, flip, rotation, crop, then shift
+    pos: Pos = Pos(
+        Vec3(0, 0, 0),
+        scale=Vec3(2, 1, 1),
+        flip=Vec3(0, 1, 0),
+        rotation=Vec3(0, 0, 90),
+        crop=Vec3(0, 3, 0),
+        shift=Vec3(5, 0, 1)
+    )
+
+    # (1, 0, 0) -> x 2 and 3 -> unchanged by the flip -> y 2 and 3 -> y 3 cropped -> shifted
+    assert _transformed([[1, 0, 0]], pos) == [[5, 2, 1]]
+
+    # (0, 1, 0) -> x 0 and 1 -> y -1 -> x 1, y 0 and 1 -> kept -> shifted
+    assert _transformed([[0, 1, 0]], pos) == [[6, 0, 1], [6, 1, 1]]
+
+
+def test_transformed_shape() -> None:
+
+    position: dict[str, Any] = {"xyz": [4, 4, 0], "scale": [1, 1, 2], "rotation": [0, 0, 90], "shift": [0, 0, 10]}
+
+    naxel = load_naxel({"voxels_list": [
+        {"type": "shape_line", "position": position, "position2": [7, 4, 0], "color": [255, 0, 0, 255]},
+    ]})
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    assert sorted(grid.export_arrays().coords.tolist()) == [[4, y, z] for y in range(4, 8) for z in (10, 11)]
@@ -0,0 +1,73 @@
+from typing import Any
+
+import os
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.naxel_binary import export_naxel_binary, load_naxel_binary
+from lib_python.voxel_grid import VoxelGrid, build_frames
+
+
+def _scene(frame_count: int) -> dict[str, Any]:
+
+    frames: list[dict[str, Any]] = []
+
+    for i in range(frame_count):
+        frames.append({
+            "frame_id": i,
+            "voxels_dict": {"-40,3,2": "skin", f"{i},20,-7": [1, 2, 3, 128]},
+            "voxels_list": [
+                {"type": "shape_sphere", "position": [-i, 0, 2], "radius": 4, "color": "skin"},
+                {"type": "shape_line", "position": [-30, -1, 5], "position2": [25, 4 + i, -9], "color": "#0000ff"},
+            ]
+        })
+
+    return {"color_palette": {"skin": [200, 150, 100, 255]}, "frames": frames}
+
+
+def _grids(naxel: Any) -> list[dict[str, list[int]]]:
+
+    return [grid.export_to_dict() for grid in build_frames(naxel.data_frames, naxel.general_data)]
+
+
+def test_post_processed_loads_arrays() -> None:
+
+    for frame_count in (1, 3):
+
+        original = load_naxel(_scene(frame_count))
+        expected: list[dict[str, list[int]]] = _grids(original)
+
+        loaded = load_naxel(original.export_to_dict_preprocessed())
+
+        # Voxels are loaded as arrays, without any shape or per-voxel object
+        for frame in loaded.data_frames:
+            assert frame.voxels_arrays is not None and not frame.voxels_list and not frame.voxels_dict
+
+        assert _grids(loaded) == expected
+
+        # Positions must not depend on the order of the color table
+        grid: VoxelGrid = VoxelGrid()
+        grid.build_from_frame(loaded.data_frames[0], loaded.general_data)
+
+        assert grid.get_voxel(-40, 3, 2).export_to_lst() == [200, 150, 100, 255]
+        assert grid.get_voxel(0, 20, -7).export_to_lst() == [1, 2, 3, 128]
+
+
+def test_binary_round_trip(tmp_path: Any) -> None:
+
+    for frame_count in (1, 4):
+
+        original = load_naxel(_scene(frame_count))
+        expected: list[dict[str, list[int]]] = _grids(original)
+
+        path: str = os.path.join(str(tmp_path), f"{frame_count}.naxb")
+
+        export_naxel_binary(original, path)
+
+        assert _grids(load_naxel_binary(path)) == expected
+
+        # From a delta-encoded export
+        delta_path: str = os.path.join(str(tmp_path), f"{frame_count}_delta.naxb")
+
+        export_naxel_binary(load_naxel(original.export_to_dict_preprocessed(delta_frames=True)), delta_path)
+
+        assert _grids(load_naxel_binary(delta_path)) == expected
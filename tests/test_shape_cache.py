@@ -0,0 +1,101 @@
+from typing import Any
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.shape_cache import SHAPE_CACHE
+
+
+# Triangles (vertices relative to the first one) and translations for which
+# the triangle fill differs when rasterized at the origin and at the translation
+TRIANGLES: list[tuple[list[list[int]], list[int]]] = [
+    ([[-4, -1, 4], [5, 10, 2], [-3, 5, 10]], [-35, 39, 15]),
+    ([[-14, -4, 5], [0, 9, 7], [-5, -2, 15]], [13, 18, -38]),
+    ([[1, -13, 3], [-12, 6, 13], [-3, -10, 11]], [-37, 3, -25]),
+]
+
+
+def _voxels(voxels_list: list[dict[str, Any]]) -> set[int]:
+
+    naxel = load_naxel({"name": "test", "voxels_list": voxels_list})
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    return set(grid._voxels)
+
+
+def _triangle(
+    vertices: list[list[int]],
+    offset: list[int]
+) -> dict[str, Any]:
+
+    p1, p2, p3 = ([v[k] + offset[k] for k in range(3)] for v in vertices)
+
+    return {"type": "shape_triangle", "position": p1, "position2": p2, "position3": p3, "color": "red"}
+
+
+def test_same_shape_in_both_orders() -> None:
+
+    for vertices, offset in TRIANGLES:
+
+        at_origin: dict[str, Any] = _triangle(vertices, [0, 0, 0])
+        moved: dict[str, Any] = _triangle(vertices, offset)
+
+        # Built at the origin first, the moved one comes from the cache
+        SHAPE_CACHE.clear()
+        origin_first: set[int] = _voxels([at_origin])
+        moved_cached: set[int] = _voxels([moved])
+
+        # Built moved first, the one at the origin comes from the cache
+        SHAPE_CACHE.clear()
+        moved_first: set[int] = _voxels([moved])
+        origin_cached: set[int] = _voxels([at_origin])
+
+        assert moved_cached == moved_first
+        assert origin_cached == origin_first
+
+
+def test_cache_disabled_gives_same_voxels() -> None:
+
+    max_voxels: int = SHAPE_CACHE.max_voxels
+
+    try:
+
+        for vertices, offset in TRIANGLES:
+
+            SHAPE_CACHE.clear()
+            SHAPE_CACHE.max_voxels = 0
+            uncached: set[int] = _voxels([_triangle(vertices, offset)])
+
+            SHAPE_CACHE.max_voxels = max_voxels
+            _voxels([_triangle(vertices, [0, 0, 0])])
+
+            assert _voxels([_triangle(vertices, offset)]) == uncached
+
+    finally:
+        SHAPE_CACHE.max_voxels = max_voxels
+        SHAPE_CACHE.clear()
+
+
+def test_fractional_positions_in_both_orders() -> None:
+
+    # Same key: the positions are truncated to [3, 0, 0] -> [2, 0, 0]
+    fractional: dict[str, Any] = {
+        "type": "shape_rect", "position": [3.5, 0, 0], "position2": [2.5, 0, 0], "color": "red"
+    }
+    integer: dict[str, Any] = {
+        "type": "shape_rect", "position": [3, 0, 0], "position2": [2, 0, 0], "color": "red"
+    }
+
+    SHAPE_CACHE.clear()
+    fractional_first: set[int] = _voxels([fractional])
+    integer_cached: set[int] = _voxels([integer])
+
+    SHAPE_CACHE.clear()
+    integer_first: set[int] = _voxels([integer])
+    fractional_cached: set[int] = _voxels([fractional])
+
+    SHAPE_CACHE.clear()
+
+    assert len(integer_first) == 2
+    assert fractional_first == integer_cached == integer_first == fractional_cached
@@ -0,0 +1,297 @@
+from typing import Any
+
+from fractions import Fraction
+
+import numpy as np
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.shape_rasterizer import rasterize_shape
+
+
+def _shape(data: dict[str, Any]) -> Any:
+
+    return load_naxel({"voxels_list": [data]}).data_frames[0].voxels_list[0]
+
+
+def _coords(data: dict[str, Any]) -> list[tuple[int, ...]]:
+
+    coords = rasterize_shape(_shape(data))
+
+    assert coords is not None
+
+    return [tuple(c) for c in coords.tolist()]
+
+
+def _loop_line(p0: list[int], p1: list[int]) -> list[tuple[int, ...]]:
+    """
+    Per-voxel line loop (accumulators stepping one voxel along the major axis),
+    with exact fractions instead of floats.
+    """
+
+    d: list[int] = [abs(b - a) for a, b in zip(p0, p1)]
+    s: list[int] = [1 if a < b else -1 for a, b in zip(p0, p1)]
+
+    dm: int = max(d)
+
+    p: list[int] = list(p0)
+    res: list[tuple[int, ...]] = [tuple(p)]
+
+    if dm == 0:
+        return res
+
+    acc: list[Fraction] = [Fraction(0)] * 3
+
+    for _ in range(dm):
+
+        for a in range(3):
+
+            acc[a] += Fraction(d[a], dm)
+
+            if acc[a] >= Fraction(1, 2):
+                p[a] += s[a]
+                acc[a] -= 1
+
+        res.append(tuple(p))
+
+    return res
+
+
+def _loop_box(lo: list[int], hi: list[int]) -> list[tuple[int, ...]]:
+
+    return [
+        (x, y, z)
+        for x in range(lo[0], hi[0] + 1)
+        for y in range(lo[1], hi[1] + 1)
+        for z in range(lo[2], hi[2] + 1)
+    ]
+
+
+def _loop_sphere(c: list[int], r: int) -> list[tuple[int, ...]]:
+
+    return [
+        (c[0] + dx, c[1] + dy, c[2] + dz)
+        for dx in range(-r, r + 1)
+        for dy in range(-r, r + 1)
+        for dz in range(-r, r + 1)
+        if dx * dx + dy * dy + dz * dz <= r * r
+    ]
+
+
+def test_matches_per_voxel_loops() -> None:
+
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    for _ in range(40):
+
+        p0: list[int] = rng.integers(-20, 20, size=3).tolist()
+        p1: list[int] = rng.integers(-20, 20, size=3).tolist()
+
+        size: int = int(rng.integers(0, 5))
+        radius: int = int(rng.integers(0, 6))
+
+        assert _coords({"type": "shape_point", "position": p0}) == [tuple(p0)]
+
+        assert _coords({"type": "shape_line", "position": p0, "position2": p1}) == _loop_line(p0, p1)
+
+        assert _coords({"type": "shape_cube", "position": p0, "size": size}) \
+            == _loop_box(p0, [v + size - 1 for v in p0])
+
+        assert _coords({"type": "shape_rect", "position": p0, "position2": p1}) \
+            == _loop_box([min(a, b) for a, b in zip(p0, p1)], [max(a, b) for a, b in zip(p0, p1)])
+
+        assert sorted(_coords({"type": "shape_sphere", "position": p0, "radius": radius})) \
+            == sorted(_loop_sphere(p0, radius))
+
+
+def test_line_half_voxel_ties() -> None:
+
+    # Exact ties (i * d / dm = k + 0.5) are rounded up, at every step
+    assert _coords({"type": "shape_line", "position": [0, 0, 0], "position2": [4, 2, 0]}) \
+        == [(0, 0, 0), (1, 1, 0), (2, 1, 0), (3, 2, 0), (4, 2, 0)]
+
+    assert _coords({"type": "shape_line", "position": [0, 0, 0], "position2": [-10, 5, 3]}) \
+        == _loop_line([0, 0, 0], [-10, 5, 3])
+
+
+def test_grid_build_matches_shapes() -> None:
+
+    voxels_list: list[dict[str, Any]] = [
+        {"type": "shape_rect", "position": [-6, -6, 0], "position2": [6, 6, 0], "color": [0, 255, 0, 255]},
+        {"type": "shape_sphere", "position": [0, 0, 3], "radius": 3, "color": [255, 0, 0, 255]},
+        {"type": "shape_line", "position": [-6, 0, 1], "position2": [6, 3, 9], "color": [0, 0, 255, 255]},
+    ]
+
+    naxel = load_naxel({"voxels_list": voxels_list})
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    # Later shapes are drawn over the earlier ones
+    expected: dict[str, list[int]] = {}
+
+    for data in voxels_list:
+        for x, y, z in _coords(data):
+            expected[f"{x},{y},{z}"] = data["color"]
+
+    assert grid.export_to_dict() == expected
+
+
+def _loop_cylinder(c: list[int], r: int, height: int, u: int, v: int) -> list[tuple[int, ...]]:
+
+    w: int = 3 - u - v
+
+    res: list[tuple[int, ...]] = []
+
+    for du in range(-r, r + 1):
+        for dv in range(-r, r + 1):
+            for dw in range(height):
+
+                if du * du + dv * dv <= r * r:
+
+                    p: list[int] = list(c)
+                    p[u] += du
+                    p[v] += dv
+                    p[w] += dw
+
+                    res.append(tuple(p))
+
+    return res
+
+
+def _loop_fill(vertices: list[list[int]]) -> list[tuple[int, ...]]:
+    """
+    Per-voxel fill of a planar polygon: even-odd test of each point of the
+    projected bounding box, then the voxel of the plane above it.
+    """
+
+    k: int = len(vertices)
+
+    nx: float = sum((vertices[i][1] - vertices[(i + 1) % k][1]) * (vertices[i][2] + vertices[(i + 1) % k][2]) for i in range(k))
+    ny: float = sum((vertices[i][2] - vertices[(i + 1) % k][2]) * (vertices[i][0] + vertices[(i + 1) % k][0]) for i in range(k))
+    nz: float = sum((vertices[i][0] - vertices[(i + 1) % k][0]) * (vertices[i][1] + vertices[(i + 1) % k][1]) for i in range(k))
+
+    normal: list[float] = [nx, ny, nz]
+
+    w: int = max(range(3), key=lambda a: abs(normal[a]))
+
+    if normal[w] == 0:
+        return []
+
+    u, v = (a for a in range(3) if a != w)
+
+    res: list[tuple[int, ...]] = []
+
+    for pu in range(min(p[u] for p in vertices), max(p[u] for p in vertices) + 1):
+        for pv in range(min(p[v] for p in vertices), max(p[v] for p in vertices) + 1):
+
+            inside: bool = False
+
+            for i in range(k):
+
+                a: list[int] = vertices[i]
+                b: list[int] = vertices[(i + 1) % k]
+
+                if a[v] != b[v] and (a[v] > pv) != (b[v] > pv):
+                    if pu < a[u] + (pv - a[v]) * (b[u] - a[u]) / (b[v] - a[v]):
+                        inside = not inside
+
+            if inside:
+
+                p: list[int] = [0, 0, 0]
+                p[u] = pu
+                p[v] = pv
+                p[w] = int(np.rint(
+                    vertices[0][w] - (normal[u] * (pu - vertices[0][u]) + normal[v] * (pv - vertices[0][v])) / normal[w]
+                ))
+
+                res.append(tuple(p))
+
+    return res
+
+
+def _loop_polygon(vertices: list[list[int]]) -> list[tuple[int, ...]]:
+
+    edges: list[tuple[int, ...]] = []
+
+    for a, b in zip(vertices[:-1], vertices[1:]):
+        edges += _loop_line(a, b)
+
+    return _loop_fill(vertices[:-1]) + edges
+
+
+def test_circle_and_cylinder_match_per_voxel_loops() -> None:
+
+    rng: np.random.Generator = np.random.default_rng(1)
+
+    axes: dict[str, tuple[int, int]] = {"xy": (0, 1), "z": (0, 1), "xz": (0, 2), "y": (0, 2), "yz": (1, 2), "x": (1, 2)}
+
+    for _ in range(20):
+
+        c: list[int] = rng.integers(-20, 20, size=3).tolist()
+
+        radius: int = int(rng.integers(0, 7))
+        height: int = int(rng.integers(1, 5))
+
+        for axis, (u, v) in axes.items():
+
+            assert sorted(_coords({"type": "shape_circle", "position": c, "radius": radius, "axis": axis})) \
+                == sorted(_loop_cylinder(c, radius, 1, u, v))
+
+            assert sorted(_coords({
+                "type": "shape_cylinder", "position": c, "radius": radius, "height": height, "axis": axis
+            })) == sorted(_loop_cylinder(c, radius, height, u, v))
+
+
+def test_triangle_and_polygon_match_per_voxel_loops() -> None:
+
+    rng: np.random.Generator = np.random.default_rng(2)
+
+    for _ in range(30):
+
+        p: list[list[int]] = rng.integers(-12, 12, size=(3, 3)).tolist()
+
+        assert sorted(_coords({"type": "shape_triangle", "position": p[0], "position2": p[1], "position3": p[2]})) \
+            == sorted(_loop_polygon([p[0], p[1], p[2], p[0]]))
+
+    # A closed, concave polygon in the plane z = 2, and the same polygon open
+    polygon: list[list[int]] = [[0, 0, 2], [10, 0, 2], [10, 10, 2], [5, 4, 2], [0, 10, 2], [0, 0, 2]]
+
+    closed: list[tuple[int, ...]] = _coords({"type": "shape_polygon", "position": polygon[0], "polygon": polygon})
+
+    assert sorted(closed) == sorted(_loop_polygon(polygon))
+
+    assert (5, 2, 2) in closed and (5, 8, 2) not in closed
+    assert all(z == 2 for _, _, z in closed)
+
+    opened: list[tuple[int, ...]] = _coords({"type": "shape_polygon", "position": polygon[0], "polygon": polygon[:-1]})
+
+    assert (5, 2, 2) not in opened and set(opened) <= set(closed)
+
+
+def test_triangle_covers_its_inside() -> None:
+
+    # A tilted triangle: every voxel center well inside its projection is covered
+    a, b, c = [0, 0, 0], [16, 2, 4], [3, 14, 8]
+
+    coords: set[tuple[int, ...]] = set(_coords({"type": "shape_triangle", "position": a, "position2": b, "position3": c}))
+
+    covered: set[tuple[int, int]] = {(x, y) for x, y, _ in coords}
+
+    for x in range(0, 17):
+        for y in range(0, 15):
+
+            # Barycentric coordinates of (x, y) in the xy projection
+            det: float = (b[1] - c[1]) * (a[0] - c[0]) + (c[0] - b[0]) * (a[1] - c[1])
+            l1: float = ((b[1] - c[1]) * (x - c[0]) + (c[0] - b[0]) * (y - c[1])) / det
+            l2: float = ((c[1] - a[1]) * (x - c[0]) + (a[0] - c[0]) * (y - c[1])) / det
+
+            if min(l1, l2, 1 - l1 - l2) > 0.05:
+                assert (x, y) in covered
+
+    # Every voxel is within a voxel of the plane of the triangle
+    normal: np.ndarray = np.cross(np.array(b) - a, np.array(c) - a)
+
+    distances: np.ndarray = np.abs((np.array(sorted(coords)) - a) @ normal) / np.linalg.norm(normal)
+
+    assert np.all(distances <= 1.0)
@@ -0,0 +1,123 @@
+from typing import Any
+
+import os
+
+import numpy as np
+import pytest
+
+from lib_python.vec import Vec3
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.voxel_grid_chunked import ChunkedVoxelGrid, CHUNKED_GRID_MAGIC
+
+
+def _grid() -> VoxelGrid:
+    """
+    A grid spread over several chunks, on both sides of the origin.
+    """
+
+    naxel = load_naxel({
+        "voxels_list": [
+            {"type": "shape_sphere", "position": [-6, 3, -2], "radius": 7, "color": [200, 150, 100, 255]},
+            {"type": "shape_line", "position": [-30, -1, 5], "position2": [25, 4, -9], "color": [0, 0, 255, 255]},
+        ]
+    })
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    return grid
+
+
+def _open_files() -> int:
+
+    return len(os.listdir("/proc/self/fd"))
+
+
+def _colors(grid: VoxelGrid, positions: list[tuple[int, int, int]]) -> list[Any]:
+
+    res: list[Any] = []
+
+    for x, y, z in positions:
+
+        color = grid.get_voxel(x, y, z)
+
+        res.append(None if color is None else color.export_to_lst())
+
+    return res
+
+
+def test_matches_voxel_grid(tmp_path: Any) -> None:
+
+    grid: VoxelGrid = _grid()
+
+    path: str = os.path.join(str(tmp_path), "a.naxc")
+
+    ChunkedVoxelGrid.from_grid(grid).save(path)
+
+    positions: list[tuple[int, int, int]] = [
+        (x, y, z) for x in range(-35, 30, 3) for y in range(-6, 12, 2) for z in range(-12, 10, 2)
+    ] + [(2 ** 25, 0, 0), (0, -2 ** 25, 0)]
+
+    for chunk_bits in (2, 4):
+
+        in_memory: ChunkedVoxelGrid = ChunkedVoxelGrid.from_grid(grid, chunk_bits)
+
+        assert in_memory.export_to_dict() == grid.export_to_dict()
+        assert _colors(in_memory, positions) == _colors(grid, positions)
+
+    opened: ChunkedVoxelGrid = ChunkedVoxelGrid.open(path, max_cached_chunks=2)
+
+    try:
+        assert opened.export_to_dict() == grid.export_to_dict()
+        assert _colors(opened, positions) == _colors(grid, positions)
+        assert opened.get_voxel_bounds()[0] == grid.get_voxel_bounds()[0]
+        assert opened.get_voxel_bounds()[1] == grid.get_voxel_bounds()[1]
+
+    finally:
+        opened.close()
+
+
+def test_query_box_fractional_corners() -> None:
+
+    grid: VoxelGrid = _grid()
+    chunked: ChunkedVoxelGrid = ChunkedVoxelGrid.from_grid(grid)
+
+    coords: np.ndarray = grid.export_arrays().coords.astype(np.int64)
+
+    for lo, hi in (((-9.5, -0.5, -4.5), (-2.5, 6.5, 0.5)), ((-1e9, -1e9, -1e9), (1e9, 1e9, 1e9))):
+
+        # Voxels whose cell [v, v + 1) overlaps the box
+        inside: np.ndarray = np.all((coords + 1 > np.array(lo)) & (coords < np.array(hi)), axis=1)
+
+        arrays = chunked.query_box(Vec3(*lo), Vec3(*hi))
+
+        assert sorted(map(tuple, arrays.coords.tolist())) == sorted(map(tuple, coords[inside].tolist()))
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+def test_invalid_files_are_closed(tmp_path: Any) -> None:
+
+    valid_path: str = os.path.join(str(tmp_path), "valid.naxc")
+
+    ChunkedVoxelGrid.from_grid(_grid()).save(valid_path)
+
+    with open(valid_path, "rb") as f:
+        valid: bytes = f.read()
+
+    # Empty, shorter than the header, wrong magic, truncated chunks
+    contents: list[bytes] = [b"", CHUNKED_GRID_MAGIC + b"\x01", b"NOPE" + valid[4:], valid[:-10]]
+
+    for i, content in enumerate(contents):
+
+        path: str = os.path.join(str(tmp_path), f"{i}.naxc")
+
+        with open(path, "wb") as f:
+            f.write(content)
+
+        before: int = _open_files()
+
+        with pytest.raises(ValueError):
+            ChunkedVoxelGrid.open(path)
+
+        assert _open_files() == before
@@ -0,0 +1,81 @@
+from typing import Any
+
+import numpy as np
+
+from lib_python.vec import Vec3
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.voxel_grid_morton import MortonVoxelGrid
+
+
+LIMIT: int = 1 << 20
+
+
+def _grid() -> VoxelGrid:
+    """
+    A grid on both sides of the origin, with a voxel at the edge of the key range.
+    """
+
+    naxel = load_naxel({
+        "voxels_dict": {f"{-LIMIT},0,{LIMIT - 1}": [255, 255, 255, 255]},
+        "voxels_list": [
+            {"type": "shape_sphere", "position": [-6, 3, -2], "radius": 7, "color": [200, 150, 100, 255]},
+            {"type": "shape_line", "position": [-30, -1, 5], "position2": [25, 4, -9], "color": [0, 0, 255, 255]},
+        ]
+    })
+
+    grid: VoxelGrid = VoxelGrid()
+    grid.build_from_frame(naxel.data_frames[0], naxel.general_data)
+
+    return grid
+
+
+def _colors(grid: VoxelGrid, positions: list[tuple[int, int, int]]) -> list[Any]:
+
+    res: list[Any] = []
+
+    for x, y, z in positions:
+
+        color = grid.get_voxel(x, y, z)
+
+        res.append(None if color is None else color.export_to_lst())
+
+    return res
+
+
+def test_matches_voxel_grid() -> None:
+
+    grid: VoxelGrid = _grid()
+    morton: MortonVoxelGrid = MortonVoxelGrid.from_grid(grid)
+
+    # Negative coordinates, and coordinates out of the Morton code range
+    positions: list[tuple[int, int, int]] = [
+        (x, y, z) for x in range(-35, 30, 3) for y in range(-6, 12, 2) for z in range(-12, 10, 2)
+    ] + [(-LIMIT, 0, LIMIT - 1), (-LIMIT - 1, 0, LIMIT - 1), (-LIMIT, 0, LIMIT), (2 ** 40, 0, 0), (0, 0, -2 ** 40)]
+
+    assert morton.export_to_dict() == grid.export_to_dict()
+    assert _colors(morton, positions) == _colors(grid, positions)
+
+
+def test_query_box_fractional_corners() -> None:
+
+    grid: VoxelGrid = _grid()
+    morton: MortonVoxelGrid = MortonVoxelGrid.from_grid(grid)
+
+    coords: np.ndarray = grid.export_arrays().coords.astype(np.int64)
+
+    boxes: list[tuple[tuple[float, ...], tuple[float, ...]]] = [
+        ((-9.5, -0.5, -4.5), (-2.5, 6.5, 0.5)),
+        ((-1e9, -1e9, -1e9), (1e9, 1e9, 1e9)),
+        ((3.0, 3.0, 3.0), (3.0, 3.0, 3.0)),
+        ((1e9, 0.0, 0.0), (2e9, 1.0, 1.0)),
+    ]
+
+    for lo, hi in boxes:
+
+        # Voxels whose cell [v, v + 1) overlaps the box
+        inside: np.ndarray = np.all((coords + 1 > np.array(lo)) & (coords < np.array(hi)), axis=1)
+
+        arrays = morton.query_box(Vec3(*lo), Vec3(*hi))
+
+        assert sorted(map(tuple, arrays.coords.tolist())) == sorted(map(tuple, coords[inside].tolist()))
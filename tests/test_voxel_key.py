@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from lib_python.voxel_key import (
+    pack_voxel_key,
+    pack_voxel_keys,
+    unpack_voxel_key,
+    unpack_voxel_keys,
+    morton_encode,
+    morton_encode_one,
+    morton_decode,
+)
+from lib_python.voxel_grid import VoxelGrid
+from lib_python.color import Color
+
+
+LIMIT: int = 1 << 20
+
+
+def test_boundary_coordinates_round_trip() -> None:
+
+    for coords in ((-LIMIT, 0, LIMIT - 1), (LIMIT - 1, -LIMIT, 0), (0, LIMIT - 1, -LIMIT)):
+
+        assert unpack_voxel_key(pack_voxel_key(*coords)) == coords
+
+        keys = pack_voxel_keys(np.array([coords]))
+
+        assert unpack_voxel_keys(keys).tolist() == [list(coords)]
+
+        codes = morton_encode(np.array([coords]))
+
+        assert int(codes[0]) == morton_encode_one(*coords)
+        assert morton_decode(codes).tolist() == [list(coords)]
+
+
+def test_out_of_range_coordinates_raise() -> None:
+
+    for coords in ((0, 0, LIMIT), (0, -LIMIT - 1, 0), (LIMIT, 0, 0)):
+
+        with pytest.raises(ValueError):
+            pack_voxel_key(*coords)
+
+        with pytest.raises(ValueError):
+            pack_voxel_keys(np.array([[0, 0, 0], coords]))
+
+        with pytest.raises(ValueError):
+            morton_encode_one(*coords)
+
+
+def test_grid_rejects_out_of_range_voxels() -> None:
+
+    grid: VoxelGrid = VoxelGrid()
+
+    with pytest.raises(ValueError):
+        grid.set_voxel(0, 0, LIMIT, Color(255, 0, 0))
+
+    grid.set_voxel(0, 0, LIMIT - 1, Color(255, 0, 0))
+
+    assert grid.export_to_dict() == {f"0,0,{LIMIT - 1}": [255, 0, 0, 255]}
+    assert grid.get_voxel(0, 0, LIMIT) is None
@@ -0,0 +1,79 @@
+from typing import Any
+
+import json
+
+import numpy as np
+
+from lib_python.naxel_loader import load_naxel
+from lib_python.voxel_arrays import VoxelArrays
+from lib_python.voxel_grid import VoxelGrid, build_frames
+
+
+def _scene(frame_count: int) -> dict[str, Any]:
+
+    frames: list[dict[str, Any]] = []
+
+    for i in range(frame_count):
+        frames.append({
+            "voxels_dict": {"-40,3,2": [9, 9, 9, 255], "-39,3,2": [9, 9, 9, 255], "-38,3,2": [8, 9, 9, 255]},
+            "voxels_list": [
+                {"type": "shape_cube", "position": [-3, -3, -3], "size": 6, "color": [200, 150, 100, 255]},
+                {"type": "shape_sphere", "position": [i, 0, 2], "radius": 4, "color": "#0000ff"},
+            ]
+        })
+
+    return {"frames": frames}
+
+
+def _grids(naxel: Any) -> list[dict[str, list[int]]]:
+
+    return [grid.export_to_dict() for grid in build_frames(naxel.data_frames, naxel.general_data)]
+
+
+def test_arrays_rle_round_trip() -> None:
+
+    rng: np.random.Generator = np.random.default_rng(0)
+
+    coords: np.ndarray = np.unique(rng.integers(-20, 20, size=(2000, 3)), axis=0)
+    colors: np.ndarray = rng.integers(0, 3, size=(len(coords), 1)) * np.array([[100, 50, 0, 0]]) + 55
+
+    arrays: VoxelArrays = VoxelArrays.from_colors(coords, colors)
+
+    for axis in ("x", "y", "z"):
+
+        rle: dict[str, Any] = arrays.export_to_rle(axis)
+
+        # Survives JSON, and is smaller than one entry per voxel
+        loaded: VoxelArrays = VoxelArrays.from_rle(json.loads(json.dumps(rle)))
+
+        assert loaded.export_to_dict() == arrays.export_to_dict()
+        assert len(rle["runs"]) // 5 < len(coords)
+
+
+def test_rle_export_round_trip() -> None:
+
+    for frame_count in (1, 3):
+
+        original = load_naxel(_scene(frame_count))
+        expected: list[dict[str, list[int]]] = _grids(original)
+
+        for axis in ("x", "y", "z"):
+
+            exported: dict[str, Any] = original.export_to_dict_preprocessed(voxels_format="rle", rle_axis=axis)
+
+            frames: list[dict[str, Any]] = exported["frames"] if frame_count > 1 else [exported]
+
+            assert all("voxels_rle" in frame and "voxels_dict" not in frame for frame in frames)
+
+            assert _grids(load_naxel(json.loads(json.dumps(exported)))) == expected
+
+        if frame_count > 1:
+
+            delta: dict[str, Any] = original.export_to_dict_preprocessed(voxels_format="rle", delta_frames=True)
+
+            assert _grids(load_naxel(delta)) == expected
+
+    # An empty frame
+    empty: VoxelGrid = VoxelGrid()
+
+    assert VoxelArrays.from_rle(empty.export_arrays().export_to_rle()).export_to_dict() == {}